@@ -15,40 +15,49 @@ Example:
 
 from __future__ import annotations
 
+import importlib
 from typing import Any
 
 __version__ = "1.1.0"
 
-# Export configuration constants
-from analysis.config import COLORS, CRIME_DATA_PATH, REPORTS_DIR
+# Public names -> defining module. Resolved on first access so that importing a
+# submodule (e.g. ``python -m analysis.cli --help``) doesn't load pandas/geopandas.
+_LAZY_EXPORTS: dict[str, str] = {
+    "COLORS": "analysis.config",
+    "CRIME_DATA_PATH": "analysis.config",
+    "REPORTS_DIR": "analysis.config",
+    "CRIME_CATEGORY_MAP": "analysis.utils",
+    "classify_crime_category": "analysis.utils",
+    "extract_temporal_features": "analysis.utils",
+    "load_data": "analysis.utils",
+    # Spatial utilities (optional, require geopandas)
+    "calculate_severity_score": "analysis.utils.spatial",
+    "clean_coordinates": "analysis.utils.spatial",
+    "df_to_geodataframe": "analysis.utils.spatial",
+}
 
-# Export key utilities
-from analysis.utils import (
-    CRIME_CATEGORY_MAP,
-    classify_crime_category,
-    extract_temporal_features,
-    load_data,
-)
 
-# Export spatial utilities (optional, requires geopandas)
-try:
-    from analysis.utils.spatial import (
-        calculate_severity_score,
-        clean_coordinates,
-        df_to_geodataframe,
+def _missing_geopandas(*args: Any, **kwargs: Any) -> Any:
+    raise ImportError(
+        "geopandas is required for spatial functions. "
+        "Install it with: conda install -c conda-forge geopandas"
     )
-except ImportError:
-    # geopandas not available - define stubs
-    def _missing_geopandas(*args: Any, **kwargs: Any) -> Any:
-        raise ImportError(
-            "geopandas is required for spatial functions. "
-            "Install it with: conda install -c conda-forge geopandas"
-        )
 
-    # Reassign with explicit type annotations
-    calculate_severity_score = _missing_geopandas
-    clean_coordinates = _missing_geopandas
-    df_to_geodataframe = _missing_geopandas
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = _LAZY_EXPORTS[name]
+    try:
+        value = getattr(importlib.import_module(module_name), name)
+    except ImportError:
+        if module_name != "analysis.utils.spatial":
+            raise
+        # geopandas not available - spatial functions raise on use
+        value = _missing_geopandas
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     # Version
@@ -5,6 +5,9 @@ scripts with Rich progress bars and configurable output.
 
 Entry point: python -m analysis.cli
 
+Daemon:
+    serve: Keep libraries and data warm; other invocations forward to it
+
 Command groups:
     chief: Chief-level analyses (trends, seasonality, covid)
     patrol: Patrol analyses (hotspots, robbery-heatmap, etc.)
@@ -19,6 +22,16 @@ Common arguments:
 See CLAUDE.md for usage examples and command reference details.
 """
 
-from analysis.cli.main import app
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    # Imported on first use so the daemon client can load without the command groups
+    if name == "app":
+        from analysis.cli.main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["app"]
@@ -1,6 +1,18 @@
-"""Module entry point for: python -m analysis.cli"""
+"""Module entry point for: python -m analysis.cli
 
-from analysis.cli.main import app
+Invocations are forwarded to a running ``serve`` daemon when there is one
+(see ``analysis.cli.daemon``); otherwise the CLI runs in this process.
+"""
+
+import sys
+
+from analysis.cli.daemon import forward
 
 if __name__ == "__main__":
+    exit_code = forward(sys.argv[1:])
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from analysis.cli.main import app
+
     app()
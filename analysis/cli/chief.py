@@ -11,7 +11,6 @@ See CLAUDE.md for usage examples and expected report artifacts.
 from pathlib import Path
 from typing import Literal
 
-import matplotlib.pyplot as plt
 import typer
 from rich.console import Console
 from rich.progress import (
@@ -24,17 +23,25 @@ from rich.progress import (
 )
 
 from analysis.config.schemas.chief import COVIDConfig, SeasonalityConfig, TrendsConfig
-from analysis.data.loading import load_crime_data
-from analysis.data.preprocessing import aggregate_by_period, filter_by_date_range
-from analysis.utils.classification import classify_crime_category
-from analysis.utils.temporal import extract_temporal_features
-from analysis.visualization import plot_bar, plot_line, save_figure
+from analysis.data.cube import CountCube, build_count_cube, load_count_cube
+from analysis.data.sampling import SAMPLE_WEIGHT_COL, load_crime_sample
+from analysis.models.resampling import bootstrap_mean_difference
+from analysis.visualization import plot_bar, plot_line, render_figure
 
 # Create typer app for this command group
 app = typer.Typer(help="Chief-level trend analyses (annual trends, seasonality, COVID impact)")
 console = Console()
 
 
+def _load_cube(fast: bool, sample_frac: float) -> CountCube:
+    """Count cube for the full dataset, or estimated from the stratified sample in fast mode."""
+    if not fast:
+        return load_count_cube()
+    df = load_crime_sample(sample_frac)
+    console.print(f"[yellow]Fast mode: Using {len(df)} rows ({sample_frac:.0%} sample)[/yellow]")
+    return build_count_cube(df, weight_col=SAMPLE_WEIGHT_COL)
+
+
 @app.command()
 def trends(
     start_year: int = typer.Option(2015, help="Start year for analysis", min=2006, max=2026),
@@ -71,27 +78,16 @@ def trends(
 
         # Stage 1: Load data
         progress.update(load_task, visible=True)
-        df = load_crime_data(clean=True)
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42)
-            console.print(
-                f"[yellow]Fast mode: Using {len(df)} rows ({config.fast_sample_frac:.0%} sample)[/yellow]"
-            )
+        cube = _load_cube(fast, config.fast_sample_frac)
         progress.update(load_task, advance=100, description="Data loaded")
 
         # Stage 2: Preprocess data
         progress.update(prep_task, visible=True)
 
-        # Add temporal features
-        df = extract_temporal_features(df)
-
-        # Filter by date range
+        # Trim the cube's day axis to the requested years
         start_date = f"{config.start_year}-01-01"
         end_date = f"{config.end_year}-12-31"
-        df = filter_by_date_range(df, start=start_date, end=end_date, date_col="dispatch_date")
-
-        # Classify crimes
-        df = classify_crime_category(df)
+        total_incidents = cube.total(start=start_date, end=end_date)
 
         progress.update(prep_task, advance=100, description="Preprocessing complete")
 
@@ -99,9 +95,7 @@ def trends(
         progress.update(analyze_task, visible=True)
 
         # Aggregate by year
-        annual_df = aggregate_by_period(
-            df, period="YE", date_col="dispatch_date", count_col="objectid"
-        )
+        annual_df = cube.counts("YE", start=start_date, end=end_date)
 
         progress.update(analyze_task, advance=100, description="Analysis complete")
 
@@ -113,8 +107,12 @@ def trends(
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Create figure: annual crime trend line
-        fig = plot_line(
+        figure_path = output_path / f"{config.report_name}_trend.{config.output_format}"
+        render_figure(
+            plot_line,
             annual_df,
+            figure_path,
+            output_format=config.output_format,
             x_col="dispatch_date",
             y_col="count",
             title=f"Annual Crime Trends ({config.start_year}-{config.end_year})",
@@ -122,18 +120,13 @@ def trends(
             ylabel="Number of Incidents",
         )
 
-        # Save figure
-        figure_path = output_path / f"{config.report_name}_trend.{config.output_format}"
-        save_figure(fig, figure_path, output_format=config.output_format)
-        plt.close(fig)
-
         # Save summary statistics
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
             f.write("Annual Trends Analysis Summary\n")
             f.write("=" * 40 + "\n")
             f.write(f"Period: {config.start_year}-{config.end_year}\n")
-            f.write(f"Total incidents: {len(df)}\n")
+            f.write(f"Total incidents: {total_incidents}\n")
             f.write("\nAnnual totals:\n")
             for row in annual_df.sort_values("dispatch_date").itertuples():
                 year = row.dispatch_date.year
@@ -144,7 +137,7 @@ def trends(
 
     console.print()
     console.print("[green]:heavy_check_mark:[/green] [bold green]Analysis complete[/bold green]")
-    console.print(f"  Total incidents analyzed: [cyan]{len(df):,.0f}[/cyan]")
+    console.print(f"  Total incidents analyzed: [cyan]{total_incidents:,.0f}[/cyan]")
     console.print(f"  Output directory: [cyan]{output_path}[/cyan]")
     console.print(f"  Summary file: [cyan]{summary_file.name}[/cyan]")
 
@@ -179,33 +172,25 @@ def seasonality(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df = load_crime_data(clean=True)
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42)
+        cube = _load_cube(fast, config.fast_sample_frac)
         progress.update(load_task, advance=100)
 
         prep_task = progress.add_task("Processing data...", total=100)
-        df = extract_temporal_features(df)
-        df = classify_crime_category(df)
+        # Monthly totals over complete years
+        monthly_df = cube.counts("ME", start="2018-01-01", end="2023-12-31")
         progress.update(prep_task, advance=100)
 
         analyze_task = progress.add_task("Analyzing seasonality...", total=100)
 
-        # Filter for complete years
-        df_filtered = filter_by_date_range(
-            df, start="2018-01-01", end="2023-12-31", date_col="dispatch_date"
-        )
-
         # Calculate seasonal averages
-        df_filtered = df_filtered.copy()
-        df_filtered["season"] = df_filtered["month"].apply(
+        monthly_df["season"] = monthly_df["dispatch_date"].dt.month.map(
             lambda m: (
                 "summer"
                 if m in config.summer_months
                 else ("winter" if m in config.winter_months else "other")
             )
         )
-        seasonal_counts = df_filtered.groupby("season")["objectid"].count()
+        seasonal_counts = monthly_df.groupby("season")["count"].sum().rename("objectid")
 
         progress.update(analyze_task, advance=100)
 
@@ -215,8 +200,12 @@ def seasonality(
 
         # Create figure: seasonal comparison bar plot
         seasonal_df = seasonal_counts.reset_index()
-        fig = plot_bar(
+        figure_path = output_path / f"{config.report_name}_seasonal.{config.output_format}"
+        render_figure(
+            plot_bar,
             seasonal_df,
+            figure_path,
+            output_format=config.output_format,
             x_col="season",
             y_col="objectid",
             title="Seasonal Crime Comparison",
@@ -224,11 +213,6 @@ def seasonality(
             ylabel="Average Incidents",
         )
 
-        # Save figure
-        figure_path = output_path / f"{config.report_name}_seasonal.{config.output_format}"
-        save_figure(fig, figure_path, output_format=config.output_format)
-        plt.close(fig)
-
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
             f.write("Seasonality Analysis Summary\n")
@@ -279,34 +263,39 @@ def covid(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df = load_crime_data(clean=True)
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42)
+        cube = _load_cube(fast, config.fast_sample_frac)
         progress.update(load_task, advance=100)
 
-        prep_task = progress.add_task("Processing data...", total=100)
-        df = extract_temporal_features(df)
-        df = classify_crime_category(df)
-        progress.update(prep_task, advance=100)
-
         analyze_task = progress.add_task("Comparing periods...", total=100)
 
-        # Get pre-COVID baseline
-        before_periods = []
-        for year in config.before_years:
-            year_data = filter_by_date_range(
-                df, start=f"{year}-01-01", end=f"{year}-12-31", date_col="dispatch_date"
-            )
-            before_periods.append(year_data)
-
-        baseline_df = pd.concat(before_periods, ignore_index=True)
-        baseline_avg = len(baseline_df) / len(config.before_years)
+        # Get pre-COVID baseline (only counts are needed, so read them off the cube)
+        baseline_total = sum(
+            cube.total(start=f"{year}-01-01", end=f"{year}-12-31") for year in config.before_years
+        )
+        baseline_avg = baseline_total / len(config.before_years)
 
-        # Get post-COVID period (2021-2022)
-        after_df = filter_by_date_range(
-            df, start="2021-01-01", end="2022-12-31", date_col="dispatch_date"
+        # Get post-COVID period (the same years as the bootstrap below)
+        after_total = sum(
+            cube.total(start=f"{year}-01-01", end=f"{year}-12-31") for year in config.after_years
         )
 
+        # Bootstrap interval for the change in mean daily incidents
+        def _daily(years: list[int]) -> pd.Series:
+            return pd.concat(
+                [
+                    cube.counts("D", start=f"{year}-01-01", end=f"{year}-12-31")["count"]
+                    for year in years
+                ]
+            )
+
+        before_daily = _daily(config.before_years)
+        after_daily = _daily(config.after_years)
+        daily_change = None
+        if len(before_daily) and len(after_daily):
+            daily_change = bootstrap_mean_difference(
+                after_daily, before_daily, n_resamples=config.n_resamples
+            )
+
         progress.update(analyze_task, advance=100)
 
         output_task = progress.add_task("Saving outputs...", total=100)
@@ -315,10 +304,14 @@ def covid(
 
         # Create figure: before/after comparison bar plot
         comparison_df = pd.DataFrame(
-            {"Period": ["Before (avg)", "After"], "Incidents": [baseline_avg, len(after_df)]}
+            {"Period": ["Before (avg)", "After"], "Incidents": [baseline_avg, after_total]}
         )
-        fig = plot_bar(
+        figure_path = output_path / f"{config.report_name}_covid_impact.{config.output_format}"
+        render_figure(
+            plot_bar,
             comparison_df,
+            figure_path,
+            output_format=config.output_format,
             x_col="Period",
             y_col="Incidents",
             title="COVID Impact on Crime",
@@ -326,21 +319,28 @@ def covid(
             ylabel="Number of Incidents",
         )
 
-        # Save figure
-        figure_path = output_path / f"{config.report_name}_covid_impact.{config.output_format}"
-        save_figure(fig, figure_path, output_format=config.output_format)
-        plt.close(fig)
-
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
             f.write("COVID Impact Analysis Summary\n")
             f.write("=" * 40 + "\n")
             f.write(f"Lockdown date: {config.lockdown_date}\n")
             f.write(f"Before years: {config.before_years}\n")
+            f.write(f"After years: {config.after_years}\n")
             f.write(f"\nAverage incidents (before): {baseline_avg:,.0f}\n")
-            f.write(f"Incidents (after): {len(after_df):,.0f}\n")
-            change_pct = (len(after_df) - baseline_avg) / baseline_avg * 100
+            f.write(f"Incidents (after): {after_total:,.0f}\n")
+            change_pct = (after_total - baseline_avg) / baseline_avg * 100
             f.write(f"Change: {change_pct:+.1f}%\n")
+            if daily_change is not None:
+                f.write(
+                    f"\nDaily mean {after_daily.mean():,.1f} (after {config.after_years}) vs "
+                    f"{before_daily.mean():,.1f} (before)\n"
+                )
+                f.write(
+                    f"Difference: {daily_change['difference']:+.1f} incidents/day "
+                    f"(95% CI {daily_change['ci_lower']:+.1f} to {daily_change['ci_upper']:+.1f}, "
+                    f"bootstrap p={daily_change['p_value']:.3f}, "
+                    f"{daily_change['n_resamples']:,} resamples)\n"
+                )
 
         progress.update(output_task, advance=100)
 
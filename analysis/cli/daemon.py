@@ -0,0 +1,252 @@
+"""Warm analysis daemon for the CLI.
+
+``python -m analysis.cli serve`` starts a long-running process that keeps the
+analysis libraries imported and the crime data loaded (see
+``keep_crime_data_in_memory``), and runs CLI invocations sent to it over a
+Unix socket. While it is running, ``python -m analysis.cli ...`` forwards its
+arguments to the daemon and prints the captured output, so repeated runs skip
+interpreter start-up, imports and data loading. Each request checks
+``crime_data_version()``, so a rewritten data file is reloaded on the next
+request rather than served stale.
+
+Functions:
+    socket_path: Resolve the daemon socket location
+    forward: Send a CLI invocation to a running daemon
+    stop: Ask a running daemon to shut down
+    serve: Run the daemon loop
+
+Protocol: one JSON request per connection. The client sends
+``{"argv": [...], "cwd": "..."}`` (or ``{"ping": true}`` / ``{"shutdown": true}``)
+and closes its write side; the daemon runs the command in ``cwd`` and answers
+with ``{"exit_code", "stdout", "stderr"}``. A malformed request gets exit code
+2 and a request whose ``cwd`` is gone exit code 1; neither stops the daemon.
+Requests are handled one at a time because matplotlib and the commands'
+console output are process-global.
+
+This module only imports the standard library at load time so the forwarding
+check stays cheap.
+
+See CLAUDE.md for usage guidance and CLI workflow examples.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import importlib
+import io
+import json
+import os
+import socket
+import sys
+import traceback
+from pathlib import Path
+from typing import Any
+
+# Default socket next to the joblib cache (project root/.cache)
+DEFAULT_SOCKET_PATH = Path(__file__).resolve().parent.parent.parent / ".cache" / "analysis-cli.sock"
+
+# Environment overrides: socket location, and opting out of forwarding
+SOCKET_ENV_VAR = "CRIME_ANALYSIS_SOCKET"
+NO_DAEMON_ENV_VAR = "CRIME_ANALYSIS_NO_DAEMON"
+
+# Commands that always run in the calling process
+_LOCAL_COMMANDS = frozenset({"serve"})
+
+# Imported once at daemon start so the first request doesn't pay for them
+_WARM_MODULES = (
+    "analysis.cli.chief",
+    "analysis.cli.patrol",
+    "analysis.cli.policy",
+    "analysis.cli.forecasting",
+    "analysis.utils.spatial",
+    "sklearn.cluster",
+    "sklearn.ensemble",
+)
+
+
+def socket_path() -> Path:
+    """Resolve the daemon socket location.
+
+    Returns:
+        Path from ``CRIME_ANALYSIS_SOCKET`` if set, else ``.cache/analysis-cli.sock``.
+    """
+    override = os.environ.get(SOCKET_ENV_VAR)
+    return Path(override) if override else DEFAULT_SOCKET_PATH
+
+
+def _request(path: Path, payload: dict[str, Any]) -> dict[str, Any] | None:
+    """Send one request; None if no daemon is listening on ``path``."""
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            # Stale socket file left by a daemon that did not shut down cleanly
+            return None
+        try:
+            sock.sendall(json.dumps(payload).encode())
+            sock.shutdown(socket.SHUT_WR)
+            return json.loads(_read_all(sock))
+        except (OSError, ValueError):
+            # Daemon died mid-request (reset or truncated reply): run locally
+            return None
+
+
+def _read_all(sock: socket.socket) -> bytes:
+    chunks = []
+    while chunk := sock.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def forward(argv: list[str], path: Path | None = None) -> int | None:
+    """Send a CLI invocation to a running daemon.
+
+    Args:
+        argv: CLI arguments without the program name.
+        path: Socket path. Defaults to ``socket_path()``.
+
+    Returns:
+        The command's exit code after printing its output, or None when the
+        invocation should run locally (no daemon, ``CRIME_ANALYSIS_NO_DAEMON``
+        set, or a command such as ``serve`` that never forwards).
+    """
+    if os.environ.get(NO_DAEMON_ENV_VAR) or (argv and argv[0] in _LOCAL_COMMANDS):
+        return None
+    response = _request(path or socket_path(), {"argv": argv, "cwd": os.getcwd()})
+    if response is None:
+        return None
+    sys.stdout.write(response["stdout"])
+    sys.stderr.write(response["stderr"])
+    return int(response["exit_code"])
+
+
+def stop(path: Path | None = None) -> bool:
+    """Ask a running daemon to shut down.
+
+    Args:
+        path: Socket path. Defaults to ``socket_path()``.
+
+    Returns:
+        True if a daemon was running and acknowledged, False otherwise.
+    """
+    return _request(path or socket_path(), {"shutdown": True}) is not None
+
+
+def _run_command(argv: list[str]) -> tuple[int, str, str]:
+    """Run a CLI invocation in this process, capturing its output."""
+    import typer
+
+    from analysis.cli.main import app
+
+    cli = typer.main.get_command(app)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            result = cli.main(argv, prog_name="python -m analysis.cli", standalone_mode=False)
+            exit_code = result if isinstance(result, int) else 0
+        except typer.Abort:
+            exit_code = 1
+        except SystemExit as exc:
+            exit_code = exc.code if isinstance(exc.code, int) else 1
+        except Exception as exc:
+            # Usage errors (click exceptions) know how to report themselves
+            if hasattr(exc, "show") and hasattr(exc, "exit_code"):
+                exc.show()
+                exit_code = exc.exit_code
+            else:
+                traceback.print_exc()
+                exit_code = 1
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def _reply(conn: socket.socket, exit_code: int, stdout: str = "", stderr: str = "") -> None:
+    payload = {"exit_code": exit_code, "stdout": stdout, "stderr": stderr}
+    # The client may have given up (Ctrl+C, timeout); its command still ran
+    with contextlib.suppress(OSError):
+        conn.sendall(json.dumps(payload).encode())
+
+
+def _handle(conn: socket.socket) -> bool:
+    """Serve one connection. Returns False when asked to shut down."""
+    try:
+        request = json.loads(_read_all(conn))
+        if request.get("ping") or request.get("shutdown"):
+            _reply(conn, 0)
+            return not request.get("shutdown")
+        argv = [str(arg) for arg in request["argv"]]
+    except (ValueError, KeyError, TypeError, AttributeError) as exc:
+        _reply(conn, 2, stderr=f"Invalid daemon request: {type(exc).__name__}: {exc}\n")
+        return True
+
+    previous_cwd = os.getcwd()
+    cwd = request.get("cwd", previous_cwd)
+    try:
+        os.chdir(cwd)
+    except (OSError, TypeError) as exc:
+        _reply(conn, 1, stderr=f"Cannot run in {cwd}: {exc}\n")
+        return True
+    try:
+        exit_code, out, err = _run_command(argv)
+    finally:
+        os.chdir(previous_cwd)
+    _reply(conn, exit_code, out, err)
+    return True
+
+
+def serve(path: Path | None = None, preload: bool = True) -> None:
+    """Run the daemon loop until a shutdown request or interrupt.
+
+    Args:
+        path: Socket path. Defaults to ``socket_path()``.
+        preload: Import the analysis modules and load the crime data before
+            accepting requests. Default True.
+
+    Raises:
+        RuntimeError: If Unix sockets are unavailable or a daemon is already
+            listening on ``path``.
+    """
+    from analysis.data.loading import keep_crime_data_in_memory, load_crime_data
+
+    if not hasattr(socket, "AF_UNIX"):
+        raise RuntimeError("The analysis daemon requires Unix domain sockets")
+    path = path or socket_path()
+    if _request(path, {"ping": True}) is not None:
+        raise RuntimeError(f"A daemon is already listening on {path}")
+    path.unlink(missing_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with keep_crime_data_in_memory(), socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(path))
+        try:
+            os.chmod(path, 0o600)
+            server.listen()
+            if preload:
+                for module in _WARM_MODULES:
+                    with contextlib.suppress(ImportError):
+                        importlib.import_module(module)
+                with contextlib.suppress(FileNotFoundError):
+                    load_crime_data()
+
+            running = True
+            while running:
+                conn, _ = server.accept()
+                with conn:
+                    try:
+                        running = _handle(conn)
+                    except Exception:  # noqa: BLE001 - one bad connection must not stop the daemon
+                        traceback.print_exc()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+__all__ = [
+    "DEFAULT_SOCKET_PATH",
+    "NO_DAEMON_ENV_VAR",
+    "SOCKET_ENV_VAR",
+    "forward",
+    "serve",
+    "socket_path",
+    "stop",
+]
@@ -1,17 +1,17 @@
 """Forecasting and prediction commands.
 
 Commands:
-    time-series: Prophet-based time series forecasting
+    time-series: Prophet or built-in baseline (naive, ETS, regression, ARIMA) forecasting
     classification: Violence classification with feature importance
 
-Note: time-series command requires prophet package (optional dependency).
+Note: Prophet is an optional dependency; without it --model-type prophet falls
+back to the built-in ETS (Holt-Winters) forecaster.
 See CLAUDE.md for usage examples and fallback behavior details.
 """
 
 from pathlib import Path
 from typing import Literal
 
-import matplotlib.pyplot as plt
 import pandas as pd
 import typer
 from rich.console import Console
@@ -27,9 +27,11 @@ from rich.progress import (
 from analysis.config.schemas.forecasting import ClassificationConfig, TimeSeriesConfig
 from analysis.data.loading import load_crime_data
 from analysis.data.preprocessing import aggregate_by_period
+from analysis.data.sampling import SAMPLE_WEIGHT_COL, incident_weights, load_crime_sample
+from analysis.models.time_series import BASELINE_MODELS, forecast_baseline
 from analysis.utils.classification import classify_crime_category
 from analysis.utils.temporal import extract_temporal_features
-from analysis.visualization import plot_bar, plot_line, save_figure
+from analysis.visualization import plot_bar, plot_line, render_figure
 
 app = typer.Typer(help="Forecasting and prediction analyses")
 console = Console()
@@ -38,7 +40,9 @@ console = Console()
 @app.command(name="time-series")
 def time_series(
     horizon: int = typer.Option(12, help="Forecast horizon (periods)"),
-    model_type: str = typer.Option("prophet", help="Model type (prophet, arima, ets)"),
+    model_type: str = typer.Option(
+        "prophet", help="Model type (prophet, ets, naive, regression, arima)"
+    ),
     version: str = typer.Option("v1.0", help="Output version tag"),
     fast: bool = typer.Option(False, "--fast", help="Fast mode with 10% sample"),
     output_format: Literal["png", "svg", "pdf"] = typer.Option("png", help="Figure output format"),
@@ -64,15 +68,14 @@ def time_series(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df = load_crime_data()
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42)
+        df = load_crime_sample(config.fast_sample_frac) if fast else load_crime_data()
         progress.update(load_task, advance=100)
 
         prep_task = progress.add_task("Preparing time series...", total=100)
 
-        # Aggregate by month
-        monthly_df = aggregate_by_period(df, "ME", "objectid", "dispatch_date")
+        # Aggregate by month (fast mode sums sample weights to estimate full counts)
+        weight_col = SAMPLE_WEIGHT_COL if SAMPLE_WEIGHT_COL in df.columns else None
+        monthly_df = aggregate_by_period(df, "ME", "objectid", "dispatch_date", weight_col)
         # Select only the columns we need for prophet
         monthly_df = monthly_df[["dispatch_date", "count"]].copy()
         monthly_df.columns = ["ds", "y"]
@@ -83,23 +86,34 @@ def time_series(
 
         model_task = progress.add_task("Training forecast model...", total=100)
 
-        # Try to use prophet for forecasting
-        try:
-            from prophet import Prophet
+        forecast = None
+        model_used = config.model_type
+        if config.model_type == "prophet":
+            try:
+                from prophet import Prophet
 
-            model = Prophet()
-            model.fit(monthly_df)
+                model = Prophet()
+                model.fit(monthly_df)
 
-            future = model.make_future_dataframe(periods=config.forecast_horizon, freq="ME")
-            forecast = model.predict(future)
+                future = model.make_future_dataframe(periods=config.forecast_horizon, freq="ME")
+                forecast = model.predict(future)
 
-            console.print("[green]Prophet model trained successfully[/green]")
-        except ImportError:
-            console.print(
-                "[yellow]Warning: prophet not available, using simple trend projection[/yellow]"
+                console.print("[green]Prophet model trained successfully[/green]")
+            except ImportError:
+                console.print(
+                    "[yellow]Warning: prophet not available, using ETS (Holt-Winters)[/yellow]"
+                )
+                model_used = "ets"
+
+        if forecast is None:
+            baseline = forecast_baseline(
+                monthly_df["y"], config.forecast_horizon, model_type=model_used
             )
-            # Simple linear trend as fallback
-            forecast = None
+            baseline["ds"] = pd.date_range(
+                monthly_df["ds"].max(), periods=config.forecast_horizon + 1, freq="ME"
+            )[1:]
+            forecast = baseline
+            console.print(f"[green]{BASELINE_MODELS[model_used]} forecast complete[/green]")
 
         progress.update(model_task, advance=100)
 
@@ -107,7 +121,7 @@ def time_series(
         output_path = Path(config.output_dir) / config.version / "forecasting"
         output_path.mkdir(parents=True, exist_ok=True)
 
-        # Create figure: historical data and forecast (if prophet available)
+        # Create figure: historical data and forecast
         if forecast is not None:
             historical_df = monthly_df.copy()
             historical_df["type"] = "historical"
@@ -120,8 +134,12 @@ def time_series(
 
             combined_df = pd.concat([historical_df, forecast_subset], ignore_index=True)
 
-            fig = plot_line(
+            figure_path = output_path / f"{config.report_name}_forecast.{config.output_format}"
+            render_figure(
+                plot_line,
                 combined_df,
+                figure_path,
+                output_format=config.output_format,
                 x_col="ds",
                 y_col="y",
                 title=f"Crime Forecast - {config.forecast_horizon} Period Horizon",
@@ -129,15 +147,13 @@ def time_series(
                 ylabel="Incidents",
             )
 
-            figure_path = output_path / f"{config.report_name}_forecast.{config.output_format}"
-            save_figure(fig, figure_path, output_format=config.output_format)
-            plt.close(fig)
-
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
             f.write("Time Series Forecasting Summary\n")
             f.write("=" * 40 + "\n")
             f.write(f"Model: {config.model_type}\n")
+            if model_used != config.model_type:
+                f.write(f"Model used: {model_used}\n")
             f.write(f"Forecast horizon: {config.forecast_horizon} periods\n")
             f.write(f"Training data: {len(monthly_df)} months\n")
             if forecast is not None:
@@ -175,20 +191,21 @@ def classification(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df = load_crime_data()
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42)
+        df = load_crime_sample(config.fast_sample_frac) if fast else load_crime_data()
         progress.update(load_task, advance=100)
 
         prep_task = progress.add_task("Preparing features...", total=100)
 
         # Create target variable (violent vs non-violent)
         df = classify_crime_category(df)
-        df = df.copy()
         df["is_violent"] = df["crime_category"] == "Violent"
 
         # Add temporal features
-        df = extract_temporal_features(df)
+        extract_temporal_features(
+            df, features=["year", "month", "hour", "day_of_week"], inplace=True, compact=True
+        )
+
+        weights = incident_weights(df)
 
         progress.update(prep_task, advance=100, description=f"Prepared {len(df)} incidents")
 
@@ -196,9 +213,14 @@ def classification(
 
         # Try to train a simple classifier
         try:
-            from sklearn.ensemble import RandomForestClassifier
             from sklearn.model_selection import train_test_split
 
+            from analysis.models.classification import (
+                aggregate_training_rows,
+                train_weighted_forest,
+                weighted_accuracy,
+            )
+
             # Select features
             feature_cols = ["year", "month", "hour", "day_of_week"]
             # Handle missing hour column
@@ -207,15 +229,22 @@ def classification(
             X = df[feature_cols].fillna(0)
             y = df["is_violent"]
 
-            X_train, X_test, y_train, y_test = train_test_split(
-                X, y, test_size=config.classification_test_size, random_state=config.random_state
+            X_train, X_test, y_train, y_test, w_train, w_test = train_test_split(
+                X,
+                y,
+                weights,
+                test_size=config.classification_test_size,
+                random_state=config.random_state,
             )
 
-            clf = RandomForestClassifier(n_estimators=100, random_state=config.random_state)
-            clf.fit(X_train, y_train)
+            # Fit on unique feature rows weighted by their (estimated) incident counts
+            X_unique, y_unique, counts = aggregate_training_rows(X_train, y_train, w_train)
+            clf = train_weighted_forest(
+                X_unique, y_unique, sample_weight=counts, random_state=config.random_state
+            )
 
-            train_score = clf.score(X_train, y_train)
-            test_score = clf.score(X_test, y_test)
+            train_score = weighted_accuracy(clf, X_train, y_train, w_train)
+            test_score = weighted_accuracy(clf, X_test, y_test, w_test)
 
             console.print(f"[green]Model trained: accuracy={test_score:.3f}[/green]")
         except ImportError:
@@ -234,8 +263,12 @@ def classification(
                 {"dataset": ["Train", "Test"], "accuracy": [train_score, test_score]}
             )
 
-            fig = plot_bar(
+            figure_path = output_path / f"{config.report_name}_performance.{config.output_format}"
+            render_figure(
+                plot_bar,
                 accuracy_df,
+                figure_path,
+                output_format=config.output_format,
                 x_col="dataset",
                 y_col="accuracy",
                 title="Violence Classification Model Performance",
@@ -243,18 +276,14 @@ def classification(
                 ylabel="Accuracy",
             )
 
-            figure_path = output_path / f"{config.report_name}_performance.{config.output_format}"
-            save_figure(fig, figure_path, output_format=config.output_format)
-            plt.close(fig)
-
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
             f.write("Violence Classification Summary\n")
             f.write("=" * 40 + "\n")
             f.write(f"Test size: {config.classification_test_size}\n")
             f.write(f"Random state: {config.random_state}\n")
-            f.write(f"Total incidents: {len(df)}\n")
-            f.write(f"Violent incidents: {df['is_violent'].sum():,.0f}\n")
+            f.write(f"Total incidents: {weights.sum():,.0f}\n")
+            f.write(f"Violent incidents: {weights[df['is_violent']].sum():,.0f}\n")
             if test_score is not None:
                 f.write("\nModel performance:\n")
                 f.write(f"  Train accuracy: {train_score:.3f}\n")
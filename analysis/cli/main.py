@@ -7,6 +7,8 @@ Usage:
     python -m analysis.cli --help
     python -m analysis.cli chief trends --help
     python -m analysis.cli chief trends --fast
+    python -m analysis.cli run-all --version v1.1 --jobs 2
+    python -m analysis.cli serve  # later invocations forward to this daemon
 
 Architecture:
     - typer.App for command registration
@@ -16,15 +18,88 @@ Architecture:
 See CLAUDE.md for command usage and workflow guidance.
 """
 
+import importlib
+import time
 from pathlib import Path
+from typing import Any, Literal
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
+from typer.core import TyperGroup
+
+# Command groups: name -> (module defining a typer ``app``, help text). The
+# modules pull in pandas/matplotlib, so they are imported only when one of
+# their commands is looked up, not for --help or version.
+COMMAND_GROUPS: dict[str, tuple[str, str]] = {
+    "chief": (
+        "analysis.cli.chief",
+        "Chief-level trend analyses (trends, seasonality, COVID impact)",
+    ),
+    "patrol": (
+        "analysis.cli.patrol",
+        "Patrol operations analyses (hotspots, robbery, district severity, census rates)",
+    ),
+    "policy": (
+        "analysis.cli.policy",
+        "Policy evaluation analyses (retail theft, vehicle crimes, composition, events)",
+    ),
+    "forecasting": (
+        "analysis.cli.forecasting",
+        "Forecasting and prediction analyses (time series, violence classification)",
+    ),
+}
+
+
+def load_command_group(name: str) -> TyperGroup:
+    """Import a command group module and build its click group.
+
+    Args:
+        name: Key of ``COMMAND_GROUPS`` (e.g. "chief").
+
+    Returns:
+        The group's commands as a TyperGroup.
+    """
+    module = importlib.import_module(COMMAND_GROUPS[name][0])
+    return typer.main.get_group(module.app)
+
+
+class _LazyCommandGroup(TyperGroup):
+    """Placeholder group that imports its module on first command lookup."""
+
+    def __init__(self, name: str, help: str) -> None:
+        super().__init__(name=name, help=help)
+        self._group: TyperGroup | None = None
+
+    def _load(self) -> TyperGroup:
+        if self._group is None:
+            self._group = load_command_group(str(self.name))
+        return self._group
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return self._load().list_commands(ctx)
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        return self._load().get_command(ctx, cmd_name)
+
+    def invoke(self, ctx: Any) -> Any:
+        # Figures render in worker processes while the command keeps computing
+        from analysis.visualization.render import figure_batch
+
+        with figure_batch():
+            return super().invoke(ctx)
+
+
+class _MainGroup(TyperGroup):
+    """Top-level group with the analysis command groups registered lazily."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        groups = {name: _LazyCommandGroup(name, help) for name, (_, help) in COMMAND_GROUPS.items()}
+        # Groups first, then the top-level commands, matching the help listing order
+        self.commands = {**groups, **self.commands}
 
-# Import command groups
-from analysis.cli import chief, forecasting, patrol, policy
 
 # Create main app
 app = typer.Typer(
@@ -32,35 +107,13 @@ app = typer.Typer(
     help="Philadelphia Crime Incidents Analysis CLI",
     no_args_is_help=True,
     add_completion=False,
+    cls=_MainGroup,
 )
 
 # Rich console for output
 console = Console()
 
 
-# Register command groups
-app.add_typer(
-    chief.app,
-    name="chief",
-    help="Chief-level trend analyses (trends, seasonality, COVID impact)",
-)
-app.add_typer(
-    patrol.app,
-    name="patrol",
-    help="Patrol operations analyses (hotspots, robbery, district severity, census rates)",
-)
-app.add_typer(
-    policy.app,
-    name="policy",
-    help="Policy evaluation analyses (retail theft, vehicle crimes, composition, events)",
-)
-app.add_typer(
-    forecasting.app,
-    name="forecasting",
-    help="Forecasting and prediction analyses (time series, violence classification)",
-)
-
-
 @app.command()
 def version() -> None:
     """Show CLI and runtime version details.
@@ -113,5 +166,166 @@ def info() -> None:
     console.print(f"Resolved path: [cyan]{Path('reports').resolve()}[/cyan]")
 
 
+def _analysis_commands() -> list[str]:
+    """All analysis commands as "group.command", in registration order."""
+    names = []
+    for group_name in COMMAND_GROUPS:
+        group = load_command_group(group_name)
+        names.extend(f"{group_name}.{name}" for name in group.commands)
+    return names
+
+
+def _run_batch(commands: list[str], args: list[str]) -> list[tuple[str, bool, float, str]]:
+    """Run analysis commands in this process, loading the crime data once.
+
+    Returns:
+        One ``(command, succeeded, seconds, error)`` tuple per command.
+    """
+    from analysis.data.loading import keep_crime_data_in_memory
+    from analysis.visualization.render import figure_batch
+
+    cli = typer.main.get_command(app)
+    results = []
+    # One render queue for the whole batch, so figures from every command
+    # render in parallel with the commands that follow
+    started = time.perf_counter()
+    try:
+        with keep_crime_data_in_memory(), figure_batch():
+            for name in commands:
+                started = time.perf_counter()
+                error = ""
+                try:
+                    exit_code = cli.main([*name.split("."), *args], standalone_mode=False)
+                    if exit_code:
+                        error = f"exit code {exit_code}"
+                except Exception as exc:
+                    error = f"{type(exc).__name__}: {exc}"
+                results.append((name, not error, time.perf_counter() - started, error))
+            started = time.perf_counter()
+    except Exception as exc:
+        # Raised while waiting for the queued figures after the last command
+        error = f"{type(exc).__name__}: {exc}"
+        results.append(("figures", False, time.perf_counter() - started, error))
+    return results
+
+
+@app.command(name="run-all")
+def run_all(
+    only: list[str] | None = typer.Option(
+        None, help="Groups or commands to run, e.g. 'chief' or 'patrol.hotspots' (default: all)"
+    ),
+    skip: list[str] | None = typer.Option(None, help="Groups or commands to leave out"),
+    jobs: int = typer.Option(1, min=1, help="Worker processes; each loads the data once"),
+    version: str = typer.Option("v1.0", help="Output version tag"),
+    fast: bool = typer.Option(False, "--fast", help="Fast mode with 10% sample"),
+    output_format: Literal["png", "svg", "pdf"] = typer.Option("png", help="Figure output format"),
+) -> None:
+    """Run many analyses in one batch, loading the crime data once per process.
+
+    Commands run with their default parameters and write to reports/{version}/.
+    A failing command is reported and does not stop the rest of the batch.
+
+    Returns:
+        None: Prints a Rich table with per-command status and timing. Exits
+        with code 1 if any command failed.
+    """
+    available = _analysis_commands()
+
+    def matches(name: str, patterns: list[str]) -> bool:
+        return any(name == p or name.split(".")[0] == p for p in patterns)
+
+    unknown = [
+        p for p in (only or []) + (skip or []) if not any(matches(n, [p]) for n in available)
+    ]
+    if unknown:
+        console.print(f"[red]Unknown command(s): {', '.join(unknown)}[/red]")
+        console.print(f"Available: {', '.join(available)}")
+        raise typer.Exit(code=2)
+
+    selected = [
+        name
+        for name in available
+        if (not only or matches(name, only)) and not matches(name, skip or [])
+    ]
+    args = ["--version", version, "--output-format", output_format, *(["--fast"] if fast else [])]
+
+    console.print(f"[bold blue]Running {len(selected)} analyses[/bold blue] (jobs={jobs})")
+    started = time.perf_counter()
+    if jobs == 1 or len(selected) <= 1:
+        results = _run_batch(selected, args)
+    else:
+        from joblib import Parallel, delayed
+
+        # Round-robin batches, one per worker, so each worker loads the data once
+        batches = [selected[i::jobs] for i in range(min(jobs, len(selected)))]
+        batch_results = Parallel(n_jobs=len(batches))(
+            delayed(_run_batch)(batch, args) for batch in batches
+        )
+        by_name = {result[0]: result for batch in batch_results for result in batch}
+        results = [by_name[name] for name in selected]
+        # Batch-level entries such as failed figure renders, one per worker
+        results.extend(
+            (f"{name} (worker {worker})", ok, seconds, error)
+            for worker, batch in enumerate(batch_results, start=1)
+            for name, ok, seconds, error in batch
+            if name not in selected
+        )
+
+    table = Table(title=f"Batch results ({version})")
+    table.add_column("Command", style="cyan")
+    table.add_column("Status")
+    table.add_column("Time (s)", justify="right")
+    table.add_column("Error", style="red")
+    for name, ok, seconds, error in results:
+        status = "[green]ok[/green]" if ok else "[red]failed[/red]"
+        table.add_row(name, status, f"{seconds:.1f}", error)
+    console.print(table)
+
+    failed = [name for name, ok, _, _ in results if not ok]
+    console.print(f"Total time: [cyan]{time.perf_counter() - started:.1f}s[/cyan]")
+    console.print(f"Output directory: [cyan]{Path('reports') / version}[/cyan]")
+    if failed:
+        console.print(f"[red]{len(failed)} of {len(results)} analyses failed[/red]")
+        raise typer.Exit(code=1)
+
+
+@app.command()
+def serve(
+    socket_file: Path | None = typer.Option(
+        None, "--socket", help="Socket path (default: $CRIME_ANALYSIS_SOCKET or .cache/)"
+    ),
+    stop: bool = typer.Option(False, "--stop", help="Stop the running daemon and exit"),
+    preload: bool = typer.Option(True, help="Load libraries and crime data before serving"),
+) -> None:
+    """Run a warm analysis daemon that other CLI invocations forward to.
+
+    While it runs, ``python -m analysis.cli <command>`` sends its arguments to
+    the daemon over a Unix socket instead of starting from scratch. Set
+    CRIME_ANALYSIS_NO_DAEMON=1 to bypass it.
+
+    Returns:
+        None: Blocks until stopped with --stop or Ctrl+C.
+    """
+    from analysis.cli import daemon
+
+    path = socket_file or daemon.socket_path()
+    if stop:
+        if daemon.stop(path):
+            console.print(f"[green]Daemon on {path} stopped[/green]")
+        else:
+            console.print(f"[yellow]No daemon running on {path}[/yellow]")
+        return
+
+    console.print(f"[bold blue]Serving analysis commands on[/bold blue] [cyan]{path}[/cyan]")
+    console.print("Stop with Ctrl+C or: python -m analysis.cli serve --stop")
+    try:
+        daemon.serve(path, preload=preload)
+    except RuntimeError as exc:
+        console.print(f"[red]{exc}[/red]")
+        raise typer.Exit(code=1) from exc
+    except KeyboardInterrupt:
+        console.print("Daemon stopped")
+
+
 if __name__ == "__main__":
     app()
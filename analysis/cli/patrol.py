@@ -12,7 +12,6 @@ See CLAUDE.md for usage examples and operational guidance.
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
-import matplotlib.pyplot as plt
 import typer
 from rich.console import Console
 from rich.progress import (
@@ -24,19 +23,20 @@ from rich.progress import (
     TimeRemainingColumn,
 )
 
-from analysis.config import SEVERITY_WEIGHTS
 from analysis.config.schemas.patrol import (
     CensusConfig,
     DistrictConfig,
     HotspotsConfig,
     RobberyConfig,
 )
-from analysis.visualization import plot_bar, save_figure
+from analysis.utils.classification import severity_weights
+from analysis.visualization import plot_bar, render_figure
 
 app = typer.Typer(help="Patrol operations analyses")
 console = Console()
 
 if TYPE_CHECKING:
+    from matplotlib.figure import Figure
     from pandas import DataFrame
 
 
@@ -50,6 +50,7 @@ def hotspots(
 ) -> None:
     """Identify crime hotspots using spatial clustering."""
     from analysis.data.loading import load_crime_data
+    from analysis.data.sampling import incident_weights, load_crime_sample
 
     config = HotspotsConfig(
         eps_degrees=eps,
@@ -80,9 +81,7 @@ def hotspots(
 
         # Stage 1: Load data
         progress.update(load_task, visible=True)
-        df: DataFrame = load_crime_data()
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42).copy()
+        df: DataFrame = load_crime_sample(config.fast_sample_frac) if fast else load_crime_data()
         progress.update(load_task, advance=100, description="Data loaded")
 
         # Stage 2: Clean coordinates
@@ -94,6 +93,7 @@ def hotspots(
             (df["point_x"].between(config.lon_min, config.lon_max))
             & (df["point_y"].between(config.lat_min, config.lat_max))
         ].dropna(subset=["point_x", "point_y"])
+        weights = incident_weights(df)
 
         progress.update(clean_task, advance=100, description=f"Cleaned to {len(df)} valid points")
 
@@ -106,10 +106,11 @@ def hotspots(
 
             coords = df[["point_x", "point_y"]].values
             clustering = DBSCAN(eps=config.eps_degrees, min_samples=config.min_samples)
-            df["cluster"] = clustering.fit_predict(coords)
+            # Sample weights count towards min_samples, so fast mode finds the same cores
+            df["cluster"] = clustering.fit_predict(coords, sample_weight=weights)
 
             n_clusters = len(set(df["cluster"])) - (1 if -1 in df["cluster"].values else 0)
-            n_noise = list(df["cluster"]).count(-1)
+            n_noise = weights[df["cluster"] == -1].sum()
 
             progress.update(cluster_task, advance=100, description=f"Found {n_clusters} clusters")
 
@@ -119,7 +120,7 @@ def hotspots(
             )
             df["cluster"] = -1
             n_clusters = 0
-            n_noise = len(df)
+            n_noise = weights.sum()
 
         # Stage 4: Save outputs
         progress.update(output_task, visible=True)
@@ -128,12 +129,17 @@ def hotspots(
 
         # Create figure: cluster sizes bar plot (if clusters found)
         if n_clusters > 0:
-            cluster_sizes = df[df["cluster"] != -1].groupby("cluster").size()
+            clustered = df["cluster"] != -1
+            cluster_sizes = weights[clustered].groupby(df.loc[clustered, "cluster"]).sum()
             cluster_df = cluster_sizes.reset_index()
             cluster_df.columns = ["cluster", "incidents"]
 
-            fig = plot_bar(
+            figure_path = output_path / f"{config.report_name}_clusters.{config.output_format}"
+            render_figure(
+                plot_bar,
                 cluster_df,
+                figure_path,
+                output_format=config.output_format,
                 x_col="cluster",
                 y_col="incidents",
                 title="Crime Hotspot Cluster Sizes",
@@ -141,10 +147,6 @@ def hotspots(
                 ylabel="Number of Incidents",
             )
 
-            figure_path = output_path / f"{config.report_name}_clusters.{config.output_format}"
-            save_figure(fig, figure_path, output_format=config.output_format)
-            plt.close(fig)
-
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
             f.write("Hotspots Analysis Summary\n")
@@ -153,9 +155,9 @@ def hotspots(
             f.write(f"  eps: {config.eps_degrees} degrees\n")
             f.write(f"  min_samples: {config.min_samples}\n")
             f.write("\nResults:\n")
-            f.write(f"  Total points: {len(df)}\n")
+            f.write(f"  Total points: {weights.sum():,.0f}\n")
             f.write(f"  Clusters found: {n_clusters}\n")
-            f.write(f"  Noise points: {n_noise}\n")
+            f.write(f"  Noise points: {n_noise:,.0f}\n")
 
         progress.update(output_task, advance=100, description="Outputs saved")
 
@@ -165,6 +167,23 @@ def hotspots(
     console.print(f"  Output directory: [cyan]{output_path}[/cyan]")
 
 
+def _plot_robbery_heatmap(heatmap_data: "DataFrame") -> "Figure":
+    """Draw the time-bin x hour robbery heatmap (module-level so workers can pickle it)."""
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    from analysis.visualization import setup_style
+
+    setup_style()
+    fig, ax = plt.subplots(figsize=(12, 8))
+    sns.heatmap(heatmap_data, cmap="YlOrRd", annot=False, ax=ax)
+    ax.set_title("Robbery Temporal Heatmap", fontsize=14, fontweight="bold", pad=20)
+    ax.set_xlabel("Hour of Day")
+    ax.set_ylabel("Time Bin")
+    plt.tight_layout()
+    return fig
+
+
 @app.command(name="robbery-heatmap")
 def robbery_heatmap(
     time_bin: int = typer.Option(60, help="Time bin size in minutes"),
@@ -174,9 +193,8 @@ def robbery_heatmap(
     output_format: Literal["png", "svg", "pdf"] = typer.Option("png", help="Figure output format"),
 ) -> None:
     """Generate temporal heatmap for robbery incidents."""
-    import pandas as pd
-
-    from analysis.data.loading import load_crime_data
+    from analysis.data.cube import build_count_cube, load_count_cube
+    from analysis.data.sampling import SAMPLE_WEIGHT_COL, load_crime_sample
 
     config = RobberyConfig(
         time_bin_size=time_bin, grid_size=grid_size, version=version, output_format=output_format
@@ -196,21 +214,26 @@ def robbery_heatmap(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df: DataFrame = load_crime_data()
         if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42).copy()
+            sample = load_crime_sample(config.fast_sample_frac)
+            cube = build_count_cube(sample, weight_col=SAMPLE_WEIGHT_COL)
+        else:
+            cube = load_count_cube()
         progress.update(load_task, advance=100)
 
         filter_task = progress.add_task("Filtering robbery incidents...", total=100)
 
-        # Filter for robbery (UCR code 300-399)
-        df = df[df["ucr_general"].between(300, 399)].copy()
-
-        # Add time column
-        df["hour"] = pd.to_datetime(df["dispatch_date"]).dt.hour
-        df["time_bin"] = (df["hour"] * 60) // config.time_bin_size
+        # Robbery is UCR band 300 (codes 300-399); the cube's hour axis comes
+        # from dispatch_time and leaves out incidents without a known hour
+        hourly_counts = cube.hourly_counts(bands=[300]).set_index("hour")["count"]
+        hourly_counts = hourly_counts[hourly_counts > 0]
+        hours = hourly_counts.index.to_series()
+        time_bins = (hours * 60 // config.time_bin_size).rename("time_bin")
+        total_robberies = hourly_counts.sum()
 
-        progress.update(filter_task, advance=100, description=f"Found {len(df)} robbery incidents")
+        progress.update(
+            filter_task, advance=100, description=f"Found {total_robberies:,.0f} robbery incidents"
+        )
 
         output_task = progress.add_task("Saving outputs...", total=100)
         output_path = Path(config.output_dir) / config.version / "patrol"
@@ -218,30 +241,23 @@ def robbery_heatmap(
 
         # Create figure: temporal heatmap (if seaborn available)
         try:
-            import matplotlib.pyplot as plt
-            import seaborn as sns  # noqa: F401
-
-            from analysis.visualization import setup_style
+            import seaborn  # noqa: F401
 
             # Create pivot table for heatmap
-            heatmap_data = df.groupby(["time_bin", "hour"]).size().unstack(fill_value=0)
+            heatmap_data = hourly_counts.groupby([time_bins, hours]).sum().unstack(fill_value=0)
 
             # Filter out empty rows/columns to avoid NaN warnings
             heatmap_data = heatmap_data.loc[(heatmap_data.sum(axis=1) > 0), :]
             heatmap_data = heatmap_data.loc[:, (heatmap_data.sum(axis=0) > 0)]
 
             if not heatmap_data.empty and heatmap_data.sum().sum() > 0:
-                setup_style()
-                fig, ax = plt.subplots(figsize=(12, 8))
-                sns.heatmap(heatmap_data, cmap="YlOrRd", annot=False, ax=ax)
-                ax.set_title("Robbery Temporal Heatmap", fontsize=14, fontweight="bold", pad=20)
-                ax.set_xlabel("Hour of Day")
-                ax.set_ylabel("Time Bin")
-                plt.tight_layout()
-
                 figure_path = output_path / f"{config.report_name}_heatmap.{config.output_format}"
-                save_figure(fig, figure_path, output_format=config.output_format)
-                plt.close(fig)
+                render_figure(
+                    _plot_robbery_heatmap,
+                    heatmap_data,
+                    figure_path,
+                    output_format=config.output_format,
+                )
         except (ImportError, RuntimeError):
             pass  # Skip heatmap if seaborn not available or data invalid
 
@@ -250,9 +266,8 @@ def robbery_heatmap(
             f.write("Robbery Heatmap Analysis Summary\n")
             f.write("=" * 40 + "\n")
             f.write(f"Time bin size: {config.time_bin_size} minutes\n")
-            f.write(f"Total robbery incidents: {len(df)}\n")
+            f.write(f"Total robbery incidents: {total_robberies:,.0f}\n")
             f.write("\nIncidents by hour:\n")
-            hourly_counts = df.groupby("hour").size()
             for hour, count in hourly_counts.items():
                 f.write(f"  {hour:02d}:00 - {count:,.0f}\n")
 
@@ -260,7 +275,7 @@ def robbery_heatmap(
 
     console.print()
     console.print("[green]:heavy_check_mark:[/green] [bold green]Analysis complete[/bold green]")
-    console.print(f"  Total robbery incidents: [cyan]{len(df)}[/cyan]")
+    console.print(f"  Total robbery incidents: [cyan]{total_robberies:,.0f}[/cyan]")
 
 
 @app.command(name="district-severity")
@@ -272,6 +287,7 @@ def district_severity(
 ) -> None:
     """Calculate severity scores by police district."""
     from analysis.data.loading import load_crime_data
+    from analysis.data.sampling import incident_weights, load_crime_sample
 
     config = DistrictConfig(districts=districts, version=version, output_format=output_format)
 
@@ -288,9 +304,7 @@ def district_severity(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df: DataFrame = load_crime_data()
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42).copy()
+        df: DataFrame = load_crime_sample(config.fast_sample_frac) if fast else load_crime_data()
         progress.update(load_task, advance=100)
 
         score_task = progress.add_task("Calculating severity scores...", total=100)
@@ -300,8 +314,9 @@ def district_severity(
             df = df[df["dc_dist"].isin(config.districts)]
 
         # Calculate severity scores
-        df["ucr_hundred"] = (df["ucr_general"] // 100) * 100
-        df["severity_weight"] = df["ucr_hundred"].map(SEVERITY_WEIGHTS).fillna(1.0)
+        df["severity_weight"] = (
+            severity_weights(df["ucr_general"], fill_value=1.0) * incident_weights(df).to_numpy()
+        )
 
         district_scores = (
             df.groupby("dc_dist")["severity_weight"].sum().sort_values(ascending=False)
@@ -322,8 +337,12 @@ def district_severity(
         # Top 10 districts
         top_districts = district_df.head(10)
 
-        fig = plot_bar(
+        figure_path = output_path / f"{config.report_name}_severity.{config.output_format}"
+        render_figure(
+            plot_bar,
             top_districts,
+            figure_path,
+            output_format=config.output_format,
             x_col="district",
             y_col="severity_score",
             title="District Severity Scores (Top 10)",
@@ -331,9 +350,6 @@ def district_severity(
             ylabel="Severity Score",
         )
 
-        figure_path = output_path / f"{config.report_name}_severity.{config.output_format}"
-        save_figure(fig, figure_path, output_format=config.output_format)
-
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
             f.write("District Severity Analysis Summary\n")
@@ -359,6 +375,7 @@ def census_rates(
 ) -> None:
     """Calculate crime rates per census tract."""
     from analysis.data.loading import load_crime_data
+    from analysis.data.sampling import incident_weights, load_crime_sample
     from analysis.utils.spatial import load_boundaries
 
     config = CensusConfig(
@@ -378,9 +395,9 @@ def census_rates(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        crime_df: DataFrame = load_crime_data()
-        if fast:
-            crime_df = crime_df.sample(frac=config.fast_sample_frac, random_state=42).copy()
+        crime_df: DataFrame = (
+            load_crime_sample(config.fast_sample_frac) if fast else load_crime_data()
+        )
         progress.update(load_task, advance=100)
 
         boundary_task = progress.add_task("Loading census boundaries...", total=100)
@@ -400,7 +417,10 @@ def census_rates(
         # Aggregate by available geographic unit
         if census_gdf is not None and "GEOID" in crime_df.columns:
             # Join with census data
-            tract_counts = crime_df.groupby("GEOID")["objectid"].count()
+            has_id = crime_df["objectid"].notna()
+            tract_counts = (
+                incident_weights(crime_df)[has_id].groupby(crime_df.loc[has_id, "GEOID"]).sum()
+            )
         else:
             # Fallback: use point-based aggregation
             console.print("[yellow]Using spatial aggregation fallback[/yellow]")
@@ -417,7 +437,7 @@ def census_rates(
             f.write("Census Rates Analysis Summary\n")
             f.write("=" * 40 + "\n")
             f.write(f"Population threshold: {config.population_threshold}\n")
-            f.write(f"Total incidents: {len(crime_df):,.0f}\n")
+            f.write(f"Total incidents: {incident_weights(crime_df).sum():,.0f}\n")
             if tract_counts is not None:
                 f.write("\nTop 10 tracts by incident count:\n")
                 for tract, count in tract_counts.head(10).items():
@@ -12,7 +12,7 @@ See CLAUDE.md for usage examples and policy analysis workflow notes.
 from pathlib import Path
 from typing import Literal
 
-import matplotlib.pyplot as plt
+import pandas as pd
 import typer
 from rich.console import Console
 from rich.progress import (
@@ -30,10 +30,18 @@ from analysis.config.schemas.policy import (
     RetailTheftConfig,
     VehicleCrimesConfig,
 )
+from analysis.data.cube import build_count_cube, load_count_cube
 from analysis.data.loading import load_crime_data
 from analysis.data.preprocessing import filter_by_date_range
-from analysis.utils.temporal import extract_temporal_features
-from analysis.visualization import plot_bar, plot_line, save_figure
+from analysis.data.sampling import SAMPLE_WEIGHT_COL, incident_weights, load_crime_sample
+from analysis.event_utils import (
+    ALL_CRIMES,
+    calculate_event_impact_by_type,
+    daily_category_counts,
+    get_event_windows,
+    load_event_data,
+)
+from analysis.visualization import plot_bar, plot_line, render_figure
 
 app = typer.Typer(help="Policy evaluation analyses")
 console = Console()
@@ -67,9 +75,7 @@ def retail_theft(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df = load_crime_data()
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42)
+        df = load_crime_sample(config.fast_sample_frac) if fast else load_crime_data()
         progress.update(load_task, advance=100)
 
         filter_task = progress.add_task("Filtering theft incidents...", total=100)
@@ -81,10 +87,12 @@ def retail_theft(
         baseline_df = filter_by_date_range(
             theft_df, config.baseline_start, config.baseline_end, date_col="dispatch_date"
         )
-        baseline_avg = len(baseline_df)
+        baseline_avg = incident_weights(baseline_df).sum()
+        theft_weights = incident_weights(theft_df)
+        total_thefts = theft_weights.sum()
 
         progress.update(
-            filter_task, advance=100, description=f"Found {len(theft_df)} theft incidents"
+            filter_task, advance=100, description=f"Found {total_thefts:,.0f} theft incidents"
         )
 
         output_task = progress.add_task("Saving outputs...", total=100)
@@ -92,15 +100,18 @@ def retail_theft(
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Create figure: monthly trend line plot
-        theft_df = extract_temporal_features(theft_df)
-        monthly_theft = theft_df.groupby(theft_df["dispatch_date"].dt.to_period("M")).size()
+        monthly_theft = theft_weights.groupby(theft_df["dispatch_date"].dt.to_period("M")).sum()
 
         monthly_df = monthly_theft.reset_index()
         monthly_df.columns = ["date", "incidents"]
         monthly_df["date"] = monthly_df["date"].dt.to_timestamp()
 
-        fig = plot_line(
+        figure_path = output_path / f"{config.report_name}_trend.{config.output_format}"
+        render_figure(
+            plot_line,
             monthly_df,
+            figure_path,
+            output_format=config.output_format,
             x_col="date",
             y_col="incidents",
             title="Retail Theft Trends",
@@ -108,17 +119,13 @@ def retail_theft(
             ylabel="Number of Incidents",
         )
 
-        figure_path = output_path / f"{config.report_name}_trend.{config.output_format}"
-        save_figure(fig, figure_path, output_format=config.output_format)
-        plt.close(fig)
-
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
             f.write("Retail Theft Analysis Summary\n")
             f.write("=" * 40 + "\n")
             f.write(f"Baseline period: {config.baseline_start} to {config.baseline_end}\n")
             f.write(f"Baseline average: {baseline_avg:,.0f} incidents\n")
-            f.write(f"Total theft incidents (all time): {len(theft_df):,.0f}\n")
+            f.write(f"Total theft incidents (all time): {total_thefts:,.0f}\n")
 
         progress.update(output_task, advance=100)
 
@@ -131,15 +138,19 @@ def vehicle_crimes(
     ucr_codes: list[int] = typer.Option([700], help="UCR codes for vehicle crimes"),
     start_date: str = typer.Option("2019-01-01", help="Analysis start date"),
     end_date: str = typer.Option("2023-12-31", help="Analysis end date"),
+    buffer_m: float = typer.Option(500.0, help="Corridor buffer distance in metres"),
     version: str = typer.Option("v1.0", help="Output version tag"),
     fast: bool = typer.Option(False, "--fast", help="Fast mode with 10% sample"),
     output_format: Literal["png", "svg", "pdf"] = typer.Option("png", help="Figure output format"),
 ) -> None:
-    """Analyze vehicle crime trends."""
+    """Analyze vehicle crime trends and proximity to transit/highway corridors."""
+    from analysis.utils.corridors import build_corridor_index, corridor_crime_stats
+
     config = VehicleCrimesConfig(
         ucr_codes=ucr_codes,
         start_date=start_date,
         end_date=end_date,
+        corridor_buffer_m=buffer_m,
         version=version,
         output_format=output_format,
     )
@@ -147,6 +158,7 @@ def vehicle_crimes(
     console.print("[bold blue]Vehicle Crimes Analysis[/bold blue]")
     console.print(f"  UCR codes: {config.ucr_codes}")
     console.print(f"  Period: {config.start_date} to {config.end_date}")
+    console.print(f"  Corridor buffer: {config.corridor_buffer_m:g} m")
     console.print()
 
     with Progress(
@@ -157,9 +169,7 @@ def vehicle_crimes(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df = load_crime_data()
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42)
+        df = load_crime_sample(config.fast_sample_frac) if fast else load_crime_data()
         progress.update(load_task, advance=100)
 
         filter_task = progress.add_task("Filtering vehicle crimes...", total=100)
@@ -172,8 +182,26 @@ def vehicle_crimes(
             vehicle_df, config.start_date, config.end_date, date_col="dispatch_date"
         )
 
+        vehicle_weights = incident_weights(vehicle_df)
+        total_vehicle = vehicle_weights.sum()
+
         progress.update(
-            filter_task, advance=100, description=f"Found {len(vehicle_df)} vehicle crime incidents"
+            filter_task,
+            advance=100,
+            description=f"Found {total_vehicle:,.0f} vehicle crime incidents",
+        )
+
+        corridor_task = progress.add_task("Indexing corridors...", total=100)
+        corridor_index = build_corridor_index(buffer_m=config.corridor_buffer_m)
+        per_corridor, corridor_summary = corridor_crime_stats(
+            vehicle_df,
+            corridor_index,
+            weight_col=SAMPLE_WEIGHT_COL if SAMPLE_WEIGHT_COL in vehicle_df.columns else None,
+        )
+        progress.update(
+            corridor_task,
+            advance=100,
+            description=f"{corridor_summary['pct_within']:.1f}% within corridor buffers",
         )
 
         output_task = progress.add_task("Saving outputs...", total=100)
@@ -181,15 +209,20 @@ def vehicle_crimes(
         output_path.mkdir(parents=True, exist_ok=True)
 
         # Create figure: monthly trend line plot
-        vehicle_df = extract_temporal_features(vehicle_df)
-        monthly_vehicle = vehicle_df.groupby(vehicle_df["dispatch_date"].dt.to_period("M")).size()
+        monthly_vehicle = vehicle_weights.groupby(
+            vehicle_df["dispatch_date"].dt.to_period("M")
+        ).sum()
 
         monthly_df = monthly_vehicle.reset_index()
         monthly_df.columns = ["date", "incidents"]
         monthly_df["date"] = monthly_df["date"].dt.to_timestamp()
 
-        fig = plot_line(
+        figure_path = output_path / f"{config.report_name}_trend.{config.output_format}"
+        render_figure(
+            plot_line,
             monthly_df,
+            figure_path,
+            output_format=config.output_format,
             x_col="date",
             y_col="incidents",
             title="Vehicle Crime Trends",
@@ -197,9 +230,10 @@ def vehicle_crimes(
             ylabel="Number of Incidents",
         )
 
-        figure_path = output_path / f"{config.report_name}_trend.{config.output_format}"
-        save_figure(fig, figure_path, output_format=config.output_format)
-        plt.close(fig)
+        per_corridor.to_csv(output_path / "vehicle_crimes_per_corridor.csv", index=False)
+        pd.DataFrame([corridor_summary]).to_csv(
+            output_path / "vehicle_crimes_corridor_stats.csv", index=False
+        )
 
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
@@ -207,7 +241,12 @@ def vehicle_crimes(
             f.write("=" * 40 + "\n")
             f.write(f"UCR codes: {config.ucr_codes}\n")
             f.write(f"Period: {config.start_date} to {config.end_date}\n")
-            f.write(f"Total incidents: {len(vehicle_df):,.0f}\n")
+            f.write(f"Total incidents: {total_vehicle:,.0f}\n")
+            f.write(
+                f"Within {config.corridor_buffer_m:g} m of a corridor: "
+                f"{corridor_summary['within_buffer']:,} "
+                f"({corridor_summary['pct_within']:.1f}%)\n"
+            )
 
         progress.update(output_task, advance=100)
 
@@ -237,9 +276,7 @@ def composition(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df = load_crime_data()
-        if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42)
+        df = load_crime_sample(config.fast_sample_frac) if fast else load_crime_data()
         progress.update(load_task, advance=100)
 
         classify_task = progress.add_task("Classifying crimes...", total=100)
@@ -249,9 +286,15 @@ def composition(
         df["ucr_hundred"] = (df["ucr_general"] // 100) * 100
 
         # Get top categories
-        top_categories = df["ucr_hundred"].value_counts().head(config.top_n)
+        weights = incident_weights(df)
+        total_incidents = weights.sum()
+        top_categories = (
+            weights.groupby(df["ucr_hundred"]).sum().sort_values(ascending=False).head(config.top_n)
+        )
 
-        progress.update(classify_task, advance=100, description=f"Classified {len(df)} incidents")
+        progress.update(
+            classify_task, advance=100, description=f"Classified {total_incidents:,.0f} incidents"
+        )
 
         output_task = progress.add_task("Saving outputs...", total=100)
         output_path = Path(config.output_dir) / config.version / "policy"
@@ -261,8 +304,12 @@ def composition(
         top_df = top_categories.reset_index()
         top_df.columns = ["ucr_code", "incidents"]
 
-        fig = plot_bar(
+        figure_path = output_path / f"{config.report_name}_categories.{config.output_format}"
+        render_figure(
+            plot_bar,
             top_df,
+            figure_path,
+            output_format=config.output_format,
             x_col="ucr_code",
             y_col="incidents",
             title=f"Top {config.top_n} Crime Categories",
@@ -270,10 +317,6 @@ def composition(
             ylabel="Number of Incidents",
         )
 
-        figure_path = output_path / f"{config.report_name}_categories.{config.output_format}"
-        save_figure(fig, figure_path, output_format=config.output_format)
-        plt.close(fig)
-
         summary_file = output_path / f"{config.report_name}_summary.txt"
         with open(summary_file, "w") as f:
             f.write("Crime Composition Analysis Summary\n")
@@ -281,7 +324,8 @@ def composition(
             f.write(f"Top {config.top_n} crime categories (UCR hundred-band):\n")
             for ucr_code, count in top_categories.items():
                 ucr_name = f"{ucr_code:03d}-Series"
-                f.write(f"  {ucr_name}: {count:,.0f} incidents ({count / len(df) * 100:.1f}%)\n")
+                share = count / total_incidents * 100
+                f.write(f"  {ucr_name}: {count:,.0f} incidents ({share:.1f}%)\n")
 
         progress.update(output_task, advance=100)
 
@@ -314,25 +358,32 @@ def events(
         TimeRemainingColumn(),
     ) as progress:
         load_task = progress.add_task("Loading data...", total=100)
-        df = load_crime_data()
         if fast:
-            df = df.sample(frac=config.fast_sample_frac, random_state=42)
+            sample = load_crime_sample(config.fast_sample_frac)
+            cube = build_count_cube(sample, weight_col=SAMPLE_WEIGHT_COL)
+        else:
+            cube = load_count_cube()
         progress.update(load_task, advance=100)
 
         analyze_task = progress.add_task("Analyzing event patterns...", total=100)
 
-        # Try to load event data
+        # Daily counts per category are computed once and shared by every event type
+        daily = daily_category_counts(cube)
         try:
-            from analysis.event_utils import get_event_windows, load_event_data
-
             events_df = load_event_data()
             event_windows = get_event_windows(events_df, config.days_before, config.days_after)
-
             console.print(f"[green]Loaded {len(event_windows)} event windows[/green]")
-        except (ImportError, FileNotFoundError) as e:
+            impact = calculate_event_impact_by_type(
+                None,
+                events_df,
+                daily_counts=daily,
+                days_before=config.days_before,
+                days_after=config.days_after,
+            )
+        except FileNotFoundError as e:
             console.print(f"[yellow]Warning: Could not load event data: {e}[/yellow]")
-            console.print("[yellow]Using temporal aggregation instead[/yellow]")
             event_windows = None
+            impact = None
 
         progress.update(analyze_task, advance=100)
 
@@ -347,9 +398,22 @@ def events(
             f.write(
                 f"Event window: {config.days_before} days before, {config.days_after} days after\n"
             )
-            f.write(f"Total incidents in dataset: {len(df):,.0f}\n")
+            f.write(f"Total incidents in dataset: {daily[ALL_CRIMES].sum():,.0f}\n")
             if event_windows is not None:
                 f.write(f"Event windows analyzed: {len(event_windows)}\n")
+            if impact is not None and not impact.empty:
+                f.write("\nDaily incidents in event windows vs all other days:\n")
+                for row in impact.itertuples():
+                    if pd.isna(row.difference):
+                        f.write(f"  {row.event_type}: no event or control days in data\n")
+                        continue
+                    p_value = "n/a" if pd.isna(row.p_value) else f"{row.p_value:.3f}"
+                    marker = " *" if row.significant else ""
+                    f.write(
+                        f"  {row.event_type}: {row.event_mean:.1f} vs {row.control_mean:.1f} "
+                        f"({row.difference:+.1f}, p={p_value}){marker}\n"
+                    )
+                impact.to_csv(output_path / f"{config.report_name}_by_type.csv", index=False)
 
         progress.update(output_task, advance=100)
 
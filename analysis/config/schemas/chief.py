@@ -45,5 +45,8 @@ class COVIDConfig(BaseConfig):
     before_years: list[int] = Field(default=[2018, 2019])
     after_years: list[int] = Field(default=[2021, 2022])
 
+    # Bootstrap replicates for the before/after daily-mean interval
+    n_resamples: int = Field(default=2000, ge=100, le=100_000)
+
     # Output
     report_name: str = "covid_impact_report"
@@ -14,8 +14,8 @@ class TimeSeriesConfig(BaseConfig):
     forecast_horizon: int = Field(default=12, ge=1, le=52)  # weeks/months
     forecast_test_size: float = Field(default=0.2, ge=0.1, le=0.5)
 
-    # Model selection
-    model_type: str = Field(default="prophet", pattern="^(prophet|arima|ets)$")
+    # Model selection: Prophet, or a built-in baseline from analysis.models.time_series
+    model_type: str = Field(default="prophet", pattern="^(prophet|arima|ets|naive|regression)$")
 
     # Output
     report_name: str = "forecast_report"
@@ -36,6 +36,9 @@ class VehicleCrimesConfig(BaseConfig):
     start_date: str = "2019-01-01"
     end_date: str = "2023-12-31"
 
+    # Corridor proximity: incidents within this many metres of a corridor count as "near"
+    corridor_buffer_m: float = Field(default=500.0, gt=0, le=5000)
+
     # Output
     report_name: str = "vehicle_crimes_report"
     output_format: Literal["png", "svg", "pdf"] = "png"
@@ -7,6 +7,9 @@ Modules:
     loading: Data loading with joblib caching
     validation: Pydantic validators for crime incident data
     preprocessing: Filtering, aggregation, and data preparation
+    cube: Pre-aggregated incident count cubes
+    sampling: Stratified, weighted sample for fast mode
+    quality: Data-quality profile exported on each refresh
 
 Example:
     >>> from analysis.data.loading import load_crime_data
@@ -20,7 +23,16 @@ See CLAUDE.md for usage guidance and CLI workflow examples.
 # Exports from loading.py
 # Exports from cache.py
 from analysis.data.cache import clear_cache, memory
-from analysis.data.loading import load_boundaries, load_crime_data, load_external_data
+
+# Exports from cube.py
+from analysis.data.cube import CountCube, build_count_cube, load_count_cube
+from analysis.data.loading import (
+    crime_data_version,
+    keep_crime_data_in_memory,
+    load_boundaries,
+    load_crime_data,
+    load_external_data,
+)
 
 # Exports from preprocessing.py
 from analysis.data.preprocessing import (
@@ -29,6 +41,18 @@ from analysis.data.preprocessing import (
     filter_by_date_range,
 )
 
+# Exports from quality.py
+from analysis.data.quality import build_quality_profile
+
+# Exports from sampling.py
+from analysis.data.sampling import (
+    SAMPLE_WEIGHT_COL,
+    build_sample_index,
+    incident_weights,
+    load_crime_sample,
+    load_sample_index,
+)
+
 # Exports from validation.py
 from analysis.data.validation import (
     PHILLY_LAT_MAX,
@@ -36,6 +60,9 @@ from analysis.data.validation import (
     PHILLY_LON_MAX,
     PHILLY_LON_MIN,
     CrimeIncidentValidator,
+    RuleViolation,
+    ValidationReport,
+    check_crime_data,
     validate_coordinates,
     validate_crime_data,
 )
@@ -44,14 +71,28 @@ __all__ = [
     "load_crime_data",
     "load_boundaries",
     "load_external_data",
+    "keep_crime_data_in_memory",
+    "crime_data_version",
     "memory",
     "clear_cache",
     "CrimeIncidentValidator",
+    "RuleViolation",
+    "ValidationReport",
+    "check_crime_data",
     "validate_crime_data",
     "validate_coordinates",
     "filter_by_date_range",
     "aggregate_by_period",
     "add_temporal_features",
+    "CountCube",
+    "build_count_cube",
+    "load_count_cube",
+    "build_quality_profile",
+    "SAMPLE_WEIGHT_COL",
+    "build_sample_index",
+    "incident_weights",
+    "load_crime_sample",
+    "load_sample_index",
     "PHILLY_LON_MIN",
     "PHILLY_LON_MAX",
     "PHILLY_LAT_MIN",
@@ -0,0 +1,407 @@
+"""Pre-aggregated incident count cubes.
+
+This module builds dense incident count arrays once per dataset version so
+period counts can be answered without rescanning the raw incidents. The
+chief commands (trends, seasonality, covid), the patrol robbery heatmap and
+the policy event-impact command read their counts from it; analyses that
+filter on offense text, coordinates or other columns the cube doesn't keep
+still count the raw incidents.
+
+Functions:
+    build_count_cube: Count incidents into a CountCube in a single pass
+    load_count_cube: Cached CountCube for the canonical dataset
+
+A CountCube holds two dense arrays that share a daily time axis:
+- daily: day x UCR hundred-band x police district
+- hourly: day x hour of day x UCR hundred-band
+
+A single day x hour x band x district array would be roughly 20 years x
+24 x 27 x 25 cells (hundreds of MB), so the hour and district axes are
+kept in separate cubes. Every roll-up in this module needs at most one of
+the two.
+
+Band ``b`` covers UCR codes ``b*100`` to ``b*100 + 99``. Band 0 also holds
+missing or unparseable codes, so band totals add up to the incident count.
+
+See CLAUDE.md for usage guidance and CLI workflow examples.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from analysis.utils.classification import CRIME_CATEGORIES, CRIME_CATEGORY_MAP
+from analysis.utils.temporal import extract_temporal_features
+
+from .cache import memory
+from .loading import crime_data_version, load_crime_data
+
+# Highest band kept separately; ucr_general is validated to 100-9999
+MAX_UCR_BAND: int = 99
+
+# Roll-up frequency -> (pandas period frequency, label with period end)
+_PERIODS: dict[str, tuple[str, bool]] = {
+    "D": ("D", False),
+    "W": ("W-SUN", True),
+    "ME": ("M", True),
+    "MS": ("M", False),
+    "QE": ("Q", True),
+    "QS": ("Q", False),
+    "YE": ("Y", True),
+    "YS": ("Y", False),
+}
+
+_BY_DAILY = ("ucr_band", "crime_category", "dc_dist")
+_BY_HOURLY = ("day_of_week", "month", "ucr_band", "crime_category")
+
+
+def _count_dtype(counts: np.ndarray) -> np.ndarray:
+    """Store counts as uint16 when they fit, halving the cube size."""
+    if counts.size == 0 or counts.max() <= np.iinfo(np.uint16).max:
+        return counts.astype(np.uint16)
+    return counts.astype(np.int32)
+
+
+@dataclass(frozen=True)
+class CountCube:
+    """Dense incident counts on a daily time axis.
+
+    Attributes:
+        start: First day covered by the cube (midnight).
+        districts: District labels for the last axis of ``daily``.
+        daily: Counts with shape ``(n_days, n_bands, n_districts)``.
+        hourly: Counts with shape ``(n_days, 24, n_bands)``. Incidents
+            without a known hour are left out.
+    """
+
+    start: pd.Timestamp
+    districts: tuple[Any, ...]
+    daily: np.ndarray
+    hourly: np.ndarray
+
+    @property
+    def days(self) -> pd.DatetimeIndex:
+        """Calendar days along the first axis."""
+        return pd.date_range(self.start, periods=self.daily.shape[0], freq="D")
+
+    @property
+    def bands(self) -> np.ndarray:
+        """UCR hundred-band values (0, 100, 200, ...) along the band axis."""
+        return np.arange(self.daily.shape[1]) * 100
+
+    def _day_slice(self, start: str | None, end: str | None) -> slice:
+        """Day-axis slice for an inclusive ``[start, end]`` date range."""
+        n_days = self.daily.shape[0]
+        lo = 0 if start is None else (pd.Timestamp(start).normalize() - self.start).days
+        hi = n_days if end is None else (pd.Timestamp(end).normalize() - self.start).days + 1
+        return slice(min(max(lo, 0), n_days), min(max(hi, 0), n_days))
+
+    def _band_mask(self, bands: Sequence[int] | None) -> np.ndarray:
+        """Boolean mask over the band axis for hundred-band values."""
+        if bands is None:
+            return np.ones(self.daily.shape[1], dtype=bool)
+        return np.isin(self.bands, [band // 100 * 100 for band in bands])
+
+    def _category_matrix(self) -> np.ndarray:
+        """One-hot ``(n_bands, n_categories)`` map from band to crime category."""
+        matrix = np.zeros((self.daily.shape[1], len(CRIME_CATEGORIES)), dtype=np.int64)
+        matrix[:, CRIME_CATEGORIES.index("Other")] = 1
+        for category, groups in CRIME_CATEGORY_MAP.items():
+            for band in groups:
+                if band < self.daily.shape[1]:
+                    matrix[band] = 0
+                    matrix[band, CRIME_CATEGORIES.index(category)] = 1
+        return matrix
+
+    def total(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        bands: Sequence[int] | None = None,
+    ) -> int:
+        """Count incidents in an inclusive date range.
+
+        Args:
+            start: First day to include. Default is the start of the cube.
+            end: Last day to include. Default is the end of the cube.
+            bands: Hundred-band values (e.g. ``[300]``) to include. Default all.
+
+        Returns:
+            Number of incidents.
+        """
+        window = self.daily[self._day_slice(start, end)][:, self._band_mask(bands)]
+        return int(window.sum(dtype=np.int64))
+
+    def counts(
+        self,
+        freq: str = "D",
+        start: str | None = None,
+        end: str | None = None,
+        by: Sequence[str] = (),
+        bands: Sequence[int] | None = None,
+        date_col: str = "dispatch_date",
+    ) -> pd.DataFrame:
+        """Roll daily counts up to a coarser period.
+
+        Args:
+            freq: Period alias as accepted by ``aggregate_by_period``
+                ("D", "W", "ME", "MS", "QE", "QS", "YE", "YS").
+            start: First day to include. Default is the start of the cube.
+            end: Last day to include. Default is the end of the cube.
+            by: Extra breakdowns, any of "ucr_band", "crime_category", "dc_dist".
+            bands: Hundred-band values to include. Default all.
+            date_col: Name of the period column. Default is "dispatch_date".
+
+        Returns:
+            Long DataFrame with ``date_col``, the ``by`` columns, and ``count``.
+            Periods are labelled like ``pandas.resample``: period start for
+            "D"/"MS"/"QS"/"YS", period end for "W"/"ME"/"QE"/"YE".
+
+        Raises:
+            ValueError: If ``freq`` or a ``by`` entry is not supported.
+
+        Examples:
+            >>> cube = load_count_cube()
+            >>> annual = cube.counts("YE", start="2015-01-01", end="2024-12-31")
+            >>> list(annual.columns)
+            ['dispatch_date', 'count']
+        """
+        _check_by(by, _BY_DAILY)
+        window_days = self._day_slice(start, end)
+        values = self.daily[window_days][:, self._band_mask(bands)].astype(np.int64)
+        band_values = self.bands[self._band_mask(bands)]
+
+        # values: (days, bands, districts) -> keep only the requested axes
+        axes: list[tuple[str, np.ndarray]] = []
+        if "ucr_band" in by:
+            axes.append(("ucr_band", band_values))
+        elif "crime_category" in by:
+            values = np.einsum("dbk,bc->dck", values, self._category_matrix()[band_values // 100])
+            axes.append(("crime_category", np.array(CRIME_CATEGORIES, dtype=object)))
+        else:
+            values = values.sum(axis=1, keepdims=True)
+        if "dc_dist" in by:
+            axes.append(("dc_dist", np.array(self.districts, dtype=object)))
+        else:
+            values = values.sum(axis=2, keepdims=True)
+        values = values.reshape(values.shape[0], -1)
+
+        labels, totals = _roll_up_days(self.days[window_days], values, freq)
+        return _to_long(labels, totals, axes, date_col)
+
+    def hourly_counts(
+        self,
+        start: str | None = None,
+        end: str | None = None,
+        by: Sequence[str] = (),
+        bands: Sequence[int] | None = None,
+    ) -> pd.DataFrame:
+        """Count incidents by hour of day, optionally split further.
+
+        Args:
+            start: First day to include. Default is the start of the cube.
+            end: Last day to include. Default is the end of the cube.
+            by: Extra breakdowns, any of "day_of_week", "month", "ucr_band",
+                "crime_category".
+            bands: Hundred-band values to include. Default all.
+
+        Returns:
+            Long DataFrame with ``hour``, the ``by`` columns, and ``count``,
+            sorted by those columns.
+
+        Raises:
+            ValueError: If a ``by`` entry is not supported.
+        """
+        _check_by(by, _BY_HOURLY)
+        window_days = self._day_slice(start, end)
+        band_mask = self._band_mask(bands)
+        values = self.hourly[window_days][:, :, band_mask].astype(np.int64)
+        band_values = self.bands[band_mask]
+
+        if "ucr_band" in by:
+            band_labels: dict[str, np.ndarray] = {"ucr_band": band_values}
+        elif "crime_category" in by:
+            values = values @ self._category_matrix()[band_values // 100]
+            band_labels = {"crime_category": np.array(CRIME_CATEGORIES, dtype=object)}
+        else:
+            values = values.sum(axis=2, keepdims=True)
+            band_labels = {}
+
+        days = self.days[window_days]
+        n_days, n_hours, n_groups = values.shape
+        frame: dict[str, Any] = {"hour": np.tile(np.repeat(np.arange(24), n_groups), n_days)}
+        for name in ("day_of_week", "month"):
+            if name in by:
+                attribute = days.dayofweek if name == "day_of_week" else days.month
+                frame[name] = np.repeat(np.asarray(attribute), n_hours * n_groups)
+        for name, labels in band_labels.items():
+            frame[name] = np.tile(labels, n_days * n_hours)
+        frame["count"] = values.reshape(-1)
+
+        keys = ["hour", *[name for name in _BY_HOURLY if name in by]]
+        return pd.DataFrame(frame).groupby(keys, sort=True)["count"].sum().reset_index()
+
+
+def _check_by(by: Sequence[str], allowed: tuple[str, ...]) -> None:
+    unknown = [name for name in by if name not in allowed]
+    if unknown:
+        raise ValueError(f"Unsupported breakdown(s) {unknown}. Expected any of {allowed}")
+    if "ucr_band" in by and "crime_category" in by:
+        raise ValueError("Use either 'ucr_band' or 'crime_category', not both")
+
+
+def _roll_up_days(
+    days: pd.DatetimeIndex, values: np.ndarray, freq: str
+) -> tuple[pd.DatetimeIndex, np.ndarray]:
+    """Sum consecutive days that fall into the same period."""
+    if freq not in _PERIODS:
+        raise ValueError(f"Unsupported freq '{freq}'. Expected one of {list(_PERIODS)}")
+    if len(days) == 0:
+        return pd.DatetimeIndex([]), values[:0]
+
+    period_freq, label_end = _PERIODS[freq]
+    periods = days.to_period(period_freq)
+    # Days are consecutive, so each period is one contiguous run
+    starts = np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+    unique_periods = periods[starts]
+    if label_end:
+        labels = unique_periods.to_timestamp(how="end").normalize()
+    else:
+        labels = unique_periods.to_timestamp(how="start")
+    return pd.DatetimeIndex(labels), np.add.reduceat(values, starts, axis=0)
+
+
+def _to_long(
+    labels: pd.DatetimeIndex,
+    totals: np.ndarray,
+    axes: list[tuple[str, np.ndarray]],
+    date_col: str,
+) -> pd.DataFrame:
+    """Flatten ``(periods, *axes)`` totals into a long DataFrame."""
+    index = pd.MultiIndex.from_product(
+        [labels, *[values for _, values in axes]],
+        names=[date_col, *[name for name, _ in axes]],
+    )
+    return pd.DataFrame({"count": totals.reshape(-1)}, index=index).reset_index()
+
+
+def _bincount(flat: np.ndarray, size: int, weights: np.ndarray | None) -> np.ndarray:
+    """Integer cell counts, rounding weighted sums to whole incidents."""
+    if weights is None:
+        return np.bincount(flat, minlength=size)
+    return np.rint(np.bincount(flat, weights=weights, minlength=size)).astype(np.int64)
+
+
+def build_count_cube(
+    df: pd.DataFrame,
+    date_col: str = "dispatch_date",
+    ucr_col: str = "ucr_general",
+    district_col: str = "dc_dist",
+    weight_col: str | None = None,
+) -> CountCube:
+    """Count incidents into a CountCube in a single pass.
+
+    Args:
+        df: Incident data with date, UCR code and district columns. The hour
+            is taken from ``dispatch_time``/``hour`` when present (see
+            ``extract_temporal_features``).
+        date_col: Datetime column. Default is "dispatch_date".
+        ucr_col: UCR code column. Default is "ucr_general".
+        district_col: District column. Default is "dc_dist".
+        weight_col: Optional per-row weight column, e.g. the ``sample_weight``
+            of ``load_crime_sample`` so a sample's cube estimates full counts.
+            Weighted cells are rounded to whole incidents.
+
+    Returns:
+        CountCube covering every day from the first to the last incident.
+        Rows without a parseable date are not counted.
+
+    Raises:
+        ValueError: If a required column is missing.
+    """
+    required = (date_col, ucr_col, district_col, *([weight_col] if weight_col else []))
+    missing = [col for col in required if col not in df.columns]
+    if missing:
+        raise ValueError(f"Columns not found in DataFrame: {missing}")
+
+    dates = pd.to_datetime(df[date_col], errors="coerce")
+    valid = dates.notna().to_numpy()
+    day_values = dates.to_numpy(dtype="datetime64[D]")[valid]
+    if len(day_values) == 0:
+        empty = np.zeros((0, 1, 0), dtype=np.uint16)
+        return CountCube(pd.Timestamp("1970-01-01"), (), empty, np.zeros((0, 24, 1), np.uint16))
+
+    first_day = day_values.min()
+    day = (day_values - first_day).astype(np.int64)
+    n_days = int(day.max()) + 1
+
+    codes = pd.to_numeric(df[ucr_col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        band = np.floor_divide(codes[valid], 100)
+        band = np.where((band >= 0) & (band <= MAX_UCR_BAND), band, 0).astype(np.int64)
+    n_bands = int(band.max()) + 1
+
+    district_codes, districts = pd.factorize(df[district_col], sort=True, use_na_sentinel=False)
+    district = district_codes[valid]
+    n_districts = len(districts)
+    weights = df[weight_col].to_numpy(dtype="float64")[valid] if weight_col else None
+
+    daily = _bincount(
+        (day * n_bands + band) * n_districts + district, n_days * n_bands * n_districts, weights
+    ).reshape(n_days, n_bands, n_districts)
+
+    hour_source = [col for col in (date_col, "dispatch_time", "hour") if col in df.columns]
+    hours = extract_temporal_features(df[hour_source], features=["hour"])["hour"]
+    hour = pd.to_numeric(hours, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    hour = hour[valid]
+    has_hour = (hour >= 0) & (hour < 24)
+    hourly = _bincount(
+        (day[has_hour] * 24 + hour[has_hour].astype(np.int64)) * n_bands + band[has_hour],
+        n_days * 24 * n_bands,
+        None if weights is None else weights[has_hour],
+    ).reshape(n_days, 24, n_bands)
+
+    return CountCube(
+        start=pd.Timestamp(first_day),
+        districts=tuple(districts.tolist()),
+        daily=_count_dtype(daily),
+        hourly=_count_dtype(hourly),
+    )
+
+
+@memory.cache
+def _load_count_cube_cached(_dataset_version: tuple[str, int, int]) -> CountCube:
+    """Build the cube for the canonical dataset (internal, cached).
+
+    ``_dataset_version`` is only part of the cache key: the data path, its
+    mtime and its size, so a rewritten data file gets a fresh cube.
+    """
+    return build_count_cube(load_crime_data(clean=True))
+
+
+def load_count_cube() -> CountCube:
+    """Load the CountCube for the canonical crime dataset.
+
+    The cube is built once per dataset version (data file path, mtime and
+    size) and cached with joblib alongside the loaded data.
+
+    Returns:
+        CountCube for ``load_crime_data(clean=True)``.
+
+    Raises:
+        FileNotFoundError: If the crime data file doesn't exist.
+
+    Example:
+        >>> from analysis.data import load_count_cube
+        >>> cube = load_count_cube()
+        >>> robberies_2020 = cube.total(start="2020-01-01", end="2020-12-31", bands=[300])
+    """
+    return _load_count_cube_cached(crime_data_version())
+
+
+__all__ = ["MAX_UCR_BAND", "CountCube", "build_count_cube", "load_count_cube"]
@@ -5,6 +5,8 @@ datasets, with joblib caching to avoid redundant I/O.
 
 Functions:
     load_crime_data: Load crime incidents from parquet with caching
+    keep_crime_data_in_memory: Share one loaded crime frame across callers
+    crime_data_version: Cache key identifying the current crime data file
     load_boundaries: Load geographic boundary data (GeoJSON)
     load_external_data: Load external datasets (weather, etc.)
 
@@ -18,6 +20,8 @@ See CLAUDE.md for usage guidance and CLI workflow examples.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal, cast
 
@@ -26,6 +30,7 @@ import pandas as pd
 from analysis.config import CRIME_DATA_PATH
 
 from .cache import memory
+from .preprocessing import mark_sorted
 
 # Optional geopandas import for spatial data
 try:
@@ -37,19 +42,28 @@ except ImportError:
     if TYPE_CHECKING:
         import geopandas as gpd
 
+# Frames held by keep_crime_data_in_memory(), keyed by ``clean``, each with the
+# crime_data_version() it was loaded from; None when inactive
+_in_memory_frames: dict[bool, tuple[tuple[str, int, int] | None, pd.DataFrame]] | None = None
+
 
 @memory.cache
-def _load_crime_data_parquet(clean: bool = True) -> pd.DataFrame:
+def _load_crime_data_parquet(
+    clean: bool = True, _dataset_version: tuple[str, int, int] | None = None
+) -> pd.DataFrame:
     """Load crime data from parquet with caching (internal function).
 
     This function is cached using joblib.Memory. The cache key includes
     the 'clean' parameter, so different clean values are cached separately.
+    ``_dataset_version`` is only part of the cache key (see
+    ``crime_data_version``), so a rewritten data file is read again.
 
     Args:
         clean: Whether to drop rows with missing dispatch_date.
+        _dataset_version: Version of the data file being loaded.
 
     Returns:
-        DataFrame with parsed dispatch_date column.
+        DataFrame with parsed dispatch_date column, sorted by dispatch_date.
 
     Raises:
         FileNotFoundError: If crime data file doesn't exist.
@@ -69,6 +83,10 @@ def _load_crime_data_parquet(clean: bool = True) -> pd.DataFrame:
     if clean and "dispatch_date" in df.columns:
         df = df.dropna(subset=["dispatch_date"])
 
+    # Canonical order: date range filters become binary searches over a sorted column
+    if "dispatch_date" in df.columns:
+        df = df.sort_values("dispatch_date", kind="stable", ignore_index=True)
+
     return df
 
 
@@ -83,7 +101,8 @@ def load_crime_data(clean: bool = True) -> pd.DataFrame:
         clean: Whether to drop rows with missing dispatch_date. Default True.
 
     Returns:
-        DataFrame with crime incident data. dispatch_date is parsed as datetime.
+        DataFrame with crime incident data. dispatch_date is parsed as datetime
+        and rows are sorted by it (missing dates last when ``clean`` is False).
 
     Raises:
         FileNotFoundError: If the crime data parquet file doesn't exist.
@@ -94,7 +113,66 @@ def load_crime_data(clean: bool = True) -> pd.DataFrame:
         >>> print(f"Loaded {len(df)} incidents")
         Loaded 1500000 incidents
     """
-    return cast(pd.DataFrame, _load_crime_data_parquet(clean=clean))
+    try:
+        version: tuple[str, int, int] | None = crime_data_version()
+    except FileNotFoundError:
+        version = None  # the loader raises with the missing path
+    if _in_memory_frames is None:
+        return _load_sorted(clean, version)
+    held = _in_memory_frames.get(clean)
+    if held is None or held[0] != version:
+        # First load in this block, or the data file was rewritten since
+        held = _in_memory_frames[clean] = (version, _load_sorted(clean, version))
+    # Shallow copy: callers may add or replace columns without affecting each other
+    return held[1].copy(deep=False)
+
+
+def _load_sorted(clean: bool, version: tuple[str, int, int] | None) -> pd.DataFrame:
+    frame = cast(pd.DataFrame, _load_crime_data_parquet(clean=clean, _dataset_version=version))
+    # Sorted with no missing dates: date filters can skip their sortedness scan
+    if clean and "dispatch_date" in frame.columns:
+        mark_sorted(frame)
+    return frame
+
+
+def crime_data_version() -> tuple[str, int, int]:
+    """Identify the current crime data file for derived-artifact caches.
+
+    Returns:
+        Tuple of ``(path, mtime_ns, size)``. Any rewrite of the data file
+        changes it, so caches keyed on it are rebuilt.
+
+    Raises:
+        FileNotFoundError: If the crime data parquet file doesn't exist.
+    """
+    if not CRIME_DATA_PATH.exists():
+        raise FileNotFoundError(f"Crime data not found: {CRIME_DATA_PATH}")
+    stat = CRIME_DATA_PATH.stat()
+    return str(CRIME_DATA_PATH), stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def keep_crime_data_in_memory() -> Iterator[None]:
+    """Serve repeated ``load_crime_data`` calls from one in-memory frame.
+
+    Inside the block, the first ``load_crime_data`` call per ``clean`` value
+    loads as usual and later calls get a shallow copy of that frame instead of
+    reading the joblib cache again, until ``crime_data_version()`` changes
+    and the frame is reloaded. Callers must not modify existing column
+    values in place; adding or replacing columns is safe.
+
+    Example:
+        >>> with keep_crime_data_in_memory():
+        ...     trends_df = load_crime_data()
+        ...     robbery_df = load_crime_data()  # no second read
+    """
+    global _in_memory_frames
+    previous = _in_memory_frames
+    _in_memory_frames = {} if previous is None else previous
+    try:
+        yield
+    finally:
+        _in_memory_frames = previous
 
 
 @memory.cache
@@ -217,6 +295,8 @@ def load_external_data(name: str) -> pd.DataFrame:
 
 __all__ = [
     "load_crime_data",
+    "keep_crime_data_in_memory",
+    "crime_data_version",
     "load_boundaries",
     "load_external_data",
 ]
@@ -5,6 +5,7 @@ crime data for analysis.
 
 Functions:
     filter_by_date_range: Filter incidents by date range
+    mark_sorted: Record that a frame is sorted by a date column
     aggregate_by_period: Aggregate counts by time period (ME, YE, etc.)
     add_temporal_features: Add extracted temporal features to DataFrame
 
@@ -21,23 +22,62 @@ import pandas as pd
 
 from analysis.utils.temporal import extract_temporal_features
 
+# DataFrame.attrs key set by mark_sorted: [date_col, rows, data address]
+SORTED_ATTR = "sorted_by"
+
+
+def _column_identity(df: pd.DataFrame, date_col: str) -> list[object]:
+    values = df[date_col].to_numpy()
+    return [date_col, len(values), int(values.ctypes.data)]
+
+
+def mark_sorted(df: pd.DataFrame, date_col: str = "dispatch_date") -> None:
+    """Record that ``df`` is sorted by ``date_col`` (no missing dates).
+
+    ``filter_by_date_range`` then binary-searches the column without first
+    scanning it for sortedness. The mark is tied to the column's current
+    data, so after re-sorting, slicing or replacing the column it no longer
+    applies and filters check sortedness again.
+
+    Args:
+        df: DataFrame sorted ascending by ``date_col``; marked in place.
+        date_col: Name of datetime column. Default is "dispatch_date".
+    """
+    df.attrs[SORTED_ATTR] = _column_identity(df, date_col)
+
+
+def _is_sorted(df: pd.DataFrame, date_col: str) -> bool:
+    if df.attrs.get(SORTED_ATTR) == _column_identity(df, date_col):
+        return True
+    return bool(df[date_col].is_monotonic_increasing)
+
 
 def filter_by_date_range(
     df: pd.DataFrame,
     start: str | None = None,
     end: str | None = None,
     date_col: str = "dispatch_date",
+    copy: bool = True,
 ) -> pd.DataFrame:
     """Filter DataFrame by date range.
 
     This function filters a DataFrame to only include rows within the
     specified date range. Dates are parsed using pandas.to_datetime.
 
+    When ``date_col`` is a datetime column sorted in ascending order (as
+    returned by ``load_crime_data``), the range is located with two binary
+    searches and returned as a contiguous row slice. Otherwise a single
+    boolean mask is applied.
+
     Args:
         df: Input DataFrame with datetime column.
         start: Start date (ISO format string, e.g., '2020-01-01').
         end: End date (ISO format string, e.g., '2023-12-31').
         date_col: Name of datetime column. Default is "dispatch_date".
+        copy: If False and ``date_col`` is sorted (see ``mark_sorted``;
+            unmarked columns are checked), return a slice that shares
+            data with ``df`` instead of copying the selected rows. Only use
+            this when the result is read, not modified. Default is True.
 
     Returns:
         Filtered DataFrame with rows in the specified date range.
@@ -51,18 +91,25 @@ def filter_by_date_range(
         >>> df_2020 = filter_by_date_range(df, "2020-01-01", "2020-12-31")
         >>> print(f"Filtered to {len(df_2020)} rows in 2020")
     """
-    result = df.copy()
-
-    if date_col not in result.columns:
+    if date_col not in df.columns:
         raise ValueError(f"Column '{date_col}' not found in DataFrame")
 
-    if start is not None:
-        result = result[result[date_col] >= pd.to_datetime(start)]
+    start_ts = pd.to_datetime(start) if start is not None else None
+    end_ts = pd.to_datetime(end) if end is not None else None
+    dates = df[date_col]
 
-    if end is not None:
-        result = result[result[date_col] <= pd.to_datetime(end)]
+    if pd.api.types.is_datetime64_any_dtype(dates) and _is_sorted(df, date_col):
+        lo = int(dates.searchsorted(start_ts, side="left")) if start_ts is not None else 0
+        hi = int(dates.searchsorted(end_ts, side="right")) if end_ts is not None else len(df)
+        result = df.iloc[lo : max(lo, hi)]
+        return result.copy() if copy else result
 
-    return result
+    mask = pd.Series(True, index=df.index)
+    if start_ts is not None:
+        mask &= dates >= start_ts
+    if end_ts is not None:
+        mask &= dates <= end_ts
+    return df.loc[mask]
 
 
 def aggregate_by_period(
@@ -70,6 +117,7 @@ def aggregate_by_period(
     period: Literal["D", "W", "ME", "MS", "QE", "QS", "YE", "YS"] = "ME",
     count_col: str = "objectid",
     date_col: str = "dispatch_date",
+    weight_col: str | None = None,
 ) -> pd.DataFrame:
     """Aggregate crime counts by time period.
 
@@ -91,12 +139,15 @@ def aggregate_by_period(
         period: Pandas resample period. Default is "ME" (month end).
         count_col: Column to count (default: objectid).
         date_col: Datetime column to group by. Default is "dispatch_date".
+        weight_col: Optional per-row weight column (e.g. the ``sample_weight``
+            of ``load_crime_sample``). When given, each period's count is the
+            sum of the weights of its non-null ``count_col`` rows.
 
     Returns:
         DataFrame with period index and count column.
 
     Raises:
-        ValueError: If date_col or count_col is not found in DataFrame.
+        ValueError: If date_col, count_col or weight_col is not found in DataFrame.
 
     Example:
         >>> from analysis.data import load_crime_data, aggregate_by_period
@@ -111,12 +162,18 @@ def aggregate_by_period(
         raise ValueError(f"Column '{date_col}' not found in DataFrame")
     if count_col not in df.columns:
         raise ValueError(f"Column '{count_col}' not found in DataFrame")
+    if weight_col is not None and weight_col not in df.columns:
+        raise ValueError(f"Column '{weight_col}' not found in DataFrame")
 
     # Make a copy and set index
     df_copy = df.set_index(date_col)
 
     # Resample and count
-    counts = df_copy.resample(period)[count_col].count().reset_index()
+    if weight_col is None:
+        counts = df_copy.resample(period)[count_col].count().reset_index()
+    else:
+        weights = df_copy[weight_col].where(df_copy[count_col].notna(), 0.0)
+        counts = weights.resample(period).sum().reset_index()
     counts.columns = [date_col, "count"]
 
     return counts
@@ -133,7 +190,7 @@ def add_temporal_features(df: pd.DataFrame, date_col: str = "dispatch_date") ->
         date_col: Name of datetime column. Default is "dispatch_date".
 
     Returns:
-        DataFrame with temporal features added (year, month, day, day_of_week).
+        DataFrame with temporal features added (year, month, day, day_of_week, hour).
 
     Raises:
         None.
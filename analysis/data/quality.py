@@ -0,0 +1,141 @@
+"""Compact data-quality profile of the crime dataset.
+
+This module summarizes a loaded incident frame into a small JSON-ready
+profile that the refresh pipeline exports as ``quality.json``, so drift
+between refreshes (falling coordinate coverage, a spike in null dates, a
+shifted UCR mix, missing days) can be spotted by comparing profiles instead
+of re-reading the data.
+
+Functions:
+    build_quality_profile: Null rates, coordinate coverage, UCR band mix and daily counts
+
+Every statistic is a vectorized column reduction over the frame the caller
+already has in memory; nothing is re-loaded.
+
+See CLAUDE.md for usage guidance and CLI workflow examples.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from analysis.config import PHILLY_LAT_MAX, PHILLY_LAT_MIN, PHILLY_LON_MAX, PHILLY_LON_MIN
+
+# Bump when the profile layout changes so consumers can tell versions apart
+QUALITY_PROFILE_VERSION: int = 1
+
+
+def _rate(count: int, total: int) -> float:
+    return round(count / total, 6) if total else 0.0
+
+
+def _coordinate_stats(df: pd.DataFrame, x_col: str, y_col: str) -> dict[str, Any]:
+    """Same fields as ``analysis.utils.spatial.get_coordinate_stats``, as plain JSON types."""
+    total = len(df)
+    if x_col not in df.columns or y_col not in df.columns:
+        has_coords = np.zeros(total, dtype=bool)
+        x = y = np.full(total, np.nan)
+    else:
+        x = pd.to_numeric(df[x_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        y = pd.to_numeric(df[y_col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        has_coords = ~np.isnan(x) & ~np.isnan(y)
+    with np.errstate(invalid="ignore"):
+        in_bounds = (
+            has_coords
+            & (x >= PHILLY_LON_MIN)
+            & (x <= PHILLY_LON_MAX)
+            & (y >= PHILLY_LAT_MIN)
+            & (y <= PHILLY_LAT_MAX)
+        )
+    valid_count = int(has_coords.sum())
+    in_bounds_count = int(in_bounds.sum())
+    return {
+        "total_records": total,
+        "has_coordinates": valid_count,
+        "in_philadelphia_bounds": in_bounds_count,
+        "coverage_rate": _rate(valid_count, total),
+        "in_bounds_rate": _rate(in_bounds_count, total),
+        "lon_min": float(np.nanmin(x[has_coords])) if valid_count else None,
+        "lon_max": float(np.nanmax(x[has_coords])) if valid_count else None,
+        "lat_min": float(np.nanmin(y[has_coords])) if valid_count else None,
+        "lat_max": float(np.nanmax(y[has_coords])) if valid_count else None,
+    }
+
+
+def build_quality_profile(
+    df: pd.DataFrame,
+    date_col: str = "dispatch_date",
+    ucr_col: str = "ucr_general",
+    x_col: str = "point_x",
+    y_col: str = "point_y",
+    source_records: int | None = None,
+) -> dict[str, Any]:
+    """Summarize a crime incident frame into a data-quality profile.
+
+    Args:
+        df: Crime incident data.
+        date_col: Dispatch date column. Default is "dispatch_date".
+        ucr_col: UCR code column. Default is "ucr_general".
+        x_col: Longitude column. Default is "point_x".
+        y_col: Latitude column. Default is "point_y".
+        source_records: Row count of the source file before cleaning. When
+            given, rows missing from ``df`` are reported as dropped for a
+            missing dispatch date (``load_crime_data(clean=True)`` drops them).
+
+    Returns:
+        JSON-serializable dict with ``version``, ``total_records``,
+        ``date_start``/``date_end``, ``null_rates`` (per column),
+        ``coordinates`` (as get_coordinate_stats), ``ucr_bands`` (incident
+        count per hundred-band, missing codes under "missing") and
+        ``daily_counts`` (incidents per ISO date, days without incidents
+        omitted). With ``source_records``, also ``source_records``,
+        ``missing_date_records`` and ``missing_date_rate``.
+
+    Example:
+        >>> profile = build_quality_profile(load_crime_data())
+        >>> profile["coordinates"]["coverage_rate"]
+        0.98
+    """
+    total = len(df)
+    null_counts = df.isna().sum()
+    null_rates = {str(col): _rate(int(count), total) for col, count in null_counts.items()}
+
+    if date_col in df.columns:
+        dates = df[date_col]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = pd.to_datetime(dates.astype(object), errors="coerce")
+        daily = dates.dropna().dt.normalize().value_counts().sort_index()
+    else:
+        daily = pd.Series(dtype="int64")
+    daily_counts = {day.date().isoformat(): int(count) for day, count in daily.items()}
+
+    ucr_bands: dict[str, int] = {}
+    if ucr_col in df.columns:
+        codes = pd.to_numeric(df[ucr_col], errors="coerce")
+        bands = (codes // 100 * 100).value_counts(dropna=False).sort_index()
+        for band, count in bands.items():
+            key = "missing" if pd.isna(band) else str(int(band))
+            ucr_bands[key] = int(count)
+
+    profile: dict[str, Any] = {
+        "version": QUALITY_PROFILE_VERSION,
+        "total_records": total,
+        "date_start": next(iter(daily_counts), None),
+        "date_end": next(reversed(daily_counts), None),
+        "null_rates": null_rates,
+        "coordinates": _coordinate_stats(df, x_col, y_col),
+        "ucr_bands": ucr_bands,
+        "daily_counts": daily_counts,
+    }
+    if source_records is not None:
+        missing_dates = max(source_records - total, 0)
+        profile["source_records"] = source_records
+        profile["missing_date_records"] = missing_dates
+        profile["missing_date_rate"] = _rate(missing_dates, source_records)
+    return profile
+
+
+__all__ = ["QUALITY_PROFILE_VERSION", "build_quality_profile"]
@@ -0,0 +1,210 @@
+"""Stratified sample of the crime dataset for fast mode.
+
+This module draws a reproducible sample stratified by year x UCR hundred-band
+x police district, so rare offence types (homicide, rape) and small districts
+stay represented, and attaches per-row weights that scale counts back to the
+full dataset.
+
+Functions:
+    build_sample_index: Choose sample rows and weights for a DataFrame
+    load_sample_index: Cached sample index for the canonical dataset
+    load_crime_sample: Cached sampled incidents with a sample_weight column
+    incident_weights: Incidents each row stands for (its weight, or 1)
+
+Each stratum keeps ``ceil(n * frac)`` rows, but at least ``min_per_stratum``
+(or all of them if the stratum is smaller). A kept row's weight is
+``stratum size / rows kept``, so the weights of any stratum add up to its
+size and weighted counts estimate full-data counts. Rare strata are
+oversampled, so counts and shares computed from a sample must sum
+``incident_weights(df)`` rather than count rows.
+
+The index and the sampled frame are cached with joblib per dataset version,
+so after the first build fast mode reads only the sample from disk.
+
+See CLAUDE.md for usage guidance and CLI workflow examples.
+"""
+
+from __future__ import annotations
+
+from typing import cast
+
+import numpy as np
+import pandas as pd
+
+from .cache import memory
+from .loading import crime_data_version, load_crime_data
+
+# Column added by load_crime_sample with each row's scaling factor
+SAMPLE_WEIGHT_COL: str = "sample_weight"
+
+# Rows kept from each stratum regardless of frac (if it has that many)
+DEFAULT_MIN_PER_STRATUM: int = 5
+
+
+def build_sample_index(
+    df: pd.DataFrame,
+    frac: float,
+    min_per_stratum: int = DEFAULT_MIN_PER_STRATUM,
+    random_state: int = 42,
+    date_col: str = "dispatch_date",
+    ucr_col: str = "ucr_general",
+    district_col: str = "dc_dist",
+) -> pd.DataFrame:
+    """Choose a stratified sample of rows and their scaling weights.
+
+    Args:
+        df: Incident data with date, UCR code and district columns.
+        frac: Share of each stratum to keep, in ``(0, 1]``.
+        min_per_stratum: Minimum rows kept per stratum. Default is 5.
+        random_state: Seed for the row selection. Default is 42.
+        date_col: Datetime column; strata use its year. Default is "dispatch_date".
+        ucr_col: UCR code column; strata use its hundred-band. Default is "ucr_general".
+        district_col: District column. Default is "dc_dist".
+
+    Returns:
+        DataFrame with ``row`` (positions in ``df``, ascending) and
+        ``sample_weight`` (stratum size / rows kept from the stratum).
+        Missing years, bands or districts form their own strata.
+
+    Raises:
+        ValueError: If ``frac`` is outside ``(0, 1]``, ``min_per_stratum`` is
+            negative, or a required column is missing.
+
+    Examples:
+        >>> index = build_sample_index(df, frac=0.1)
+        >>> bool(np.isclose(index["sample_weight"].sum(), len(df)))
+        True
+    """
+    if not 0 < frac <= 1:
+        raise ValueError(f"frac must be in (0, 1], got {frac}")
+    if min_per_stratum < 0:
+        raise ValueError(f"min_per_stratum must be non-negative, got {min_per_stratum}")
+    missing = [col for col in (date_col, ucr_col, district_col) if col not in df.columns]
+    if missing:
+        raise ValueError(f"Columns not found in DataFrame: {missing}")
+
+    year = pd.to_datetime(df[date_col], errors="coerce").dt.year
+    band = pd.to_numeric(df[ucr_col], errors="coerce") // 100
+    stratum = (
+        pd.DataFrame({"year": year, "band": band, "district": df[district_col]})
+        .groupby(["year", "band", "district"], sort=False, dropna=False)
+        .ngroup()
+        .to_numpy()
+    )
+    sizes = np.bincount(stratum)
+    keep_counts = np.minimum(
+        sizes, np.maximum(np.ceil(sizes * frac).astype(np.int64), min_per_stratum)
+    )
+
+    # Random order within each stratum; keep the first keep_counts rows of each
+    rng = np.random.default_rng(random_state)
+    order = np.lexsort((rng.random(len(df)), stratum))
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    rank = np.arange(len(df)) - starts[stratum[order]]
+    rows = np.sort(order[rank < keep_counts[stratum[order]]])
+
+    weights = sizes / np.maximum(keep_counts, 1)
+    return pd.DataFrame({"row": rows, SAMPLE_WEIGHT_COL: weights[stratum[rows]]})
+
+
+@memory.cache
+def _load_sample_index_cached(
+    _dataset_version: tuple[str, int, int], frac: float, random_state: int
+) -> pd.DataFrame:
+    """Build the sample index for the canonical dataset (internal, cached).
+
+    ``_dataset_version`` is only part of the cache key (see ``crime_data_version``).
+    """
+    return build_sample_index(load_crime_data(clean=True), frac, random_state=random_state)
+
+
+@memory.cache
+def _load_crime_sample_cached(
+    _dataset_version: tuple[str, int, int], frac: float, random_state: int
+) -> pd.DataFrame:
+    """Materialize the sampled incidents (internal, cached)."""
+    index = _load_sample_index_cached(_dataset_version, frac, random_state)
+    sample = load_crime_data(clean=True).iloc[index["row"].to_numpy()].reset_index(drop=True)
+    sample[SAMPLE_WEIGHT_COL] = index[SAMPLE_WEIGHT_COL].to_numpy()
+    return sample
+
+
+def load_sample_index(frac: float = 0.1, random_state: int = 42) -> pd.DataFrame:
+    """Load the stratified sample index for the canonical crime dataset.
+
+    Built once per dataset version and cached with joblib; later calls read
+    only the index, not the crime data.
+
+    Args:
+        frac: Share of each stratum to keep. Default is 0.1.
+        random_state: Seed for the row selection. Default is 42.
+
+    Returns:
+        DataFrame with ``row`` (positions in ``load_crime_data(clean=True)``)
+        and ``sample_weight``.
+
+    Raises:
+        FileNotFoundError: If the crime data file doesn't exist.
+    """
+    return cast(pd.DataFrame, _load_sample_index_cached(crime_data_version(), frac, random_state))
+
+
+def load_crime_sample(frac: float = 0.1, random_state: int = 42) -> pd.DataFrame:
+    """Load a stratified sample of the crime incidents for fast mode.
+
+    The sample is cached with joblib per dataset version, so repeated fast
+    runs read only the sampled rows.
+
+    Args:
+        frac: Share of each year x UCR band x district stratum to keep.
+            Default is 0.1.
+        random_state: Seed for the row selection. Default is 42.
+
+    Returns:
+        Sampled incidents in ``load_crime_data`` order (sorted by
+        dispatch_date) with an extra ``sample_weight`` column. Summing the
+        weights instead of counting rows estimates full-data counts.
+
+    Raises:
+        FileNotFoundError: If the crime data file doesn't exist.
+
+    Example:
+        >>> from analysis.data import load_crime_sample
+        >>> sample = load_crime_sample(0.1)
+        >>> round(sample["sample_weight"].sum()) == len(load_crime_data())
+        True
+    """
+    return cast(pd.DataFrame, _load_crime_sample_cached(crime_data_version(), frac, random_state))
+
+
+def incident_weights(df: pd.DataFrame) -> pd.Series:
+    """Number of incidents each row stands for.
+
+    Args:
+        df: Incident data, either full (``load_crime_data``) or sampled
+            (``load_crime_sample``).
+
+    Returns:
+        Float Series aligned with ``df``: the ``sample_weight`` column when
+        present, otherwise 1.0 for every row. Summing it (overall or per
+        group) gives row counts for full data and estimated full-data
+        counts for a sample.
+
+    Examples:
+        >>> df = pd.DataFrame({"dc_dist": [1, 1, 2], "sample_weight": [2.0, 2.0, 8.0]})
+        >>> incident_weights(df).groupby(df["dc_dist"]).sum().tolist()
+        [4.0, 8.0]
+    """
+    if SAMPLE_WEIGHT_COL in df.columns:
+        return df[SAMPLE_WEIGHT_COL].astype("float64")
+    return pd.Series(1.0, index=df.index, name=SAMPLE_WEIGHT_COL)
+
+
+__all__ = [
+    "DEFAULT_MIN_PER_STRATUM",
+    "SAMPLE_WEIGHT_COL",
+    "build_sample_index",
+    "incident_weights",
+    "load_crime_sample",
+    "load_sample_index",
+]
@@ -5,6 +5,13 @@ schema, ensuring type safety and data quality.
 
 Classes:
     CrimeIncidentValidator: Validates crime incident row data
+    RuleViolation: Violation count and example rows for one rule
+    ValidationReport: Result of check_crime_data
+
+Functions:
+    check_crime_data: Vectorized per-rule validation of a whole DataFrame
+    validate_crime_data: Raise ValueError if a DataFrame breaks any rule
+    validate_coordinates: Keep rows with coordinates inside bounds
 
 Validation rules:
 - dispatch_time: Valid datetime, not null
@@ -12,15 +19,23 @@ Validation rules:
 - point_x, point_y: Float coordinates within Philadelphia bounds
 - text_general_code: Non-empty string
 
+check_crime_data applies the model's rules as column-level NumPy masks, so
+the whole dataset can be checked in well under a second per million rows;
+CrimeIncidentValidator remains the reference for single records.
+
 See CLAUDE.md for usage guidance and CLI workflow examples.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
+from pydantic import BaseModel, Field, field_validator
 
 from analysis.config import PHILLY_LAT_MAX, PHILLY_LAT_MIN, PHILLY_LON_MAX, PHILLY_LON_MIN
 
@@ -102,15 +117,191 @@ class CrimeIncidentValidator(BaseModel):
         return v
 
 
+@dataclass(frozen=True)
+class RuleViolation:
+    """Rows of a DataFrame that break one validation rule.
+
+    Attributes:
+        rule: Rule name, e.g. "ucr_general_range".
+        description: What the rule requires.
+        count: Number of violating rows.
+        sample_rows: Index labels of the first violating rows.
+    """
+
+    rule: str
+    description: str
+    count: int
+    sample_rows: list[Any] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class ValidationReport:
+    """Result of check_crime_data.
+
+    Attributes:
+        n_rows: Rows checked.
+        n_invalid_rows: Rows breaking at least one rule.
+        violations: One entry per rule with violations, in rule order.
+    """
+
+    n_rows: int
+    n_invalid_rows: int
+    violations: list[RuleViolation] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """True if no rule was violated."""
+        return not self.violations
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-serializable form (sample row labels converted to str)."""
+        return {
+            "n_rows": self.n_rows,
+            "n_invalid_rows": self.n_invalid_rows,
+            "violations": [
+                {
+                    "rule": v.rule,
+                    "description": v.description,
+                    "count": v.count,
+                    "sample_rows": [str(row) for row in v.sample_rows],
+                }
+                for v in self.violations
+            ],
+        }
+
+
+def _present(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Non-null mask for an optional column (all False when it's absent)."""
+    if col not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return df[col].notna().to_numpy()
+
+
+def _numeric(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Column as float64; unparseable values become NaN."""
+    return pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _dispatch_date_invalid(df: pd.DataFrame) -> np.ndarray:
+    if "dispatch_date" not in df.columns:
+        return np.ones(len(df), dtype=bool)
+    dates = df["dispatch_date"]
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates.astype(object), errors="coerce", format="mixed")
+    return dates.isna().to_numpy()
+
+
+def _integer_out_of_range(df: pd.DataFrame, col: str, low: float, high: float) -> np.ndarray:
+    present = _present(df, col)
+    if not present.any():
+        return present
+    values = _numeric(df, col)
+    with np.errstate(invalid="ignore"):
+        bad = np.isnan(values) | (values != np.floor(values)) | (values < low) | (values > high)
+    return present & bad
+
+
+def _float_out_of_range(df: pd.DataFrame, col: str, low: float, high: float) -> np.ndarray:
+    present = _present(df, col)
+    if not present.any():
+        return present
+    values = _numeric(df, col)
+    with np.errstate(invalid="ignore"):
+        return present & ~((values >= low) & (values <= high))
+
+
+def _not_integer(df: pd.DataFrame, col: str) -> np.ndarray:
+    return _integer_out_of_range(df, col, -np.inf, np.inf)
+
+
+def _not_string(df: pd.DataFrame, col: str) -> np.ndarray:
+    present = _present(df, col)
+    if not present.any():
+        return present
+    values = df[col]
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Check each category once, then look rows up by code (null rows aren't present)
+        is_str = np.array([isinstance(v, str) for v in values.cat.categories], dtype=bool)
+        return present & ~is_str[values.cat.codes.to_numpy()]
+    if pd.api.types.is_numeric_dtype(values.dtype):
+        return present
+    if pd.api.types.infer_dtype(values, skipna=True) == "string":
+        return np.zeros(len(df), dtype=bool)
+    # Mixed object column: fall back to a per-value type check
+    return present & ~values.map(lambda v: isinstance(v, str)).to_numpy(dtype=bool)
+
+
+# (rule, description, mask of violating rows); mirrors CrimeIncidentValidator
+VALIDATION_RULES: list[tuple[str, str, Callable[[pd.DataFrame], np.ndarray]]] = [
+    ("dispatch_date_missing", "dispatch_date present and a valid date", _dispatch_date_invalid),
+    (
+        "ucr_general_range",
+        "ucr_general an integer in 100-9999",
+        lambda df: _integer_out_of_range(df, "ucr_general", 100, 9999),
+    ),
+    (
+        "point_x_bounds",
+        f"point_x within Philadelphia longitudes {PHILLY_LON_MIN} to {PHILLY_LON_MAX}",
+        lambda df: _float_out_of_range(df, "point_x", PHILLY_LON_MIN, PHILLY_LON_MAX),
+    ),
+    (
+        "point_y_bounds",
+        f"point_y within Philadelphia latitudes {PHILLY_LAT_MIN} to {PHILLY_LAT_MAX}",
+        lambda df: _float_out_of_range(df, "point_y", PHILLY_LAT_MIN, PHILLY_LAT_MAX),
+    ),
+    ("dc_key_integer", "dc_key an integer", lambda df: _not_integer(df, "dc_key")),
+    (
+        "text_columns_string",
+        "incident_id, text_general_code and psa are strings",
+        lambda df: (
+            _not_string(df, "incident_id")
+            | _not_string(df, "text_general_code")
+            | _not_string(df, "psa")
+        ),
+    ),
+]
+
+
+def check_crime_data(df: pd.DataFrame, max_samples: int = 5) -> ValidationReport:
+    """Check every row of a DataFrame against the crime incident rules.
+
+    Each rule of CrimeIncidentValidator is evaluated as a boolean mask over
+    whole columns, so no per-row Python objects are created. Null optional
+    fields are valid, as in the Pydantic model.
+
+    Args:
+        df: Crime incident data.
+        max_samples: Example index labels kept per rule. Default is 5.
+
+    Returns:
+        ValidationReport with per-rule violation counts and sample rows.
+
+    Example:
+        >>> report = check_crime_data(load_crime_data())
+        >>> for violation in report.violations:
+        ...     print(violation.rule, violation.count)
+    """
+    invalid = np.zeros(len(df), dtype=bool)
+    violations = []
+    for rule, description, check in VALIDATION_RULES:
+        mask = check(df)
+        count = int(mask.sum())
+        if count:
+            invalid |= mask
+            rows = df.index[np.flatnonzero(mask)[:max_samples]].to_list()
+            violations.append(RuleViolation(rule, description, count, rows))
+    return ValidationReport(len(df), int(invalid.sum()), violations)
+
+
 def validate_crime_data(
     df: pd.DataFrame,
     sample_size: int = 1000,
     strict: bool = False,
 ) -> pd.DataFrame:
-    """Validate crime data using Pydantic model.
+    """Validate crime data against the CrimeIncidentValidator rules.
 
-    This function validates a sample of rows by default for performance.
-    Set strict=True to validate all rows (may be slow for large datasets).
+    Rows are checked with check_crime_data, which is vectorized, so
+    strict=True is cheap even for the full dataset.
 
     Args:
         df: DataFrame to validate.
@@ -127,7 +318,7 @@ def validate_crime_data(
         >>> from analysis.data import load_crime_data, validate_crime_data
         >>> df = load_crime_data()
         >>> validate_crime_data(df)  # Validate sample
-        >>> validate_crime_data(df, strict=True)  # Validate all (slow)
+        >>> validate_crime_data(df, strict=True)  # Validate all rows
     """
     if len(df) == 0:
         raise ValueError("DataFrame is empty")
@@ -141,46 +332,13 @@ def validate_crime_data(
             df.sample(n=sample_size_actual, random_state=42) if len(df) > sample_size_actual else df
         )
 
-    sample_for_validation = sample.rename(columns=str)
-    sample_for_validation = sample_for_validation.where(
-        pd.notna(sample_for_validation),
-        None,
-    )
-    records = sample_for_validation.to_dict(orient="records")
-    sample_index = sample.index.to_list()
-
-    errors = []
-    try:
-        TypeAdapter(list[CrimeIncidentValidator]).validate_python(records)
-    except ValidationError as e:
-        errors_by_row: dict[object, list[str]] = {}
-        for error in e.errors():
-            loc = error.get("loc", ())
-            row_pos = loc[0] if loc else "unknown"
-            field_path = ".".join(str(part) for part in loc[1:]) if len(loc) > 1 else ""
-            error_message = error.get("msg", "Validation error")
-            if field_path:
-                error_message = f"{field_path}: {error_message}"
-
-            if isinstance(row_pos, int) and 0 <= row_pos < len(sample_index):
-                row_idx: object = sample_index[row_pos]
-            else:
-                row_idx = row_pos
-
-            errors_by_row.setdefault(row_idx, []).append(error_message)
-
-        errors = [(idx, "; ".join(messages)) for idx, messages in errors_by_row.items()]
-    except Exception as e:
-        errors.append(("batch", f"Unexpected error: {e}"))
-
-    if errors:
+    report = check_crime_data(sample)
+    if not report.ok:
         error_msg = "\n".join(
-            f"Row {idx}: {err[:100]}..." if len(err) > 100 else f"Row {idx}: {err}"
-            for idx, err in errors[:5]
+            f"{v.rule} ({v.description}): {v.count} rows, e.g. rows {v.sample_rows}"
+            for v in report.violations
         )
-        if len(errors) > 5:
-            error_msg += f"\n... and {len(errors) - 5} more errors"
-        raise ValueError(f"Data validation failed ({len(errors)} errors):\n{error_msg}")
+        raise ValueError(f"Data validation failed ({report.n_invalid_rows} errors):\n{error_msg}")
 
     return df
 
@@ -240,6 +398,10 @@ def validate_coordinates(
 
 __all__ = [
     "CrimeIncidentValidator",
+    "RuleViolation",
+    "ValidationReport",
+    "VALIDATION_RULES",
+    "check_crime_data",
     "validate_crime_data",
     "validate_coordinates",
     "PHILLY_LON_MIN",
@@ -1,9 +1,198 @@
-"""Event impact analysis utilities for Phase 3."""
+"""Event impact analysis utilities for Phase 3.
 
+Dates are handled as integer day numbers (days since 1970-01-01) so that
+tagging incidents and matching control days are sorted-array lookups
+(``np.searchsorted``) instead of Python sets of Timestamps.
+"""
+
+import warnings
+from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
+from analysis.event_calendar import EVENT_CALENDAR_PATH, build_event_calendar
+from analysis.models.resampling import resample_groups
+from analysis.utils.classification import CRIME_CATEGORIES, classify_crime_category
+
+# daily_category_counts column holding every incident
+ALL_CRIMES = "All"
+
+# to_day_numbers value for NaT
+MISSING_DAY = np.iinfo(np.int64).min
+
+
+def to_day_numbers(dates: Any) -> np.ndarray:
+    """Convert datetime-like values to int64 days since 1970-01-01 (time of day dropped).
+
+    Missing dates become ``MISSING_DAY``.
+    """
+    values = pd.to_datetime(pd.Series(dates)).to_numpy(dtype="datetime64[ns]")
+    return values.astype("datetime64[D]").astype(np.int64)
+
+
+def from_day_numbers(days: np.ndarray) -> pd.DatetimeIndex:
+    """Inverse of ``to_day_numbers``."""
+    return pd.DatetimeIndex(np.asarray(days, dtype=np.int64).astype("datetime64[D]")).as_unit("ns")
+
+
+def _contains(sorted_days: np.ndarray, days: np.ndarray) -> np.ndarray:
+    """Membership of ``days`` in a sorted, unique day array."""
+    if len(sorted_days) == 0:
+        return np.zeros(np.shape(days), dtype=bool)
+    pos = np.searchsorted(sorted_days, days)
+    return sorted_days[np.minimum(pos, len(sorted_days) - 1)] == days
+
+
+def in_event_windows(days: np.ndarray, event_days: np.ndarray, buffer_days: int = 0) -> np.ndarray:
+    """Whether each day falls within ``buffer_days`` of any event day.
+
+    Parameters
+    ----------
+    days : np.ndarray
+        Day numbers to tag (any order, duplicates allowed)
+    event_days : np.ndarray
+        Event day numbers
+    buffer_days : int
+        Include N days before/after events
+
+    Returns
+    -------
+    np.ndarray
+        Boolean mask aligned with ``days``
+    """
+    return _in_windows(days, event_days, buffer_days, buffer_days)
+
+
+def _in_windows(
+    days: np.ndarray, event_days: np.ndarray, days_before: int, days_after: int
+) -> np.ndarray:
+    """Whether each day falls from ``days_before`` before to ``days_after`` after an event."""
+    days = np.asarray(days, dtype=np.int64)
+    event_days = np.asarray(event_days, dtype=np.int64)
+    starts = np.unique(event_days[event_days != MISSING_DAY]) - days_before
+    known = days != MISSING_DAY
+    result = np.zeros(len(days), dtype=bool)
+    if len(starts) == 0 or not known.any():
+        return result
+
+    # Tag each calendar day in the covered range once, then gather per
+    # incident; incidents span a few thousand days but number in millions
+    first = days[known].min()
+    calendar = np.arange(first, days[known].max() + 1)
+    # Windows all have the same length, so their ends are sorted too: the last
+    # window starting on or before a day is the only one that can contain it
+    idx = np.searchsorted(starts, calendar, side="right") - 1
+    tagged = (idx >= 0) & (calendar <= starts[np.maximum(idx, 0)] + days_before + days_after)
+    result[known] = tagged[days[known] - first]
+    return result
+
+
+def load_event_data(path: Path | None = None) -> pd.DataFrame:
+    """Load the event calendar.
+
+    Parameters
+    ----------
+    path : Path, optional
+        Calendar parquet file. Default is the file written by
+        ``scripts/create_event_calendar.py``; if that file has not been
+        created the same calendar is generated in memory.
+
+    Returns
+    -------
+    pd.DataFrame
+        Events with normalized 'date', 'event_type' and 'event_name' columns
+
+    Raises
+    ------
+    FileNotFoundError
+        If an explicit ``path`` does not exist
+    """
+    if path is None:
+        if not EVENT_CALENDAR_PATH.exists():
+            return build_event_calendar()
+        path = EVENT_CALENDAR_PATH
+    if not path.exists():
+        raise FileNotFoundError(f"Event calendar not found: {path}")
+
+    events = pd.read_parquet(path)
+    events["date"] = pd.to_datetime(events["date"]).dt.normalize()
+    return events
+
+
+def get_event_windows(
+    event_df: pd.DataFrame, days_before: int = 7, days_after: int = 7
+) -> pd.DataFrame:
+    """Add the analysis window around each event.
+
+    Parameters
+    ----------
+    event_df : pd.DataFrame
+        Event calendar with 'date' column
+    days_before : int
+        Days before the event included in its window
+    days_after : int
+        Days after the event included in its window
+
+    Returns
+    -------
+    pd.DataFrame
+        Events sorted by date with 'window_start' and 'window_end' columns
+    """
+    windows = event_df.sort_values("date").reset_index(drop=True)
+    windows["window_start"] = windows["date"] - pd.Timedelta(days=days_before)
+    windows["window_end"] = windows["date"] + pd.Timedelta(days=days_after)
+    return windows
+
+
+def daily_category_counts(source: Any, date_col: str = "dispatch_date") -> pd.DataFrame:
+    """Incident counts for every calendar day, per crime category.
+
+    Event impact statistics only need these few thousand daily values, so
+    they are counted once here and shared by every event type and category.
+
+    Parameters
+    ----------
+    source : pd.DataFrame or CountCube
+        Crime incidents (classified on the fly if there is no
+        'crime_category' column), or a CountCube from ``analysis.data``
+    date_col : str
+        Name of date column in an incident DataFrame
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per day from the first to the last incident (days without
+        incidents count as 0), one column per crime category plus 'All'
+    """
+    from analysis.data.cube import CountCube
+
+    if isinstance(source, CountCube):
+        long = source.counts("D", by=("crime_category",), date_col="date")
+        counts = long.pivot(index="date", columns="crime_category", values="count")
+        counts = counts.reindex(columns=list(CRIME_CATEGORIES)).to_numpy()
+        index = source.days
+    else:
+        if "crime_category" not in source.columns:
+            source = classify_crime_category(source[[date_col, "ucr_general"]])
+        days = to_day_numbers(source[date_col])
+        codes = pd.Categorical(source["crime_category"], categories=CRIME_CATEGORIES).codes
+        valid = (days != MISSING_DAY) & (codes >= 0)
+        days, codes = days[valid], codes[valid].astype(np.int64)
+        first = days.min() if len(days) else 0
+        n_days = int(days.max() - first) + 1 if len(days) else 0
+        n_categories = len(CRIME_CATEGORIES)
+        counts = np.bincount(
+            (days - first) * n_categories + codes, minlength=n_days * n_categories
+        ).reshape(n_days, n_categories)
+        index = from_day_numbers(np.arange(first, first + n_days))
+
+    frame = pd.DataFrame(counts, index=index, columns=list(CRIME_CATEGORIES), dtype=np.int64)
+    frame[ALL_CRIMES] = frame.sum(axis=1)
+    frame.index.name = "date"
+    return frame
+
 
 def identify_event_days(
     crime_df: pd.DataFrame,
@@ -32,26 +221,65 @@ def identify_event_days(
     crime_df = crime_df.copy()
     crime_df[date_col] = pd.to_datetime(crime_df[date_col]).dt.normalize()
 
-    # Create expanded event dates with buffer
-    event_dates: set[pd.Timestamp] = set()
-    for date in event_df["date"]:
-        for offset in range(-buffer_days, buffer_days + 1):
-            event_dates.add(date + pd.Timedelta(days=offset))
-
-    crime_df["is_event_day"] = crime_df[date_col].isin(event_dates)
+    crime_days = to_day_numbers(crime_df[date_col])
+    event_days = to_day_numbers(event_df["date"])
+    crime_df["is_event_day"] = in_event_windows(crime_days, event_days, buffer_days)
 
     # Add specific event type indicators
+    event_types = event_df["event_type"].to_numpy()
     for event_type in event_df["event_type"].unique():
-        type_dates = set(event_df[event_df["event_type"] == event_type]["date"])
-        expanded_dates: set[pd.Timestamp] = set()
-        for date in type_dates:
-            for offset in range(-buffer_days, buffer_days + 1):
-                expanded_dates.add(date + pd.Timedelta(days=offset))
-        crime_df[f"is_{event_type}_day"] = crime_df[date_col].isin(expanded_dates)
+        crime_df[f"is_{event_type}_day"] = in_event_windows(
+            crime_days, event_days[event_types == event_type], buffer_days
+        )
 
     return crime_df
 
 
+def match_control_days(
+    event_days: np.ndarray,
+    available_days: np.ndarray,
+    excluded_days: np.ndarray,
+    n_controls: int = 4,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Match control days to every event at once (same day-of-week, adjacent weeks).
+
+    Candidates are taken in the order 1 week before, 1 week after, 2 weeks
+    before, ... and the first ``n_controls`` that are available and not
+    excluded are kept.
+
+    Parameters
+    ----------
+    event_days : np.ndarray
+        Event day numbers
+    available_days : np.ndarray
+        Day numbers present in the crime data
+    excluded_days : np.ndarray
+        Day numbers that cannot be controls (usually all event days)
+    n_controls : int
+        Number of control days per event
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        ``(event_index, control_day)``: position in ``event_days`` and the
+        matched control day number, grouped by event in candidate order
+    """
+    weeks = np.repeat(np.arange(1, n_controls + 1), 2) * 7
+    offsets = weeks * np.tile([-1, 1], n_controls)
+    event_days = np.asarray(event_days, dtype=np.int64)
+    known = event_days != MISSING_DAY
+    candidates = np.where(known, event_days, 0)[:, None] + offsets[None, :]
+
+    valid = (
+        known[:, None]
+        & _contains(np.unique(available_days), candidates)
+        & ~_contains(np.unique(excluded_days), candidates)
+    )
+    keep = valid & (np.cumsum(valid, axis=1) <= n_controls)
+    event_index, column = np.nonzero(keep)
+    return event_index, candidates[event_index, column]
+
+
 def get_control_days(
     event_date: pd.Timestamp,
     all_dates: pd.DatetimeIndex,
@@ -76,113 +304,218 @@ def get_control_days(
     List[pd.Timestamp]
         Control day dates
     """
-    controls: list[pd.Timestamp] = []
-    all_dates_set = set(all_dates)
-
-    # Look for same day-of-week in adjacent weeks
-    for weeks in range(1, n_controls + 1):
-        before = event_date - pd.Timedelta(weeks=weeks)
-        after = event_date + pd.Timedelta(weeks=weeks)
-
-        if before in all_dates_set and before not in event_dates:
-            controls.append(before)
-        if after in all_dates_set and after not in event_dates:
-            controls.append(after)
-
-        if len(controls) >= n_controls:
-            break
-
-    return controls[:n_controls]
+    _, control_days = match_control_days(
+        to_day_numbers([event_date]),
+        to_day_numbers(all_dates),
+        to_day_numbers(list(event_dates)),
+        n_controls,
+    )
+    return list(from_day_numbers(control_days))
 
 
 def calculate_event_impact(
-    crime_df: pd.DataFrame,
+    crime_df: pd.DataFrame | None,
     event_df: pd.DataFrame,
     crime_category: str = None,
     date_col: str = "dispatch_date",
+    daily_counts: pd.DataFrame | None = None,
+    days_before: int = 0,
+    days_after: int = 0,
 ) -> dict[str, Any]:
     """Calculate difference-in-means for event vs control days.
 
+    Days in the window around an event (by default the event day alone)
+    count as event days; every other day in the data is a control day.
+
     Parameters
     ----------
-    crime_df : pd.DataFrame
-        Crime incidents with date column
+    crime_df : pd.DataFrame or None
+        Crime incidents with date column (unused when ``daily_counts`` is given)
     event_df : pd.DataFrame
         Event calendar with 'date' column
     crime_category : str, optional
         Filter to specific crime category
     date_col : str
         Name of date column in crime_df
+    daily_counts : pd.DataFrame, optional
+        Output of ``daily_category_counts``; computed from crime_df if omitted
+    days_before : int
+        Days before each event counted as event days
+    days_after : int
+        Days after each event counted as event days
 
     Returns
     -------
     dict
         Dictionary with mean counts, difference, and statistical tests
+        (means and p-value are None when there are no event or control days)
     """
     from scipy import stats
 
-    df = crime_df.copy()
-    df[date_col] = pd.to_datetime(df[date_col]).dt.normalize()
-
-    if crime_category:
-        df = df[df["crime_category"] == crime_category]
-
-    # Daily counts
-    daily_counts = df.groupby(date_col).size()
-
-    event_dates = set(event_df["date"])
-    event_counts = daily_counts[daily_counts.index.isin(event_dates)]
-    control_counts = daily_counts[~daily_counts.index.isin(event_dates)]
-
-    event_mean = event_counts.mean()
-    control_mean = control_counts.mean()
-    diff = event_mean - control_mean
-
-    # T-test for statistical significance
-    t_result = stats.ttest_ind(event_counts, control_counts)
+    if daily_counts is None:
+        daily_counts = daily_category_counts(crime_df, date_col)
+    counts = daily_counts[crime_category or ALL_CRIMES].to_numpy(dtype=np.float64)
+
+    is_event = _in_windows(
+        to_day_numbers(daily_counts.index),
+        to_day_numbers(event_df["date"]),
+        days_before,
+        days_after,
+    )
+    event_counts = counts[is_event]
+    control_counts = counts[~is_event]
+
+    if len(event_counts) == 0 or len(control_counts) == 0:
+        event_mean = float(event_counts.mean()) if len(event_counts) else None
+        control_mean = float(control_counts.mean()) if len(control_counts) else None
+        diff, p_value = None, None
+    else:
+        event_mean = float(event_counts.mean())
+        control_mean = float(control_counts.mean())
+        diff = event_mean - control_mean
+        # T-test for statistical significance; degenerate (constant) samples
+        # give NaN, reported as None
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)
+            p_value = float(stats.ttest_ind(event_counts, control_counts).pvalue)
+        if np.isnan(p_value):
+            p_value = None
 
     return {
         "event_mean": event_mean,
         "control_mean": control_mean,
         "difference": diff,
-        "pct_change": (diff / control_mean * 100) if control_mean > 0 else None,
-        "p_value": t_result.pvalue,
-        "n_event_days": len(event_counts),
-        "n_control_days": len(control_counts),
-        "significant": t_result.pvalue < 0.05,
+        "pct_change": (diff / control_mean * 100)
+        if diff is not None and control_mean > 0
+        else None,
+        "p_value": p_value,
+        "n_event_days": int(is_event.sum()),
+        "n_control_days": int((~is_event).sum()),
+        "significant": p_value is not None and p_value < 0.05,
     }
 
 
 def calculate_event_impact_by_type(
-    crime_df: pd.DataFrame, event_df: pd.DataFrame, date_col: str = "dispatch_date"
+    crime_df: pd.DataFrame | None,
+    event_df: pd.DataFrame,
+    date_col: str = "dispatch_date",
+    crime_category: str | None = None,
+    daily_counts: pd.DataFrame | None = None,
+    days_before: int = 0,
+    days_after: int = 0,
 ) -> pd.DataFrame:
     """Calculate event impact separately for each event type.
 
     Parameters
     ----------
-    crime_df : pd.DataFrame
-        Crime incidents with date column
+    crime_df : pd.DataFrame or None
+        Crime incidents with date column (unused when ``daily_counts`` is given)
     event_df : pd.DataFrame
         Event calendar with 'date' and 'event_type' columns
     date_col : str
         Name of date column in crime_df
+    crime_category : str, optional
+        Filter to specific crime category
+    daily_counts : pd.DataFrame, optional
+        Output of ``daily_category_counts``; computed once from crime_df if omitted
+    days_before : int
+        Days before each event counted as event days
+    days_after : int
+        Days after each event counted as event days
 
     Returns
     -------
     pd.DataFrame
         Impact statistics by event type
     """
-    results = []
+    if daily_counts is None:
+        daily_counts = daily_category_counts(crime_df, date_col)
 
+    results = []
     for event_type in event_df["event_type"].unique():
         type_events = event_df[event_df["event_type"] == event_type]
-        impact = calculate_event_impact(crime_df, type_events, date_col=date_col)
+        impact = calculate_event_impact(
+            None,
+            type_events,
+            crime_category=crime_category,
+            daily_counts=daily_counts,
+            days_before=days_before,
+            days_after=days_after,
+        )
         impact["event_type"] = event_type
         results.append(impact)
 
     return pd.DataFrame(results)
 
 
+def event_impact_intervals(
+    daily_counts: pd.DataFrame,
+    event_df: pd.DataFrame,
+    columns: list[str] | None = None,
+    n_resamples: int = 2000,
+    level: float = 0.95,
+    seed: int = 42,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    """Bootstrap confidence intervals for event vs control day means.
+
+    Runs one job per event type; within a job every column (crime
+    category) is resampled from the same draws.
+
+    Parameters
+    ----------
+    daily_counts : pd.DataFrame
+        Output of ``daily_category_counts``
+    event_df : pd.DataFrame
+        Event calendar with 'date' and 'event_type' columns
+    columns : list of str, optional
+        Columns of daily_counts to test. Default all
+    n_resamples : int
+        Bootstrap replicates per event type
+    level : float
+        Confidence level
+    seed : int
+        Base seed (results do not depend on n_jobs)
+    n_jobs : int
+        Parallel jobs over event types (-1 = all cores)
+
+    Returns
+    -------
+    pd.DataFrame
+        One row per event type and column with 'event_type',
+        'crime_category', 'ci_lower', 'ci_upper' (for the difference in
+        daily means) and 'bootstrap_p_value'. Event types with no event
+        days, or no control days, in the data are left out.
+    """
+    columns = list(daily_counts.columns) if columns is None else list(columns)
+    values = daily_counts[columns].to_numpy(dtype=np.float64)
+    days = to_day_numbers(daily_counts.index)
+
+    groups = {}
+    for event_type in event_df["event_type"].unique():
+        type_days = to_day_numbers(event_df.loc[event_df["event_type"] == event_type, "date"])
+        is_event = _contains(np.unique(type_days), days)
+        if is_event.any() and not is_event.all():
+            groups[event_type] = (values[is_event], values[~is_event])
+
+    results = resample_groups(groups, "bootstrap", n_resamples, level, seed, n_jobs)
+    rows = [
+        {
+            "event_type": event_type,
+            "crime_category": column,
+            "ci_lower": float(result["ci_lower"][j]),
+            "ci_upper": float(result["ci_upper"][j]),
+            "bootstrap_p_value": float(result["p_value"][j]),
+        }
+        for event_type, result in results.iterrows()
+        for j, column in enumerate(columns)
+    ]
+    return pd.DataFrame(
+        rows,
+        columns=["event_type", "crime_category", "ci_lower", "ci_upper", "bootstrap_p_value"],
+    )
+
+
 def generate_matched_controls(
     event_df: pd.DataFrame,
     crime_df: pd.DataFrame,
@@ -209,23 +542,21 @@ def generate_matched_controls(
     pd.DataFrame
         Control days with event_date they are matched to
     """
-    df = crime_df.copy()
-    df[date_col] = pd.to_datetime(df[date_col]).dt.normalize()
-    all_dates = pd.DatetimeIndex(df[date_col].unique())
-    event_dates = set(event_df["date"])
-
-    controls = []
-    for _, row in event_df.iterrows():
-        event_date = row["date"]
-        matched = get_control_days(event_date, all_dates, event_dates, n_controls)
-        for control_date in matched:
-            controls.append(
-                {
-                    "control_date": control_date,
-                    "matched_event_date": event_date,
-                    "event_type": row.get("event_type", "unknown"),
-                    "event_name": row.get("event_name", "unknown"),
-                }
-            )
-
-    return pd.DataFrame(controls)
+    event_days = to_day_numbers(event_df["date"])
+    event_index, control_days = match_control_days(
+        event_days, to_day_numbers(crime_df[date_col]), event_days, n_controls
+    )
+
+    def _event_column(name: str) -> np.ndarray:
+        if name not in event_df.columns:
+            return np.full(len(event_index), "unknown", dtype=object)
+        return event_df[name].to_numpy()[event_index]
+
+    return pd.DataFrame(
+        {
+            "control_date": from_day_numbers(control_days),
+            "matched_event_date": event_df["date"].to_numpy()[event_index],
+            "event_type": _event_column("event_type"),
+            "event_name": _event_column("event_name"),
+        }
+    )
@@ -12,12 +12,15 @@ import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import joblib
 import numpy as np
 import pandas as pd
+from sklearn.base import clone
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import classification_report, confusion_matrix, roc_auc_score
 from sklearn.model_selection import TimeSeriesSplit
 from sklearn.preprocessing import StandardScaler
+from sklearn.tree import DecisionTreeClassifier
 
 if TYPE_CHECKING:
     from shap import Explainer
@@ -132,6 +135,134 @@ def train_random_forest(
     return model, scaler
 
 
+def aggregate_training_rows(
+    X: pd.DataFrame, y: pd.Series, weights: np.ndarray | pd.Series | None = None
+) -> tuple[pd.DataFrame, pd.Series, np.ndarray]:
+    """
+    Collapse duplicate (features, label) rows into unique rows with counts.
+
+    Low-cardinality features such as year/month/day_of_week/hour leave a few
+    thousand distinct rows out of millions of incidents; the counts become
+    ``sample_weight`` so a model fitted on the unique rows sees the same
+    class balance and split impurities as one fitted on every row.
+
+    Args:
+        X: Feature DataFrame
+        y: Target Series (aligned positionally with X)
+        weights: Optional per-row weights (e.g. ``sample_weight`` of a fast-mode
+            sample); each unique row then carries the sum of its rows' weights
+
+    Returns:
+        Tuple of (X_unique, y_unique, weights), sorted by feature values
+    """
+    target = "__target__"
+    frame = X.reset_index(drop=True)
+    frame[target] = np.asarray(y)
+    grouped = frame.groupby([*X.columns, target], observed=True, dropna=False, sort=True)
+    if weights is None:
+        counts = grouped.size()
+    else:
+        counts = (
+            pd.Series(np.asarray(weights, dtype=np.float64))
+            .groupby([frame[col] for col in grouped.keys], observed=True, dropna=False, sort=True)
+            .sum()
+        )
+    unique = counts.index.to_frame(index=False)
+    X_unique = unique[list(X.columns)].astype(X.dtypes.to_dict())
+    y_unique = unique[target].astype(y.dtype).rename(y.name)
+    return X_unique, y_unique, counts.to_numpy(dtype=np.float64)
+
+
+def _fit_weighted_tree(
+    template: DecisionTreeClassifier,
+    X: np.ndarray,
+    y: np.ndarray,
+    sample_weight: np.ndarray,
+    seed: int,
+) -> DecisionTreeClassifier:
+    tree = clone(template).set_params(random_state=seed)
+    return tree.fit(X, y, sample_weight=sample_weight)
+
+
+def train_weighted_forest(
+    X: pd.DataFrame,
+    y: pd.Series,
+    sample_weight: np.ndarray | None = None,
+    n_estimators: int = 100,
+    random_state: int = 42,
+    n_jobs: int = -1,
+) -> RandomForestClassifier:
+    """
+    Train a Random Forest on unique feature rows weighted by their counts.
+
+    Each tree gets its own bootstrap of the underlying incidents, drawn as
+    multinomial counts over the unique rows and passed as ``sample_weight``.
+    A plain bootstrap over the unique rows would instead drop whole feature
+    combinations from every tree and shift the feature importances. All
+    draws are made up front and the trees are fitted in parallel threads
+    (tree building releases the GIL); the first tree is fitted by the forest
+    itself so the returned model is a regular RandomForestClassifier.
+
+    Args:
+        X: Feature DataFrame (one row per incident, or already aggregated)
+        y: Target Series
+        sample_weight: Row counts when X, y come from aggregate_training_rows;
+            None aggregates X, y here
+        n_estimators: Number of trees
+        random_state: Random seed for reproducibility
+        n_jobs: Parallel jobs for fitting and prediction (-1 = all cores)
+
+    Returns:
+        Fitted RandomForestClassifier
+    """
+    if sample_weight is None:
+        X, y, sample_weight = aggregate_training_rows(X, y)
+
+    rng = np.random.default_rng(random_state)
+    total = int(round(sample_weight.sum()))
+    draws = rng.multinomial(total, sample_weight / sample_weight.sum(), size=n_estimators)
+    seeds = rng.integers(np.iinfo(np.int32).max, size=n_estimators)
+
+    model = RandomForestClassifier(
+        n_estimators=1, random_state=random_state, bootstrap=False, n_jobs=n_jobs
+    )
+    model.fit(X, y, sample_weight=draws[0])
+    first = model.estimators_[0]
+
+    # Same input encoding as the forest's own trees: float32 features, class indices
+    X_array = np.asarray(X, dtype=np.float32)
+    y_index = np.searchsorted(model.classes_, np.asarray(y)).astype(np.float64)
+    rest = joblib.Parallel(n_jobs=n_jobs, prefer="threads")(
+        joblib.delayed(_fit_weighted_tree)(first, X_array, y_index, draws[i], int(seeds[i]))
+        for i in range(1, n_estimators)
+    )
+    model.estimators_ = [first, *rest]
+    model.set_params(n_estimators=n_estimators)
+    return model
+
+
+def weighted_accuracy(
+    model: RandomForestClassifier,
+    X: pd.DataFrame,
+    y: pd.Series,
+    weights: np.ndarray | pd.Series | None = None,
+) -> float:
+    """
+    Accuracy of ``model`` on X, y, predicting each unique feature row once.
+
+    Args:
+        model: Fitted classifier
+        X: Feature DataFrame (one row per incident)
+        y: True labels
+        weights: Optional per-row weights (e.g. ``sample_weight``)
+
+    Returns:
+        Fraction of rows (or of total weight) predicted correctly
+    """
+    X_unique, y_unique, weights = aggregate_training_rows(X, y, weights)
+    return float(model.score(X_unique, y_unique, sample_weight=weights))
+
+
 def train_xgboost(
     X_train: pd.DataFrame,
     y_train: pd.Series,
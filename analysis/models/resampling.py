@@ -0,0 +1,239 @@
+"""
+Resampling Significance Tests for Crime Analysis
+
+This module provides bootstrap confidence intervals and permutation tests for
+differences in mean daily counts (event vs control days, before vs after
+periods). Replicates are computed in batches from one random draw matrix per
+batch, and independent comparisons can run in parallel threads.
+
+All imports use absolute paths via __file__ to ensure modules work regardless
+of working directory.
+"""
+
+import sys
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any, Literal
+
+import joblib
+import numpy as np
+import pandas as pd
+
+# Ensure absolute path resolution
+MODULE_DIR = Path(__file__).parent.absolute()
+REPO_ROOT = MODULE_DIR.parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+# Upper bound on random draws held in memory at once (replicates x observations)
+MAX_BATCH_CELLS = 1 << 22
+
+
+def _as_columns(values: Any, name: str) -> np.ndarray:
+    array = np.asarray(values, dtype=np.float64)
+    if array.ndim == 1:
+        array = array[:, None]
+    if array.ndim != 2 or len(array) == 0:
+        raise ValueError(f"{name} must be a non-empty 1-D or 2-D array, got shape {array.shape}")
+    return array
+
+
+def _batches(n_resamples: int, n_obs: int) -> Iterator[slice]:
+    size = max(1, MAX_BATCH_CELLS // max(n_obs, 1))
+    for start in range(0, n_resamples, size):
+        yield slice(start, min(start + size, n_resamples))
+
+
+def _row_counts(indices: np.ndarray, n: int) -> np.ndarray:
+    """How often each of ``n`` positions is drawn in each row of ``indices``."""
+    rows = len(indices)
+    flat = indices + (np.arange(rows) * n)[:, None]
+    counts = np.bincount(flat.ravel(), minlength=rows * n).reshape(rows, n)
+    # Float counts keep the following matrix product on BLAS
+    return counts.astype(np.float64)
+
+
+def _shape_result(result: dict[str, Any], one_dimensional: bool) -> dict[str, Any]:
+    if not one_dimensional:
+        return result
+    return {
+        key: float(value[0]) if isinstance(value, np.ndarray) else value
+        for key, value in result.items()
+    }
+
+
+def bootstrap_mean_difference(
+    treated: Any,
+    control: Any,
+    n_resamples: int = 2000,
+    level: float = 0.95,
+    seed: int | np.random.SeedSequence | None = 42,
+) -> dict[str, Any]:
+    """
+    Bootstrap the difference in means between two groups.
+
+    Each batch of replicates comes from one uniform draw matrix with a
+    column per observation: the first ``len(treated)`` columns resample the
+    treated group, the rest the control group. Resampled means are computed
+    as draw counts times values, so several series (columns of a 2-D input,
+    e.g. one per crime category) share the same draws.
+
+    Args:
+        treated: Treated-group values, shape (n_treated,) or (n_treated, k)
+        control: Control-group values, shape (n_control,) or (n_control, k)
+        n_resamples: Number of bootstrap replicates
+        level: Confidence level of the percentile interval
+        seed: Seed (or SeedSequence) for the draws
+
+    Returns:
+        Dictionary with 'difference' (observed mean(treated) - mean(control)),
+        'ci_lower', 'ci_upper', 'p_value' (two-sided, from the replicates
+        re-centred on zero) and 'n_resamples'. Values are floats for 1-D
+        inputs and length-k arrays for 2-D inputs.
+
+    Raises:
+        ValueError: If a group is empty or the groups have different widths
+    """
+    one_dimensional = np.ndim(treated) == 1
+    treated = _as_columns(treated, "treated")
+    control = _as_columns(control, "control")
+    if treated.shape[1] != control.shape[1]:
+        raise ValueError("treated and control must have the same number of columns")
+
+    n_treated, n_control = len(treated), len(control)
+    observed = treated.mean(axis=0) - control.mean(axis=0)
+    rng = np.random.default_rng(seed)
+
+    replicates = np.empty((n_resamples, treated.shape[1]))
+    for batch in _batches(n_resamples, n_treated + n_control):
+        draws = rng.random((batch.stop - batch.start, n_treated + n_control))
+        treated_idx = (draws[:, :n_treated] * n_treated).astype(np.int64)
+        control_idx = (draws[:, n_treated:] * n_control).astype(np.int64)
+        replicates[batch] = (_row_counts(treated_idx, n_treated) @ treated) / n_treated - (
+            _row_counts(control_idx, n_control) @ control
+        ) / n_control
+
+    alpha = 1 - level
+    lower, upper = np.quantile(replicates, [alpha / 2, 1 - alpha / 2], axis=0)
+    exceed = (np.abs(replicates - observed) >= np.abs(observed)).sum(axis=0)
+    result = {
+        "difference": observed,
+        "ci_lower": lower,
+        "ci_upper": upper,
+        "p_value": (exceed + 1) / (n_resamples + 1),
+        "n_resamples": n_resamples,
+    }
+    return _shape_result(result, one_dimensional)
+
+
+def permutation_mean_difference(
+    treated: Any,
+    control: Any,
+    n_resamples: int = 2000,
+    seed: int | np.random.SeedSequence | None = 42,
+) -> dict[str, Any]:
+    """
+    Permutation test for the difference in means between two groups.
+
+    Each replicate relabels a random ``len(treated)`` of the pooled
+    observations as treated; a batch of replicates is the smallest keys
+    of one uniform draw matrix per row (``np.argpartition``).
+
+    Args:
+        treated: Treated-group values, shape (n_treated,) or (n_treated, k)
+        control: Control-group values, shape (n_control,) or (n_control, k)
+        n_resamples: Number of permutations
+        seed: Seed (or SeedSequence) for the draws
+
+    Returns:
+        Dictionary with 'difference', 'p_value' (two-sided) and
+        'n_resamples'; floats for 1-D inputs, length-k arrays for 2-D inputs
+
+    Raises:
+        ValueError: If a group is empty or the groups have different widths
+    """
+    one_dimensional = np.ndim(treated) == 1
+    treated = _as_columns(treated, "treated")
+    control = _as_columns(control, "control")
+    if treated.shape[1] != control.shape[1]:
+        raise ValueError("treated and control must have the same number of columns")
+
+    pooled = np.vstack([treated, control])
+    n_treated, n_pooled = len(treated), len(pooled)
+    total = pooled.sum(axis=0)
+    observed = treated.mean(axis=0) - control.mean(axis=0)
+    rng = np.random.default_rng(seed)
+
+    exceed = np.zeros(pooled.shape[1], dtype=np.int64)
+    for batch in _batches(n_resamples, n_pooled):
+        keys = rng.random((batch.stop - batch.start, n_pooled))
+        picked = np.argpartition(keys, n_treated - 1, axis=1)[:, :n_treated]
+        treated_sum = _row_counts(picked, n_pooled) @ pooled
+        difference = treated_sum / n_treated - (total - treated_sum) / (n_pooled - n_treated)
+        # Small tolerance so ties with the observed statistic count as extreme
+        exceed += (np.abs(difference) >= np.abs(observed) - 1e-12).sum(axis=0)
+
+    result = {
+        "difference": observed,
+        "p_value": (exceed + 1) / (n_resamples + 1),
+        "n_resamples": n_resamples,
+    }
+    return _shape_result(result, one_dimensional)
+
+
+_METHODS = ("bootstrap", "permutation")
+
+
+def _compare_group(
+    treated: Any,
+    control: Any,
+    method: str,
+    n_resamples: int,
+    level: float,
+    seed: np.random.SeedSequence,
+) -> dict[str, Any]:
+    if method == "bootstrap":
+        return bootstrap_mean_difference(treated, control, n_resamples, level=level, seed=seed)
+    return permutation_mean_difference(treated, control, n_resamples, seed=seed)
+
+
+def resample_groups(
+    groups: Mapping[Any, tuple[Any, Any]],
+    method: Literal["bootstrap", "permutation"] = "bootstrap",
+    n_resamples: int = 2000,
+    level: float = 0.95,
+    seed: int = 42,
+    n_jobs: int = 1,
+) -> pd.DataFrame:
+    """
+    Run independent two-group comparisons, one job per group.
+
+    Each group gets its own child of ``SeedSequence(seed)``, so results do
+    not depend on ``n_jobs``. Jobs run in threads: the work is NumPy kernels
+    that release the GIL, and threads avoid copying the inputs to workers.
+
+    Args:
+        groups: Mapping of group name (e.g. event type) to (treated, control) values
+        method: 'bootstrap' (difference, CI and p-value) or 'permutation'
+            (difference and p-value)
+        n_resamples: Replicates per group
+        level: Confidence level for bootstrap intervals
+        seed: Base seed
+        n_jobs: Parallel jobs (-1 = all cores)
+
+    Returns:
+        DataFrame indexed by group name with one column per result key. For
+        2-D inputs each cell holds a length-k array.
+
+    Raises:
+        ValueError: If method is unknown
+    """
+    if method not in _METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {', '.join(_METHODS)}")
+
+    names = list(groups)
+    seeds = np.random.SeedSequence(seed).spawn(len(names))
+    results = joblib.Parallel(n_jobs=n_jobs, prefer="threads")(
+        joblib.delayed(_compare_group)(*groups[name], method, n_resamples, level, child)
+        for name, child in zip(names, seeds, strict=True)
+    )
+    return pd.DataFrame(list(results), index=pd.Index(names, name="group"))
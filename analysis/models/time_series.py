@@ -2,14 +2,19 @@
 Time Series Forecasting Utilities for Crime Analysis
 
 This module provides utilities for time series preprocessing, Prophet model
-configuration, and forecast evaluation.
+configuration, fast statistical baseline forecasters (seasonal naive,
+Holt-Winters ETS, seasonal regression, ARIMA) with analytic prediction
+intervals, and forecast evaluation.
 
 All imports use absolute paths via __file__ to ensure modules work regardless
 of working directory.
 """
 
 import sys
+import warnings
+from collections.abc import Callable
 from pathlib import Path
+from statistics import NormalDist
 from typing import Any
 
 import numpy as np
@@ -179,3 +184,236 @@ def detect_anomalies(
     anomalies = threshold_anomaly | interval_anomaly
 
     return anomalies
+
+
+# Built-in forecasters selectable via TimeSeriesConfig.model_type, with the
+# model name reported in exports
+BASELINE_MODELS: dict[str, str] = {
+    "naive": "SeasonalNaive",
+    "ets": "ETS",
+    "regression": "SeasonalRegression",
+    "arima": "ARIMA",
+}
+
+# Smoothing-parameter grid searched (all at once) by holt_winters_forecast
+_ETS_ALPHAS = np.linspace(0.05, 0.95, 19)
+_ETS_BETAS = np.array([0.0, 0.01, 0.03, 0.05, 0.1, 0.2])
+_ETS_GAMMAS = np.array([0.0, 0.05, 0.1, 0.2, 0.3, 0.5])
+
+
+def _series_values(y: Any, min_length: int = 2) -> np.ndarray:
+    values = np.asarray(y, dtype=np.float64)
+    if values.ndim != 1 or len(values) < min_length or not np.isfinite(values).all():
+        raise ValueError(
+            f"Expected a 1-D series of at least {min_length} finite values, got {values.shape}"
+        )
+    return values
+
+
+def _interval_frame(yhat: np.ndarray, sd: np.ndarray, level: float) -> pd.DataFrame:
+    z = NormalDist().inv_cdf(0.5 + level / 2)
+    return pd.DataFrame(
+        {
+            "step": np.arange(1, len(yhat) + 1),
+            "yhat": yhat,
+            "yhat_lower": yhat - z * sd,
+            "yhat_upper": yhat + z * sd,
+        }
+    )
+
+
+def seasonal_naive_forecast(
+    y: Any, horizon: int, season_length: int = 12, level: float = 0.95
+) -> pd.DataFrame:
+    """
+    Forecast each period as the same period one season earlier.
+
+    Args:
+        y: Observed values, oldest first
+        horizon: Number of periods to forecast
+        season_length: Periods per season (naive random walk if the series
+            is not longer than one season)
+        level: Prediction interval coverage
+
+    Returns:
+        DataFrame with 'step' (1..horizon), 'yhat', 'yhat_lower', 'yhat_upper'
+    """
+    values = _series_values(y)
+    m = season_length if len(values) > season_length else 1
+    steps = np.arange(1, horizon + 1)
+    yhat = values[len(values) - m + (steps - 1) % m]
+
+    # Interval widens with the number of whole seasons ahead
+    residuals = values[m:] - values[:-m]
+    sigma = np.sqrt(np.mean(residuals**2))
+    return _interval_frame(yhat, sigma * np.sqrt((steps - 1) // m + 1), level)
+
+
+def holt_winters_forecast(
+    y: Any, horizon: int, season_length: int = 12, level: float = 0.95
+) -> pd.DataFrame:
+    """
+    Additive Holt-Winters (ETS(A,A,A)) forecast with analytic intervals.
+
+    Smoothing parameters are chosen by minimum in-sample squared error over
+    a fixed grid; the recursion runs once with the whole grid as a vector,
+    so fitting takes milliseconds.
+
+    Args:
+        y: Observed values, oldest first
+        horizon: Number of periods to forecast
+        season_length: Periods per season (seasonality is dropped when the
+            series covers fewer than two seasons)
+        level: Prediction interval coverage
+
+    Returns:
+        DataFrame with 'step' (1..horizon), 'yhat', 'yhat_lower', 'yhat_upper'
+    """
+    values = _series_values(y)
+    n = len(values)
+    m = season_length if n >= 2 * season_length else 1
+    seasonal = m > 1
+
+    gammas = _ETS_GAMMAS if seasonal else np.zeros(1)
+    alpha, beta, gamma = (
+        grid.ravel() for grid in np.meshgrid(_ETS_ALPHAS, _ETS_BETAS, gammas, indexing="ij")
+    )
+    valid = (beta <= alpha) & (gamma <= 1 - alpha)
+    alpha, beta, gamma = alpha[valid], beta[valid], gamma[valid]
+
+    if seasonal:
+        level0 = values[:m].mean()
+        trend0 = (values[m : 2 * m].mean() - level0) / m
+        season0 = values[:m] - level0
+    else:
+        level0, trend0, season0 = values[0], values[1] - values[0], np.zeros(1)
+
+    lvl = np.full(len(alpha), level0)
+    trend = np.full(len(alpha), trend0)
+    season = np.tile(season0, (len(alpha), 1))
+    sse = np.zeros(len(alpha))
+    for t, value in enumerate(values):
+        j = t % m
+        error = value - (lvl + trend + season[:, j])
+        sse += error**2
+        lvl = lvl + trend + alpha * error
+        trend = trend + beta * error
+        season[:, j] += gamma * error
+
+    best = int(np.argmin(sse))
+    steps = np.arange(1, horizon + 1)
+    yhat = lvl[best] + steps * trend[best] + season[best, (n - 1 + steps) % m]
+
+    # Var(h) = sigma^2 * (1 + sum_{j<h} c_j^2), c_j = alpha + beta*j + gamma*[j % m == 0]
+    n_params = 2 + (m + 1 if seasonal else 1)
+    sigma2 = sse[best] / max(n - n_params, 1)
+    lags = np.arange(1, horizon)
+    c = alpha[best] + beta[best] * lags + gamma[best] * (lags % m == 0)
+    variance = sigma2 * (1 + np.concatenate([[0.0], np.cumsum(c**2)]))
+    return _interval_frame(yhat, np.sqrt(variance), level)
+
+
+def seasonal_regression_forecast(
+    y: Any, horizon: int, season_length: int = 12, level: float = 0.95
+) -> pd.DataFrame:
+    """
+    Least-squares trend plus seasonal dummies, with OLS prediction intervals.
+
+    Args:
+        y: Observed values, oldest first
+        horizon: Number of periods to forecast
+        season_length: Periods per season (trend only when the series is too
+            short to estimate every seasonal dummy)
+        level: Prediction interval coverage
+
+    Returns:
+        DataFrame with 'step' (1..horizon), 'yhat', 'yhat_lower', 'yhat_upper'
+    """
+    values = _series_values(y, min_length=3)
+    n = len(values)
+    m = season_length if n > season_length + 2 else 1
+
+    t = np.arange(n + horizon)
+    design = np.column_stack(
+        [np.ones(n + horizon), t, (t[:, None] % m == np.arange(1, m)).astype(np.float64)]
+    )
+    train, future = design[:n], design[n:]
+    coef, *_ = np.linalg.lstsq(train, values, rcond=None)
+
+    residuals = values - train @ coef
+    sigma2 = residuals @ residuals / max(n - train.shape[1], 1)
+    leverage = np.einsum("ij,jk,ik->i", future, np.linalg.pinv(train.T @ train), future)
+    return _interval_frame(future @ coef, np.sqrt(sigma2 * (1 + leverage)), level)
+
+
+def arima_forecast(
+    y: Any, horizon: int, season_length: int = 12, level: float = 0.95
+) -> pd.DataFrame:
+    """
+    Seasonal ARIMA(1,1,1)(0,1,1) forecast via statsmodels state-space intervals.
+
+    Args:
+        y: Observed values, oldest first
+        horizon: Number of periods to forecast
+        season_length: Periods per season (non-seasonal ARIMA(1,1,1) when
+            the series covers fewer than three seasons)
+        level: Prediction interval coverage
+
+    Returns:
+        DataFrame with 'step' (1..horizon), 'yhat', 'yhat_lower', 'yhat_upper'
+    """
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    values = _series_values(y, min_length=4)
+    seasonal_order = (0, 1, 1, season_length) if len(values) >= 3 * season_length else (0, 0, 0, 0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        result = SARIMAX(values, order=(1, 1, 1), seasonal_order=seasonal_order).fit(disp=False)
+    forecast = result.get_forecast(horizon)
+    bounds = np.asarray(forecast.conf_int(alpha=1 - level))
+    return pd.DataFrame(
+        {
+            "step": np.arange(1, horizon + 1),
+            "yhat": np.asarray(forecast.predicted_mean),
+            "yhat_lower": bounds[:, 0],
+            "yhat_upper": bounds[:, 1],
+        }
+    )
+
+
+_FORECASTERS: dict[str, Callable[..., pd.DataFrame]] = {
+    "naive": seasonal_naive_forecast,
+    "ets": holt_winters_forecast,
+    "regression": seasonal_regression_forecast,
+    "arima": arima_forecast,
+}
+
+
+def forecast_baseline(
+    y: Any,
+    horizon: int,
+    model_type: str = "ets",
+    season_length: int = 12,
+    level: float = 0.95,
+) -> pd.DataFrame:
+    """
+    Forecast with one of the built-in statistical models.
+
+    Args:
+        y: Observed values, oldest first
+        horizon: Number of periods to forecast
+        model_type: 'naive', 'ets', 'regression' or 'arima' (see BASELINE_MODELS)
+        season_length: Periods per season (12 for monthly data)
+        level: Prediction interval coverage
+
+    Returns:
+        DataFrame with 'step' (1..horizon), 'yhat', 'yhat_lower', 'yhat_upper'
+
+    Raises:
+        ValueError: If model_type is not a built-in model or the series is too short
+    """
+    if model_type not in _FORECASTERS:
+        raise ValueError(
+            f"Unknown baseline model {model_type!r}; expected one of {', '.join(_FORECASTERS)}"
+        )
+    return _FORECASTERS[model_type](y, horizon, season_length=season_length, level=level)
@@ -1,18 +1,23 @@
 """
 Model Validation Utilities for Crime Analysis
 
-This module provides utilities for time series cross-validation and model
-evaluation metrics.
+This module provides utilities for time series cross-validation, parallel
+walk-forward backtesting, and model evaluation metrics.
 
 All imports use absolute paths via __file__ to ensure modules work regardless
 of working directory.
 """
 
+import functools
+import hashlib
+import inspect
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
+import joblib
 import numpy as np
 import pandas as pd
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
@@ -58,6 +63,284 @@ def time_series_cv_score(
     }
 
 
+BacktestWindow = Literal["expanding", "sliding"]
+
+
+@dataclass(frozen=True)
+class BacktestResult:
+    """
+    Columnar backtest output: one array entry per fold, predictions flattened.
+
+    Fold ``i`` trained on rows ``train_start[i]:train_end[i]`` and predicted
+    rows ``train_end[i]:test_end[i]``; its predictions, actuals and row
+    positions are ``predictions[offsets[i]:offsets[i + 1]]`` (likewise
+    ``actuals`` and ``positions``).
+    """
+
+    train_start: np.ndarray
+    train_end: np.ndarray
+    test_end: np.ndarray
+    seeds: np.ndarray
+    error: np.ndarray
+    offsets: np.ndarray
+    positions: np.ndarray
+    predictions: np.ndarray
+    actuals: np.ndarray
+
+    @property
+    def n_folds(self) -> int:
+        return len(self.train_end)
+
+    def fold(self, i: int) -> tuple[np.ndarray, np.ndarray]:
+        """(predictions, actuals) of fold ``i``."""
+        window = slice(self.offsets[i], self.offsets[i + 1])
+        return self.predictions[window], self.actuals[window]
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per fold: window bounds, sizes, seed and error."""
+        return pd.DataFrame(
+            {
+                "train_start_idx": self.train_start,
+                "train_end_idx": self.train_end,
+                "test_end_idx": self.test_end,
+                "n_train": self.train_end - self.train_start,
+                "n_test": self.test_end - self.train_end,
+                "seed": self.seeds,
+                "error": self.error,
+            }
+        )
+
+    def predictions_frame(self) -> pd.DataFrame:
+        """One row per prediction: fold, row position, prediction and actual."""
+        return pd.DataFrame(
+            {
+                "fold": np.repeat(np.arange(self.n_folds), np.diff(self.offsets)),
+                "position": self.positions,
+                "prediction": self.predictions,
+                "actual": self.actuals,
+            }
+        )
+
+
+def backtest_folds(
+    n_obs: int,
+    initial_train_size: int,
+    step_size: int = 1,
+    horizon: int | None = None,
+    window: BacktestWindow = "expanding",
+) -> np.ndarray:
+    """
+    Compute walk-forward fold boundaries.
+
+    Args:
+        n_obs: Number of observations in the series
+        initial_train_size: Training rows in the first fold (and the fixed
+            window length when window="sliding")
+        step_size: Rows the forecast origin advances per fold
+        horizon: Rows predicted per fold (None = step_size)
+        window: "expanding" trains on everything before the origin,
+            "sliding" on the last initial_train_size rows
+
+    Returns:
+        Integer array of shape (n_folds, 3): train_start, train_end, test_end
+    """
+    if initial_train_size < 1 or step_size < 1 or (horizon is not None and horizon < 1):
+        raise ValueError("initial_train_size, step_size and horizon must be positive")
+    if window not in ("expanding", "sliding"):
+        raise ValueError(f"window must be 'expanding' or 'sliding', got {window!r}")
+
+    train_end = np.arange(initial_train_size, n_obs, step_size, dtype=np.int64)
+    test_end = np.minimum(train_end + (horizon or step_size), n_obs)
+    if window == "sliding":
+        train_start = train_end - initial_train_size
+    else:
+        train_start = np.zeros_like(train_end)
+    return np.column_stack([train_start, train_end, test_end])
+
+
+def _seed_model(model: Any, seed: int) -> Any:
+    # Sklearn-style estimators left unseeded: pin random_state so folds are
+    # reproducible regardless of which worker runs them. An explicit
+    # random_state from the caller is kept as is.
+    if hasattr(model, "get_params") and model.get_params().get("random_state", 0) is None:
+        model.set_params(random_state=int(seed))
+    return model
+
+
+def _run_folds(
+    model_fn: Callable,
+    X: pd.DataFrame,
+    y: pd.Series,
+    folds: np.ndarray,
+    seeds: np.ndarray,
+    metric_fn: Callable,
+) -> list[tuple[np.ndarray, float]]:
+    """Fit and score a chunk of folds (runs inside a worker process)."""
+    results = []
+    for (train_start, train_end, test_end), seed in zip(folds, seeds, strict=True):
+        model = _seed_model(model_fn(), seed)
+        model.fit(X.iloc[train_start:train_end], y.iloc[train_start:train_end])
+        y_pred = np.asarray(model.predict(X.iloc[train_end:test_end])).ravel()
+        results.append((y_pred, float(metric_fn(y.iloc[train_end:test_end], y_pred))))
+    return results
+
+
+# Closure values folded into a callable's hash; mutable state such as
+# counters is left out so it doesn't invalidate a checkpoint
+_CLOSURE_VALUE_TYPES = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+
+def _code_parts(code: Any) -> tuple:
+    consts = tuple(_code_parts(c) if inspect.iscode(c) else c for c in code.co_consts)
+    return code.co_code, consts, code.co_names
+
+
+def _callable_hash(fn: Callable) -> str:
+    """Hash of a model or metric callable, including partial arguments.
+
+    Classes and module-level functions go to ``joblib.hash`` directly. Plain
+    functions (lambdas and closures included, which joblib cannot pickle)
+    are hashed by their bytecode, constants and immutable closure values.
+    """
+    bound = []
+    while isinstance(fn, functools.partial):
+        bound.append((fn.args, fn.keywords))
+        fn = fn.func
+    target: Any = fn
+    if inspect.isfunction(fn):
+        cells = []
+        for cell in fn.__closure__ or ():
+            try:
+                value = cell.cell_contents
+            except ValueError:  # empty cell
+                continue
+            cells.append(value if isinstance(value, _CLOSURE_VALUE_TYPES) else None)
+        target = (fn.__module__, fn.__qualname__, _code_parts(fn.__code__), cells)
+    return joblib.hash((target, bound))
+
+
+def _backtest_signature(
+    model_fn: Callable,
+    X: pd.DataFrame,
+    y: pd.Series,
+    folds: np.ndarray,
+    seed: int,
+    metric_fn: Callable,
+) -> str:
+    digest = hashlib.sha256(pd.util.hash_pandas_object(X, index=False).to_numpy().tobytes())
+    digest.update(str(list(X.columns)).encode())
+    digest.update(pd.util.hash_pandas_object(y, index=False).to_numpy().tobytes())
+    digest.update(folds.tobytes())
+    digest.update(str(seed).encode())
+    digest.update(_callable_hash(model_fn).encode())
+    digest.update(_callable_hash(metric_fn).encode())
+    return digest.hexdigest()
+
+
+def _load_checkpoint(path: Path, signature: str) -> dict[int, tuple[np.ndarray, float]]:
+    try:
+        state = joblib.load(path)
+    except Exception:  # noqa: BLE001 - unreadable checkpoint means start over
+        return {}
+    if not isinstance(state, dict) or state.get("signature") != signature:
+        return {}
+    return state["folds"]
+
+
+def _save_checkpoint(path: Path, signature: str, done: dict[int, tuple[np.ndarray, float]]) -> None:
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    joblib.dump({"signature": signature, "folds": done}, tmp)
+    tmp.replace(path)
+
+
+def backtest(
+    model_fn: Callable,
+    X: pd.DataFrame,
+    y: pd.Series,
+    initial_train_size: int,
+    step_size: int = 1,
+    horizon: int | None = None,
+    window: BacktestWindow = "expanding",
+    metric_fn: Callable = mean_absolute_error,
+    n_jobs: int = 1,
+    seed: int = 42,
+    checkpoint: Path | str | None = None,
+    chunk_size: int | None = None,
+) -> BacktestResult:
+    """
+    Walk-forward backtest with folds fitted in a process pool.
+
+    Folds are independent, so they run in chunks across ``n_jobs`` worker
+    processes. Each fold gets a seed derived from ``seed`` and its index, set
+    as ``random_state`` on estimators that leave it None, so results don't
+    depend on n_jobs or chunking.
+
+    Args:
+        model_fn: Function that returns a new model instance (must be picklable
+            when n_jobs != 1)
+        X: Feature DataFrame (sorted by time)
+        y: Target Series
+        initial_train_size: Training rows in the first fold
+        step_size: Rows the forecast origin advances per fold
+        horizon: Rows predicted per fold (None = step_size)
+        window: "expanding" or "sliding" training window
+        metric_fn: Function to compute error metric
+        n_jobs: Worker processes (1 = run in this process, -1 = all cores)
+        seed: Base seed for the per-fold seeds
+        checkpoint: File to save completed folds to after every chunk; a
+            rerun with the same model_fn, metric_fn, X, y, fold layout and
+            seed resumes from it (any other run starts over)
+        chunk_size: Folds per task (None = about four tasks per worker)
+
+    Returns:
+        BacktestResult with per-fold arrays and flattened predictions
+    """
+    folds = backtest_folds(len(X), initial_train_size, step_size, horizon, window)
+    n_folds = len(folds)
+    seeds = np.random.default_rng(seed).integers(0, 2**31 - 1, size=n_folds)
+
+    checkpoint_path = Path(checkpoint) if checkpoint is not None else None
+    signature = (
+        _backtest_signature(model_fn, X, y, folds, seed, metric_fn) if checkpoint_path else ""
+    )
+    done = _load_checkpoint(checkpoint_path, signature) if checkpoint_path else {}
+    pending = np.array([i for i in range(n_folds) if i not in done], dtype=np.int64)
+
+    if len(pending):
+        workers = joblib.effective_n_jobs(n_jobs)
+        size = chunk_size or max(1, -(-len(pending) // (workers * 4)))
+        chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+        tasks = (
+            joblib.delayed(_run_folds)(model_fn, X, y, folds[chunk], seeds[chunk], metric_fn)
+            for chunk in chunks
+        )
+        outputs: Iterator[list[tuple[np.ndarray, float]]] = joblib.Parallel(
+            n_jobs=n_jobs, return_as="generator"
+        )(tasks)
+        for chunk, chunk_results in zip(chunks, outputs, strict=True):
+            done.update(zip(chunk.tolist(), chunk_results, strict=True))
+            if checkpoint_path is not None:
+                _save_checkpoint(checkpoint_path, signature, done)
+
+    sizes = folds[:, 2] - folds[:, 1]
+    offsets = np.concatenate([[0], np.cumsum(sizes)])
+    positions = np.concatenate(
+        [np.arange(start, end) for _, start, end in folds] or [np.empty(0, dtype=np.int64)]
+    )
+    predictions = [done[i][0] for i in range(n_folds)]
+    return BacktestResult(
+        train_start=folds[:, 0],
+        train_end=folds[:, 1],
+        test_end=folds[:, 2],
+        seeds=seeds,
+        error=np.array([done[i][1] for i in range(n_folds)], dtype=np.float64),
+        offsets=offsets,
+        positions=positions,
+        predictions=np.concatenate(predictions) if predictions else np.empty(0),
+        actuals=np.asarray(y)[positions],
+    )
+
+
 def walk_forward_validation(
     model_fn: Callable,
     X: pd.DataFrame,
@@ -65,10 +348,15 @@ def walk_forward_validation(
     initial_train_size: int,
     step_size: int = 1,
     metric_fn: Callable = mean_absolute_error,
+    n_jobs: int = 1,
 ) -> pd.DataFrame:
     """
     Perform walk-forward validation for time series.
 
+    Thin wrapper over ``backtest`` (expanding window, horizon = step_size)
+    that keeps the original one-row-per-step layout; use ``backtest``
+    directly for the columnar result, sliding windows and checkpointing.
+
     Args:
         model_fn: Function that returns a new model instance
         X: Feature DataFrame (sorted by time)
@@ -76,48 +364,28 @@ def walk_forward_validation(
         initial_train_size: Initial training window size
         step_size: Number of observations to step forward each iteration
         metric_fn: Function to compute error metric
+        n_jobs: Worker processes for fitting folds (1 = sequential)
 
     Returns:
         DataFrame with predictions and errors for each step
     """
-    results = []
-
-    for i in range(initial_train_size, len(X), step_size):
-        # Train on all data up to i
-        X_train = X.iloc[:i]
-        y_train = y.iloc[:i]
-
-        # Test on next step_size observations
-        X_test = X.iloc[i : i + step_size]
-        y_test = y.iloc[i : i + step_size]
-
-        if len(X_test) == 0:
-            break
-
-        # Train model
-        model = model_fn()
-        model.fit(X_train, y_train)
-
-        # Predict
-        y_pred = model.predict(X_test)
-
-        # Compute error
-        error = metric_fn(y_test, y_pred)
-
-        results.append(
-            {
-                "train_end_idx": i,
-                "test_start_idx": i,
-                "test_end_idx": i + len(X_test),
-                "n_train": len(X_train),
-                "n_test": len(X_test),
-                "error": error,
-                "predictions": y_pred,
-                "actuals": y_test.values,
-            }
-        )
-
-    return pd.DataFrame(results)
+    result = backtest(
+        model_fn, X, y, initial_train_size, step_size, metric_fn=metric_fn, n_jobs=n_jobs
+    )
+    folds = [result.fold(i) for i in range(result.n_folds)]
+
+    return pd.DataFrame(
+        {
+            "train_end_idx": result.train_end,
+            "test_start_idx": result.train_end,
+            "test_end_idx": result.test_end,
+            "n_train": result.train_end - result.train_start,
+            "n_test": result.test_end - result.train_end,
+            "error": result.error,
+            "predictions": [predictions for predictions, _ in folds],
+            "actuals": [actuals for _, actuals in folds],
+        }
+    )
 
 
 def compute_regression_metrics(
@@ -7,6 +7,7 @@ Modules:
     classification: Crime category classification and UCR code mapping
     temporal: Temporal feature extraction (year, month, day_of_week, etc.)
     spatial: Coordinate cleaning, spatial joins, severity scoring
+    corridors: Incident counts near transit/highway corridors (requires geopandas)
 
 Example:
     >>> from analysis.utils.classification import classify_crime_category
@@ -27,7 +28,11 @@ from typing import Any
 
 import pandas as pd
 
-from analysis.utils.classification import CRIME_CATEGORY_MAP, classify_crime_category
+from analysis.utils.classification import (
+    CRIME_CATEGORY_MAP,
+    classify_crime_category,
+    severity_weights,
+)
 from analysis.utils.temporal import extract_temporal_features
 
 # Optional spatial imports (require geopandas)
@@ -87,6 +92,7 @@ else:
 __all__ = [
     "classify_crime_category",
     "CRIME_CATEGORY_MAP",
+    "severity_weights",
     "extract_temporal_features",
     "load_data",
     "clean_coordinates",
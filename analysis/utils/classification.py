@@ -5,6 +5,7 @@ This module provides functions for classifying crimes into categories
 
 Functions:
     classify_crime_category: Classify a single UCR code into a category
+    severity_weights: Look up severity weights for UCR codes
     CRIME_CATEGORY_MAP: Dictionary mapping category names to UCR code sets
 
 The classification uses UCR hundred-bands (first digit of ucr_general code):
@@ -12,13 +13,19 @@ The classification uses UCR hundred-bands (first digit of ucr_general code):
 - Property: 5xx, 6xx, 7xx (Burglary, Theft, Vehicle Theft)
 - Other: All other codes
 
+Both classification and severity weights go through small NumPy lookup
+tables indexed by hundred-band, so each is a single vectorized gather.
+
 See CLAUDE.md for usage guidance and CLI workflow examples.
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from analysis.config import SEVERITY_WEIGHTS
+
 # UCR hundred-bands: 1=Homicide, 2=Rape, 3=Robbery, 4=Agg Assault,
 # 5=Burglary, 6=Theft, 7=Vehicle Theft
 CRIME_CATEGORY_MAP: dict[str, set[int]] = {
@@ -26,8 +33,79 @@ CRIME_CATEGORY_MAP: dict[str, set[int]] = {
     "Property": {5, 6, 7},  # Burglary, Theft, Vehicle Theft
 }
 
+# Fixed category order for the crime_category Categorical (alphabetical, so sorting by
+# category matches sorting by label)
+CRIME_CATEGORIES: tuple[str, ...] = ("Other", "Property", "Violent")
+CRIME_CATEGORY_DTYPE = pd.CategoricalDtype(list(CRIME_CATEGORIES))
+
+
+def _band_lookup(values: dict[int, float] | dict[int, int], fill_value: float) -> np.ndarray:
+    """Build a lookup table indexed by UCR hundred-band.
+
+    Entry ``i`` holds the value for band ``i``; the final entry is ``fill_value`` and is
+    used for bands that are missing, negative, or past the end of the table.
+    """
+    size = max((band for band in values if band >= 0), default=-1) + 1
+    table = np.full(size + 1, fill_value, dtype="float64")
+    for band, value in values.items():
+        if band >= 0:
+            table[band] = value
+    return table
+
+
+def _lookup_bands(ucr: pd.Series, table: np.ndarray) -> np.ndarray:
+    """Map UCR codes through a band lookup table built by ``_band_lookup``."""
+    codes = pd.to_numeric(ucr, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        bands = np.floor_divide(codes, 100)
+        valid = (bands >= 0) & (bands < len(table) - 1)
+    index = np.full(len(codes), len(table) - 1, dtype="intp")
+    index[valid] = bands[valid]
+    return table[index]
+
+
+_CATEGORY_TABLE = _band_lookup(
+    {
+        band: CRIME_CATEGORIES.index(category)
+        for category, bands in CRIME_CATEGORY_MAP.items()
+        for band in bands
+    },
+    fill_value=CRIME_CATEGORIES.index("Other"),
+).astype("int8")
+
+
+def severity_weights(
+    ucr: pd.Series,
+    weights: dict[int, float] | None = None,
+    fill_value: float = 0.5,
+) -> np.ndarray:
+    """Look up the severity weight for each UCR code.
+
+    Args:
+        ucr: UCR general codes (numeric or numeric strings).
+        weights: UCR hundred-band (100, 200, ...) to weight mapping.
+            If None, uses ``SEVERITY_WEIGHTS`` from config.
+        fill_value: Weight for missing codes and bands without a weight.
+
+    Returns:
+        Float array of weights aligned with ``ucr``.
+
+    Examples:
+        >>> import pandas as pd
+        >>> severity_weights(pd.Series([100, 600, None])).tolist()
+        [10.0, 1.0, 0.5]
+    """
+    if weights is None:
+        weights = SEVERITY_WEIGHTS
+    # Weights are keyed by band start (100, 200, ...); keys off the hundreds never matched
+    table = _band_lookup(
+        {band // 100: value for band, value in weights.items() if band % 100 == 0},
+        fill_value=fill_value,
+    )
+    return _lookup_bands(ucr, table)
+
 
-def classify_crime_category(df: pd.DataFrame) -> pd.DataFrame:
+def classify_crime_category(df: pd.DataFrame, inplace: bool = False) -> pd.DataFrame:
     """Classify crimes into Violent, Property, or Other.
 
     This function adds a ``crime_category`` column to the DataFrame based
@@ -38,10 +116,13 @@ def classify_crime_category(df: pd.DataFrame) -> pd.DataFrame:
 
     Args:
         df: Dataset containing a ``ucr_general`` column with UCR general codes.
+        inplace: If True, add the column to ``df`` itself instead of to a
+            shallow copy. Default is False.
 
     Returns:
-        DataFrame with a ``crime_category`` column added. Values are
-        ``"Violent"``, ``"Property"``, or ``"Other"``.
+        DataFrame with a categorical ``crime_category`` column added (categories
+        ``CRIME_CATEGORIES``). Values are ``"Violent"``, ``"Property"``, or
+        ``"Other"``. This is ``df`` itself when ``inplace`` is True.
 
     Raises:
         ValueError: If ``ucr_general`` column is not found in the DataFrame.
@@ -56,12 +137,10 @@ def classify_crime_category(df: pd.DataFrame) -> pd.DataFrame:
     if "ucr_general" not in df.columns:
         raise ValueError("Expected 'ucr_general' column for classification")
 
-    df = df.copy()
-    ucr_series = pd.to_numeric(df["ucr_general"], errors="coerce")
-    ucr_group = (ucr_series // 100).astype("Int64")
-
-    df["crime_category"] = "Other"
-    for category, groups in CRIME_CATEGORY_MAP.items():
-        df.loc[ucr_group.isin(groups), "crime_category"] = category
+    codes = _lookup_bands(df["ucr_general"], _CATEGORY_TABLE).astype("int8")
+    category = pd.Categorical.from_codes(codes, dtype=CRIME_CATEGORY_DTYPE)
 
+    if not inplace:
+        df = df.copy(deep=False)
+    df["crime_category"] = category
     return df
@@ -0,0 +1,239 @@
+"""Corridor proximity index for incident data.
+
+This module measures how many incidents fall within a fixed distance of the
+transit and highway corridors in ``data/boundaries/corridors.geojson``
+(see ``scripts/download_corridors.py``).
+
+Functions:
+    load_corridors: Load the cached corridor lines
+    build_corridor_index: Buffer corridors in a metric CRS and index them
+    corridor_crime_stats: Per-corridor incident counts and overall share
+
+Corridors are buffered once in UTM zone 18N (metres) and stored in a shapely
+STRtree. Incident coordinates are projected with a vectorized pyproj
+transform and queried against the tree in fixed-size chunks, so the full
+incident history never has to exist as shapely objects at once.
+
+See CLAUDE.md for usage guidance and CLI workflow examples.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from pyproj import Transformer
+
+from analysis.utils.spatial import get_repo_root
+
+# UTM zone 18N covers Philadelphia; units are metres
+METRIC_CRS: str = "EPSG:32618"
+
+# ~5 city blocks, matching config/phase3_config.yaml
+DEFAULT_BUFFER_M: float = 500.0
+
+DEFAULT_CHUNK_SIZE: int = 250_000
+
+
+@dataclass(frozen=True)
+class CorridorIndex:
+    """Buffered corridors indexed for point queries.
+
+    Attributes:
+        corridors: Corridor attributes (no geometry), one row per corridor.
+        tree: STRtree over the buffered corridor polygons in ``METRIC_CRS``.
+        buffer_m: Buffer distance in metres.
+    """
+
+    corridors: pd.DataFrame
+    tree: Any
+    buffer_m: float
+
+    def count_within(
+        self,
+        lon: np.ndarray,
+        lat: np.ndarray,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        weights: np.ndarray | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Count points inside each corridor buffer.
+
+        Args:
+            lon: Longitudes (WGS84).
+            lat: Latitudes (WGS84).
+            chunk_size: Number of points queried per batch.
+            weights: Optional per-point weights; counts become weight sums.
+
+        Returns:
+            Tuple of ``(per_corridor, near_any)``. ``per_corridor`` holds the
+            number (or total weight) of points within each corridor's buffer
+            (a point near two corridors counts for both); ``near_any`` is a
+            boolean mask marking points within the buffer of at least one
+            corridor.
+
+        Raises:
+            ValueError: If ``chunk_size`` is not positive.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        lon = np.asarray(lon, dtype="float64")
+        lat = np.asarray(lat, dtype="float64")
+        transformer = Transformer.from_crs("EPSG:4326", METRIC_CRS, always_xy=True)
+
+        if weights is not None:
+            weights = np.asarray(weights, dtype="float64")
+        per_corridor = np.zeros(
+            len(self.corridors), dtype="int64" if weights is None else "float64"
+        )
+        near_any = np.zeros(len(lon), dtype=bool)
+        for start in range(0, len(lon), chunk_size):
+            stop = min(start + chunk_size, len(lon))
+            x, y = transformer.transform(lon[start:stop], lat[start:stop])
+            points = shapely.points(x, y)
+            # Missing coordinates project to inf/NaN and never intersect a buffer
+            point_idx, corridor_idx = self.tree.query(points, predicate="intersects")
+            point_weights = None if weights is None else weights[start + point_idx]
+            per_corridor += np.bincount(
+                corridor_idx, weights=point_weights, minlength=len(self.corridors)
+            )
+            near_any[start + point_idx] = True
+        return per_corridor, near_any
+
+
+def load_corridors(path: Path | None = None) -> gpd.GeoDataFrame:
+    """Load the cached corridor lines.
+
+    Args:
+        path: GeoJSON file to read. Defaults to ``data/boundaries/corridors.geojson``.
+
+    Returns:
+        GeoDataFrame of corridor lines with ``name``, ``type`` and ``osm_id``.
+
+    Raises:
+        FileNotFoundError: If the corridor file does not exist.
+    """
+    if path is None:
+        path = get_repo_root() / "data" / "boundaries" / "corridors.geojson"
+
+    if not path.exists():
+        raise FileNotFoundError(
+            f"Corridor file not found: {path}. Run scripts/download_corridors.py first."
+        )
+
+    return gpd.read_file(path)
+
+
+def build_corridor_index(
+    corridors: gpd.GeoDataFrame | None = None,
+    buffer_m: float = DEFAULT_BUFFER_M,
+) -> CorridorIndex:
+    """Buffer corridors in a metric CRS and build an STRtree over them.
+
+    Args:
+        corridors: Corridor lines. If None, loads them with ``load_corridors()``.
+        buffer_m: Buffer distance in metres. Default is 500.
+
+    Returns:
+        CorridorIndex ready for ``count_within`` queries.
+
+    Raises:
+        ValueError: If ``buffer_m`` is not positive.
+
+    Examples:
+        >>> index = build_corridor_index(buffer_m=250)
+        >>> index.buffer_m
+        250
+    """
+    if buffer_m <= 0:
+        raise ValueError(f"buffer_m must be positive, got {buffer_m}")
+    if corridors is None:
+        corridors = load_corridors()
+
+    if corridors.crs is None:
+        corridors = corridors.set_crs("EPSG:4326")
+    buffered = corridors.geometry.to_crs(METRIC_CRS).buffer(buffer_m)
+
+    attributes = pd.DataFrame(corridors.drop(columns=corridors.geometry.name)).reset_index(
+        drop=True
+    )
+    return CorridorIndex(
+        corridors=attributes,
+        tree=shapely.STRtree(buffered.to_numpy()),
+        buffer_m=buffer_m,
+    )
+
+
+def corridor_crime_stats(
+    df: pd.DataFrame,
+    index: CorridorIndex,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    x_col: str = "point_x",
+    y_col: str = "point_y",
+    weight_col: str | None = None,
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """Compute per-corridor incident counts and the overall corridor share.
+
+    Args:
+        df: Incident data with coordinate columns.
+        index: Corridor index from ``build_corridor_index``.
+        chunk_size: Number of incidents queried per batch.
+        x_col: Column name for longitude. Default is "point_x".
+        y_col: Column name for latitude. Default is "point_y".
+        weight_col: Optional per-row weight column (e.g. the ``sample_weight``
+            of ``load_crime_sample``); counts are weight sums rounded to
+            whole incidents.
+
+    Returns:
+        Tuple of ``(per_corridor, summary)``. ``per_corridor`` has the corridor
+        attributes plus ``incident_count`` and ``pct_of_crimes``, sorted by
+        count descending. ``summary`` has ``buffer_m``, ``total_incidents``,
+        ``within_buffer`` and ``pct_within``.
+
+    Raises:
+        ValueError: If coordinate or weight columns are not found in DataFrame.
+    """
+    if x_col not in df.columns or y_col not in df.columns:
+        raise ValueError(f"Columns {x_col} and/or {y_col} not found in DataFrame")
+    if weight_col is not None and weight_col not in df.columns:
+        raise ValueError(f"Column {weight_col} not found in DataFrame")
+
+    weights = None if weight_col is None else df[weight_col].to_numpy(dtype="float64")
+    total = len(df) if weights is None else int(np.rint(weights.sum()))
+    per_corridor, near_any = index.count_within(
+        df[x_col].to_numpy(dtype="float64", na_value=np.nan),
+        df[y_col].to_numpy(dtype="float64", na_value=np.nan),
+        chunk_size=chunk_size,
+        weights=weights,
+    )
+    if weights is not None:
+        per_corridor = np.rint(per_corridor).astype("int64")
+
+    stats = index.corridors.copy()
+    stats["incident_count"] = per_corridor
+    stats["pct_of_crimes"] = per_corridor / total * 100 if total else 0.0
+    stats = stats.sort_values("incident_count", ascending=False, kind="stable")
+
+    within = int(near_any.sum()) if weights is None else int(np.rint(weights[near_any].sum()))
+    summary = {
+        "buffer_m": index.buffer_m,
+        "total_incidents": total,
+        "within_buffer": within,
+        "pct_within": within / total * 100 if total else 0.0,
+    }
+    return stats.reset_index(drop=True), summary
+
+
+__all__ = [
+    "DEFAULT_BUFFER_M",
+    "METRIC_CRS",
+    "CorridorIndex",
+    "build_corridor_index",
+    "corridor_crime_stats",
+    "load_corridors",
+]
@@ -0,0 +1,228 @@
+"""Binned crime-density surfaces for heat map exports.
+
+This module bins incident coordinates onto a fixed square grid over the
+Philadelphia bounding box and counts incidents per cell, optionally split
+into layers (e.g. per year and crime category). It only depends on NumPy
+and pandas, so it works without geopandas.
+
+Functions:
+    build_density_grid: Create the square grid covering Philadelphia
+    compute_density_layers: Count incidents per grid cell for each layer
+    density_layers_to_records: Encode layers as sparse, JSON-ready records
+
+Binning uses a single pass over the data: every row gets a flat cell index
+and a layer index, and ``np.bincount`` counts all layers at once.
+
+See CLAUDE.md for usage guidance and CLI workflow examples.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from analysis.config import PHILLY_LAT_MAX, PHILLY_LAT_MIN, PHILLY_LON_MAX, PHILLY_LON_MIN
+
+# Roughly 450m x 550m cells at Philadelphia's latitude
+DEFAULT_CELL_SIZE: float = 0.005
+
+
+@dataclass(frozen=True)
+class DensityGrid:
+    """Square grid over a WGS84 bounding box.
+
+    Attributes:
+        lon_min: Western edge of the grid.
+        lat_min: Southern edge of the grid.
+        cell_size: Cell edge length in degrees.
+        n_cols: Number of cells along longitude.
+        n_rows: Number of cells along latitude.
+    """
+
+    lon_min: float
+    lat_min: float
+    cell_size: float
+    n_cols: int
+    n_rows: int
+
+    @property
+    def n_cells(self) -> int:
+        """Total number of cells in the grid."""
+        return self.n_cols * self.n_rows
+
+    @property
+    def bounds(self) -> list[float]:
+        """Grid extent as ``[lon_min, lat_min, lon_max, lat_max]``."""
+        return [
+            self.lon_min,
+            self.lat_min,
+            self.lon_min + self.n_cols * self.cell_size,
+            self.lat_min + self.n_rows * self.cell_size,
+        ]
+
+    def cell_index(self, lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+        """Map coordinates to flat row-major cell indices.
+
+        Args:
+            lon: Longitudes.
+            lat: Latitudes.
+
+        Returns:
+            Integer array of flat cell indices; ``-1`` for points that are
+            missing or fall outside the grid.
+        """
+        lon = np.asarray(lon, dtype="float64")
+        lat = np.asarray(lat, dtype="float64")
+        with np.errstate(invalid="ignore"):
+            col = np.floor((lon - self.lon_min) / self.cell_size)
+            row = np.floor((lat - self.lat_min) / self.cell_size)
+            valid = (col >= 0) & (col < self.n_cols) & (row >= 0) & (row < self.n_rows)
+        index = np.full(lon.shape, -1, dtype="int64")
+        index[valid] = row[valid].astype("int64") * self.n_cols + col[valid].astype("int64")
+        return index
+
+
+def build_density_grid(
+    cell_size: float = DEFAULT_CELL_SIZE,
+    bounds: tuple[float, float, float, float] = (
+        PHILLY_LON_MIN,
+        PHILLY_LAT_MIN,
+        PHILLY_LON_MAX,
+        PHILLY_LAT_MAX,
+    ),
+) -> DensityGrid:
+    """Create a square grid covering the given bounding box.
+
+    Args:
+        cell_size: Cell edge length in degrees. Default is 0.005.
+        bounds: ``(lon_min, lat_min, lon_max, lat_max)``. Defaults to the
+            Philadelphia coordinate bounds from config.
+
+    Returns:
+        DensityGrid whose extent covers ``bounds``.
+
+    Raises:
+        ValueError: If ``cell_size`` is not positive or bounds are empty.
+
+    Examples:
+        >>> grid = build_density_grid(cell_size=0.05)
+        >>> (grid.n_rows, grid.n_cols)
+        (6, 7)
+    """
+    lon_min, lat_min, lon_max, lat_max = bounds
+    if cell_size <= 0:
+        raise ValueError(f"cell_size must be positive, got {cell_size}")
+    if lon_max <= lon_min or lat_max <= lat_min:
+        raise ValueError(f"Invalid bounds: {bounds}")
+
+    n_cols = int(np.ceil(round((lon_max - lon_min) / cell_size, 9)))
+    n_rows = int(np.ceil(round((lat_max - lat_min) / cell_size, 9)))
+    return DensityGrid(
+        lon_min=lon_min, lat_min=lat_min, cell_size=cell_size, n_cols=n_cols, n_rows=n_rows
+    )
+
+
+def compute_density_layers(
+    df: pd.DataFrame,
+    grid: DensityGrid | None = None,
+    layer_cols: Sequence[str] = (),
+    x_col: str = "point_x",
+    y_col: str = "point_y",
+) -> tuple[pd.DataFrame, np.ndarray]:
+    """Count incidents per grid cell, split into layers.
+
+    Args:
+        df: Incident data with coordinate columns and any ``layer_cols``.
+        grid: Target grid. If None, uses ``build_density_grid()``.
+        layer_cols: Columns whose unique combinations define the layers
+            (e.g. ``["year", "crime_category"]``). Empty means one layer.
+        x_col: Column name for longitude. Default is "point_x".
+        y_col: Column name for latitude. Default is "point_y".
+
+    Returns:
+        Tuple of ``(layers, counts)``. ``layers`` has one row per layer with
+        the ``layer_cols`` values, sorted by those columns. ``counts`` is an
+        ``int32`` array of shape ``(n_layers, grid.n_rows, grid.n_cols)``.
+
+    Raises:
+        ValueError: If coordinate or layer columns are missing.
+
+    Examples:
+        >>> import pandas as pd
+        >>> df = pd.DataFrame({"point_x": [-75.16, -75.16], "point_y": [39.95, 39.95]})
+        >>> layers, counts = compute_density_layers(df)
+        >>> int(counts.sum())
+        2
+    """
+    if grid is None:
+        grid = build_density_grid()
+
+    missing = [c for c in (x_col, y_col, *layer_cols) if c not in df.columns]
+    if missing:
+        raise ValueError(f"Columns not found in DataFrame: {missing}")
+
+    cells = grid.cell_index(df[x_col].to_numpy(), df[y_col].to_numpy())
+
+    if layer_cols:
+        grouped = df.groupby(list(layer_cols), sort=True, observed=True)
+        # Rows with a missing layer key get code -1 and are dropped with the off-grid points
+        codes = np.nan_to_num(grouped.ngroup().to_numpy(dtype="float64"), nan=-1).astype("int64")
+        layers = grouped.size().index.to_frame(index=False)
+    else:
+        codes = np.zeros(len(df), dtype="int64")
+        layers = pd.DataFrame(index=range(1))
+
+    keep = (cells >= 0) & (codes >= 0)
+    n_layers = len(layers)
+    flat = codes[keep].astype("int64") * grid.n_cells + cells[keep]
+    counts = np.bincount(flat, minlength=n_layers * grid.n_cells).astype("int32")
+
+    return layers, counts.reshape(n_layers, grid.n_rows, grid.n_cols)
+
+
+def density_layers_to_records(
+    layers: pd.DataFrame,
+    counts: np.ndarray,
+) -> list[dict[str, Any]]:
+    """Encode density layers as sparse, JSON-serializable records.
+
+    Each record carries the layer key values plus ``cells`` (flat row-major
+    indices of non-empty cells) and ``counts`` (their incident counts), so
+    empty cells cost nothing in the export.
+
+    Args:
+        layers: Layer keys as returned by ``compute_density_layers``.
+        counts: Count array as returned by ``compute_density_layers``.
+
+    Returns:
+        List of dictionaries, one per layer, with ``total`` and ``max``
+        summary values alongside the sparse cell data.
+    """
+    records: list[dict[str, Any]] = []
+    flat_counts = counts.reshape(len(layers), -1)
+    for key, layer in zip(layers.to_dict(orient="records"), flat_counts):
+        nonzero = np.flatnonzero(layer)
+        record = {k: v.item() if isinstance(v, np.generic) else v for k, v in key.items()}
+        record.update(
+            {
+                "total": int(layer.sum()),
+                "max": int(layer.max()) if layer.size else 0,
+                "cells": nonzero.tolist(),
+                "counts": layer[nonzero].tolist(),
+            }
+        )
+        records.append(record)
+    return records
+
+
+__all__ = [
+    "DEFAULT_CELL_SIZE",
+    "DensityGrid",
+    "build_density_grid",
+    "compute_density_layers",
+    "density_layers_to_records",
+]
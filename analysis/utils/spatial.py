@@ -28,8 +28,8 @@ from analysis.config import (
     PHILLY_LAT_MIN,
     PHILLY_LON_MAX,
     PHILLY_LON_MIN,
-    SEVERITY_WEIGHTS,
 )
+from analysis.utils.classification import severity_weights
 
 
 def get_repo_root() -> Path:
@@ -321,20 +321,13 @@ def calculate_severity_score(
         >>> scores.tolist()
         [10.0, 1.0, 0.5]
     """
-    if weights is None:
-        weights = SEVERITY_WEIGHTS
-
     if ucr_col not in df.columns:
         raise ValueError(f"Column {ucr_col} not found in DataFrame")
 
-    # Convert UCR code to hundred-band
-    ucr_numeric = pd.to_numeric(df[ucr_col], errors="coerce")
-    ucr_band = (ucr_numeric // 100) * 100
-
-    # Map to severity weights, default to 0.5 for unknown codes
-    severity = ucr_band.map(weights).fillna(0.5)
+    # Band lookup table, default to 0.5 for unknown codes
+    severity = severity_weights(df[ucr_col], weights, fill_value=0.5)
 
-    return severity
+    return pd.Series(severity, index=df.index, name=ucr_col)
 
 
 def get_coordinate_stats(
@@ -10,22 +10,66 @@ Functions:
 Temporal features extracted:
 - year, month, day
 - day_of_week (0=Monday, 6=Sunday)
-- hour, minute
-- is_weekend (True for Saturday/Sunday)
-- quarter (1-4)
+- hour (from dispatch_time when available)
+
+Callers can request a subset of features, add them in place, and store
+them in compact int16/int8 dtypes.
 
 See CLAUDE.md for usage guidance and CLI workflow examples.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
+import numpy as np
 import pandas as pd
 
+# Features extract_temporal_features can add, in output order
+TEMPORAL_FEATURES: tuple[str, ...] = ("year", "month", "day", "day_of_week", "hour")
+
+# Smallest dtype that holds each feature; nullable variants are used when values are missing
+_COMPACT_DTYPES: dict[str, str] = {
+    "year": "int16",
+    "month": "int8",
+    "day": "int8",
+    "day_of_week": "int8",
+    "hour": "int8",
+}
+
 
-def extract_temporal_features(df: pd.DataFrame) -> pd.DataFrame:
+def _hour_from_dispatch_time(times: pd.Series) -> pd.Series:
+    """Parse the hour out of ``HH:MM[:SS]`` dispatch times.
+
+    Dispatch times repeat heavily (at most 86,400 distinct values), so only
+    the unique values are parsed and the result is broadcast back by code.
+    """
+    codes, uniques = pd.factorize(times)
+    hours = pd.to_numeric(
+        pd.Series(uniques, dtype="object").astype(str).str.split(":", n=1).str[0],
+        errors="coerce",
+    ).to_numpy(dtype="float64")
+    hours[(hours < 0) | (hours > 23)] = np.nan
+    # Code -1 marks missing times; the appended NaN slot keeps them missing
+    return pd.Series(np.append(hours, np.nan)[codes], index=times.index)
+
+
+def _compact(values: pd.Series, feature: str) -> pd.Series:
+    dtype = _COMPACT_DTYPES[feature]
+    if values.isna().any():
+        return values.astype(dtype.capitalize())
+    return values.astype(dtype)
+
+
+def extract_temporal_features(
+    df: pd.DataFrame,
+    features: Sequence[str] | None = None,
+    inplace: bool = False,
+    compact: bool = False,
+) -> pd.DataFrame:
     """Extract temporal features from dispatch timestamps.
 
-    This function extracts year, month, day, and day_of_week features
+    This function extracts year, month, day, day_of_week and hour features
     from a datetime column. If ``dispatch_datetime`` column exists,
     it is used directly. If only ``dispatch_date`` exists, it is
     converted to datetime. If neither exists, the DataFrame is returned
@@ -34,19 +78,29 @@ def extract_temporal_features(df: pd.DataFrame) -> pd.DataFrame:
     Args:
         df: Dataset containing a dispatch timestamp column
             (``dispatch_datetime`` or ``dispatch_date``).
+        features: Subset of ``TEMPORAL_FEATURES`` to compute. If None,
+            computes all of them.
+        inplace: If True, add the columns to ``df`` itself instead of to a
+            shallow copy. Default is False.
+        compact: If True, store features as int16 (year) / int8 (others),
+            or their nullable ``Int`` variants when values are missing.
+            Default is False (pandas' default integer/float dtypes).
 
     Returns:
-        DataFrame with ``year``, ``month``, ``day``, and ``day_of_week``
-        columns added. The ``day_of_week`` column uses pandas convention
-        where Monday=0 and Sunday=6.
+        DataFrame with the requested feature columns added. The
+        ``day_of_week`` column uses pandas convention where Monday=0 and
+        Sunday=6. This is ``df`` itself when ``inplace`` is True.
 
     Raises:
-        None.
+        ValueError: If ``features`` contains an unknown feature name.
 
     Notes:
         - If ``dispatch_datetime`` does not exist but ``dispatch_date`` does,
           the function creates ``dispatch_datetime`` from ``dispatch_date``.
         - If neither column exists, the DataFrame is returned unchanged.
+        - ``hour`` is parsed from ``dispatch_time`` when that column exists.
+          Otherwise an existing ``hour`` column is kept as is, and failing
+          that it is taken from ``dispatch_datetime``.
         - All extractions use pandas ``dt`` accessor for datetime properties.
 
     Examples:
@@ -58,7 +112,13 @@ def extract_temporal_features(df: pd.DataFrame) -> pd.DataFrame:
         >>> result[["year", "month", "day", "day_of_week"]].values.tolist()
         [[2023, 1, 15, 6], [2023, 2, 20, 0], [2023, 3, 25, 5]]
     """
-    df = df.copy()
+    requested = TEMPORAL_FEATURES if features is None else tuple(features)
+    unknown = sorted(set(requested) - set(TEMPORAL_FEATURES))
+    if unknown:
+        raise ValueError(f"Unknown temporal features: {unknown}. Expected {TEMPORAL_FEATURES}")
+
+    if not inplace:
+        df = df.copy(deep=False)
 
     if "dispatch_datetime" not in df.columns:
         if "dispatch_date" in df.columns:
@@ -67,9 +127,23 @@ def extract_temporal_features(df: pd.DataFrame) -> pd.DataFrame:
             return df
 
     dt = df["dispatch_datetime"].dt
-    df["year"] = dt.year
-    df["month"] = dt.month
-    df["day"] = dt.day
-    df["day_of_week"] = dt.dayofweek
+    extractors = {
+        "year": lambda: dt.year,
+        "month": lambda: dt.month,
+        "day": lambda: dt.day,
+        "day_of_week": lambda: dt.dayofweek,
+    }
+    for feature in TEMPORAL_FEATURES:
+        if feature not in requested:
+            continue
+        if feature != "hour":
+            values = extractors[feature]()
+        elif "dispatch_time" in df.columns:
+            values = _hour_from_dispatch_time(df["dispatch_time"])
+        elif "hour" in df.columns:
+            values = df["hour"]
+        else:
+            values = dt.hour
+        df[feature] = _compact(values, feature) if compact else values
 
     return df
@@ -8,6 +8,7 @@ Modules:
     style: Matplotlib style configuration (color palette and rcParams)
     helpers: Figure saving utilities for reproducible output artifacts
     plots: Reusable high-level plot helpers for CLI analysis commands
+    render: Background, input-hash cached figure rendering
 
 Example:
     >>> from analysis.visualization import setup_style, plot_line, save_figure
@@ -27,6 +28,9 @@ from analysis.visualization.helpers import save_figure
 
 # Plot functions
 from analysis.visualization.plots import plot_bar, plot_heatmap, plot_line
+
+# Cached background rendering
+from analysis.visualization.render import RenderQueue, figure_batch, render_figure
 from analysis.visualization.style import COLORS, setup_style
 
 __all__ = [
@@ -39,6 +43,10 @@ __all__ = [
     "plot_line",
     "plot_bar",
     "plot_heatmap",
+    # Rendering
+    "render_figure",
+    "figure_batch",
+    "RenderQueue",
     # Legacy (backward compatibility)
     "forecast_plots",
 ]
@@ -0,0 +1,311 @@
+"""Background, cached figure rendering.
+
+This module renders report figures in worker processes and skips figures
+whose inputs haven't changed since they were last written.
+
+Functions:
+    figure_key: Hash a figure's plot function, data and parameters
+    render_figure: Render (or queue) a figure unless it is up to date
+    figure_batch: Render figures submitted inside a block in the background
+
+Classes:
+    RenderQueue: Process pool plus cache bookkeeping for figure rendering
+
+Each output directory keeps a ``.figure_cache.json`` manifest mapping figure
+file names to the key they were rendered from. A figure is skipped when the
+file exists and its manifest key matches. Bump ``FIGURE_CACHE_VERSION`` when
+plot styling changes so existing figures are re-rendered. Updates merge into
+the manifest under a lock file and replace it atomically, so parallel
+``run-all`` workers writing to the same directory don't drop each other's
+entries.
+
+Inside ``figure_batch()`` (the CLI command groups open one per command, and
+``run-all`` one per batch) ``render_figure`` only queues the figure, so the
+command keeps computing while workers render. This overlaps rendering with
+computation; it does not let a command finish before its figures do. The
+batch blocks on exit until every figure is written and recorded, so a
+command takes about as long as the slower of its computation and its
+rendering. Outside a batch figures render synchronously.
+
+See CLAUDE.md for report output paths and testing conventions.
+"""
+
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+# Part of every figure key; bump to invalidate all cached figures
+FIGURE_CACHE_VERSION = 1
+
+MANIFEST_NAME = ".figure_cache.json"
+
+# Held while a process merges its entries into the manifest
+MANIFEST_LOCK_NAME = ".figure_cache.lock"
+
+# Worker process count override (0 renders inline in the calling process)
+RENDER_WORKERS_ENV_VAR = "CRIME_ANALYSIS_RENDER_WORKERS"
+
+_active_queue: "RenderQueue | None" = None
+
+
+def figure_key(
+    plot_fn: Callable[..., Any],
+    data: Any,
+    params: dict[str, Any],
+    output_format: str,
+    dpi: int,
+) -> str:
+    """Hash a figure's plot function, data and parameters.
+
+    Args:
+        plot_fn: Module-level function that builds the Figure.
+        data: DataFrame passed to ``plot_fn``.
+        params: Keyword arguments passed to ``plot_fn``.
+        output_format: File format ('png', 'svg' or 'pdf').
+        dpi: Raster resolution.
+
+    Returns:
+        Hex SHA-256 digest identifying the rendered figure.
+    """
+    import pandas as pd
+
+    digest = hashlib.sha256()
+    header = {
+        "version": FIGURE_CACHE_VERSION,
+        "plot_fn": f"{plot_fn.__module__}.{plot_fn.__qualname__}",
+        "params": params,
+        "format": output_format,
+        "dpi": dpi,
+        "columns": [str(col) for col in data.columns],
+        "dtypes": [str(dtype) for dtype in data.dtypes],
+        "index": str(data.index.dtype),
+    }
+    digest.update(json.dumps(header, sort_keys=True, default=str).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _render(
+    plot_fn: Callable[..., Any],
+    data: Any,
+    params: dict[str, Any],
+    output_path: Path,
+    output_format: str,
+    dpi: int,
+) -> None:
+    """Build, save and close one figure (runs in a worker process)."""
+    import matplotlib.pyplot as plt
+
+    from analysis.visualization.helpers import save_figure
+
+    fig = plot_fn(data, **params)
+    try:
+        save_figure(fig, output_path, output_format=output_format, dpi=dpi)  # type: ignore[arg-type]
+    finally:
+        plt.close(fig)
+
+
+def _read_manifest(directory: Path) -> dict[str, str]:
+    try:
+        return dict(json.loads((directory / MANIFEST_NAME).read_text()))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+@contextmanager
+def _manifest_lock(directory: Path) -> Iterator[None]:
+    """Hold an exclusive lock on ``directory``'s manifest (no-op on Windows)."""
+    if sys.platform == "win32":
+        yield
+        return
+
+    import fcntl
+
+    with open(directory / MANIFEST_LOCK_NAME, "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def _update_manifest(directory: Path, entries: dict[str, str]) -> None:
+    """Merge ``entries`` into ``directory``'s manifest without losing concurrent updates."""
+    with _manifest_lock(directory):
+        manifest = _read_manifest(directory)
+        manifest.update(entries)
+        tmp = directory / f"{MANIFEST_NAME}.{os.getpid()}.tmp"
+        tmp.write_text(json.dumps(manifest, indent=2))
+        tmp.replace(directory / MANIFEST_NAME)
+
+
+def _default_workers() -> int:
+    override = os.environ.get(RENDER_WORKERS_ENV_VAR)
+    if override is not None:
+        return max(int(override), 0)
+    return min(4, os.cpu_count() or 1)
+
+
+class RenderQueue:
+    """Process pool plus cache bookkeeping for figure rendering.
+
+    Args:
+        max_workers: Worker processes. 0 renders inline in the calling
+            process. Defaults to ``$CRIME_ANALYSIS_RENDER_WORKERS`` or
+            ``min(4, cpu_count)``.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self.max_workers = _default_workers() if max_workers is None else max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending: list[tuple[Future[None], Path, str]] = []
+        self.rendered: list[Path] = []
+        self.skipped: list[Path] = []
+
+    def submit(
+        self,
+        plot_fn: Callable[..., Any],
+        data: Any,
+        output_path: str | Path,
+        output_format: str = "png",
+        dpi: int = 300,
+        **params: Any,
+    ) -> bool:
+        """Queue a figure unless its file is up to date.
+
+        Returns:
+            True if the figure was queued (or rendered inline), False if skipped.
+        """
+        output_path = Path(output_path)
+        key = figure_key(plot_fn, data, params, output_format, dpi)
+        if output_path.exists() and _read_manifest(output_path.parent).get(output_path.name) == key:
+            self.skipped.append(output_path)
+            return False
+
+        if self.max_workers == 0:
+            _render(plot_fn, data, params, output_path, output_format, dpi)
+            self._record(output_path, key)
+            return True
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        future = self._executor.submit(
+            _render, plot_fn, data, params, output_path, output_format, dpi
+        )
+        self._pending.append((future, output_path, key))
+        return True
+
+    def _record(self, output_path: Path, key: str) -> None:
+        _update_manifest(output_path.parent, {output_path.name: key})
+        self.rendered.append(output_path)
+
+    def wait(self) -> None:
+        """Wait for queued figures and record them in their manifests.
+
+        Raises:
+            Exception: The first rendering error, after all other figures
+                have finished. Failed figures are not recorded.
+        """
+        pending, self._pending = self._pending, []
+        first_error: BaseException | None = None
+        for future, output_path, key in pending:
+            error = future.exception()
+            if error is None:
+                self._record(output_path, key)
+            elif first_error is None:
+                first_error = error
+        if first_error is not None:
+            raise first_error
+
+    def close(self) -> None:
+        """Wait for queued figures and shut down the worker processes."""
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+
+@contextmanager
+def figure_batch(max_workers: int | None = None) -> Iterator[RenderQueue]:
+    """Render figures submitted inside the block in the background.
+
+    Figures render while the block keeps running, but leaving the block
+    waits for every queued figure: callers see all files written (or the
+    first rendering error) once the block exits, never an early return with
+    figures still pending. Nested blocks share the outermost queue, which
+    waits for all figures and shuts down its workers on exit.
+
+    Args:
+        max_workers: Worker processes for a new queue (see ``RenderQueue``).
+
+    Yields:
+        The active RenderQueue.
+    """
+    global _active_queue
+    if _active_queue is not None:
+        yield _active_queue
+        return
+
+    queue = RenderQueue(max_workers)
+    _active_queue = queue
+    try:
+        yield queue
+    finally:
+        _active_queue = None
+        queue.close()
+
+
+def render_figure(
+    plot_fn: Callable[..., Any],
+    data: Any,
+    output_path: str | Path,
+    output_format: str = "png",
+    dpi: int = 300,
+    **params: Any,
+) -> bool:
+    """Render a figure to a file unless it is already up to date.
+
+    Inside ``figure_batch()`` the figure is queued for a worker process;
+    otherwise it is rendered before returning.
+
+    Args:
+        plot_fn: Module-level function ``plot_fn(data, **params) -> Figure``,
+            e.g. ``plot_line`` or ``plot_bar``.
+        data: DataFrame to plot.
+        output_path: Destination file. Its directory must exist.
+        output_format: File format ('png', 'svg' or 'pdf'). Default 'png'.
+        dpi: Raster resolution (PNG only). Default 300.
+        **params: Keyword arguments for ``plot_fn``.
+
+    Returns:
+        True if the figure was rendered or queued, False if it was skipped
+        because the file was rendered from identical inputs.
+
+    Example:
+        >>> from analysis.visualization import plot_line, render_figure
+        >>> render_figure(plot_line, annual_df, "trend.png", x_col="year",
+        ...               y_col="count", title="Annual Trend")
+        True
+    """
+    if _active_queue is not None:
+        return _active_queue.submit(plot_fn, data, output_path, output_format, dpi, **params)
+    queue = RenderQueue(max_workers=0)
+    return queue.submit(plot_fn, data, output_path, output_format, dpi, **params)
+
+
+__all__ = [
+    "FIGURE_CACHE_VERSION",
+    "RENDER_WORKERS_ENV_VAR",
+    "RenderQueue",
+    "figure_batch",
+    "figure_key",
+    "render_figure",
+]
@@ -15,7 +15,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from starlette.responses import Response
 
-from api.routers import forecasting, metadata, policy, questions, spatial, trends
+from api.routers import forecasting, incidents, metadata, policy, questions, spatial, trends
 from api.services.data_loader import cache_keys, contract_status, load_all_data
 
 logger = logging.getLogger("crime_api")
@@ -151,3 +151,4 @@ app.include_router(policy.router, prefix="/api/v1")
 app.include_router(forecasting.router, prefix="/api/v1")
 app.include_router(questions.router, prefix="/api/v1")
 app.include_router(metadata.router, prefix="/api/v1")
+app.include_router(incidents.router, prefix="/api/v1")
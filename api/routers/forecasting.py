@@ -4,16 +4,49 @@ from __future__ import annotations
 
 from typing import Any, cast
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query
 
 from api.services.data_loader import get_data
 
 router = APIRouter(prefix="/forecasting", tags=["forecasting"])
 
+_FORECAST_FIELDS = ("yhat", "yhat_lower", "yhat_upper")
+
+
+def _series_payload(payload: dict[str, Any], series: dict[str, Any]) -> dict[str, Any]:
+    """Expand one columnar series from forecast_series.json into time-series records."""
+    return {
+        "historical": [
+            {"ds": ds, "y": y} for ds, y in zip(payload["dates"], series["y"], strict=True)
+        ],
+        "forecast": [
+            {"ds": ds, **{field: series[field][i] for field in _FORECAST_FIELDS}}
+            for i, ds in enumerate(payload["forecast_dates"])
+        ],
+        "model": series["model"],
+        "district": series["district"],
+        "category": series["category"],
+    }
+
 
 @router.get("/time-series")
-def time_series() -> dict[str, Any]:
-    return cast(dict[str, Any], get_data("forecast.json"))
+def time_series(
+    district: int | None = Query(
+        default=None, ge=1, le=23, description="PPD district number (1-23)"
+    ),
+    category: str | None = Query(default=None, description="Violent, Property or Other"),
+) -> dict[str, Any]:
+    if district is None and category is None:
+        return cast(dict[str, Any], get_data("forecast.json"))
+
+    try:
+        payload = cast(dict[str, Any], get_data("forecast_series.json"))
+    except KeyError:
+        raise HTTPException(status_code=503, detail="Per-series forecasts not available")
+    for series in payload["series"]:
+        if series["district"] == district and series["category"] == category:
+            return _series_payload(payload, series)
+    raise HTTPException(status_code=404, detail="No forecast for that district/category")
 
 
 @router.get("/classification")
@@ -0,0 +1,59 @@
+"""Raw incident export endpoint (streamed NDJSON, CSV or Arrow IPC)."""
+
+from __future__ import annotations
+
+import datetime as dt
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from api.services.incident_export import MEDIA_TYPES, ExportFormat, max_rows, stream_incidents
+
+router = APIRouter(prefix="/incidents", tags=["incidents"])
+
+
+@router.get("")
+def incidents(
+    format: ExportFormat = Query(default="ndjson", description="ndjson, csv or arrow"),
+    district: int | None = Query(
+        default=None, ge=1, le=23, description="PPD district number (1-23)"
+    ),
+    start_date: dt.date | None = Query(default=None, description="First dispatch date (inclusive)"),
+    end_date: dt.date | None = Query(default=None, description="Last dispatch date (inclusive)"),
+    ucr_band: int | None = Query(
+        default=None,
+        ge=100,
+        le=9900,
+        multiple_of=100,
+        description="UCR hundred-band, e.g. 600 for thefts or 2600 for all other offenses",
+    ),
+    columns: list[str] | None = Query(default=None, description="Columns to return (default all)"),
+    limit: int | None = Query(default=None, ge=1, description="Maximum rows (capped server-side)"),
+) -> StreamingResponse:
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(status_code=422, detail="start_date must not be after end_date")
+    try:
+        chunks = stream_incidents(
+            format,
+            district=district,
+            start_date=start_date,
+            end_date=end_date,
+            ucr_band=ucr_band,
+            columns=columns,
+            limit=limit,
+        )
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail="Incident dataset not available")
+    except ValueError as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
+
+    row_cap = max_rows() if limit is None else min(limit, max_rows())
+    extension = {"ndjson": "ndjson", "csv": "csv", "arrow": "arrows"}[format]
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="incidents.{extension}"',
+            "X-Row-Cap": str(row_cap),
+        },
+    )
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, cast
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 
 from api.services.data_loader import get_data
 
@@ -14,3 +14,11 @@ router = APIRouter(tags=["metadata"])
 @router.get("/metadata")
 def metadata() -> dict[str, Any]:
     return cast(dict[str, Any], get_data("metadata.json"))
+
+
+@router.get("/quality")
+def quality() -> dict[str, Any]:
+    try:
+        return cast(dict[str, Any], get_data("quality.json"))
+    except KeyError:
+        raise HTTPException(status_code=503, detail="Quality profile not available")
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, cast
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException
 
 from api.services.data_loader import get_data
 
@@ -21,6 +21,14 @@ def vehicle_crimes() -> list[dict[str, Any]]:
     return cast(list[dict[str, Any]], get_data("vehicle_crime_trend.json"))
 
 
+@router.get("/vehicle-corridors")
+def vehicle_corridors() -> dict[str, Any]:
+    try:
+        return cast(dict[str, Any], get_data("vehicle_crimes_per_corridor.json"))
+    except KeyError:
+        raise HTTPException(status_code=503, detail="Corridor export not available")
+
+
 @router.get("/composition")
 def composition() -> list[dict[str, Any]]:
     return cast(list[dict[str, Any]], get_data("crime_composition.json"))
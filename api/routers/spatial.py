@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, cast
 
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query
 
 from api.services.data_loader import get_data
 
@@ -29,3 +29,20 @@ def hotspots() -> dict[str, Any]:
 @router.get("/corridors")
 def corridors() -> dict[str, Any]:
     return cast(dict[str, Any], get_data("geo/corridors.geojson"))
+
+
+@router.get("/density")
+def density(
+    year: int | None = Query(default=None),
+    category: str | None = Query(default=None),
+) -> dict[str, Any]:
+    try:
+        payload = cast(dict[str, Any], get_data("density.json"))
+    except KeyError:
+        raise HTTPException(status_code=503, detail="Density export not available")
+    layers = cast(list[dict[str, Any]], payload["layers"])
+    if year is not None:
+        layers = [layer for layer in layers if layer.get("year") == year]
+    if category:
+        layers = [layer for layer in layers if layer.get("crime_category") == category]
+    return {**payload, "layers": layers}
@@ -3,35 +3,66 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import asdict, dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import typer
 
-from analysis.config import COLORS
+from analysis.config import COLORS, CRIME_DATA_PATH
+from analysis.config.schemas.forecasting import TimeSeriesConfig
 from analysis.data.loading import load_crime_data
 from analysis.data.preprocessing import aggregate_by_period
-from analysis.utils.classification import classify_crime_category
+from analysis.data.quality import build_quality_profile
+from analysis.data.validation import ValidationReport, check_crime_data
+from analysis.event_calendar import build_event_calendar
+from analysis.event_utils import (
+    ALL_CRIMES,
+    calculate_event_impact_by_type,
+    daily_category_counts,
+    event_impact_intervals,
+    load_event_data,
+)
+from analysis.models.time_series import BASELINE_MODELS, forecast_baseline
+from analysis.utils.classification import CRIME_CATEGORIES, classify_crime_category
+from analysis.utils.density import (
+    build_density_grid,
+    compute_density_layers,
+    density_layers_to_records,
+)
 from analysis.utils.temporal import extract_temporal_features
+from pipeline.manifest import (
+    frame_fingerprint,
+    hash_outputs,
+    snapshot,
+    stage_fingerprint,
+    write_manifest,
+    written_files,
+)
+from pipeline.model_store import ModelStore
 
 try:
     import geopandas as gpd
 
+    from analysis.utils.corridors import build_corridor_index, corridor_crime_stats, load_corridors
+
     HAS_GEOPANDAS = True
 except ImportError:
     HAS_GEOPANDAS = False
 
 try:
     from prophet import Prophet
+    from prophet.serialize import model_from_json, model_to_json
 
     HAS_PROPHET = True
 except ImportError:
     HAS_PROPHET = False
 
 try:
-    from sklearn.ensemble import RandomForestClassifier
+    from analysis.models.classification import aggregate_training_rows, train_weighted_forest
 
     HAS_SKLEARN = True
 except ImportError:
@@ -39,6 +70,15 @@ except ImportError:
 
 app = typer.Typer(help="Export analysis outputs as API-ready JSON/GeoJSON")
 
+# Incidents per spatial-join batch; bounds the shapely objects alive at once
+SPATIAL_JOIN_CHUNK_SIZE = 250_000
+
+# Written by scripts/create_event_calendar.py (relative to the repo root)
+EVENT_CALENDAR_FILE = "data/external/event_calendar.parquet"
+
+# Bootstrap replicates behind the event impact confidence intervals
+EVENT_RESAMPLES = 2000
+
 
 @dataclass
 class ExportMetadata:
@@ -69,7 +109,10 @@ def _to_records(df: Any) -> list[dict[str, Any]]:
     return rows
 
 
-def _write_json(path: Path, payload: Any) -> None:
+def _write_json(path: Path, payload: Any, compact: bool = False) -> None:
+    if compact:
+        path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        return
     path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
 
 
@@ -81,23 +124,23 @@ def _group_size_to_records_frame(grouped: Any, count_name: str = "count") -> Any
 def _export_trends(df: Any, output_dir: Path) -> None:
     categorized = classify_crime_category(df)
     categorized["dispatch_date"] = categorized["dispatch_date"].astype("datetime64[ns]")
-    categorized = extract_temporal_features(categorized)
+    extract_temporal_features(categorized, features=["year"], inplace=True, compact=True)
 
     annual = _group_size_to_records_frame(
-        categorized.groupby(["year", "crime_category"], observed=False)
+        categorized.groupby(["year", "crime_category"], observed=True)
     ).sort_values(["year", "crime_category"])
     _write_json(output_dir / "annual_trends.json", _to_records(annual))
 
     monthly = _group_size_to_records_frame(
         categorized.assign(
             month=categorized["dispatch_date"].dt.to_period("M").dt.to_timestamp()
-        ).groupby(["month", "crime_category"], observed=False)
+        ).groupby(["month", "crime_category"], observed=True)
     ).sort_values(["month", "crime_category"])
     _write_json(output_dir / "monthly_trends.json", _to_records(monthly))
 
     # District-scoped annual trends (includes dc_dist)
     annual_district = _group_size_to_records_frame(
-        categorized.groupby(["year", "crime_category", "dc_dist"], observed=False)
+        categorized.groupby(["year", "crime_category", "dc_dist"], observed=True)
     ).sort_values(["year", "crime_category", "dc_dist"])
     _write_json(output_dir / "annual_trends_district.json", _to_records(annual_district))
 
@@ -105,7 +148,7 @@ def _export_trends(df: Any, output_dir: Path) -> None:
     monthly_district = _group_size_to_records_frame(
         categorized.assign(
             month=categorized["dispatch_date"].dt.to_period("M").dt.to_timestamp()
-        ).groupby(["month", "crime_category", "dc_dist"], observed=False)
+        ).groupby(["month", "crime_category", "dc_dist"], observed=True)
     ).sort_values(["month", "crime_category", "dc_dist"])
     _write_json(output_dir / "monthly_trends_district.json", _to_records(monthly_district))
 
@@ -130,7 +173,9 @@ def _export_trends(df: Any, output_dir: Path) -> None:
 
 
 def _export_seasonality(df: Any, output_dir: Path) -> None:
-    temporal = extract_temporal_features(df)
+    temporal = extract_temporal_features(
+        df, features=["month", "day_of_week", "hour"], compact=True
+    )
     temporal["dispatch_date"] = temporal["dispatch_date"].astype("datetime64[ns]")
     temporal["hour"] = temporal["hour"].fillna(0).astype(int)
 
@@ -152,6 +197,28 @@ def _export_seasonality(df: Any, output_dir: Path) -> None:
     _write_json(output_dir / "robbery_heatmap.json", _to_records(robbery_matrix))
 
 
+def _count_points_in_tracts(
+    df: Any, tracts: Any, chunk_size: int = SPATIAL_JOIN_CHUNK_SIZE
+) -> dict[Any, int]:
+    x = df["point_x"].to_numpy(dtype="float64", na_value=np.nan)
+    y = df["point_y"].to_numpy(dtype="float64", na_value=np.nan)
+    valid = (x >= -75.30) & (x <= -74.95) & (y >= 39.85) & (y <= 40.15)
+    x, y = x[valid], y[valid]
+
+    # Only the running per-GEOID counts outlive each batch, so peak memory is bounded by
+    # chunk_size rather than by the full incident history.
+    counts: dict[Any, int] = {}
+    for start in range(0, len(x), chunk_size):
+        stop = start + chunk_size
+        points = gpd.GeoDataFrame(
+            geometry=gpd.points_from_xy(x[start:stop], y[start:stop]), crs="EPSG:4326"
+        )
+        joined = gpd.sjoin(points, tracts, how="inner", predicate="within")
+        for geoid, count in joined["GEOID"].value_counts().items():
+            counts[geoid] = counts.get(geoid, 0) + int(count)
+    return counts
+
+
 def _export_spatial(df: Any, output_dir: Path, geo_dir: Path, repo_root: Path) -> None:
     _ensure_dir(geo_dir)
     if not HAS_GEOPANDAS:
@@ -185,29 +252,11 @@ def _export_spatial(df: Any, output_dir: Path, geo_dir: Path, repo_root: Path) -
     districts.to_file(geo_dir / "districts.geojson", driver="GeoJSON")
 
     tracts = gpd.read_file(tracts_path)
-    clean = df.dropna(subset=["point_x", "point_y"]).copy()
-    clean = clean[
-        (clean["point_x"].between(-75.30, -74.95)) & (clean["point_y"].between(39.85, 40.15))
-    ]
-    if not clean.empty:
-        points = gpd.GeoDataFrame(
-            clean,
-            geometry=gpd.points_from_xy(clean["point_x"], clean["point_y"]),
-            crs="EPSG:4326",
-        )
-        if tracts.crs != points.crs:
-            tracts = tracts.to_crs(points.crs)
-        joined = gpd.sjoin(
-            points, tracts[["GEOID", "total_pop", "geometry"]], how="left", predicate="within"
-        )
-        rate = _group_size_to_records_frame(
-            joined.groupby("GEOID", observed=False),
-            count_name="crime_count",
-        ).merge(tracts[["GEOID", "total_pop"]].drop_duplicates(), on="GEOID", how="left")
-        rate["crime_rate"] = (rate["crime_count"] / rate["total_pop"].clip(lower=1)) * 100000
-        tracts = tracts.merge(rate[["GEOID", "crime_count", "crime_rate"]], on="GEOID", how="left")
-    tracts["crime_count"] = tracts.get("crime_count", 0).fillna(0).astype(int)
-    tracts["crime_rate"] = tracts.get("crime_rate", 0.0).fillna(0.0)
+    if tracts.crs != "EPSG:4326":
+        tracts = tracts.to_crs("EPSG:4326")
+    tract_counts = _count_points_in_tracts(df, tracts[["GEOID", "geometry"]])
+    tracts["crime_count"] = tracts["GEOID"].map(tract_counts).fillna(0).astype(int)
+    tracts["crime_rate"] = (tracts["crime_count"] / tracts["total_pop"].clip(lower=1)) * 100000
     tracts.to_file(geo_dir / "tracts.geojson", driver="GeoJSON")
 
     hotspots = gpd.read_file(hotspot_path)
@@ -227,9 +276,40 @@ def _export_spatial(df: Any, output_dir: Path, geo_dir: Path, repo_root: Path) -
     )
 
 
+def _export_density(df: Any, output_dir: Path) -> None:
+    grid = build_density_grid()
+    categorized = classify_crime_category(df)
+    categorized["year"] = categorized["dispatch_date"].astype("datetime64[ns]").dt.year
+
+    layers, counts = compute_density_layers(categorized, grid, ["year", "crime_category"])
+    _write_json(
+        output_dir / "density.json",
+        {
+            "bounds": grid.bounds,
+            "cell_size": grid.cell_size,
+            "shape": [grid.n_rows, grid.n_cols],
+            "layers": density_layers_to_records(layers, counts),
+        },
+        compact=True,
+    )
+
+
+def _export_vehicle_corridors(df: Any, output_dir: Path, repo_root: Path) -> None:
+    if not HAS_GEOPANDAS:
+        return
+
+    corridors = load_corridors(repo_root / "data" / "boundaries" / "corridors.geojson")
+    vehicle = df[(df["ucr_general"] >= 700) & (df["ucr_general"] < 800)]
+    per_corridor, summary = corridor_crime_stats(vehicle, build_corridor_index(corridors))
+    _write_json(
+        output_dir / "vehicle_crimes_per_corridor.json",
+        {**summary, "corridors": _to_records(per_corridor)},
+    )
+
+
 def _export_policy(df: Any, output_dir: Path, repo_root: Path) -> None:
-    work = extract_temporal_features(df)
-    work = classify_crime_category(work)
+    work = extract_temporal_features(df, features=["year"], compact=True)
+    classify_crime_category(work, inplace=True)
     work["dispatch_date"] = work["dispatch_date"].astype("datetime64[ns]")
 
     retail = work[(work["ucr_general"] >= 600) & (work["ucr_general"] < 700)]
@@ -253,28 +333,269 @@ def _export_policy(df: Any, output_dir: Path, repo_root: Path) -> None:
     )
 
     composition = _group_size_to_records_frame(
-        work.groupby(["year", "crime_category"], observed=False)
+        work.groupby(["year", "crime_category"], observed=True)
     ).sort_values(["year", "crime_category"])
     _write_json(output_dir / "crime_composition.json", _to_records(composition))
 
-    event_file = repo_root / "reports" / "event_impact_results.csv"
-    if event_file.exists():
-        import pandas as pd
+    _write_json(output_dir / "event_impact.json", _event_impact_records(work, repo_root))
 
-        event_df = pd.read_csv(event_file)
-        _write_json(output_dir / "event_impact.json", _to_records(event_df))
-    else:
-        _write_json(output_dir / "event_impact.json", [])
+
+def _event_impact_records(classified: Any, repo_root: Path) -> list[dict[str, Any]]:
+    """Event vs control day impact per event type and crime category (plus all crimes).
+
+    ``significant`` is taken from the bootstrap interval (it excludes zero);
+    the t-test ``p_value`` is kept alongside.
+    """
+    import pandas as pd
+
+    calendar = repo_root / EVENT_CALENDAR_FILE
+    events = load_event_data(calendar) if calendar.exists() else build_event_calendar()
+    daily = daily_category_counts(classified)
+    categories = [ALL_CRIMES, *CRIME_CATEGORIES]
+
+    impact = pd.DataFrame(
+        [
+            {**row, "crime_category": category}
+            for category in categories
+            for row in calculate_event_impact_by_type(
+                None, events, crime_category=category, daily_counts=daily
+            ).to_dict(orient="records")
+        ]
+    )
+    intervals = event_impact_intervals(
+        daily, events, columns=categories, n_resamples=EVENT_RESAMPLES, n_jobs=-1
+    )
+    impact = impact.merge(intervals, on=["event_type", "crime_category"], how="left")
+    impact["significant"] = (impact["ci_lower"] > 0) | (impact["ci_upper"] < 0)
+
+    columns = ["event_type", "crime_category"]
+    impact = impact[columns + [col for col in impact.columns if col not in columns]]
+    # Undefined means/p-values (no event days in the data) export as null
+    return _to_records(impact.astype(object).where(impact.notna(), None))
+
+
+CLASSIFIER_FEATURES = ["year", "month", "day_of_week", "hour"]
+
+# Months forecast past the last observed month
+FORECAST_PERIODS = 24
+
+
+def _fit_prophet(monthly: Any) -> Any:
+    model = Prophet()
+    model.fit(monthly, seed=42)
+    return model
 
 
-def _export_forecasting(df: Any, output_dir: Path) -> None:
+def _warm_start_prophet(previous: Any, monthly: Any) -> Any:
+    """Refit starting from the previous fit's parameters (Prophet's warm start)."""
+    init = {name: previous.params[name][0][0] for name in ("k", "m", "sigma_obs")}
+    init.update({name: previous.params[name][0] for name in ("delta", "beta")})
+    model = Prophet()
+    try:
+        model.fit(monthly, init=init, seed=42)
+    except ValueError:
+        # Changepoint count moved with the series length; start cold
+        return _fit_prophet(monthly)
+    return model
+
+
+def _fit_violence_classifier(training: Any) -> Any:
+    return train_weighted_forest(
+        training[CLASSIFIER_FEATURES],
+        training["is_violent"],
+        sample_weight=training["weight"].to_numpy(),
+        random_state=42,
+    )
+
+
+def _linear_projection(y: Any, periods: int = FORECAST_PERIODS) -> np.ndarray:
+    """Extend the slope between the first and last of the last 24 points."""
+    last = y.tail(24)
+    slope = (last.iloc[-1] - last.iloc[0]) / max(len(last) - 1, 1)
+    return np.asarray(last.iloc[-1] + slope * np.arange(1, periods + 1), dtype=np.float64)
+
+
+def _series_store_name(district: int | None, category: str | None) -> str:
+    district_part = "all" if district is None else str(district)
+    return f"forecast_{district_part}_{(category or 'all').lower()}"
+
+
+def _forecast_model_type() -> str:
+    """Configured forecaster (TimeSeriesConfig.model_type); ETS when Prophet is missing."""
+    model_type = TimeSeriesConfig().model_type
+    if model_type == "prophet" and not HAS_PROPHET:
+        return "ets"
+    return model_type
+
+
+def _forecast_series(
+    district: int | None,
+    category: str | None,
+    history: Any,
+    store: ModelStore,
+    model_type: str,
+) -> dict[str, Any]:
+    """Forecast one district/category monthly series (runs in a worker process).
+
+    Prophet goes through the model store; the built-in baselines are cheap
+    enough to refit every time. Any failure falls back to the linear
+    projection so one bad series can't abort the export.
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame({"ds": history.index, "y": history.to_numpy(dtype=np.float64)})
+    entry: dict[str, Any] = {"district": district, "category": category}
+    try:
+        if model_type == "prophet":
+            model, _ = store.fit(
+                _series_store_name(district, category),
+                frame,
+                _fit_prophet,
+                refit_fn=_warm_start_prophet,
+                encode=model_to_json,
+                decode=model_from_json,
+            )
+            future = model.make_future_dataframe(
+                periods=FORECAST_PERIODS, freq="ME", include_history=False
+            )
+            pred = model.predict(future)
+            entry["model"] = "Prophet"
+        else:
+            pred = forecast_baseline(frame["y"], FORECAST_PERIODS, model_type=model_type)
+            entry["model"] = BASELINE_MODELS[model_type]
+        yhat = pred["yhat"].to_numpy()
+        lower = pred["yhat_lower"].to_numpy()
+        upper = pred["yhat_upper"].to_numpy()
+    except Exception as exc:  # noqa: BLE001 - any fit failure degrades to linear
+        entry["fallback_reason"] = f"{type(exc).__name__}: {exc}"
+        yhat = _linear_projection(frame["y"])
+        lower, upper = yhat * 0.9, yhat * 1.1
+        entry["model"] = "LinearFallback"
+
+    entry["y"] = [int(value) for value in frame["y"]]
+    for name, values in (("yhat", yhat), ("yhat_lower", lower), ("yhat_upper", upper)):
+        # Incident counts can't go negative
+        entry[name] = [round(float(value), 2) for value in np.clip(values, 0, None)]
+    return entry
+
+
+def _forecast_jobs(n_jobs: int | None, model_type: str) -> int:
+    if n_jobs is not None:
+        return n_jobs
+    raw = os.getenv("PIPELINE_FORECAST_JOBS")
+    if raw:
+        return int(raw)
+    # The other baselines fit in milliseconds; worker start-up would dominate
+    return -1 if model_type in {"prophet", "arima"} else 1
+
+
+def _export_series_forecasts(
+    classified: Any,
+    output_dir: Path,
+    store: ModelStore,
+    n_jobs: int | None = None,
+    model_type: str | None = None,
+) -> None:
+    """Forecast every district x category series (plus district and category totals).
+
+    Writes ``forecast_series.json``: shared history/forecast date axes and one
+    entry per series with its counts, forecast, bounds and model name. A
+    ``None`` district or category marks a total over that dimension.
+    """
+    import pandas as pd
+    from joblib import Parallel, delayed
+
+    work = classified.dropna(subset=["dispatch_date", "dc_dist"])
+    month = pd.to_datetime(work["dispatch_date"]).dt.normalize() + pd.offsets.MonthEnd(0)
+    counts = work.groupby(
+        [work["dc_dist"].astype(int), work["crime_category"].astype(str), month.rename("month")],
+        observed=True,
+    ).size()
+    if counts.empty:
+        _write_json(
+            output_dir / "forecast_series.json",
+            {"dates": [], "forecast_dates": [], "series": []},
+            compact=True,
+        )
+        return
+
+    wide = counts.unstack(fill_value=0)
+    months = pd.date_range(wide.columns.min(), wide.columns.max(), freq="ME")
+    wide = wide.reindex(columns=months, fill_value=0)
+
+    series: list[tuple[int | None, str | None, Any]] = [
+        (int(district), str(category), row) for (district, category), row in wide.iterrows()
+    ]
+    series += [(int(d), None, row) for d, row in wide.groupby(level=0).sum().iterrows()]
+    series += [(None, str(c), row) for c, row in wide.groupby(level=1).sum().iterrows()]
+
+    model_type = model_type or _forecast_model_type()
+    results = Parallel(n_jobs=_forecast_jobs(n_jobs, model_type))(
+        delayed(_forecast_series)(district, category, history, store, model_type)
+        for district, category, history in series
+    )
+    forecast_dates = pd.date_range(months[-1], periods=FORECAST_PERIODS + 1, freq="ME")[1:]
+    payload = {
+        "dates": [date.isoformat() for date in months],
+        "forecast_dates": [date.isoformat() for date in forecast_dates],
+        "series": results,
+    }
+    _write_json(output_dir / "forecast_series.json", payload, compact=True)
+
+
+def _baseline_forecast_payload(monthly: Any, model_type: str) -> dict[str, Any]:
+    """Citywide forecast.json payload from a built-in model (linear if the series is too short)."""
+    import pandas as pd
+
+    base_date = monthly["ds"].max()
+    try:
+        pred = forecast_baseline(monthly["y"], FORECAST_PERIODS, model_type=model_type)
+    except ValueError:
+        projection = _linear_projection(monthly["y"])
+        forecast_rows = []
+        for i in range(1, FORECAST_PERIODS + 1):
+            dt = (base_date + pd.DateOffset(months=i)).to_pydatetime()
+            pred_value = float(projection[i - 1])
+            forecast_rows.append(
+                {
+                    "ds": dt.isoformat(),
+                    "yhat": pred_value,
+                    "yhat_lower": pred_value * 0.9,
+                    "yhat_upper": pred_value * 1.1,
+                }
+            )
+        return {
+            "historical": _to_records(monthly),
+            "forecast": forecast_rows,
+            "model": "LinearFallback",
+        }
+
+    pred["ds"] = pd.date_range(base_date, periods=FORECAST_PERIODS + 1, freq="ME")[1:]
+    return {
+        "historical": _to_records(monthly),
+        "forecast": _to_records(pred[["ds", "yhat", "yhat_lower", "yhat_upper"]]),
+        "model": BASELINE_MODELS[model_type],
+    }
+
+
+def _export_forecasting(
+    df: Any, output_dir: Path, store: ModelStore | None = None, n_jobs: int | None = None
+) -> None:
+    store = store or ModelStore()
     monthly = aggregate_by_period(df, period="ME", count_col="objectid", date_col="dispatch_date")
     monthly = monthly.rename(columns={"dispatch_date": "ds", "count": "y"})
 
     forecast_payload: dict[str, Any]
-    if HAS_PROPHET:
-        model = Prophet()
-        model.fit(monthly, seed=42)
+    model_type = _forecast_model_type()
+    if model_type == "prophet":
+        model, _ = store.fit(
+            "forecast_prophet",
+            monthly[["ds", "y"]],
+            _fit_prophet,
+            refit_fn=_warm_start_prophet,
+            encode=model_to_json,
+            decode=model_from_json,
+        )
         future = model.make_future_dataframe(periods=24, freq="ME")
         pred = model.predict(future)[["ds", "yhat", "yhat_lower", "yhat_upper"]]
         pred_records = _to_records(pred)
@@ -285,43 +606,27 @@ def _export_forecasting(df: Any, output_dir: Path) -> None:
             "model": "Prophet",
         }
     else:
-        last = monthly.tail(24).copy()
-        slope = (last["y"].iloc[-1] - last["y"].iloc[0]) / max(len(last) - 1, 1)
-        base_date = monthly["ds"].max()
-        forecast_rows = []
-        for i in range(1, 25):
-            dt = (base_date + __import__("pandas").DateOffset(months=i)).to_pydatetime()
-            pred = float(last["y"].iloc[-1] + slope * i)
-            forecast_rows.append(
-                {
-                    "ds": dt.isoformat(),
-                    "yhat": pred,
-                    "yhat_lower": pred * 0.9,
-                    "yhat_upper": pred * 1.1,
-                }
-            )
-        forecast_payload = {
-            "historical": _to_records(monthly),
-            "forecast": forecast_rows,
-            "model": "LinearFallback",
-        }
+        forecast_payload = _baseline_forecast_payload(monthly, model_type)
 
     _write_json(output_dir / "forecast.json", forecast_payload)
 
-    classified = classify_crime_category(extract_temporal_features(df))
+    classified = extract_temporal_features(
+        df, features=["year", "month", "day_of_week", "hour"], compact=True
+    )
+    classify_crime_category(classified, inplace=True)
     classified["is_violent"] = (classified["crime_category"] == "Violent").astype(int)
     classified["hour"] = classified["hour"].fillna(0)
 
     if HAS_SKLEARN:
-        features = classified[["year", "month", "day_of_week", "hour"]].fillna(0)
-        target = classified["is_violent"]
-        model = RandomForestClassifier(n_estimators=100, random_state=42)
-        model.fit(features, target)
+        # A few thousand weighted feature combinations instead of every incident
+        features, target, weights = aggregate_training_rows(
+            classified[CLASSIFIER_FEATURES].fillna(0), classified["is_violent"]
+        )
+        training = features.assign(is_violent=target, weight=weights)
+        model, _ = store.fit("violence_classifier", training, _fit_violence_classifier)
         importances = [
             {"feature": name, "importance": float(value)}
-            for name, value in zip(
-                features.columns.tolist(), model.feature_importances_, strict=False
-            )
+            for name, value in zip(CLASSIFIER_FEATURES, model.feature_importances_, strict=False)
         ]
     else:
         importances = [
@@ -333,6 +638,9 @@ def _export_forecasting(df: Any, output_dir: Path) -> None:
 
     _write_json(output_dir / "classification_features.json", importances)
 
+    if "dc_dist" in classified.columns:
+        _export_series_forecasts(classified, output_dir, store, n_jobs, model_type)
+
 
 def _export_metadata(df: Any, output_dir: Path) -> None:
     dates = df["dispatch_date"].astype("datetime64[ns]")
@@ -352,27 +660,124 @@ def _export_metadata(df: Any, output_dir: Path) -> None:
     _write_json(output_dir / "metadata.json", asdict(metadata))
 
 
-def export_all(output_dir: Path) -> Path:
-    """Generate all API data exports and return the resolved output path."""
-    repo_root = Path(__file__).resolve().parent.parent
-    output_dir = output_dir if output_dir.is_absolute() else (repo_root / output_dir)
-    geo_dir = output_dir / "geo"
-    _ensure_dir(output_dir)
-    _ensure_dir(geo_dir)
-
+def _source_row_count() -> int | None:
+    """Rows in the crime parquet before cleaning, from its footer (no data read)."""
+    try:
+        import pyarrow.parquet as pq
+
+        return int(pq.ParquetFile(CRIME_DATA_PATH).metadata.num_rows)
+    except (ImportError, OSError):
+        return None
+
+
+def _export_quality(df: Any, output_dir: Path, report: ValidationReport) -> None:
+    profile = build_quality_profile(df, source_records=_source_row_count())
+    profile["validation"] = report.to_dict()
+    _write_json(output_dir / "quality.json", profile, compact=True)
+
+
+# Export stages in run order: name -> (writer function name, extra input files
+# relative to the repo root). Writers are looked up at run time.
+EXPORT_STAGES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "quality": ("_export_quality", ()),
+    "trends": ("_export_trends", ()),
+    "seasonality": ("_export_seasonality", ()),
+    "spatial": (
+        "_export_spatial",
+        (
+            "data/boundaries/police_districts.geojson",
+            "data/boundaries/census_tracts_pop.geojson",
+            "data/boundaries/corridors.geojson",
+            "reports/hotspot_centroids.geojson",
+        ),
+    ),
+    "density": ("_export_density", ()),
+    "vehicle_corridors": ("_export_vehicle_corridors", ("data/boundaries/corridors.geojson",)),
+    "policy": ("_export_policy", (EVENT_CALENDAR_FILE,)),
+    "forecasting": ("_export_forecasting", ()),
+    "metadata": ("_export_metadata", ()),
+}
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+def load_export_frame() -> Any:
+    """Load the incident frame every export stage reads."""
     df = load_crime_data(clean=True)
     if "dispatch_date" in df.columns:
         import pandas as pd
 
         df["dispatch_date"] = pd.to_datetime(df["dispatch_date"], errors="coerce")
         df = df.dropna(subset=["dispatch_date"])
+    return df
 
-    _export_trends(df, output_dir)
-    _export_seasonality(df, output_dir)
-    _export_spatial(df, output_dir, geo_dir, repo_root)
-    _export_policy(df, output_dir, repo_root)
-    _export_forecasting(df, output_dir)
-    _export_metadata(df, output_dir)
+
+def run_stage(
+    name: str,
+    df: Any,
+    output_dir: Path,
+    report: ValidationReport | None = None,
+    store: ModelStore | None = None,
+) -> None:
+    """Run one export stage, writing its files under ``output_dir``.
+
+    ``store`` is the model store the forecasting stage fits through (default:
+    the shared ``.cache/models`` store).
+    """
+    writer = globals()[EXPORT_STAGES[name][0]]
+    geo_dir = output_dir / "geo"
+    _ensure_dir(geo_dir)
+    if name == "quality":
+        writer(df, output_dir, report if report is not None else check_crime_data(df))
+    elif name == "spatial":
+        writer(df, output_dir, geo_dir, _REPO_ROOT)
+    elif name in {"vehicle_corridors", "policy"}:
+        writer(df, output_dir, _REPO_ROOT)
+    elif name == "forecasting":
+        writer(df, output_dir, store)
+    else:
+        writer(df, output_dir)
+
+
+def stage_fingerprint_for(name: str, frame_hash: str) -> str:
+    """Fingerprint of a stage's inputs: the frame, its extra files and its code."""
+    writer_name, extra_inputs = EXPORT_STAGES[name]
+    return stage_fingerprint(
+        frame_hash, globals()[writer_name], [_REPO_ROOT / path for path in extra_inputs]
+    )
+
+
+def export_all(output_dir: Path) -> Path:
+    """Generate all API data exports and return the resolved output path.
+
+    Also writes ``export_manifest.json`` with each stage's input fingerprint
+    and the SHA-256 of every file it wrote (see pipeline.manifest).
+    """
+    output_dir = output_dir if output_dir.is_absolute() else (_REPO_ROOT / output_dir)
+    _ensure_dir(output_dir)
+    _ensure_dir(output_dir / "geo")
+
+    df = load_export_frame()
+
+    # Full-dataset rule check (vectorized, so cheap enough for every refresh)
+    report = check_crime_data(df)
+    for violation in report.violations:
+        typer.echo(
+            f"Validation: {violation.count} rows fail {violation.rule} "
+            f"({violation.description}), e.g. rows {violation.sample_rows}",
+            err=True,
+        )
+
+    frame_hash = frame_fingerprint(df)
+    stages: dict[str, dict[str, Any]] = {}
+    for name in EXPORT_STAGES:
+        before = snapshot(output_dir)
+        run_stage(name, df, output_dir, report)
+        stages[name] = {
+            "fingerprint": stage_fingerprint_for(name, frame_hash),
+            "outputs": hash_outputs(output_dir, written_files(output_dir, before)),
+        }
+    write_manifest(output_dir, frame_hash, stages)
 
     return output_dir
 
@@ -0,0 +1,201 @@
+"""Export manifest: per-stage input fingerprints and output hashes.
+
+``export_all`` records, for every export stage, a fingerprint of what the
+stage read (the incident frame, any boundary/report files, and the source of
+the stage and of every repo function, class and constant it reaches) and the
+SHA-256 of every file it wrote. Reproducibility checks
+re-run a single stage and compare hashes instead of repeating the whole
+export and re-parsing its JSON.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import inspect
+import json
+import types
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+MANIFEST_NAME = "export_manifest.json"
+MANIFEST_VERSION = 1
+
+_CHUNK_SIZE = 1 << 20
+
+# Top-level packages whose code is part of a stage fingerprint
+_REPO_PACKAGES = frozenset({"analysis", "pipeline"})
+
+# Module-level values hashed by repr when a stage's code refers to them
+_CONSTANT_TYPES = (bool, int, float, str, bytes, tuple, frozenset, list, dict)
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def frame_fingerprint(df: Any) -> str:
+    """Content hash of a DataFrame (columns, dtypes and values, not the index)."""
+    import pandas as pd
+
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(c), str(t)] for c, t in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _in_repo(obj: Any) -> bool:
+    module = getattr(obj, "__module__", None) or ""
+    return module.split(".")[0] in _REPO_PACKAGES
+
+
+def _code_names(code: types.CodeType) -> Iterator[str]:
+    """Global, attribute and import names used by ``code`` and its nested functions."""
+    yield from code.co_names
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            yield from _code_names(const)
+
+
+def _functions_of(obj: Any) -> list[types.FunctionType]:
+    if inspect.isfunction(obj):
+        return [obj]
+    members = []
+    for value in vars(obj).values():
+        value = getattr(value, "__func__", value)  # staticmethod / classmethod
+        if isinstance(value, property):
+            members.extend(fn for fn in (value.fget, value.fset) if fn is not None)
+        elif inspect.isfunction(value):
+            members.append(value)
+    return members
+
+
+def _references(obj: Any) -> Iterator[tuple[str, Any]]:
+    """(qualified name, value) of what ``obj``'s code refers to, for repo code only."""
+    for fn in _functions_of(obj):
+        names = sorted(set(_code_names(fn.__code__)))
+        namespaces: list[Any] = [fn.__globals__]
+        for name in names:
+            # Lazy "from analysis.x import y" inside a function: resolve y in analysis.x
+            if name.split(".")[0] in _REPO_PACKAGES and "." in name:
+                try:
+                    namespaces.append(vars(importlib.import_module(name)))
+                except ImportError:
+                    continue
+        for namespace in namespaces:
+            module_name = namespace.get("__name__", "")
+            for name in names:
+                if name not in namespace:
+                    continue
+                value = namespace[name]
+                if isinstance(value, types.ModuleType):
+                    if value.__name__.split(".")[0] in _REPO_PACKAGES:
+                        namespaces.append(vars(value))
+                    continue
+                yield f"{module_name}.{name}", value
+
+
+def code_fingerprint(fn: Callable[..., Any]) -> str:
+    """Hash of ``fn``'s source and of all repo code and constants it reaches.
+
+    Follows the names ``fn`` uses (including imports inside the function and
+    ``module.attr`` access) to functions and classes defined under the repo's
+    packages, transitively, so editing a helper changes the fingerprint of
+    every stage that calls it. Simple module-level constants are hashed by
+    value; third-party code is not followed.
+    """
+    parts: dict[str, str] = {}
+    pending: list[tuple[str, Any]] = [(getattr(fn, "__qualname__", repr(fn)), fn)]
+    seen: set[int] = set()
+    while pending:
+        name, obj = pending.pop()
+        if callable(obj) and not inspect.isclass(obj):
+            obj = inspect.unwrap(obj)
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if inspect.isfunction(obj) or inspect.isclass(obj):
+            if obj is not fn and not _in_repo(obj):
+                continue
+            key = f"{obj.__module__}.{obj.__qualname__}"
+            try:
+                parts[key] = inspect.getsource(obj)
+            except (OSError, TypeError):
+                parts[key] = repr(obj)
+            pending.extend(_references(obj))
+        elif isinstance(obj, _CONSTANT_TYPES):
+            parts[name] = repr(obj)
+
+    digest = hashlib.sha256()
+    for key in sorted(parts):
+        digest.update(f"{key}\n{parts[key]}\n".encode())
+    return digest.hexdigest()
+
+
+def stage_fingerprint(
+    frame_hash: str, stage_fn: Callable[..., Any], extra_inputs: Iterable[Path] = ()
+) -> str:
+    """Fingerprint of everything a stage depends on.
+
+    Args:
+        frame_hash: ``frame_fingerprint`` of the incident frame.
+        stage_fn: Function that writes the stage's files; its code and the
+            repo code it calls are hashed (see ``code_fingerprint``) so code
+            changes mark the stage as changed.
+        extra_inputs: Files the stage reads besides the frame (missing files
+            are recorded as missing).
+    """
+    digest = hashlib.sha256(frame_hash.encode())
+    digest.update(code_fingerprint(stage_fn).encode())
+    for path in extra_inputs:
+        digest.update(str(path.name).encode())
+        digest.update(file_sha256(path).encode() if path.exists() else b"missing")
+    return digest.hexdigest()
+
+
+def snapshot(root: Path) -> dict[str, tuple[int, int]]:
+    """(mtime_ns, size) of every file under ``root``, keyed by relative path."""
+    if not root.exists():
+        return {}
+    return {
+        path.relative_to(root).as_posix(): (path.stat().st_mtime_ns, path.stat().st_size)
+        for path in root.rglob("*")
+        if path.is_file() and path.name != MANIFEST_NAME
+    }
+
+
+def written_files(root: Path, before: dict[str, tuple[int, int]]) -> list[str]:
+    """Files under ``root`` created or rewritten since ``before`` was taken."""
+    after = snapshot(root)
+    return sorted(relative for relative, stat in after.items() if before.get(relative) != stat)
+
+
+def hash_outputs(root: Path, relatives: Iterable[str]) -> dict[str, str]:
+    """SHA-256 of each file in ``relatives`` (paths relative to ``root``)."""
+    return {relative: file_sha256(root / relative) for relative in sorted(relatives)}
+
+
+def read_manifest(root: Path) -> dict[str, Any] | None:
+    """Manifest in ``root``, or None if absent or unreadable."""
+    try:
+        manifest = json.loads((root / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def write_manifest(root: Path, frame_hash: str, stages: dict[str, dict[str, Any]]) -> None:
+    """Write the manifest, flagging stages whose fingerprint changed since the last one."""
+    previous = read_manifest(root) or {}
+    previous_stages = previous.get("stages", {})
+    for name, stage in stages.items():
+        old = previous_stages.get(name, {})
+        stage["changed"] = old.get("fingerprint") != stage["fingerprint"]
+    manifest = {"version": MANIFEST_VERSION, "input_fingerprint": frame_hash, "stages": stages}
+    (root / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2, sort_keys=True), "utf-8")
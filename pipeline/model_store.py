@@ -0,0 +1,160 @@
+"""Fitted-model store keyed on a hash of the training input.
+
+Refreshes run every 15 minutes but the monthly series behind the forecast
+rarely changes by more than its last point. ``ModelStore.fit`` reuses the
+stored model when the training frame and the fitting code hash the same as
+last time and fits from scratch otherwise. With warm start enabled
+(``PIPELINE_WARM_START=1``) it instead calls a cheap refit (e.g. a Prophet
+warm start) when only the last row changed or a row was appended. A warm
+started model depends on what was stored before, so such entries are marked
+and a store without warm start refits them rather than publishing them.
+
+Models are serialized with joblib under ``.cache/models`` at the project
+root (``PIPELINE_MODEL_CACHE`` overrides the location).
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Literal
+
+import joblib
+
+from pipeline.manifest import code_fingerprint, frame_fingerprint
+
+FitStatus = Literal["cached", "refit", "fit"]
+
+MODEL_CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache" / "models"
+
+# Bump when the stored entry layout changes; older entries are then ignored
+STORE_VERSION = 2
+
+
+def resolve_cache_dir() -> Path:
+    raw = os.getenv("PIPELINE_MODEL_CACHE")
+    return Path(raw) if raw else MODEL_CACHE_DIR
+
+
+def warm_start_enabled() -> bool:
+    return os.getenv("PIPELINE_WARM_START", "").lower() in {"1", "true", "yes"}
+
+
+def _identity(model: Any) -> Any:
+    return model
+
+
+def fit_signature(*fns: Callable[..., Any] | None) -> str:
+    """Hash of the fitting callables: their code and any partial-bound arguments."""
+    parts = []
+    for fn in fns:
+        bound: list[Any] = []
+        while isinstance(fn, functools.partial):
+            bound.append((fn.args, fn.keywords))
+            fn = fn.func
+        parts.append((code_fingerprint(fn) if fn is not None else None, bound))
+    return joblib.hash(parts)
+
+
+class ModelStore:
+    """Directory of fitted models, one entry per model name.
+
+    Each entry holds the (encoded) model, the hash of the frame it was
+    trained on and of that frame minus its last row (both combined with the
+    fit signature), and whether the model was warm started.
+    """
+
+    def __init__(self, root: Path | None = None, warm_start: bool | None = None) -> None:
+        self.root = root or resolve_cache_dir()
+        self.warm_start = warm_start_enabled() if warm_start is None else warm_start
+
+    def path(self, name: str) -> Path:
+        return self.root / f"{name}.joblib"
+
+    def load(self, name: str) -> dict[str, Any] | None:
+        """Stored entry for ``name``, or None if absent, stale or unreadable."""
+        try:
+            entry = joblib.load(self.path(name))
+        except Exception:  # noqa: BLE001 - a corrupt cache entry is just a miss
+            return None
+        if not isinstance(entry, dict) or entry.get("version") != STORE_VERSION:
+            return None
+        return entry
+
+    def save(
+        self,
+        name: str,
+        model: Any,
+        key: str,
+        prefix_key: str | None,
+        warm_started: bool = False,
+    ) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "version": STORE_VERSION,
+            "key": key,
+            "prefix_key": prefix_key,
+            "warm_started": warm_started,
+            "model": model,
+        }
+        # Write then rename so a concurrent refresh never reads a half-written file
+        tmp = self.path(name).with_suffix(f".{os.getpid()}.tmp")
+        joblib.dump(entry, tmp)
+        tmp.replace(self.path(name))
+
+    def fit(
+        self,
+        name: str,
+        data: Any,
+        fit_fn: Callable[[Any], Any],
+        refit_fn: Callable[[Any, Any], Any] | None = None,
+        encode: Callable[[Any], Any] = _identity,
+        decode: Callable[[Any], Any] = _identity,
+    ) -> tuple[Any, FitStatus]:
+        """Return a model trained on ``data``, reusing the stored one when possible.
+
+        Args:
+            name: Entry name (one model per name).
+            data: Training frame; its content hash, together with
+                ``fit_signature(fit_fn, refit_fn)``, is the cache key.
+            fit_fn: ``fit_fn(data)`` fits a model from scratch.
+            refit_fn: ``refit_fn(previous_model, data)`` for the cheap path,
+                taken with warm start enabled when ``data`` differs from the
+                stored training frame only in its last row or by one
+                appended row. Otherwise a full fit runs instead.
+            encode: Converts the model to a picklable form before saving.
+            decode: Inverse of ``encode``.
+
+        Returns:
+            ``(model, status)`` where status is "cached", "refit" or "fit".
+        """
+        signature = fit_signature(fit_fn, refit_fn)
+        key = joblib.hash((frame_fingerprint(data), signature))
+        prefix_key = (
+            joblib.hash((frame_fingerprint(data.iloc[:-1]), signature)) if len(data) > 1 else None
+        )
+        entry = self.load(name)
+
+        if (
+            entry is not None
+            and entry["key"] == key
+            and (self.warm_start or not entry["warm_started"])
+        ):
+            return decode(entry["model"]), "cached"
+
+        status: FitStatus = "fit"
+        if (
+            entry is not None
+            and self.warm_start
+            and refit_fn is not None
+            and prefix_key is not None
+            and prefix_key in (entry["prefix_key"], entry["key"])
+        ):
+            model = refit_fn(decode(entry["model"]), data)
+            status = "refit"
+        else:
+            model = fit_fn(data)
+        self.save(name, encode(model), key, prefix_key, warm_started=status == "refit")
+        return model, status
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""Benchmark the data-loading, export and CLI start-up hot paths against a baseline.
+
+Each benchmark runs on a deterministic synthetic incident dataset (same seed,
+same rows on every machine) at one or more sizes, and reports the best of
+several timed runs. Results are compared with ``benchmark_baseline.json`` and
+the run fails when a hot path is slower than its baseline by more than the
+ratio configured in ``performance_thresholds.BENCHMARK_REGRESSION_RATIOS``.
+
+Usage:
+    python scripts/benchmark_hot_paths.py                      # 100k rows, gate on baseline
+    python scripts/benchmark_hot_paths.py --rows 100000 1000000 5000000
+    python scripts/benchmark_hot_paths.py --only classify_crime_category --repeats 5
+    python scripts/benchmark_hot_paths.py --update-baseline    # record this machine's timings
+
+Baselines are machine-specific: regenerate them with ``--update-baseline`` on
+the machine (or CI runner class) that does the gating.
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPTS_DIR.parent
+for _path in (str(REPO_ROOT), str(SCRIPTS_DIR)):
+    if _path not in sys.path:
+        sys.path.insert(0, _path)
+
+from performance_thresholds import BENCHMARK_REGRESSION_RATIOS  # noqa: E402
+
+BASELINE_PATH = SCRIPTS_DIR / "benchmark_baseline.json"
+DEFAULT_ROWS = [100_000]
+SYNTHETIC_SEED = 42
+
+# UCR codes with roughly the production mix (theft and vandalism dominate)
+_UCR_CODES = np.array([100, 200, 300, 400, 500, 600, 700, 800, 1400, 1800, 2600])
+_UCR_WEIGHTS = np.array([0.005, 0.01, 0.04, 0.06, 0.06, 0.30, 0.05, 0.18, 0.12, 0.07, 0.105])
+_UCR_TEXT = {
+    100: "Homicide - Criminal",
+    200: "Rape",
+    300: "Robbery No Firearm",
+    400: "Aggravated Assault No Firearm",
+    500: "Burglary Residential",
+    600: "Thefts",
+    700: "Motor Vehicle Theft",
+    800: "Other Assaults",
+    1400: "Vandalism/Criminal Mischief",
+    1800: "Narcotic / Drug Law Violations",
+    2600: "All Other Offenses",
+}
+_DISTRICTS = np.array([1, 2, 3, 5, 6, 7, 8, 9, 12, 14, 15, 16, 17, 18, 19, 22, 24, 25, 26, 35, 39])
+_FIRST_DAY = pd.Timestamp("2006-01-01")
+_N_DAYS = (pd.Timestamp("2025-12-31") - _FIRST_DAY).days + 1
+# Share of incidents without coordinates, as in the source data
+_MISSING_POINT_SHARE = 0.01
+
+
+def synthetic_incidents(n_rows: int, seed: int = SYNTHETIC_SEED) -> pd.DataFrame:
+    """Build ``n_rows`` incidents with the combined dataset's schema.
+
+    The same ``n_rows`` and ``seed`` always give the same frame. Dates span
+    2006-2025, coordinates fall inside Philadelphia's bounding box (about 1%
+    missing) and UCR codes follow roughly the production mix.
+    """
+    rng = np.random.default_rng(seed)
+    ucr = rng.choice(_UCR_CODES, n_rows, p=_UCR_WEIGHTS)
+    days = np.sort(rng.integers(0, _N_DAYS, n_rows))
+    seconds = rng.integers(0, 24 * 3600, n_rows)
+    point_x = rng.uniform(-75.28, -74.96, n_rows)
+    point_y = rng.uniform(39.87, 40.14, n_rows)
+    missing = rng.random(n_rows) < _MISSING_POINT_SHARE
+    point_x[missing] = np.nan
+    point_y[missing] = np.nan
+    district = rng.choice(_DISTRICTS, n_rows)
+
+    # At most 86,400 distinct times of day: format each once
+    unique_seconds, time_codes = np.unique(seconds, return_inverse=True)
+    clock = [f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}" for s in unique_seconds.tolist()]
+    text = pd.Categorical.from_codes(
+        np.searchsorted(_UCR_CODES, ucr), categories=[_UCR_TEXT[code] for code in _UCR_CODES]
+    )
+    return pd.DataFrame(
+        {
+            "objectid": np.arange(1, n_rows + 1),
+            "dispatch_date": _FIRST_DAY + pd.to_timedelta(days, unit="D"),
+            "dispatch_time": pd.Categorical.from_codes(time_codes, categories=clock),
+            "hour": (seconds // 3600).astype(np.int64),
+            "ucr_general": ucr,
+            "text_general_code": text,
+            "dc_dist": district,
+            "psa": pd.Categorical((district * 10 + rng.integers(1, 4, n_rows)).astype(str)),
+            "point_x": point_x,
+            "point_y": point_y,
+        }
+    )
+
+
+def write_synthetic_parquet(df: pd.DataFrame, path: Path) -> Path:
+    """Write ``df`` like the combined incidents file (dispatch_date as category)."""
+    stored = df.assign(dispatch_date=df["dispatch_date"].dt.strftime("%Y-%m-%d").astype("category"))
+    stored.to_parquet(path, index=False)
+    return path
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A hot path to time: ``setup`` builds the zero-argument call that is timed."""
+
+    name: str
+    setup: Callable[[pd.DataFrame, Path], Callable[[], Any]]
+    requires_geopandas: bool = False
+
+
+def _setup_load(df: pd.DataFrame, workdir: Path) -> Callable[[], Any]:
+    from analysis.data import loading
+
+    path = write_synthetic_parquet(df, workdir / "crime_incidents_combined.parquet")
+
+    def run() -> Any:
+        # The uncached loader: the joblib cache key does not include the file path
+        with patch.object(loading, "CRIME_DATA_PATH", path):
+            return loading._load_crime_data_parquet.func(clean=True)
+
+    return run
+
+
+def _setup_classify(df: pd.DataFrame, _workdir: Path) -> Callable[[], Any]:
+    from analysis.utils.classification import classify_crime_category
+
+    return lambda: classify_crime_category(df)
+
+
+def _setup_temporal(df: pd.DataFrame, _workdir: Path) -> Callable[[], Any]:
+    from analysis.utils.temporal import extract_temporal_features
+
+    return lambda: extract_temporal_features(df)
+
+
+def _setup_join_districts(df: pd.DataFrame, _workdir: Path) -> Callable[[], Any]:
+    import geopandas as gpd
+
+    from analysis.utils.spatial import spatial_join_districts
+
+    districts = gpd.read_file(REPO_ROOT / "data" / "boundaries" / "police_districts.geojson")
+    return lambda: spatial_join_districts(df, districts)
+
+
+def _setup_count_tracts(df: pd.DataFrame, _workdir: Path) -> Callable[[], Any]:
+    import geopandas as gpd
+
+    from pipeline.export_data import _count_points_in_tracts
+
+    tracts = gpd.read_file(REPO_ROOT / "data" / "boundaries" / "census_tracts_pop.geojson")
+    return lambda: _count_points_in_tracts(df, tracts[["GEOID", "geometry"]])
+
+
+def _setup_export_all(df: pd.DataFrame, workdir: Path) -> Callable[[], Any]:
+    from analysis.data import loading
+    from pipeline import export_data
+
+    path = write_synthetic_parquet(df, workdir / "crime_incidents_combined.parquet")
+    runs = itertools.count()
+
+    def load(clean: bool = True) -> pd.DataFrame:
+        return loading._load_crime_data_parquet.func(clean=clean)
+
+    def run() -> Any:
+        # Fresh output and model cache each run: a cold refresh, not a cached one
+        run_dir = workdir / f"export_{next(runs)}"
+        with (
+            patch.object(loading, "CRIME_DATA_PATH", path),
+            patch.object(export_data, "CRIME_DATA_PATH", path),
+            patch.object(export_data, "load_crime_data", load),
+            patch.dict(os.environ, {"PIPELINE_MODEL_CACHE": str(run_dir / "models")}),
+            _quiet(),
+        ):
+            return export_data.export_all(run_dir / "api_data")
+
+    return run
+
+
+def _setup_cli_help(_df: pd.DataFrame, _workdir: Path) -> Callable[[], Any]:
+    # A fresh interpreter each run: this is the cold start users wait for
+    command = [sys.executable, "-m", "analysis.cli", "--help"]
+    env = {**os.environ, "CRIME_ANALYSIS_NO_DAEMON": "1"}
+
+    def run() -> Any:
+        return subprocess.run(command, cwd=REPO_ROOT, env=env, capture_output=True, check=True)
+
+    return run
+
+
+@contextmanager
+def _quiet() -> Iterator[None]:
+    with open(os.devnull, "w") as devnull, patch.object(sys, "stderr", devnull):
+        yield
+
+
+BENCHMARKS = [
+    Benchmark("load_crime_data", _setup_load),
+    Benchmark("classify_crime_category", _setup_classify),
+    Benchmark("extract_temporal_features", _setup_temporal),
+    Benchmark("spatial_join_districts", _setup_join_districts, requires_geopandas=True),
+    Benchmark("count_points_in_tracts", _setup_count_tracts, requires_geopandas=True),
+    Benchmark("export_all", _setup_export_all),
+    Benchmark("cli_help_startup", _setup_cli_help),
+]
+
+
+def time_call(func: Callable[[], Any], repeats: int = 3, warmup: int = 1) -> float:
+    """Best wall-clock time of ``repeats`` calls to ``func``, in seconds."""
+    for _ in range(warmup):
+        func()
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(
+    rows: list[int],
+    names: list[str] | None = None,
+    repeats: int = 3,
+    warmup: int = 1,
+) -> dict[str, dict[str, float]]:
+    """Time each selected benchmark at each size.
+
+    Returns:
+        ``{str(n_rows): {benchmark name: seconds}}``
+    """
+    try:
+        import geopandas  # noqa: F401
+
+        has_geopandas = True
+    except ImportError:
+        has_geopandas = False
+
+    selected = [b for b in BENCHMARKS if names is None or b.name in names]
+    results: dict[str, dict[str, float]] = {}
+    for n_rows in rows:
+        df = synthetic_incidents(n_rows)
+        timings: dict[str, float] = {}
+        for bench in selected:
+            if bench.requires_geopandas and not has_geopandas:
+                print(f"  {bench.name:<28} skipped (geopandas not installed)")
+                continue
+            with tempfile.TemporaryDirectory(prefix="crime-bench-") as workdir:
+                func = bench.setup(df, Path(workdir))
+                timings[bench.name] = time_call(func, repeats=repeats, warmup=warmup)
+            print(f"  {n_rows:>9,} rows  {bench.name:<28} {timings[bench.name]:9.3f}s")
+        results[str(n_rows)] = timings
+    return results
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """One benchmark's timing against its baseline."""
+
+    rows: str
+    name: str
+    seconds: float
+    baseline: float | None
+    max_ratio: float
+
+    @property
+    def ratio(self) -> float | None:
+        return None if not self.baseline else self.seconds / self.baseline
+
+    @property
+    def regressed(self) -> bool:
+        return self.ratio is not None and self.ratio > self.max_ratio
+
+
+def compare_to_baseline(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, Any],
+    ratios: dict[str, float] = BENCHMARK_REGRESSION_RATIOS,
+) -> list[Comparison]:
+    """Pair each result with its baseline timing and allowed slowdown ratio."""
+    recorded = baseline.get("results", {})
+    return [
+        Comparison(
+            rows=rows,
+            name=name,
+            seconds=seconds,
+            baseline=recorded.get(rows, {}).get(name),
+            max_ratio=ratios.get(name, ratios["default"]),
+        )
+        for rows, timings in results.items()
+        for name, seconds in timings.items()
+    ]
+
+
+def machine_info() -> dict[str, Any]:
+    """What the timings depend on besides the code."""
+    return {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def update_baseline(results: dict[str, dict[str, float]], path: Path = BASELINE_PATH) -> None:
+    """Merge ``results`` into the baseline file, keeping sizes that were not run."""
+    baseline = load_baseline(path)
+    recorded = baseline.get("results", {})
+    for rows, timings in results.items():
+        recorded.setdefault(rows, {}).update({name: round(s, 4) for name, s in timings.items()})
+    payload = {
+        "machine": machine_info(),
+        "results": {rows: recorded[rows] for rows in sorted(recorded, key=int)},
+    }
+    path.write_text(json.dumps(payload, indent=2) + "\n")
+
+
+def report(comparisons: list[Comparison]) -> int:
+    """Print the comparison table and return the number of regressions."""
+    print(f"\n{'rows':>9}  {'benchmark':<28} {'seconds':>9} {'baseline':>9} {'ratio':>6}")
+    for c in comparisons:
+        baseline = f"{c.baseline:9.3f}" if c.baseline else f"{'-':>9}"
+        ratio = f"{c.ratio:6.2f}" if c.ratio is not None else f"{'-':>6}"
+        flag = f"  REGRESSION (> {c.max_ratio:.2f}x)" if c.regressed else ""
+        print(f"{int(c.rows):>9,}  {c.name:<28} {c.seconds:9.3f} {baseline} {ratio}{flag}")
+    return sum(c.regressed for c in comparisons)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Dataset sizes to run"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=[b.name for b in BENCHMARKS],
+        help="Run only these benchmarks",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per benchmark")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per benchmark")
+    parser.add_argument(
+        "--baseline", type=Path, default=BASELINE_PATH, help="Baseline results file"
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record these timings as the new baseline instead of gating on it",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    results = run_benchmarks(args.rows, args.only, repeats=args.repeats, warmup=args.warmup)
+
+    if args.update_baseline:
+        update_baseline(results, args.baseline)
+        print(f"\nBaseline updated: {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline.get("machine") and baseline["machine"] != machine_info():
+        print(f"\nNote: baseline recorded on {baseline['machine']}, running on {machine_info()}")
+    regressions = report(compare_to_baseline(results, baseline))
+    if regressions:
+        print(f"\n{regressions} hot path(s) regressed beyond the allowed ratio")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -35,4 +35,14 @@ PERFORMANCE_THRESHOLDS = {
         "warning_threshold_ms": 2000,  # 2 seconds
         "error_threshold_ms": 4000     # 4 seconds
     }
-}
\ No newline at end of file
+}
+
+# Allowed slowdown of a hot-path benchmark relative to its recorded baseline
+# (scripts/benchmark_hot_paths.py). 1.25 fails a run more than 25% slower.
+BENCHMARK_REGRESSION_RATIOS = {
+    "default": 1.25,
+    # Whole-pipeline timing includes model fitting and file I/O, so it is noisier
+    "export_all": 1.5,
+    # Interpreter start-up varies with disk cache and machine load
+    "cli_help_startup": 1.5,
+}
@@ -1436,3 +1436,220 @@ def test_question_text_with_www_url(monkeypatch: MonkeyPatch) -> None:
 
     assert response.status_code == 422
     assert "URLs are not allowed" in response.json()["message"]
+
+
+def test_spatial_density_filters_layers(monkeypatch: MonkeyPatch) -> None:
+    """Test density endpoint filters layers by year and category."""
+    from api.services import data_loader
+
+    payload = {
+        "bounds": [-75.3, 39.85, -74.95, 40.15],
+        "cell_size": 0.005,
+        "shape": [60, 70],
+        "layers": [
+            {"year": 2020, "crime_category": "Violent", "total": 1, "cells": [0], "counts": [1]},
+            {"year": 2021, "crime_category": "Violent", "total": 2, "cells": [5], "counts": [2]},
+            {"year": 2021, "crime_category": "Property", "total": 1, "cells": [7], "counts": [1]},
+        ],
+    }
+    monkeypatch.setattr(data_loader, "_DATA_CACHE", {"density.json": payload})
+
+    response = client.get("/api/v1/spatial/density", params={"year": 2021, "category": "Violent"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["shape"] == [60, 70]
+    assert [layer["total"] for layer in body["layers"]] == [2]
+
+    response = client.get("/api/v1/spatial/density")
+    assert len(response.json()["layers"]) == 3
+
+
+def test_spatial_density_missing_export(monkeypatch: MonkeyPatch) -> None:
+    """Test density endpoint returns 503 when the export is not loaded."""
+    from api.services import data_loader
+
+    monkeypatch.setattr(data_loader, "_DATA_CACHE", {})
+
+    response = client.get("/api/v1/spatial/density")
+    assert response.status_code == 503
+
+
+def test_quality_profile(monkeypatch: MonkeyPatch) -> None:
+    """Test quality endpoint serves the refresh profile and 503s when absent."""
+    from api.services import data_loader
+
+    payload = {"version": 1, "total_records": 10, "null_rates": {"dispatch_date": 0.0}}
+    monkeypatch.setattr(data_loader, "_DATA_CACHE", {"quality.json": payload})
+    response = client.get("/api/v1/quality")
+    assert response.status_code == 200
+    assert response.json() == payload
+
+    monkeypatch.setattr(data_loader, "_DATA_CACHE", {})
+    assert client.get("/api/v1/quality").status_code == 503
+
+
+def test_forecasting_time_series_filtered(monkeypatch: MonkeyPatch) -> None:
+    """Test district/category filters select a series from forecast_series.json."""
+    from api.services import data_loader
+
+    series = {
+        "dates": ["2024-01-31T00:00:00", "2024-02-29T00:00:00"],
+        "forecast_dates": ["2024-03-31T00:00:00"],
+        "series": [
+            {
+                "district": 5,
+                "category": "Violent",
+                "model": "LinearFallback",
+                "y": [10, 12],
+                "yhat": [14.0],
+                "yhat_lower": [12.6],
+                "yhat_upper": [15.4],
+            },
+            {
+                "district": 5,
+                "category": None,
+                "model": "Prophet",
+                "y": [30, 31],
+                "yhat": [32.0],
+                "yhat_lower": [29.0],
+                "yhat_upper": [35.0],
+            },
+        ],
+    }
+    citywide = {"historical": [], "forecast": [], "model": "Prophet"}
+    monkeypatch.setattr(
+        data_loader,
+        "_DATA_CACHE",
+        {"forecast.json": citywide, "forecast_series.json": series},
+    )
+
+    assert client.get("/api/v1/forecasting/time-series").json() == citywide
+
+    response = client.get("/api/v1/forecasting/time-series?district=5&category=Violent")
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["model"] == "LinearFallback"
+    assert payload["historical"] == [
+        {"ds": "2024-01-31T00:00:00", "y": 10},
+        {"ds": "2024-02-29T00:00:00", "y": 12},
+    ]
+    assert payload["forecast"] == [
+        {"ds": "2024-03-31T00:00:00", "yhat": 14.0, "yhat_lower": 12.6, "yhat_upper": 15.4}
+    ]
+
+    district_total = client.get("/api/v1/forecasting/time-series?district=5").json()
+    assert district_total["category"] is None
+    assert district_total["historical"][1]["y"] == 31
+
+    assert client.get("/api/v1/forecasting/time-series?category=Other").status_code == 404
+
+    monkeypatch.setattr(data_loader, "_DATA_CACHE", {"forecast.json": citywide})
+    assert client.get("/api/v1/forecasting/time-series?district=5").status_code == 503
+
+
+def test_policy_vehicle_corridors(monkeypatch: MonkeyPatch) -> None:
+    """Test vehicle corridor endpoint serves the export and 503s when absent."""
+    from api.services import data_loader
+
+    payload = {
+        "buffer_m": 500.0,
+        "total_incidents": 10,
+        "within_buffer": 4,
+        "pct_within": 40.0,
+        "corridors": [{"name": "I 95", "type": "highway", "incident_count": 4}],
+    }
+    monkeypatch.setattr(data_loader, "_DATA_CACHE", {"vehicle_crimes_per_corridor.json": payload})
+    response = client.get("/api/v1/policy/vehicle-corridors")
+    assert response.status_code == 200
+    assert response.json()["pct_within"] == 40.0
+
+    monkeypatch.setattr(data_loader, "_DATA_CACHE", {})
+    response = client.get("/api/v1/policy/vehicle-corridors")
+    assert response.status_code == 503
+
+
+# Incident export tests
+@pytest.fixture
+def incidents_parquet(tmp_path, monkeypatch: MonkeyPatch):
+    """Small incidents file with many row groups, served by /api/v1/incidents."""
+    import pandas as pd
+
+    dates = pd.date_range("2020-01-01", periods=400, freq="D")
+    df = pd.DataFrame(
+        {
+            "objectid": range(400),
+            "dispatch_date": dates.strftime("%Y-%m-%d").astype("category"),
+            "dc_dist": [i % 4 + 1 for i in range(400)],
+            "ucr_general": [600 if i % 2 else 300 for i in range(400)],
+        }
+    )
+    path = tmp_path / "incidents.parquet"
+    df.to_parquet(path, row_group_size=50)
+    monkeypatch.setenv("API_INCIDENTS_PATH", str(path))
+    return df
+
+
+def test_incidents_ndjson_filters(incidents_parquet) -> None:
+    import json
+
+    response = client.get(
+        "/api/v1/incidents",
+        params={"district": 2, "start_date": "2020-03-01", "end_date": "2020-03-31", "ucr_band": 300},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    expected = incidents_parquet[
+        (incidents_parquet["dc_dist"] == 2)
+        & incidents_parquet["dispatch_date"].astype(str).between("2020-03-01", "2020-03-31")
+        & (incidents_parquet["ucr_general"] == 300)
+    ]
+    assert [row["objectid"] for row in rows] == expected["objectid"].tolist()
+    assert all(row["dispatch_date"].startswith("2020-03") for row in rows)
+
+
+def test_incidents_high_ucr_band(incidents_parquet) -> None:
+    """Bands above 900 (e.g. 2600, all other offenses) are valid filters."""
+    response = client.get("/api/v1/incidents", params={"ucr_band": 2600})
+    assert response.status_code == 200
+    assert response.text == ""
+
+
+def test_incidents_csv_columns_and_limit(incidents_parquet) -> None:
+    response = client.get(
+        "/api/v1/incidents", params={"format": "csv", "columns": ["objectid", "dc_dist"], "limit": 120}
+    )
+    assert response.status_code == 200
+    lines = response.text.strip().splitlines()
+    assert lines[0] == '"objectid","dc_dist"'
+    assert len(lines) == 121
+    assert response.headers["x-row-cap"] == "120"
+
+
+def test_incidents_arrow_stream(incidents_parquet) -> None:
+    import pyarrow as pa
+
+    response = client.get("/api/v1/incidents", params={"format": "arrow", "district": 1})
+    assert response.status_code == 200
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.num_rows == (incidents_parquet["dc_dist"] == 1).sum()
+    assert table.schema.field("dispatch_date").type == pa.string()
+
+
+def test_incidents_row_cap(incidents_parquet, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("API_INCIDENTS_MAX_ROWS", "75")
+    response = client.get("/api/v1/incidents", params={"limit": 1000})
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 75
+
+
+def test_incidents_unknown_column(incidents_parquet) -> None:
+    response = client.get("/api/v1/incidents", params={"columns": ["nope"]})
+    assert response.status_code == 422
+    assert "nope" in response.json()["message"]
+
+
+def test_incidents_missing_dataset(tmp_path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setenv("API_INCIDENTS_PATH", str(tmp_path / "missing.parquet"))
+    response = client.get("/api/v1/incidents")
+    assert response.status_code == 503
@@ -529,3 +529,35 @@ class TestEnvironmentVariableIntegration:
         # Verify status reflects tmp_path
         assert status["data_dir"] == str(tmp_path)
         assert status["ok"] is False  # Missing most required files
+
+
+class TestIncidentExport:
+    """Tests for api/services/incident_export.py row-group pruning."""
+
+    @pytest.mark.parametrize("stored_as", ["category", "string", "timestamp"])
+    def test_date_window_prunes_row_groups(self, tmp_path: Path, stored_as: str) -> None:
+        """Only row groups overlapping the window are scanned, however dates are stored."""
+        import datetime as dt
+
+        import pandas as pd
+        import pyarrow.dataset as ds
+
+        from api.services import incident_export
+
+        dates = pd.date_range("2020-01-01", periods=400, freq="D")
+        stored: Any = {
+            "category": dates.strftime("%Y-%m-%d").astype("category"),
+            "string": dates.strftime("%Y-%m-%d"),
+            "timestamp": dates,
+        }[stored_as]
+        path = tmp_path / "incidents.parquet"
+        pd.DataFrame({"dispatch_date": stored, "dc_dist": 1}).to_parquet(path, row_group_size=50)
+
+        dataset = ds.dataset(path, format="parquet")
+        start, end = dt.date(2020, 3, 1), dt.date(2020, 3, 31)
+        fragments = list(incident_export.iter_fragments(dataset, start, end))
+        filter_expr = incident_export.build_filter(dataset.schema, start_date=start, end_date=end)
+        batches = incident_export.iter_batches(dataset, iter(fragments), filter_expr, None, 1000)
+
+        assert sum(fragment.num_row_groups for fragment in fragments) == 1
+        assert sum(batch.num_rows for batch in batches) == 31
@@ -0,0 +1,107 @@
+"""Tests for the hot-path benchmark runner (scripts/benchmark_hot_paths.py)."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+
+def _load_benchmark_module():
+    module_path = Path("scripts/benchmark_hot_paths.py")
+    scripts_dir = str(module_path.parent.resolve())
+    if scripts_dir not in sys.path:
+        sys.path.insert(0, scripts_dir)
+    spec = importlib.util.spec_from_file_location("benchmark_hot_paths", module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError("Failed to load scripts/benchmark_hot_paths.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["benchmark_hot_paths"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+benchmark_hot_paths = _load_benchmark_module()
+
+
+class TestSyntheticIncidents:
+    def test_same_seed_same_frame(self) -> None:
+        pd.testing.assert_frame_equal(
+            benchmark_hot_paths.synthetic_incidents(1_000),
+            benchmark_hot_paths.synthetic_incidents(1_000),
+        )
+
+    def test_schema_and_bounds(self) -> None:
+        df = benchmark_hot_paths.synthetic_incidents(5_000)
+
+        assert len(df) == 5_000
+        assert df["dispatch_date"].is_monotonic_increasing
+        assert df["point_x"].dropna().between(-75.30, -74.95).all()
+        assert df["point_y"].dropna().between(39.85, 40.15).all()
+        assert 0 < df["point_x"].isna().sum() < 200
+        hours = df["dispatch_time"].astype(str).str[:2].astype(int)
+        assert (hours == df["hour"]).all()
+
+    def test_parquet_loads_like_combined_file(self, tmp_path: Path) -> None:
+        from analysis.data import loading
+
+        df = benchmark_hot_paths.synthetic_incidents(1_000)
+        path = benchmark_hot_paths.write_synthetic_parquet(df, tmp_path / "incidents.parquet")
+
+        assert pd.read_parquet(path)["dispatch_date"].dtype.name == "category"
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(loading, "CRIME_DATA_PATH", path)
+            loaded = loading._load_crime_data_parquet.func(clean=True)
+        pd.testing.assert_series_equal(loaded["dispatch_date"], df["dispatch_date"])
+
+
+class TestBaselineGate:
+    def test_flags_only_slowdowns_beyond_ratio(self) -> None:
+        results = {"1000": {"a": 1.2, "b": 1.3, "new": 1.0}}
+        baseline = {"results": {"1000": {"a": 1.0, "b": 1.0}}}
+
+        comparisons = benchmark_hot_paths.compare_to_baseline(
+            results, baseline, ratios={"default": 1.25}
+        )
+
+        assert {c.name: c.regressed for c in comparisons} == {"a": False, "b": True, "new": False}
+        assert next(c for c in comparisons if c.name == "new").ratio is None
+
+    def test_per_benchmark_ratio_overrides_default(self) -> None:
+        comparisons = benchmark_hot_paths.compare_to_baseline(
+            {"1000": {"slow": 1.4}},
+            {"results": {"1000": {"slow": 1.0}}},
+            ratios={"default": 1.25, "slow": 1.5},
+        )
+
+        assert not comparisons[0].regressed
+
+    def test_update_keeps_sizes_not_run(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+        benchmark_hot_paths.update_baseline({"5000000": {"a": 9.0}}, path)
+        benchmark_hot_paths.update_baseline({"100000": {"a": 0.123456}}, path)
+
+        results = json.loads(path.read_text())["results"]
+        assert list(results) == ["100000", "5000000"]
+        assert results["100000"]["a"] == 0.1235
+
+    @pytest.mark.parametrize(("baseline_seconds", "exit_code"), [(1e-9, 1), (1e9, 0)])
+    def test_main_exit_code(self, tmp_path: Path, baseline_seconds: float, exit_code: int) -> None:
+        path = tmp_path / "baseline.json"
+        path.write_text(
+            json.dumps({"results": {"2000": {"classify_crime_category": baseline_seconds}}})
+        )
+        args = ["--rows", "2000", "--only", "classify_crime_category", "--repeats", "1"]
+
+        assert benchmark_hot_paths.main([*args, "--baseline", str(path)]) == exit_code
+
+    def test_main_update_baseline(self, tmp_path: Path) -> None:
+        path = tmp_path / "baseline.json"
+        args = ["--rows", "2000", "--only", "classify_crime_category", "--repeats", "1"]
+
+        assert benchmark_hot_paths.main([*args, "--baseline", str(path), "--update-baseline"]) == 0
+        assert json.loads(path.read_text())["results"]["2000"]["classify_crime_category"] > 0
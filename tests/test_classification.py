@@ -3,7 +3,12 @@
 import pandas as pd
 import pytest
 
-from analysis.utils.classification import CRIME_CATEGORY_MAP, classify_crime_category
+from analysis.utils.classification import (
+    CRIME_CATEGORIES,
+    CRIME_CATEGORY_MAP,
+    classify_crime_category,
+    severity_weights,
+)
 
 
 class TestCrimeCategoryMap:
@@ -157,9 +162,16 @@ class TestClassifyCrimeCategory:
         """Returns a copy, not a view."""
         df = pd.DataFrame({"ucr_general": [100]})
         result = classify_crime_category(df)
-        result.loc[result.index[0], "crime_category"] = "Modified"
+        result.loc[result.index[0], "crime_category"] = "Other"
         assert "crime_category" not in df.columns
 
+    def test_inplace_adds_column_to_input(self):
+        """inplace=True adds the column to the input frame and returns it."""
+        df = pd.DataFrame({"ucr_general": [100, 600]})
+        result = classify_crime_category(df, inplace=True)
+        assert result is df
+        assert df["crime_category"].tolist() == ["Violent", "Property"]
+
     def test_preserves_original_columns(self):
         """Preserves all original columns."""
         df = pd.DataFrame(
@@ -188,11 +200,12 @@ class TestClassifyCrimeCategory:
         assert len(result) == 1
         assert result["crime_category"].iloc[0] == "Violent"
 
-    def test_crime_category_is_string(self):
-        """crime_category column contains string values."""
-        df = pd.DataFrame({"ucr_general": [100, 500, 999]})
+    def test_crime_category_is_categorical(self):
+        """crime_category column is a Categorical with fixed categories."""
+        df = pd.DataFrame({"ucr_general": [100, 100]})
         result = classify_crime_category(df)
-        assert result["crime_category"].dtype == object
+        assert isinstance(result["crime_category"].dtype, pd.CategoricalDtype)
+        assert tuple(result["crime_category"].cat.categories) == CRIME_CATEGORIES
 
     @pytest.mark.parametrize(
         "ucr_code,expected",
@@ -214,3 +227,22 @@ class TestClassifyCrimeCategory:
         df = pd.DataFrame({"ucr_general": [ucr_code]})
         result = classify_crime_category(df)
         assert result["crime_category"].iloc[0] == expected
+
+
+class TestSeverityWeights:
+    """Tests for severity_weights lookup."""
+
+    def test_default_weights(self):
+        """Default weights come from SEVERITY_WEIGHTS by hundred-band."""
+        result = severity_weights(pd.Series([100, 199, 600, 700, 999]))
+        assert result.tolist() == [10.0, 10.0, 1.0, 2.0, 0.5]
+
+    def test_fill_value_for_unknown_codes(self):
+        """Missing and out-of-table codes get fill_value."""
+        result = severity_weights(pd.Series([None, 50, 2600, "abc"]), fill_value=1.0)
+        assert result.tolist() == [1.0, 1.0, 1.0, 1.0]
+
+    def test_custom_weights(self):
+        """Custom weights replace the defaults entirely."""
+        result = severity_weights(pd.Series([100, 300]), weights={300: 7.0})
+        assert result.tolist() == [0.5, 7.0]
@@ -0,0 +1,133 @@
+"""Tests for the warm CLI daemon (analysis/cli/daemon.py)."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import socket
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from analysis.cli import daemon
+
+
+@pytest.fixture
+def socket_file() -> Iterator[Path]:
+    """Short socket path (Unix socket paths are limited to ~100 characters)."""
+    directory = Path(tempfile.mkdtemp(prefix="acli-", dir="/tmp"))
+    yield directory / "daemon.sock"
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+@pytest.fixture
+def running_daemon(socket_file: Path) -> Iterator[Path]:
+    """Daemon serving on ``socket_file`` in a background thread."""
+    thread = threading.Thread(
+        target=daemon.serve, kwargs={"path": socket_file, "preload": False}, daemon=True
+    )
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not socket_file.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    yield socket_file
+    daemon.stop(socket_file)
+    thread.join(timeout=10)
+
+
+class TestForward:
+    def test_no_daemon_runs_locally(self, socket_file: Path) -> None:
+        assert daemon.forward(["version"], path=socket_file) is None
+
+    def test_stale_socket_file_runs_locally(self, socket_file: Path) -> None:
+        socket_file.touch()
+        assert daemon.forward(["version"], path=socket_file) is None
+
+    def test_daemon_dying_mid_request_runs_locally(self, socket_file: Path) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+            server.bind(str(socket_file))
+            server.listen()
+
+            def truncated_reply() -> None:
+                conn, _ = server.accept()
+                with conn:
+                    conn.sendall(b'{"exit_code": 0, "std')
+
+            thread = threading.Thread(target=truncated_reply, daemon=True)
+            thread.start()
+            assert daemon.forward(["version"], path=socket_file) is None
+            thread.join(timeout=10)
+
+    def test_serve_is_never_forwarded(self, running_daemon: Path) -> None:
+        assert daemon.forward(["serve", "--stop"], path=running_daemon) is None
+
+    def test_opt_out_env_var(self, running_daemon: Path, monkeypatch) -> None:
+        monkeypatch.setenv(daemon.NO_DAEMON_ENV_VAR, "1")
+        assert daemon.forward(["version"], path=running_daemon) is None
+
+    def test_forwards_command_output(self, running_daemon: Path, capsys) -> None:
+        exit_code = daemon.forward(["version"], path=running_daemon)
+
+        assert exit_code == 0
+        assert "CLI Version" in capsys.readouterr().out
+
+    def test_forwards_usage_errors(self, running_daemon: Path, capsys) -> None:
+        exit_code = daemon.forward(["chief", "trends", "--bogus"], path=running_daemon)
+
+        assert exit_code == 2
+        assert "No such option" in capsys.readouterr().err
+
+
+class TestServe:
+    def test_stop_removes_socket(self, socket_file: Path, running_daemon: Path) -> None:
+        assert daemon.stop(running_daemon)
+        deadline = time.monotonic() + 10
+        while socket_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert not socket_file.exists()
+        assert not daemon.stop(running_daemon)
+
+    def test_second_daemon_refuses_to_start(self, running_daemon: Path) -> None:
+        with pytest.raises(RuntimeError, match="already listening"):
+            daemon.serve(running_daemon, preload=False)
+
+    @pytest.mark.parametrize(
+        ("payload", "exit_code"),
+        [
+            (b'{"argv": ["vers', 2),
+            (b'{"cwd": "/"}', 2),
+            (b'["version"]', 2),
+            (b'{"argv": ["version"], "cwd": "/nonexistent/acli"}', 1),
+        ],
+        ids=["truncated", "missing-argv", "not-an-object", "missing-cwd"],
+    )
+    def test_bad_request_gets_error_and_daemon_keeps_serving(
+        self, running_daemon: Path, payload: bytes, exit_code: int, capsys
+    ) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(running_daemon))
+            sock.sendall(payload)
+            sock.shutdown(socket.SHUT_WR)
+            reply = json.loads(daemon._read_all(sock))
+
+        assert reply["exit_code"] == exit_code
+        assert reply["stderr"]
+        assert daemon.forward(["version"], path=running_daemon) == 0
+        assert "CLI Version" in capsys.readouterr().out
+
+    def test_client_gone_before_reply_keeps_serving(self, running_daemon: Path, capsys) -> None:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(running_daemon))
+            sock.sendall(json.dumps({"argv": ["version"], "cwd": "/"}).encode())
+            sock.shutdown(socket.SHUT_WR)
+
+        assert daemon.forward(["version"], path=running_daemon) == 0
+        assert "CLI Version" in capsys.readouterr().out
+
+    def test_socket_path_env_override(self, monkeypatch, tmp_path: Path) -> None:
+        monkeypatch.setenv(daemon.SOCKET_ENV_VAR, str(tmp_path / "custom.sock"))
+        assert daemon.socket_path() == tmp_path / "custom.sock"
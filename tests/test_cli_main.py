@@ -11,11 +11,13 @@ Test classes:
     TestVersionCommand: Tests for the 'version' command
     TestInfoCommand: Tests for the 'info' command
     TestRichFormatting: Tests for Rich output formatting
+    TestRunAllCommand: Tests for the 'run-all' batch command
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 from typer.testing import CliRunner
 
@@ -131,8 +133,9 @@ class TestRichFormatting:
         assert len(lines) >= 3, "Table output should have multiple lines"
 
         # Check for version numbers in the output
-        assert any("v" in line or "Version" in line for line in lines), \
+        assert any("v" in line or "Version" in line for line in lines), (
             "Table should contain version information"
+        )
 
     def test_info_uses_rich_panel(self) -> None:
         """Test info command uses Rich panel formatting."""
@@ -166,3 +169,104 @@ class TestRichFormatting:
         assert "Error" not in info_result.stdout
         assert "Exception" not in info_result.stdout
         assert "Traceback" not in info_result.stdout
+
+
+class TestRunAllCommand:
+    """Tests for the 'run-all' batch command."""
+
+    def test_selects_groups_and_commands(self) -> None:
+        """--only accepts group names and group.command names; --skip removes."""
+        calls: list[tuple[list[str], list[str]]] = []
+
+        def fake_batch(commands: list[str], args: list[str]) -> list:
+            calls.append((commands, args))
+            return [(name, True, 0.0, "") for name in commands]
+
+        with patch("analysis.cli.main._run_batch", side_effect=fake_batch):
+            result = runner.invoke(
+                app,
+                [
+                    "run-all",
+                    "--only",
+                    "chief",
+                    "--only",
+                    "patrol.hotspots",
+                    "--skip",
+                    "chief.covid",
+                ],
+            )
+
+        assert result.exit_code == 0, f"Command failed: {result.output}"
+        commands, args = calls[0]
+        assert commands == ["chief.trends", "chief.seasonality", "patrol.hotspots"]
+        assert args == ["--version", "v1.0", "--output-format", "png"]
+
+    def test_unknown_command_exits_with_usage_error(self) -> None:
+        """Unknown selections are rejected before anything runs."""
+        result = runner.invoke(app, ["run-all", "--only", "chief.nope"])
+
+        assert result.exit_code == 2
+        assert "Unknown command" in result.stdout
+
+    def test_failures_are_reported_and_set_exit_code(self) -> None:
+        """A failing command is listed and the batch exits with code 1."""
+        results = [
+            ("chief.trends", True, 0.1, ""),
+            ("chief.covid", False, 0.1, "FileNotFoundError: missing"),
+        ]
+        with patch("analysis.cli.main._run_batch", return_value=results):
+            result = runner.invoke(
+                app, ["run-all", "--only", "chief.trends", "--only", "chief.covid"]
+            )
+
+        assert result.exit_code == 1
+        assert "failed" in result.stdout
+        assert "1 of 2 analyses failed" in result.stdout
+
+    def test_parallel_batch_keeps_figure_failures(self) -> None:
+        """A failed figure render in any worker is listed and fails the batch."""
+
+        def fake_batch(commands: list[str], args: list[str]) -> list:
+            results = [(name, True, 0.0, "") for name in commands]
+            if "chief.covid" in commands:
+                results.append(("figures", False, 0.0, "KeyError: 'count'"))
+            return results
+
+        def fake_parallel(n_jobs: int):
+            return lambda tasks: [fn(*fn_args, **kwargs) for fn, fn_args, kwargs in tasks]
+
+        with (
+            patch("analysis.cli.main._run_batch", side_effect=fake_batch),
+            patch("joblib.Parallel", side_effect=fake_parallel),
+        ):
+            result = runner.invoke(
+                app, ["run-all", "--only", "chief", "--jobs", "2"], terminal_width=200
+            )
+
+        assert result.exit_code == 1
+        assert "figures (worker" in result.stdout
+        assert "1 of 4 analyses failed" in result.stdout
+
+    def test_run_batch_loads_data_once(self, sample_crime_df) -> None:
+        """Commands in one batch share a single load of the crime data."""
+        from analysis.cli.main import _run_batch
+        from analysis.data import load_crime_data
+
+        def command_stub(args: list[str], standalone_mode: bool) -> int:
+            df = load_crime_data()
+            df["scratch"] = 1  # column additions stay private to this caller
+            assert "scratch" not in load_crime_data().columns
+            return 0
+
+        with (
+            patch(
+                "analysis.data.loading._load_crime_data_parquet", return_value=sample_crime_df
+            ) as loader,
+            patch("typer.main.get_command") as get_command,
+        ):
+            get_command.return_value.main.side_effect = command_stub
+            results = _run_batch(["chief.trends", "policy.events"], ["--fast"])
+
+        assert [ok for _, ok, _, _ in results] == [True, True]
+        assert loader.call_count == 1
+        assert "scratch" not in sample_crime_df.columns
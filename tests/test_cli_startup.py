@@ -0,0 +1,64 @@
+"""Startup-time checks for the CLI entry point.
+
+``python -m analysis.cli --help`` and ``version`` should not import the
+scientific stack; command groups load their dependencies only when one of
+their commands runs. The wall-clock time of ``--help`` is gated by
+``scripts/benchmark_hot_paths.py`` (``cli_help_startup``) rather than here,
+where parallel test workers make timings unreliable.
+
+Usage:
+    pytest tests/test_cli_startup.py -v
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("pandas", "numpy", "matplotlib", "geopandas", "sklearn", "pydantic")
+
+_PROBE = """
+import json, sys
+sys.argv = ["analysis.cli", *sys.argv[1:]]
+from analysis.cli.main import app
+try:
+    app()
+except SystemExit:
+    pass
+print(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _run(*args: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "CRIME_ANALYSIS_NO_DAEMON": "1"}
+    return subprocess.run(
+        [sys.executable, *args], cwd=REPO_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+
+
+def _imported_modules(*argv: str) -> set[str]:
+    """Modules loaded after running the CLI with ``argv`` in a fresh interpreter."""
+    return set(json.loads(_run("-c", _PROBE, *argv).stdout.strip().splitlines()[-1]))
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["version"]])
+def test_heavy_modules_not_imported(argv: list[str]) -> None:
+    """Help and version output load none of the scientific stack."""
+    roots = {name.split(".")[0] for name in _imported_modules(*argv)}
+    assert roots.isdisjoint(HEAVY_MODULES), sorted(roots & set(HEAVY_MODULES))
+
+
+def test_group_help_imports_only_that_group() -> None:
+    """Listing one group's commands doesn't import the other groups."""
+    imported = _imported_modules("chief", "--help")
+    assert "analysis.cli.chief" in imported
+    assert imported.isdisjoint(
+        {"analysis.cli.patrol", "analysis.cli.policy", "analysis.cli.forecasting"}
+    )
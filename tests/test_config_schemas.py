@@ -299,6 +299,7 @@ class TestVehicleCrimesConfig:
         assert config.start_date == "2019-01-01"
         assert config.end_date == "2023-12-31"
         assert config.report_name == "vehicle_crimes_report"
+        assert config.corridor_buffer_m == 500.0
 
     def test_vehicle_crimes_config_validation_ucr_codes(self) -> None:
         """Verify ucr_codes accepts list of ints."""
@@ -310,6 +311,11 @@ class TestVehicleCrimesConfig:
         config = VehicleCrimesConfig(ucr_codes=[700, 800, 900])
         assert len(config.ucr_codes) == 3
 
+    def test_vehicle_crimes_config_validation_corridor_buffer(self) -> None:
+        """Verify corridor_buffer_m must be positive."""
+        with pytest.raises(ValidationError):
+            VehicleCrimesConfig(corridor_buffer_m=0)
+
 
 class TestCompositionConfig:
     """Tests for CompositionConfig (policy.py)."""
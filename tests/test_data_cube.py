@@ -0,0 +1,112 @@
+"""Unit tests for data/cube.py pre-aggregated count cubes."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.data.cube import build_count_cube
+from analysis.data.preprocessing import aggregate_by_period, filter_by_date_range
+from analysis.utils.classification import classify_crime_category
+
+
+@pytest.fixture
+def incidents() -> pd.DataFrame:
+    """Incidents spread over ~2.5 years with times, bands and districts."""
+    rng = np.random.default_rng(7)
+    n = 2000
+    return pd.DataFrame(
+        {
+            "objectid": np.arange(n),
+            "dispatch_date": pd.Timestamp("2019-01-01")
+            + pd.to_timedelta(rng.integers(0, 900, n), unit="D"),
+            "dispatch_time": [f"{h:02d}:15:00" for h in rng.integers(0, 24, n)],
+            "ucr_general": rng.choice([100, 300, 600, 700, 1400, 2600], n),
+            "dc_dist": rng.choice([3, 12, 22], n),
+        }
+    )
+
+
+class TestBuildCountCube:
+    def test_shapes_and_totals(self, incidents) -> None:
+        cube = build_count_cube(incidents)
+        n_days = (incidents["dispatch_date"].max() - incidents["dispatch_date"].min()).days + 1
+        assert cube.daily.shape == (n_days, 27, 3)
+        assert cube.hourly.shape == (n_days, 24, 27)
+        assert cube.districts == (3, 12, 22)
+        assert cube.daily.dtype == np.uint16
+        assert cube.total() == len(incidents)
+        assert int(cube.hourly.sum()) == len(incidents)
+
+    def test_missing_hour_is_left_out_of_hourly(self, incidents) -> None:
+        incidents.loc[:9, "dispatch_time"] = None
+        cube = build_count_cube(incidents)
+        assert cube.total() == len(incidents)
+        assert int(cube.hourly.sum()) == len(incidents) - 10
+
+    def test_invalid_codes_go_to_band_zero(self) -> None:
+        df = pd.DataFrame(
+            {
+                "dispatch_date": pd.to_datetime(["2020-01-01", "2020-01-01", "2020-01-02"]),
+                "ucr_general": [None, 50, 600],
+                "dc_dist": [1, 1, 2],
+            }
+        )
+        cube = build_count_cube(df)
+        assert cube.total(bands=[0]) == 2
+        assert cube.total(bands=[600]) == 1
+
+    def test_missing_column_raises(self, incidents) -> None:
+        with pytest.raises(ValueError, match="dc_dist"):
+            build_count_cube(incidents.drop(columns="dc_dist"))
+
+
+class TestCountCubeRollUps:
+    @pytest.mark.parametrize("freq", ["D", "W", "ME", "QE", "YE"])
+    def test_counts_match_aggregate_by_period(self, incidents, freq) -> None:
+        expected = aggregate_by_period(incidents, period=freq, count_col="objectid")
+        result = build_count_cube(incidents).counts(freq)
+        pd.testing.assert_frame_equal(
+            result, expected, check_dtype=False, check_index_type=False, check_freq=False
+        )
+
+    def test_total_matches_date_filter(self, incidents) -> None:
+        cube = build_count_cube(incidents)
+        expected = len(filter_by_date_range(incidents, "2020-03-01", "2020-06-30"))
+        assert cube.total(start="2020-03-01", end="2020-06-30") == expected
+        assert cube.total(start="2030-01-01") == 0
+
+    def test_counts_by_category_and_district(self, incidents) -> None:
+        result = build_count_cube(incidents).counts("YE", by=["crime_category", "dc_dist"])
+        categorized = classify_crime_category(incidents)
+        expected = categorized.groupby(
+            [categorized["dispatch_date"].dt.year, "crime_category", "dc_dist"], observed=True
+        ).size()
+        result = result[result["count"] > 0]
+        keys = [result["dispatch_date"].dt.year, "crime_category", "dc_dist"]
+        actual = result.set_index(keys)["count"]
+        assert actual.to_dict() == expected.to_dict()
+
+    def test_counts_filtered_by_band(self, incidents) -> None:
+        result = build_count_cube(incidents).counts("YS", by=["ucr_band"], bands=[600, 700])
+        assert set(result["ucr_band"]) == {600, 700}
+        assert result["count"].sum() == incidents["ucr_general"].isin([600, 700]).sum()
+        assert result["dispatch_date"].dt.is_year_start.all()
+
+    def test_hourly_counts_by_day_of_week(self, incidents) -> None:
+        result = build_count_cube(incidents).hourly_counts(by=["day_of_week"])
+        hours = incidents["dispatch_time"].str[:2].astype(int)
+        expected = incidents.groupby([hours, incidents["dispatch_date"].dt.dayofweek]).size()
+        actual = result.set_index(["hour", "day_of_week"])["count"]
+        assert actual[actual > 0].to_dict() == expected.to_dict()
+        assert len(result) == 24 * 7
+
+    def test_unsupported_arguments_raise(self, incidents) -> None:
+        cube = build_count_cube(incidents)
+        with pytest.raises(ValueError, match="freq"):
+            cube.counts("h")
+        with pytest.raises(ValueError, match="Unsupported breakdown"):
+            cube.counts(by=["hour"])
+        with pytest.raises(ValueError, match="not both"):
+            cube.hourly_counts(by=["ucr_band", "crime_category"])
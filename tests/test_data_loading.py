@@ -117,6 +117,50 @@ class TestLoadCrimeData:
         assert len(df2) >= len(df1)
 
 
+class TestKeepCrimeDataInMemory:
+    """Tests for the in-memory frame shared inside keep_crime_data_in_memory()."""
+
+    def test_reloads_when_data_file_changes(self, tmp_path, monkeypatch):
+        """A rewritten data file is reloaded on the next call, not served stale."""
+        import os
+
+        from analysis.data import keep_crime_data_in_memory, loading
+
+        path = tmp_path / "incidents.parquet"
+        pd.DataFrame({"dispatch_date": ["2020-01-01"] * 3}).to_parquet(path)
+        monkeypatch.setattr(loading, "CRIME_DATA_PATH", path)
+        loader = Mock(side_effect=_load_crime_data_parquet.func)
+        monkeypatch.setattr(loading, "_load_crime_data_parquet", loader)
+
+        with keep_crime_data_in_memory():
+            assert len(load_crime_data()) == 3
+            assert len(load_crime_data()) == 3
+            pd.DataFrame({"dispatch_date": ["2020-01-01"] * 5}).to_parquet(path)
+            os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+            assert len(load_crime_data()) == 5
+
+        assert loader.call_count == 2
+        assert loader.call_args.kwargs["_dataset_version"] == loading.crime_data_version()
+
+    def test_loaded_frames_are_marked_sorted(self, tmp_path, monkeypatch):
+        """Clean frames, held or not, carry the sorted mark filters rely on."""
+        from analysis.data import keep_crime_data_in_memory, loading
+        from analysis.data.preprocessing import SORTED_ATTR, _is_sorted
+
+        path = tmp_path / "incidents.parquet"
+        dates = ["2020-01-03", "2020-01-01", None, "2020-01-02"]
+        pd.DataFrame({"dispatch_date": dates}).to_parquet(path)
+        monkeypatch.setattr(loading, "CRIME_DATA_PATH", path)
+        monkeypatch.setattr(loading, "_load_crime_data_parquet", _load_crime_data_parquet.func)
+
+        assert SORTED_ATTR not in load_crime_data(clean=False).attrs
+        with keep_crime_data_in_memory():
+            for _ in range(2):
+                df = load_crime_data()
+                assert SORTED_ATTR in df.attrs
+                assert _is_sorted(df, "dispatch_date")
+
+
 class TestCacheDirectory:
     """Tests for cache directory management."""
 
@@ -8,6 +8,7 @@ This module tests the data preprocessing functionality including:
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -15,6 +16,7 @@ from analysis.data.preprocessing import (
     add_temporal_features,
     aggregate_by_period,
     filter_by_date_range,
+    mark_sorted,
 )
 
 
@@ -109,6 +111,58 @@ class TestFilterByDateRange:
         with pytest.raises((TypeError, ValueError)):
             filter_by_date_range(sample_df, "invalid-date", end="2020-12-31")
 
+    def test_unsorted_dates_match_sorted(self, sample_df):
+        """Unsorted input selects the same rows as sorted input."""
+        shuffled = sample_df.iloc[[3, 0, 4, 2, 1]]
+        result = filter_by_date_range(shuffled, "2020-01-01", "2021-01-01")
+        assert sorted(result["objectid"].tolist()) == [2, 3, 4]
+
+    def test_sorted_end_date_is_inclusive(self):
+        """Rows exactly on the end timestamp are kept, later ones are not."""
+        df = pd.DataFrame(
+            {
+                "dispatch_date": pd.to_datetime(
+                    ["2020-12-30 00:00", "2020-12-31 00:00", "2020-12-31 00:00", "2020-12-31 08:00"]
+                ),
+                "objectid": [1, 2, 3, 4],
+            }
+        )
+        result = filter_by_date_range(df, "2020-12-31", "2020-12-31")
+        assert result["objectid"].tolist() == [2, 3]
+
+    def test_sorted_start_after_end_is_empty(self, sample_df):
+        """A start date after the end date returns no rows."""
+        result = filter_by_date_range(sample_df, "2021-01-01", "2020-01-01")
+        assert len(result) == 0
+
+    def test_copy_false_returns_slice_of_sorted_frame(self, sample_df):
+        """copy=False on a sorted column shares data with the input."""
+        result = filter_by_date_range(sample_df, "2020-01-01", "2020-12-31", copy=False)
+        assert result["objectid"].tolist() == [2, 3]
+        assert np.shares_memory(result["objectid"].to_numpy(), sample_df["objectid"].to_numpy())
+
+    def test_marked_frame_skips_sortedness_scan(self, sample_df, monkeypatch):
+        """A frame marked sorted is binary-searched without checking the column."""
+        mark_sorted(sample_df)
+        shallow = sample_df.copy(deep=False)
+
+        def no_scan(self):
+            raise AssertionError("sortedness scanned")
+
+        monkeypatch.setattr(pd.Series, "is_monotonic_increasing", property(no_scan))
+        result = filter_by_date_range(shallow, "2020-01-01", "2020-12-31", copy=False)
+
+        assert result["objectid"].tolist() == [2, 3]
+
+    def test_mark_does_not_survive_resorting(self, sample_df):
+        """Re-sorting by another column keeps attrs but not the sorted mark."""
+        mark_sorted(sample_df)
+        resorted = sample_df.sort_values("ucr_general", ascending=False)
+
+        result = filter_by_date_range(resorted, "2020-01-01", "2021-01-01")
+
+        assert sorted(result["objectid"].tolist()) == [2, 3, 4]
+
 
 class TestAggregateByPeriod:
     """Tests for aggregate_by_period function."""
@@ -146,6 +200,12 @@ class TestAggregateByPeriod:
         # Verify we have non-zero counts for our actual data points
         assert result["count"].sum() == 6  # Total counts match input
 
+    def test_weighted_aggregation(self, sample_df):
+        """Weights are summed per period instead of counting rows."""
+        weighted = sample_df.assign(sample_weight=[1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+        result = aggregate_by_period(weighted, period="ME", weight_col="sample_weight")
+        assert result["count"].tolist() == [3.0, 3.0, 4.0, 5.0, 6.0]
+
     def test_weekly_aggregation(self, sample_df):
         """Aggregate by week (period='W').
 
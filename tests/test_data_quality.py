@@ -0,0 +1,79 @@
+"""Unit tests for data/quality.py data-quality profiles."""
+
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.data.quality import QUALITY_PROFILE_VERSION, build_quality_profile
+from analysis.utils.spatial import get_coordinate_stats
+
+
+@pytest.fixture
+def incidents() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "dispatch_date": pd.to_datetime(
+                ["2020-01-01", "2020-01-01", "2020-01-03", None, "2020-01-03"]
+            ),
+            "ucr_general": [600, 650, 300, np.nan, 1400],
+            "point_x": [-75.16, -75.20, np.nan, -80.0, -75.10],
+            "point_y": [39.95, 40.00, np.nan, 39.95, 39.90],
+        }
+    )
+
+
+class TestBuildQualityProfile:
+    def test_null_rates(self, incidents) -> None:
+        profile = build_quality_profile(incidents)
+
+        assert profile["version"] == QUALITY_PROFILE_VERSION
+        assert profile["total_records"] == 5
+        assert profile["null_rates"] == {
+            "dispatch_date": 0.2,
+            "ucr_general": 0.2,
+            "point_x": 0.2,
+            "point_y": 0.2,
+        }
+
+    def test_coordinates_match_get_coordinate_stats(self, incidents) -> None:
+        coordinates = build_quality_profile(incidents)["coordinates"]
+        expected = get_coordinate_stats(incidents)
+
+        assert coordinates.keys() == expected.keys()
+        for key, value in expected.items():
+            assert coordinates[key] == pytest.approx(value)
+
+    def test_ucr_bands_and_daily_counts(self, incidents) -> None:
+        profile = build_quality_profile(incidents)
+
+        assert profile["ucr_bands"] == {"300": 1, "600": 2, "1400": 1, "missing": 1}
+        assert profile["daily_counts"] == {"2020-01-01": 2, "2020-01-03": 2}
+        assert (profile["date_start"], profile["date_end"]) == ("2020-01-01", "2020-01-03")
+
+    def test_source_records_report_dropped_dates(self, incidents) -> None:
+        profile = build_quality_profile(
+            incidents.dropna(subset=["dispatch_date"]), source_records=5
+        )
+
+        assert profile["source_records"] == 5
+        assert profile["missing_date_records"] == 1
+        assert profile["missing_date_rate"] == 0.2
+        assert "source_records" not in build_quality_profile(incidents)
+
+    def test_string_dates_are_parsed(self, incidents) -> None:
+        as_text = incidents.assign(
+            dispatch_date=incidents["dispatch_date"].dt.strftime("%Y-%m-%d").astype("category")
+        )
+        assert build_quality_profile(as_text)["daily_counts"] == {"2020-01-01": 2, "2020-01-03": 2}
+
+    def test_json_serializable_when_columns_missing(self) -> None:
+        profile = build_quality_profile(pd.DataFrame({"objectid": [1, 2]}))
+
+        assert profile["coordinates"]["has_coordinates"] == 0
+        assert profile["ucr_bands"] == {}
+        assert profile["daily_counts"] == {}
+        json.dumps(profile)
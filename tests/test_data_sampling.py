@@ -0,0 +1,110 @@
+"""Unit tests for data/sampling.py stratified fast-mode sampling."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.data.cube import build_count_cube
+from analysis.data.sampling import SAMPLE_WEIGHT_COL, build_sample_index, incident_weights
+
+
+@pytest.fixture
+def incidents() -> pd.DataFrame:
+    """Mostly thefts, plus a handful of homicides in one district."""
+    rng = np.random.default_rng(3)
+    n = 5000
+    df = pd.DataFrame(
+        {
+            "dispatch_date": pd.Timestamp("2020-01-01")
+            + pd.to_timedelta(rng.integers(0, 730, n), unit="D"),
+            "ucr_general": rng.choice([600, 700], n),
+            "dc_dist": rng.choice([1, 2, 3], n),
+        }
+    )
+    df.loc[:3, ["ucr_general", "dc_dist"]] = [100, 9]
+    return df.sort_values("dispatch_date", ignore_index=True)
+
+
+class TestBuildSampleIndex:
+    def test_sample_size_and_weights_sum_to_population(self, incidents) -> None:
+        index = build_sample_index(incidents, frac=0.1)
+
+        assert 0.1 * len(incidents) <= len(index) <= 0.12 * len(incidents)
+        assert index["row"].is_monotonic_increasing
+        assert index[SAMPLE_WEIGHT_COL].sum() == pytest.approx(len(incidents))
+
+    def test_weights_reproduce_stratum_counts(self, incidents) -> None:
+        index = build_sample_index(incidents, frac=0.1)
+        sample = incidents.iloc[index["row"]].assign(weight=index[SAMPLE_WEIGHT_COL].to_numpy())
+        keys = [sample["dispatch_date"].dt.year, "ucr_general", "dc_dist"]
+        estimated = sample.groupby(keys)["weight"].sum()
+        actual = incidents.groupby(
+            [incidents["dispatch_date"].dt.year, "ucr_general", "dc_dist"]
+        ).size()
+        pd.testing.assert_series_equal(estimated, actual.astype(float), check_names=False)
+
+    def test_rare_strata_are_kept(self, incidents) -> None:
+        index = build_sample_index(incidents, frac=0.1)
+        sampled = incidents.iloc[index["row"]]
+        homicides = sampled[sampled["ucr_general"] == 100]
+
+        # Four homicides is below min_per_stratum, so all are kept with weight 1
+        assert len(homicides) == 4
+        assert (index.loc[index["row"].isin(homicides.index), SAMPLE_WEIGHT_COL] == 1.0).all()
+
+    def test_reproducible_for_seed(self, incidents) -> None:
+        first = build_sample_index(incidents, frac=0.1, random_state=1)
+        second = build_sample_index(incidents, frac=0.1, random_state=1)
+        other = build_sample_index(incidents, frac=0.1, random_state=2)
+
+        pd.testing.assert_frame_equal(first, second)
+        assert not first["row"].equals(other["row"])
+
+    def test_full_fraction_keeps_everything(self, incidents) -> None:
+        index = build_sample_index(incidents, frac=1.0)
+        assert index["row"].tolist() == list(range(len(incidents)))
+        assert (index[SAMPLE_WEIGHT_COL] == 1.0).all()
+
+    @pytest.mark.parametrize("frac", [0, -0.1, 1.5])
+    def test_invalid_fraction_raises(self, incidents, frac) -> None:
+        with pytest.raises(ValueError, match="frac"):
+            build_sample_index(incidents, frac=frac)
+
+    def test_missing_column_raises(self, incidents) -> None:
+        with pytest.raises(ValueError, match="dc_dist"):
+            build_sample_index(incidents.drop(columns="dc_dist"), frac=0.1)
+
+
+class TestIncidentWeights:
+    def test_sample_weights_or_ones(self, incidents) -> None:
+        index = build_sample_index(incidents, frac=0.1)
+        sample = incidents.iloc[index["row"]].reset_index(drop=True)
+        sample[SAMPLE_WEIGHT_COL] = index[SAMPLE_WEIGHT_COL].to_numpy()
+
+        assert incident_weights(incidents).sum() == len(incidents)
+        assert incident_weights(sample).sum() == pytest.approx(len(incidents))
+
+    def test_weighted_shares_undo_oversampling(self, incidents) -> None:
+        """Homicides are oversampled (min_per_stratum) but weighted shares match the data."""
+        index = build_sample_index(incidents, frac=0.1)
+        sample = incidents.iloc[index["row"]].reset_index(drop=True)
+        sample[SAMPLE_WEIGHT_COL] = index[SAMPLE_WEIGHT_COL].to_numpy()
+        is_homicide = sample["ucr_general"] == 100
+
+        assert is_homicide.mean() > 4 / len(incidents) * 5
+        weighted_share = incident_weights(sample)[is_homicide].sum() / len(incidents)
+        assert weighted_share == pytest.approx(4 / len(incidents))
+
+
+class TestWeightedCube:
+    def test_weighted_cube_estimates_full_counts(self, incidents) -> None:
+        index = build_sample_index(incidents, frac=0.1)
+        sample = incidents.iloc[index["row"]].reset_index(drop=True)
+        sample[SAMPLE_WEIGHT_COL] = index[SAMPLE_WEIGHT_COL].to_numpy()
+
+        cube = build_count_cube(sample, weight_col=SAMPLE_WEIGHT_COL)
+
+        assert cube.total() == pytest.approx(len(incidents), rel=0.02)
+        assert cube.total(bands=[100]) == 4
@@ -3,6 +3,7 @@
 This module tests the data validation functionality including:
 - CrimeIncidentValidator with valid/invalid data
 - validate_crime_data() with sampling and strict mode
+- check_crime_data() vectorized rules and parity with the Pydantic model
 - validate_coordinates() for Philadelphia bounds filtering
 - Coordinate bounds constants
 """
@@ -11,6 +12,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
 import pytest
 from pydantic import ValidationError
@@ -21,6 +23,7 @@ from analysis.data.validation import (
     PHILLY_LON_MAX,
     PHILLY_LON_MIN,
     CrimeIncidentValidator,
+    check_crime_data,
     validate_coordinates,
     validate_crime_data,
 )
@@ -369,3 +372,86 @@ class TestValidateCrimeData:
         )
         result = validate_crime_data(df, strict=True)
         assert len(result) == 100
+
+
+class TestCheckCrimeData:
+    """Tests for the vectorized check_crime_data function."""
+
+    @pytest.fixture
+    def mixed_df(self):
+        """Rows 1-5 each break one rule; rows 0 and 6 are valid."""
+        return pd.DataFrame(
+            {
+                "dispatch_date": pd.to_datetime(
+                    [
+                        "2020-01-01",
+                        None,
+                        "2020-01-03",
+                        "2020-01-04",
+                        "2020-01-05",
+                        "2020-01-06",
+                        "2020-01-07",
+                    ]
+                ),
+                "ucr_general": [600, 600, 50, 600.5, 600, 600, np.nan],
+                "point_x": [-75.16, -75.16, -75.16, -75.16, -100.0, -75.16, np.nan],
+                "point_y": [39.95, 39.95, 39.95, 39.95, 39.95, 50.0, np.nan],
+                "psa": pd.Categorical(["A", "B", "C", "D", "E", "1", None]),
+            },
+            index=[10, 11, 12, 13, 14, 15, 16],
+        )
+
+    def test_counts_and_sample_rows_per_rule(self, mixed_df):
+        """Each violated rule reports its count and example index labels."""
+        report = check_crime_data(mixed_df)
+
+        assert not report.ok
+        assert report.n_rows == 7
+        assert report.n_invalid_rows == 5
+        by_rule = {v.rule: (v.count, v.sample_rows) for v in report.violations}
+        assert by_rule == {
+            "dispatch_date_missing": (1, [11]),
+            "ucr_general_range": (2, [12, 13]),
+            "point_x_bounds": (1, [14]),
+            "point_y_bounds": (1, [15]),
+        }
+
+    def test_valid_frame_passes(self, mixed_df):
+        """Rows that satisfy every rule produce an empty report."""
+        report = check_crime_data(mixed_df.loc[[10, 16]])
+        assert report.ok
+        assert report.to_dict() == {"n_rows": 2, "n_invalid_rows": 0, "violations": []}
+
+    def test_missing_dispatch_date_column(self):
+        """A frame without dispatch_date fails that rule on every row."""
+        report = check_crime_data(pd.DataFrame({"ucr_general": [600, 700]}))
+        assert [(v.rule, v.count) for v in report.violations] == [("dispatch_date_missing", 2)]
+
+    def test_sample_rows_are_capped(self):
+        """At most max_samples example rows are kept per rule."""
+        df = pd.DataFrame(
+            {"dispatch_date": pd.date_range("2020-01-01", periods=50), "ucr_general": [1] * 50}
+        )
+        violation = check_crime_data(df, max_samples=3).violations[0]
+        assert violation.count == 50
+        assert violation.sample_rows == [0, 1, 2]
+
+    def test_matches_pydantic_validator(self, mixed_df):
+        """Rows flagged by the masks are exactly those the Pydantic model rejects."""
+        df = mixed_df.assign(
+            dc_key=[1, 2.5, 3, 4, 5, 6, None],
+            text_general_code=["Theft", "Theft", 7, "Theft", "Theft", "Theft", None],
+        )
+        report = check_crime_data(df, max_samples=len(df))
+        flagged = {row for v in report.violations for row in v.sample_rows}
+
+        rejected = set()
+        records = df.astype(object).where(df.notna(), None).to_dict(orient="index")
+        for label, record in records.items():
+            try:
+                CrimeIncidentValidator(**record)
+            except ValidationError:
+                rejected.add(label)
+
+        assert flagged == rejected
+        assert report.n_invalid_rows == len(rejected)
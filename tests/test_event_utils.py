@@ -0,0 +1,266 @@
+"""Tests for event-day tagging and matched control days."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.data.cube import build_count_cube
+from analysis.event_utils import (
+    calculate_event_impact,
+    calculate_event_impact_by_type,
+    daily_category_counts,
+    event_impact_intervals,
+    generate_matched_controls,
+    get_control_days,
+    get_event_windows,
+    identify_event_days,
+    in_event_windows,
+    load_event_data,
+    to_day_numbers,
+)
+
+
+@pytest.fixture
+def crime_df() -> pd.DataFrame:
+    """One incident per day through January-February 2023, with times of day."""
+    dates = pd.date_range("2023-01-01", "2023-02-28", freq="D") + pd.Timedelta(hours=13)
+    return pd.DataFrame({"dispatch_date": dates})
+
+
+@pytest.fixture
+def event_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "date": pd.to_datetime(["2023-01-15", "2023-01-22", "2023-02-10"]),
+            "event_type": ["sports", "sports", "holiday"],
+            "event_name": ["Game 1", "Game 2", "Holiday"],
+        }
+    )
+
+
+class TestInEventWindows:
+    """Tests for in_event_windows function."""
+
+    def test_buffer_covers_days_either_side(self):
+        """Days within buffer_days of an event are tagged, others are not."""
+        days = np.arange(0, 20)
+        result = in_event_windows(days, np.array([5, 15]), buffer_days=2)
+        assert np.flatnonzero(result).tolist() == [3, 4, 5, 6, 7, 13, 14, 15, 16, 17]
+
+    def test_overlapping_windows(self):
+        """Overlapping windows tag their union."""
+        days = np.arange(0, 10)
+        result = in_event_windows(days, np.array([4, 3, 4]), buffer_days=1)
+        assert np.flatnonzero(result).tolist() == [2, 3, 4, 5]
+
+    def test_missing_dates_are_not_event_days(self):
+        """NaT dates are never tagged and do not widen the calendar."""
+        days = to_day_numbers(pd.to_datetime(["2023-01-15", None, "2023-03-01"]))
+        event_days = to_day_numbers(pd.to_datetime(["2023-01-15"]))
+        assert in_event_windows(days, event_days).tolist() == [True, False, False]
+
+    def test_no_events(self):
+        """Empty event calendar tags nothing."""
+        assert not in_event_windows(np.arange(5), np.array([], dtype=np.int64)).any()
+
+
+class TestIdentifyEventDays:
+    """Tests for identify_event_days function."""
+
+    def test_tags_event_and_type_columns(self, crime_df, event_df):
+        """Adds overall and per-type indicators, ignoring time of day."""
+        result = identify_event_days(crime_df, event_df)
+        tagged = result.loc[result["is_event_day"], "dispatch_date"].dt.strftime("%m-%d")
+        assert tagged.tolist() == ["01-15", "01-22", "02-10"]
+        assert result["is_sports_day"].sum() == 2
+        assert result["is_holiday_day"].sum() == 1
+
+    def test_buffer_days(self, crime_df, event_df):
+        """Each event covers 2 * buffer_days + 1 days."""
+        result = identify_event_days(crime_df, event_df, buffer_days=1)
+        assert result["is_event_day"].sum() == 9
+        assert result["is_sports_day"].sum() == 6
+
+
+class TestMatchedControls:
+    """Tests for get_control_days and generate_matched_controls."""
+
+    def test_same_weekday_nearest_weeks_first(self, crime_df):
+        """Controls alternate before/after, nearest weeks first."""
+        all_dates = pd.DatetimeIndex(crime_df["dispatch_date"].dt.normalize())
+        controls = get_control_days(pd.Timestamp("2023-01-29"), all_dates, set(), n_controls=3)
+        assert controls == [
+            pd.Timestamp("2023-01-22"),
+            pd.Timestamp("2023-02-05"),
+            pd.Timestamp("2023-01-15"),
+        ]
+
+    def test_skips_event_days_and_missing_dates(self, crime_df, event_df):
+        """Other event days and days outside the data are never controls."""
+        controls = generate_matched_controls(event_df, crime_df, n_controls=4)
+        first = controls[controls["matched_event_date"] == pd.Timestamp("2023-01-15")]
+
+        assert first["control_date"].dt.strftime("%m-%d").tolist() == [
+            "01-08",
+            "01-01",
+            "01-29",
+            "02-05",
+        ]
+        assert not controls["control_date"].isin(event_df["date"]).any()
+        assert set(controls["event_name"]) == {"Game 1", "Game 2", "Holiday"}
+
+    def test_missing_event_columns_default_to_unknown(self, crime_df):
+        """Events without type/name columns are labelled 'unknown'."""
+        events = pd.DataFrame({"date": pd.to_datetime(["2023-02-01"])})
+        controls = generate_matched_controls(events, crime_df, n_controls=2)
+        assert len(controls) == 2
+        assert set(controls["event_type"]) == {"unknown"}
+        assert set(controls["event_name"]) == {"unknown"}
+
+
+@pytest.fixture
+def incidents() -> pd.DataFrame:
+    """Incidents over January-February 2023 with a spike on each event day."""
+    rng = np.random.default_rng(0)
+    days = pd.date_range("2023-01-01", "2023-02-28", freq="D")
+    spike = days.isin(pd.to_datetime(["2023-01-15", "2023-01-22"]))
+    per_day = np.where(spike, 40, 10) + rng.integers(0, 3, len(days))
+    dates = np.repeat(days, per_day)
+    return pd.DataFrame(
+        {
+            "dispatch_date": dates,
+            "dispatch_time": "12:00:00",
+            "ucr_general": rng.choice([100, 300, 600, 1400], len(dates)),
+            "dc_dist": rng.integers(1, 4, len(dates)),
+        }
+    )
+
+
+class TestEventCalendar:
+    """Tests for load_event_data and get_event_windows."""
+
+    def test_loads_parquet(self, event_df, tmp_path):
+        """Reads an explicit calendar file with normalized dates."""
+        path = tmp_path / "calendar.parquet"
+        event_df.assign(date=event_df["date"] + pd.Timedelta(hours=19)).to_parquet(path)
+
+        result = load_event_data(path)
+
+        assert (result["date"] == event_df["date"]).all()
+
+    def test_missing_explicit_file_raises(self, tmp_path):
+        """An explicit path that does not exist raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_event_data(tmp_path / "missing.parquet")
+
+    def test_windows(self, event_df):
+        """Windows span days_before to days_after around each event."""
+        windows = get_event_windows(event_df, days_before=3, days_after=1)
+
+        first = windows.iloc[0]
+        assert first["window_start"] == pd.Timestamp("2023-01-12")
+        assert first["window_end"] == pd.Timestamp("2023-01-16")
+        assert len(windows) == len(event_df)
+
+
+class TestDailyCategoryCounts:
+    """Tests for daily_category_counts function."""
+
+    def test_counts_every_day_by_category(self, incidents):
+        """One row per day, category columns sum to the 'All' column."""
+        daily = daily_category_counts(incidents)
+
+        assert len(daily) == 59
+        assert daily["All"].sum() == len(incidents)
+        assert (daily[["Other", "Property", "Violent"]].sum(axis=1) == daily["All"]).all()
+        assert daily.loc["2023-01-15", "All"] >= 40
+
+    def test_days_without_incidents_are_zero(self):
+        """Gaps between the first and last incident are counted as zero."""
+        df = pd.DataFrame(
+            {"dispatch_date": pd.to_datetime(["2023-01-01", "2023-01-04"]), "ucr_general": 600}
+        )
+        daily = daily_category_counts(df)
+
+        assert daily["Property"].tolist() == [1, 0, 0, 1]
+
+    def test_count_cube_matches_incidents(self, incidents):
+        """A CountCube gives the same daily counts as the raw incidents."""
+        pd.testing.assert_frame_equal(
+            daily_category_counts(build_count_cube(incidents)),
+            daily_category_counts(incidents),
+            check_freq=False,
+        )
+
+
+class TestCalculateEventImpact:
+    """Tests for calculate_event_impact and calculate_event_impact_by_type."""
+
+    def test_detects_event_day_spike(self, incidents, event_df):
+        """Event days with four times the incidents are significant."""
+        sports = event_df[event_df["event_type"] == "sports"]
+        impact = calculate_event_impact(incidents, sports)
+
+        assert 40 <= impact["event_mean"] <= 42
+        assert 10 <= impact["control_mean"] <= 12
+        assert impact["pct_change"] > 200
+        assert impact["n_event_days"] == 2
+        assert impact["significant"]
+
+    def test_daily_counts_match_raw_incidents(self, incidents, event_df):
+        """Precomputed daily counts give the same result as raw incidents."""
+        daily = daily_category_counts(incidents)
+
+        from_raw = calculate_event_impact_by_type(incidents, event_df, crime_category="Violent")
+        from_daily = calculate_event_impact_by_type(
+            None, event_df, crime_category="Violent", daily_counts=daily
+        )
+
+        pd.testing.assert_frame_equal(from_raw, from_daily)
+        assert from_daily["event_type"].tolist() == ["sports", "holiday"]
+
+    def test_window_around_events(self, incidents, event_df):
+        """days_before/days_after widen each event to a window of event days."""
+        sports = event_df[event_df["event_type"] == "sports"]
+        impact = calculate_event_impact(incidents, sports, days_before=2, days_after=1)
+
+        # Jan 13-16 and Jan 20-23
+        assert impact["n_event_days"] == 8
+        assert impact["n_control_days"] == 59 - 8
+        assert impact["event_mean"] < 40
+
+        by_type = calculate_event_impact_by_type(incidents, event_df, days_before=2, days_after=1)
+        assert by_type["n_event_days"].tolist() == [8, 4]
+
+    def test_no_event_days_in_data(self, incidents):
+        """Events outside the data give no means and are not significant."""
+        events = pd.DataFrame({"date": pd.to_datetime(["2024-07-04"])})
+        impact = calculate_event_impact(incidents, events)
+
+        assert impact["n_event_days"] == 0
+        assert impact["event_mean"] is None
+        assert impact["p_value"] is None
+        assert not impact["significant"]
+
+
+class TestEventImpactIntervals:
+    """Tests for event_impact_intervals function."""
+
+    def test_interval_per_event_type_and_column(self, incidents, event_df):
+        """One row per event type and column; the spike's interval excludes zero."""
+        daily = daily_category_counts(incidents)
+        result = event_impact_intervals(daily, event_df, columns=["All", "Violent"])
+
+        assert len(result) == 4
+        sports = result[(result["event_type"] == "sports") & (result["crime_category"] == "All")]
+        assert sports["ci_lower"].item() > 20
+        assert (result["ci_lower"] <= result["ci_upper"]).all()
+
+    def test_event_types_without_event_days_are_skipped(self, incidents):
+        """Event types outside the data have no interval row."""
+        events = pd.DataFrame(
+            {"date": pd.to_datetime(["2023-01-15", "2024-07-04"]), "event_type": ["a", "b"]}
+        )
+        result = event_impact_intervals(daily_category_counts(incidents), events)
+
+        assert set(result["event_type"]) == {"a"}
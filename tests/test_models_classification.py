@@ -18,11 +18,14 @@ import pytest
 from sklearn.ensemble import RandomForestClassifier
 
 from analysis.models.classification import (
+    aggregate_training_rows,
     create_time_aware_split,
     extract_feature_importance,
     get_time_series_cv,
     handle_class_imbalance,
     train_random_forest,
+    train_weighted_forest,
+    weighted_accuracy,
 )
 
 
@@ -271,6 +274,114 @@ class TestTrainRandomForest:
         )
 
 
+@pytest.fixture
+def temporal_features() -> tuple[pd.DataFrame, pd.Series]:
+    """Incident-level temporal features with a night-time violence signal."""
+    rng = np.random.default_rng(0)
+    n = 20_000
+    X = pd.DataFrame(
+        {
+            "year": rng.integers(2020, 2023, n).astype("int16"),
+            "month": rng.integers(1, 13, n).astype("int8"),
+            "day_of_week": rng.integers(0, 7, n).astype("int8"),
+            "hour": rng.integers(0, 24, n).astype("int8"),
+        }
+    )
+    p = 0.1 + 0.4 * (X["hour"] < 5) + 0.1 * (X["day_of_week"] >= 5)
+    y = pd.Series((rng.random(n) < p).astype(int), name="is_violent")
+    return X, y
+
+
+class TestAggregateTrainingRows:
+    """Tests for aggregate_training_rows function."""
+
+    def test_counts_sum_to_row_count(self, temporal_features):
+        """Verify weights account for every input row."""
+        X, y = temporal_features
+
+        X_unique, y_unique, weights = aggregate_training_rows(X, y)
+
+        assert weights.sum() == len(X)
+        assert len(X_unique) == len(y_unique) == len(weights)
+        assert len(X_unique) < len(X)
+
+    def test_rows_are_unique_and_dtypes_kept(self, temporal_features):
+        """Verify one row per (features, label) with original dtypes."""
+        X, y = temporal_features
+
+        X_unique, y_unique, _ = aggregate_training_rows(X, y)
+
+        assert not X_unique.assign(target=y_unique.to_numpy()).duplicated().any()
+        assert X_unique.dtypes.to_dict() == X.dtypes.to_dict()
+        assert y_unique.name == "is_violent"
+
+    def test_weights_match_group_counts(self):
+        """Verify duplicate rows collapse into a single weighted row."""
+        X = pd.DataFrame({"hour": [1, 1, 1, 2], "month": [3, 3, 3, 4]})
+        y = pd.Series([1, 1, 0, 0])
+
+        X_unique, y_unique, weights = aggregate_training_rows(X, y)
+
+        assert X_unique.to_dict("list") == {"hour": [1, 1, 2], "month": [3, 3, 4]}
+        assert y_unique.tolist() == [0, 1, 0]
+        assert weights.tolist() == [1.0, 2.0, 1.0]
+
+    def test_row_weights_are_summed(self):
+        """Verify per-row weights replace row counts."""
+        X = pd.DataFrame({"hour": [1, 1, 1, 2], "month": [3, 3, 3, 4]})
+        y = pd.Series([1, 1, 0, 0])
+
+        _, _, weights = aggregate_training_rows(X, y, np.array([2.0, 3.0, 4.0, 10.0]))
+
+        assert weights.tolist() == [4.0, 5.0, 10.0]
+
+
+class TestTrainWeightedForest:
+    """Tests for train_weighted_forest function."""
+
+    def test_importances_match_full_row_forest(self, temporal_features):
+        """Verify importances agree with a forest trained on every row."""
+        X, y = temporal_features
+        full = RandomForestClassifier(n_estimators=50, random_state=0).fit(X, y)
+
+        weighted = train_weighted_forest(X, y, n_estimators=50, random_state=0)
+
+        np.testing.assert_allclose(
+            weighted.feature_importances_, full.feature_importances_, atol=0.03
+        )
+        assert weighted.n_estimators == 50
+
+    def test_accepts_pre_aggregated_rows(self, temporal_features):
+        """Verify passing aggregated rows and weights gives the same forest."""
+        X, y = temporal_features
+        X_unique, y_unique, weights = aggregate_training_rows(X, y)
+
+        direct = train_weighted_forest(X, y, n_estimators=5)
+        aggregated = train_weighted_forest(X_unique, y_unique, weights, n_estimators=5)
+
+        np.testing.assert_array_almost_equal(
+            direct.feature_importances_, aggregated.feature_importances_
+        )
+
+    def test_weighted_accuracy_matches_row_accuracy(self, temporal_features):
+        """Verify accuracy over unique rows equals accuracy over every row."""
+        X, y = temporal_features
+        model = train_weighted_forest(X, y, n_estimators=5)
+
+        assert weighted_accuracy(model, X, y) == pytest.approx(model.score(X, y))
+
+    def test_parallel_fit_is_deterministic(self, temporal_features):
+        """Verify the forest does not depend on the number of workers."""
+        X, y = temporal_features
+
+        serial = train_weighted_forest(X, y, n_estimators=8, n_jobs=1)
+        parallel = train_weighted_forest(X, y, n_estimators=8, n_jobs=2)
+
+        assert len(parallel.estimators_) == 8
+        np.testing.assert_allclose(serial.feature_importances_, parallel.feature_importances_)
+        np.testing.assert_allclose(serial.predict_proba(X), parallel.predict_proba(X))
+
+
 class TestExtractFeatureImportance:
     """Tests for extract_feature_importance function."""
 
@@ -0,0 +1,143 @@
+"""Tests for bootstrap and permutation resampling utilities."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from analysis.models import resampling
+from analysis.models.resampling import (
+    bootstrap_mean_difference,
+    permutation_mean_difference,
+    resample_groups,
+)
+
+
+@pytest.fixture
+def shifted_groups():
+    """Treated group with a mean 5 above the control group."""
+    rng = np.random.default_rng(0)
+    return rng.normal(105, 10, 200), rng.normal(100, 10, 2000)
+
+
+@pytest.fixture
+def null_groups():
+    """Two samples from the same distribution."""
+    rng = np.random.default_rng(1)
+    return rng.poisson(50, 100).astype(float), rng.poisson(50, 1000).astype(float)
+
+
+class TestBootstrapMeanDifference:
+    """Tests for bootstrap_mean_difference function."""
+
+    def test_interval_covers_true_difference(self, shifted_groups):
+        """95% interval around the observed difference contains the true shift."""
+        treated, control = shifted_groups
+        result = bootstrap_mean_difference(treated, control, n_resamples=2000)
+
+        assert result["difference"] == pytest.approx(treated.mean() - control.mean())
+        assert result["ci_lower"] < 5 < result["ci_upper"]
+        assert result["ci_lower"] > 0
+        assert result["p_value"] < 0.01
+
+    def test_interval_width_matches_standard_error(self, shifted_groups):
+        """Percentile interval is close to the normal-theory interval."""
+        treated, control = shifted_groups
+        result = bootstrap_mean_difference(treated, control, n_resamples=4000)
+
+        se = np.sqrt(treated.var() / len(treated) + control.var() / len(control))
+        assert result["ci_upper"] - result["ci_lower"] == pytest.approx(2 * 1.96 * se, rel=0.1)
+
+    def test_p_value_agrees_with_t_test(self, null_groups):
+        """Under no difference the bootstrap p-value is close to Welch's t-test."""
+        treated, control = null_groups
+        result = bootstrap_mean_difference(treated, control, n_resamples=4000)
+
+        welch = stats.ttest_ind(treated, control, equal_var=False).pvalue
+        assert result["p_value"] == pytest.approx(welch, abs=0.05)
+
+    def test_same_seed_same_result(self, shifted_groups):
+        """Results are reproducible for a fixed seed."""
+        first = bootstrap_mean_difference(*shifted_groups, n_resamples=500, seed=7)
+        second = bootstrap_mean_difference(*shifted_groups, n_resamples=500, seed=7)
+        assert first == second
+
+    def test_batches_do_not_change_result(self, shifted_groups, monkeypatch):
+        """Splitting replicates into more batches draws the same numbers."""
+        whole = bootstrap_mean_difference(*shifted_groups, n_resamples=300)
+        monkeypatch.setattr(resampling, "MAX_BATCH_CELLS", 2200 * 7)
+        batched = bootstrap_mean_difference(*shifted_groups, n_resamples=300)
+
+        assert batched["ci_lower"] == pytest.approx(whole["ci_lower"])
+        assert batched["ci_upper"] == pytest.approx(whole["ci_upper"])
+
+    def test_columns_share_draws(self, shifted_groups):
+        """Each column of 2-D input matches the 1-D result for that column."""
+        treated, control = shifted_groups
+        stacked = bootstrap_mean_difference(
+            np.column_stack([treated, treated * 2]), np.column_stack([control, control * 2])
+        )
+        single = bootstrap_mean_difference(treated, control)
+
+        assert stacked["ci_lower"].shape == (2,)
+        assert stacked["ci_lower"][0] == pytest.approx(single["ci_lower"])
+        assert stacked["ci_upper"][1] == pytest.approx(2 * single["ci_upper"])
+
+    def test_empty_group_raises(self):
+        """An empty group raises ValueError."""
+        with pytest.raises(ValueError, match="non-empty"):
+            bootstrap_mean_difference([], [1.0, 2.0])
+
+    def test_mismatched_columns_raise(self):
+        """Groups with different widths raise ValueError."""
+        with pytest.raises(ValueError, match="columns"):
+            bootstrap_mean_difference(np.ones((3, 2)), np.ones((3, 3)))
+
+
+class TestPermutationMeanDifference:
+    """Tests for permutation_mean_difference function."""
+
+    def test_detects_shift(self, shifted_groups):
+        """A clear shift gives the smallest attainable p-value."""
+        result = permutation_mean_difference(*shifted_groups, n_resamples=999)
+        assert result["p_value"] == pytest.approx(1 / 1000)
+
+    def test_p_value_agrees_with_t_test(self, null_groups):
+        """Under no difference the permutation p-value is close to the t-test."""
+        treated, control = null_groups
+        result = permutation_mean_difference(treated, control, n_resamples=4000)
+
+        assert result["p_value"] == pytest.approx(
+            stats.ttest_ind(treated, control).pvalue, abs=0.05
+        )
+
+    def test_identical_groups_are_never_significant(self):
+        """Constant data gives p = 1."""
+        result = permutation_mean_difference(np.full(5, 3.0), np.full(20, 3.0), n_resamples=99)
+        assert result["p_value"] == 1.0
+
+
+class TestResampleGroups:
+    """Tests for resample_groups function."""
+
+    def test_one_row_per_group(self, shifted_groups, null_groups):
+        """Returns one row per group, indexed by group name."""
+        result = resample_groups({"shifted": shifted_groups, "null": null_groups}, n_resamples=200)
+
+        assert list(result.index) == ["shifted", "null"]
+        assert {"difference", "ci_lower", "ci_upper", "p_value"} <= set(result.columns)
+        assert result.loc["shifted", "ci_lower"] > 0
+
+    def test_results_do_not_depend_on_n_jobs(self, shifted_groups, null_groups):
+        """Per-group seeds make serial and parallel runs identical."""
+        groups = {"shifted": shifted_groups, "null": null_groups}
+        serial = resample_groups(groups, "permutation", n_resamples=200, n_jobs=1)
+        parallel = resample_groups(groups, "permutation", n_resamples=200, n_jobs=2)
+
+        assert serial.equals(parallel)
+
+    def test_unknown_method_raises(self, shifted_groups):
+        """Unknown method raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown method"):
+            resample_groups({"a": shifted_groups}, method="jackknife")
@@ -2,22 +2,27 @@
 
 This module tests time series forecasting utilities including Prophet data
 preparation, train/test splitting, Prophet configuration, forecast evaluation,
-and anomaly detection.
+anomaly detection, and the built-in baseline forecasters.
 
 Tests use synthetic time series data to avoid slow Prophet model training.
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from analysis.models.time_series import (
+    BASELINE_MODELS,
     prepare_prophet_data,
     create_train_test_split,
     get_prophet_config,
     evaluate_forecast,
     detect_anomalies,
+    forecast_baseline,
+    holt_winters_forecast,
+    seasonal_naive_forecast,
 )
 
 
@@ -518,3 +523,83 @@ class TestDetectAnomalies:
         # All should be anomalies
         assert anomalies.sum() == 3
         assert all(anomalies)
+
+
+@pytest.fixture
+def seasonal_series():
+    """Five years of monthly counts: trend, yearly cycle and noise."""
+    rng = np.random.default_rng(0)
+    t = np.arange(60)
+    return 1000 + 2 * t + 80 * np.sin(2 * np.pi * t / 12) + rng.normal(0, 10, 60)
+
+
+class TestForecastBaseline:
+    """Tests for the built-in statistical forecasters."""
+
+    @pytest.mark.parametrize("model_type", sorted(BASELINE_MODELS))
+    def test_returns_horizon_rows_with_ordered_bounds(self, seasonal_series, model_type):
+        """Every model returns one row per step with lower <= yhat <= upper."""
+        result = forecast_baseline(seasonal_series, 24, model_type=model_type)
+
+        assert list(result.columns) == ["step", "yhat", "yhat_lower", "yhat_upper"]
+        assert result["step"].tolist() == list(range(1, 25))
+        assert (result["yhat_lower"] <= result["yhat"]).all()
+        assert (result["yhat"] <= result["yhat_upper"]).all()
+
+    @pytest.mark.parametrize("model_type", sorted(BASELINE_MODELS))
+    def test_tracks_seasonal_pattern(self, seasonal_series, model_type):
+        """Forecasts of the next year stay close to the noiseless signal."""
+        t = np.arange(60, 72)
+        expected = 1000 + 2 * t + 80 * np.sin(2 * np.pi * t / 12)
+
+        result = forecast_baseline(seasonal_series, 12, model_type=model_type)
+
+        assert np.abs(result["yhat"].to_numpy() - expected).mean() < 40
+
+    def test_naive_repeats_last_season(self, seasonal_series):
+        """Seasonal naive forecast is the last observed season, repeated."""
+        result = seasonal_naive_forecast(seasonal_series, 24)
+
+        np.testing.assert_allclose(result["yhat"][:12], seasonal_series[-12:])
+        np.testing.assert_allclose(result["yhat"][12:], seasonal_series[-12:])
+
+    def test_interval_widens_with_horizon(self, seasonal_series):
+        """ETS interval width never shrinks further ahead."""
+        result = holt_winters_forecast(seasonal_series, 24)
+        width = (result["yhat_upper"] - result["yhat_lower"]).to_numpy()
+
+        assert (np.diff(width) >= -1e-9).all()
+        assert width[-1] > width[0]
+
+    def test_wider_level_gives_wider_interval(self, seasonal_series):
+        """A 99% interval contains the 80% interval."""
+        narrow = forecast_baseline(seasonal_series, 6, level=0.8)
+        wide = forecast_baseline(seasonal_series, 6, level=0.99)
+
+        assert (wide["yhat_lower"] < narrow["yhat_lower"]).all()
+        assert (wide["yhat_upper"] > narrow["yhat_upper"]).all()
+
+    @pytest.mark.parametrize("model_type", sorted(BASELINE_MODELS))
+    def test_short_series_drops_seasonality(self, model_type):
+        """Series shorter than two seasons still produce a forecast."""
+        result = forecast_baseline(pd.Series(range(100, 110)), 3, model_type=model_type)
+
+        assert len(result) == 3
+        assert np.isfinite(result[["yhat", "yhat_lower", "yhat_upper"]].to_numpy()).all()
+
+    def test_too_short_series_raises(self):
+        """A single observation raises ValueError."""
+        with pytest.raises(ValueError, match="at least"):
+            forecast_baseline([100.0], 3)
+
+    def test_unknown_model_raises(self, seasonal_series):
+        """Unknown model_type raises ValueError naming the choices."""
+        with pytest.raises(ValueError, match="Unknown baseline model"):
+            forecast_baseline(seasonal_series, 3, model_type="lstm")
+
+    @pytest.mark.parametrize("model_type", ["naive", "regression"])
+    def test_config_accepts_baseline_model_types(self, model_type):
+        """TimeSeriesConfig accepts every built-in model type."""
+        from analysis.config.schemas.forecasting import TimeSeriesConfig
+
+        assert TimeSeriesConfig(model_type=model_type).model_type == model_type
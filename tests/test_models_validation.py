@@ -17,16 +17,21 @@ Tests follow behavior-focused patterns from TESTING_QUALITY_CRITERIA.md.
 from __future__ import annotations
 
 from collections.abc import Callable
+from functools import partial
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
 import pytest
+from sklearn.dummy import DummyRegressor
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.linear_model import LinearRegression
 
 from analysis.models.validation import (
+    BacktestResult,
+    backtest,
+    backtest_folds,
     check_residual_autocorrelation,
     compute_forecast_accuracy,
     compute_regression_metrics,
@@ -817,3 +822,208 @@ class TestWalkForwardValidation:
             assert len(predictions) == results.iloc[idx]["n_test"]
             assert len(actuals) == results.iloc[idx]["n_test"]
 
+
+def _forest() -> RandomForestRegressor:
+    return RandomForestRegressor(n_estimators=5)
+
+
+@pytest.fixture
+def daily_series() -> tuple[pd.DataFrame, pd.Series]:
+    rng = np.random.default_rng(0)
+    index = pd.date_range("2020-01-01", periods=60)
+    X = pd.DataFrame({"t": np.arange(60), "noise": rng.normal(size=60)}, index=index)
+    y = pd.Series(2.0 * np.arange(60) + rng.normal(size=60), index=index)
+    return X, y
+
+
+class TestBacktestFolds:
+    """Tests for backtest_folds function."""
+
+    def test_expanding_window_starts_at_zero(self):
+        """Verify expanding folds all train from row 0."""
+        folds = backtest_folds(10, initial_train_size=4, step_size=2)
+
+        assert folds.tolist() == [[0, 4, 6], [0, 6, 8], [0, 8, 10]]
+
+    def test_sliding_window_keeps_length(self):
+        """Verify sliding folds train on a fixed-length window."""
+        folds = backtest_folds(10, initial_train_size=4, step_size=3, window="sliding")
+
+        assert folds.tolist() == [[0, 4, 7], [3, 7, 10]]
+
+    def test_horizon_clipped_to_series_end(self):
+        """Verify horizon longer than step is capped at n_obs."""
+        folds = backtest_folds(8, initial_train_size=5, step_size=1, horizon=3)
+
+        assert folds[:, 2].tolist() == [8, 8, 8]
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"initial_train_size": 0}, {"step_size": 0}, {"horizon": 0}, {"window": "rolling"}],
+    )
+    def test_rejects_invalid_arguments(self, kwargs):
+        """Verify non-positive sizes and unknown windows raise ValueError."""
+        params = {"initial_train_size": 4, **kwargs}
+
+        with pytest.raises(ValueError):
+            backtest_folds(10, **params)
+
+
+class TestBacktest:
+    """Tests for backtest function."""
+
+    def test_returns_columnar_result(self, daily_series):
+        """Verify per-fold arrays and flattened predictions line up."""
+        X, y = daily_series
+
+        result = backtest(LinearRegression, X, y, initial_train_size=40, step_size=5)
+
+        assert isinstance(result, BacktestResult)
+        assert result.n_folds == 4
+        assert len(result.error) == result.n_folds
+        assert result.offsets[-1] == len(result.predictions) == len(result.actuals) == 20
+        np.testing.assert_array_equal(result.actuals, y.to_numpy()[40:])
+        predictions, actuals = result.fold(1)
+        assert len(predictions) == len(actuals) == 5
+
+    def test_matches_walk_forward_validation(self, daily_series):
+        """Verify errors agree with the legacy per-step DataFrame."""
+        X, y = daily_series
+
+        result = backtest(LinearRegression, X, y, initial_train_size=30, step_size=5)
+        legacy = walk_forward_validation(LinearRegression, X, y, initial_train_size=30, step_size=5)
+
+        np.testing.assert_allclose(result.error, legacy["error"].to_numpy())
+        assert result.to_frame()["n_train"].tolist() == legacy["n_train"].tolist()
+
+    def test_parallel_matches_sequential(self, daily_series):
+        """Verify per-fold seeds make process-pool runs reproducible."""
+        X, y = daily_series
+
+        sequential = backtest(_forest, X, y, initial_train_size=40, step_size=2)
+        parallel = backtest(_forest, X, y, initial_train_size=40, step_size=2, n_jobs=2)
+
+        np.testing.assert_allclose(parallel.predictions, sequential.predictions)
+        np.testing.assert_array_equal(parallel.seeds, sequential.seeds)
+
+    def test_sliding_window_train_sizes(self, daily_series):
+        """Verify sliding windows keep n_train fixed."""
+        X, y = daily_series
+
+        frame = backtest(
+            LinearRegression, X, y, initial_train_size=20, step_size=10, window="sliding"
+        ).to_frame()
+
+        assert (frame["n_train"] == 20).all()
+        assert frame["train_start_idx"].tolist() == [0, 10, 20, 30]
+
+    def test_predictions_frame_long_format(self, daily_series):
+        """Verify one row per prediction with fold and position."""
+        X, y = daily_series
+
+        frame = backtest(
+            LinearRegression, X, y, initial_train_size=50, step_size=5
+        ).predictions_frame()
+
+        assert frame["fold"].tolist() == [0] * 5 + [1] * 5
+        assert frame["position"].tolist() == list(range(50, 60))
+
+    def test_checkpoint_resumes_completed_folds(self, daily_series, tmp_path):
+        """Verify an interrupted run resumes without refitting finished folds."""
+        X, y = daily_series
+        checkpoint = tmp_path / "backtest.joblib"
+        fits = []
+        fail_after = [3]
+
+        def model_fn():
+            if len(fits) == fail_after[0]:
+                raise RuntimeError("interrupted")
+            fits.append(1)
+            return LinearRegression()
+
+        with pytest.raises(RuntimeError):
+            backtest(
+                model_fn,
+                X,
+                y,
+                initial_train_size=40,
+                step_size=2,
+                checkpoint=checkpoint,
+                chunk_size=1,
+            )
+
+        fits.clear()
+        fail_after[0] = -1
+        resumed = backtest(
+            model_fn, X, y, initial_train_size=40, step_size=2, checkpoint=checkpoint
+        )
+        full = backtest(LinearRegression, X, y, initial_train_size=40, step_size=2)
+
+        assert len(fits) == full.n_folds - 3
+        np.testing.assert_allclose(resumed.predictions, full.predictions)
+
+    def test_checkpoint_ignored_when_data_changes(self, daily_series, tmp_path):
+        """Verify a checkpoint from a different series is not reused."""
+        X, y = daily_series
+        checkpoint = tmp_path / "backtest.joblib"
+        backtest(LinearRegression, X, y, initial_train_size=40, step_size=5, checkpoint=checkpoint)
+
+        shifted = backtest(
+            LinearRegression, X, y + 100, initial_train_size=40, step_size=5, checkpoint=checkpoint
+        )
+
+        np.testing.assert_allclose(shifted.actuals, y.to_numpy()[40:] + 100)
+        assert shifted.predictions.mean() > y.to_numpy()[40:].mean() + 50
+
+    def test_checkpoint_ignored_when_model_or_features_change(self, daily_series, tmp_path):
+        """Verify a checkpoint is keyed on model_fn and X, not only y."""
+        X, y = daily_series
+        checkpoint = tmp_path / "backtest.joblib"
+        backtest(LinearRegression, X, y, initial_train_size=40, step_size=5, checkpoint=checkpoint)
+
+        dummy = backtest(
+            DummyRegressor, X, y, initial_train_size=40, step_size=5, checkpoint=checkpoint
+        )
+        rescaled = backtest(
+            LinearRegression, X * 0, y, initial_train_size=40, step_size=5, checkpoint=checkpoint
+        )
+
+        fresh = backtest(DummyRegressor, X, y, initial_train_size=40, step_size=5)
+        np.testing.assert_allclose(dummy.predictions, fresh.predictions)
+        np.testing.assert_allclose(
+            rescaled.predictions,
+            backtest(LinearRegression, X * 0, y, initial_train_size=40, step_size=5).predictions,
+        )
+
+    def test_checkpoint_ignored_when_hyperparameters_change(self, daily_series, tmp_path):
+        """Verify partials and lambdas differing only in hyperparameters don't share checkpoints."""
+        X, y = daily_series
+        checkpoint = tmp_path / "backtest.joblib"
+
+        def run(model_fn: Callable[[], Any], path=checkpoint) -> np.ndarray:
+            return backtest(
+                model_fn, X, y, initial_train_size=40, step_size=10, checkpoint=path
+            ).predictions
+
+        shallow = partial(RandomForestRegressor, n_estimators=5, max_depth=1, random_state=0)
+        deep = partial(RandomForestRegressor, n_estimators=5, max_depth=10, random_state=0)
+        run(shallow)
+        np.testing.assert_allclose(run(deep), run(deep, path=None))
+
+        run(lambda: RandomForestRegressor(n_estimators=5, max_depth=1, random_state=0))
+        np.testing.assert_allclose(
+            run(lambda: RandomForestRegressor(n_estimators=5, max_depth=10, random_state=0)),
+            run(deep, path=None),
+        )
+
+    def test_explicit_random_state_is_kept(self, daily_series):
+        """Verify per-fold seeds only fill in an unset random_state."""
+        X, y = daily_series
+
+        def seeded_forest():
+            return RandomForestRegressor(n_estimators=5, random_state=7)
+
+        result = backtest(seeded_forest, X, y, initial_train_size=40, step_size=20)
+        model = seeded_forest().fit(X.iloc[:40], y.iloc[:40])
+
+        np.testing.assert_allclose(result.fold(0)[0], model.predict(X.iloc[40:60]))
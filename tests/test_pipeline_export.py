@@ -12,13 +12,17 @@ from typer.testing import CliRunner
 
 from pipeline import export_data
 from pipeline.export_data import (
+    _count_points_in_tracts,
     _ensure_dir,
+    _export_density,
     _export_forecasting,
     _export_metadata,
     _export_policy,
+    _export_quality,
     _export_seasonality,
     _export_spatial,
     _export_trends,
+    _export_vehicle_corridors,
     _to_records,
     _write_json,
     app,
@@ -68,7 +72,7 @@ class TestMissingDependencies:
     def test_export_forecasting_uses_fallback_without_prophet(
         self, sample_crime_df: pd.DataFrame, tmp_path: Path
     ) -> None:
-        """Verify _export_forecasting uses LinearFallback when HAS_PROPHET=False."""
+        """Verify _export_forecasting uses the ETS baseline when HAS_PROPHET=False."""
         from analysis.utils.temporal import extract_temporal_features
 
         # Prepare data with temporal features
@@ -79,12 +83,12 @@ class TestMissingDependencies:
         with patch.object(export_data, "HAS_PROPHET", False):
             export_data._export_forecasting(df, tmp_path)
 
-            # Forecast file should be created with fallback model
+            # Forecast file should be created with the baseline model
             forecast_file = tmp_path / "forecast.json"
             assert forecast_file.exists()
 
             forecast = json.loads(forecast_file.read_text())
-            assert forecast["model"] == "LinearFallback"
+            assert forecast["model"] == "ETS"
             assert "historical" in forecast
             assert "forecast" in forecast
 
@@ -655,6 +659,31 @@ class TestExportSpatial:
             assert "corridors" in summary
 
 
+class TestCountPointsInTracts:
+    """Tests for the chunked tract spatial join."""
+
+    def test_chunked_counts_match_single_pass(self) -> None:
+        """Verify per-GEOID counts do not depend on the chunk size."""
+        import geopandas as gpd
+        from shapely.geometry import box
+
+        tracts = gpd.GeoDataFrame(
+            {"GEOID": ["A", "B"]},
+            geometry=[box(-75.2, 39.9, -75.1, 40.0), box(-75.1, 39.9, -75.0, 40.0)],
+            crs="EPSG:4326",
+        )
+        df = pd.DataFrame(
+            {
+                "point_x": [-75.15, -75.15, -75.05, -75.25, None, -80.0],
+                "point_y": [39.95, 39.95, 39.95, 39.95, 39.95, 39.95],
+            }
+        )
+
+        expected = {"A": 2, "B": 1}
+        assert _count_points_in_tracts(df, tracts) == expected
+        assert _count_points_in_tracts(df, tracts, chunk_size=1) == expected
+
+
 # =============================================================================
 # Task 7: Boundary Conditions and Edge Cases
 # =============================================================================
@@ -809,38 +838,64 @@ class TestExportPolicy:
             assert "crime_category" in composition_data[0]
             assert "count" in composition_data[0]
 
-    def test_export_policy_handles_missing_event_file(
+    def test_export_policy_generates_calendar_when_file_missing(
         self, sample_crime_df: pd.DataFrame, tmp_path: Path
     ) -> None:
-        """Verify event_impact.json is empty list when event file missing."""
-        # tmp_path doesn't have event_impact_results.csv
+        """Verify event impacts use the generated calendar when no parquet exists."""
+        # tmp_path doesn't have data/external/event_calendar.parquet
         _export_policy(sample_crime_df, tmp_path, tmp_path)
 
         event_file = tmp_path / "event_impact.json"
         assert event_file.exists()
 
         event_data = json.loads(event_file.read_text())
-        assert event_data == []  # Empty list when file missing
-
-    def test_export_policy_loads_event_file_when_exists(
+        assert {row["event_type"] for row in event_data} == {"holiday", "sports", "celebration"}
+        assert {row["crime_category"] for row in event_data} == {
+            "All",
+            "Violent",
+            "Property",
+            "Other",
+        }
+        for row in event_data:
+            assert row["n_event_days"] + row["n_control_days"] == len(sample_crime_df)
+
+        # Sample data (Jan-Apr 2020) has no New Year's Eve or July 3rd
+        celebration = next(
+            row
+            for row in event_data
+            if row["event_type"] == "celebration" and row["crime_category"] == "All"
+        )
+        assert celebration["n_event_days"] == 0
+        assert celebration["event_mean"] is None
+        assert celebration["significant"] is False
+
+    def test_export_policy_uses_calendar_file_when_exists(
         self, sample_crime_df: pd.DataFrame, tmp_path: Path
     ) -> None:
-        """Verify event_impact.json populated when event file exists."""
-        # Create mock event file
-        reports_dir = tmp_path / "reports"
-        reports_dir.mkdir(parents=True, exist_ok=True)
-        event_csv = reports_dir / "event_impact_results.csv"
-        event_csv.write_text("event,date,impact\ntest,2020-01-01,10\n")
+        """Verify event_impact.json is computed from the calendar parquet when present."""
+        calendar_dir = tmp_path / "data" / "external"
+        calendar_dir.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(
+            {
+                "date": pd.to_datetime(["2020-01-05", "2020-01-12"]),
+                "event_type": ["parade", "parade"],
+                "event_name": ["Parade", "Parade"],
+            }
+        ).to_parquet(calendar_dir / "event_calendar.parquet")
 
         _export_policy(sample_crime_df, tmp_path, tmp_path)
 
-        event_file = tmp_path / "event_impact.json"
-        assert event_file.exists()
-
-        event_data = json.loads(event_file.read_text())
-        assert isinstance(event_data, list)
-        # Should have loaded the CSV data
-        assert len(event_data) > 0
+        event_data = json.loads((tmp_path / "event_impact.json").read_text())
+        assert len(event_data) == 4
+        assert {row["event_type"] for row in event_data} == {"parade"}
+        # One incident per day in the sample data
+        all_crimes = next(row for row in event_data if row["crime_category"] == "All")
+        assert all_crimes["n_event_days"] == 2
+        assert all_crimes["event_mean"] == pytest.approx(1.0)
+        assert all_crimes["difference"] == pytest.approx(0.0)
+        assert all_crimes["ci_lower"] == pytest.approx(0.0)
+        assert all_crimes["ci_upper"] == pytest.approx(0.0)
+        assert all_crimes["significant"] is False
 
 
 # =============================================================================
@@ -854,7 +909,7 @@ class TestExportForecasting:
     def test_export_forecasting_fallback_without_prophet(
         self, sample_crime_df: pd.DataFrame, tmp_path: Path
     ) -> None:
-        """Set HAS_PROPHET=False, verify LinearFallback model used."""
+        """Set HAS_PROPHET=False, verify the ETS baseline is used."""
         from analysis.utils.classification import classify_crime_category
         from analysis.utils.temporal import extract_temporal_features
 
@@ -870,7 +925,7 @@ class TestExportForecasting:
             assert forecast_file.exists()
 
             forecast = json.loads(forecast_file.read_text())
-            assert forecast["model"] == "LinearFallback"
+            assert forecast["model"] == "ETS"
             assert "historical" in forecast
             assert "forecast" in forecast
 
@@ -923,6 +978,59 @@ class TestExportForecasting:
                 assert feature["importance"] == 0.25
 
 
+class TestExportVehicleCorridors:
+    """Tests for _export_vehicle_corridors function."""
+
+    def test_export_vehicle_corridors_without_geopandas(
+        self, sample_crime_df: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """Verify nothing is written when HAS_GEOPANDAS=False."""
+        with patch.object(export_data, "HAS_GEOPANDAS", False):
+            _export_vehicle_corridors(sample_crime_df, tmp_path, tmp_path)
+
+        assert not (tmp_path / "vehicle_crimes_per_corridor.json").exists()
+
+    def test_export_vehicle_corridors_writes_stats(
+        self, sample_crime_df: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """Verify per-corridor stats for vehicle crimes against the shipped corridors."""
+        from analysis.utils.spatial import get_repo_root
+
+        df = sample_crime_df.assign(ucr_general=700)
+        _export_vehicle_corridors(df, tmp_path, get_repo_root())
+
+        payload = json.loads((tmp_path / "vehicle_crimes_per_corridor.json").read_text())
+        assert payload["total_incidents"] == len(df)
+        assert 0 <= payload["within_buffer"] <= len(df)
+        assert 0 <= payload["pct_within"] <= 100
+        counts = [row["incident_count"] for row in payload["corridors"]]
+        assert counts == sorted(counts, reverse=True)
+        assert {"name", "type", "incident_count", "pct_of_crimes"} <= set(payload["corridors"][0])
+
+
+class TestExportDensity:
+    """Tests for _export_density function."""
+
+    def test_export_density_writes_sparse_layers(
+        self, sample_crime_df: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """Verify density.json has grid metadata and per year/category layers."""
+        _export_density(sample_crime_df, tmp_path)
+
+        payload = json.loads((tmp_path / "density.json").read_text())
+        assert set(payload) == {"bounds", "cell_size", "shape", "layers"}
+        n_rows, n_cols = payload["shape"]
+
+        total = 0
+        for layer in payload["layers"]:
+            assert {"year", "crime_category", "total", "max", "cells", "counts"} <= set(layer)
+            assert len(layer["cells"]) == len(layer["counts"])
+            assert all(0 <= cell < n_rows * n_cols for cell in layer["cells"])
+            assert sum(layer["counts"]) == layer["total"]
+            total += layer["total"]
+        assert 0 < total <= len(sample_crime_df)
+
+
 # =============================================================================
 # Export Metadata Tests (Task 7)
 # =============================================================================
@@ -1001,6 +1109,25 @@ class TestExportMetadataClass:
 # =============================================================================
 
 
+class TestExportQuality:
+    """Tests for _export_quality function."""
+
+    def test_export_quality_writes_profile_and_validation(
+        self, sample_crime_df: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        """quality.json holds the profile plus the validation report."""
+        from analysis.data.validation import check_crime_data
+
+        report = check_crime_data(sample_crime_df)
+        _export_quality(sample_crime_df, tmp_path, report)
+
+        quality = json.loads((tmp_path / "quality.json").read_text())
+        assert quality["total_records"] == len(sample_crime_df)
+        assert {"null_rates", "coordinates", "ucr_bands", "daily_counts"} <= quality.keys()
+        assert sum(quality["daily_counts"].values()) == len(sample_crime_df)
+        assert quality["validation"] == report.to_dict()
+
+
 class TestExportAllOrchestration:
     """Tests for export_all orchestration function."""
 
@@ -1024,8 +1151,8 @@ class TestExportAllOrchestration:
     ) -> None:
         """Verify geo/ directory created under output_dir."""
         # Create test DataFrame directly
-        import pandas as pd
         import numpy as np
+        import pandas as pd
         np.random.seed(42)
         test_df = pd.DataFrame({
             "objectid": range(1, 101),
@@ -0,0 +1,218 @@
+"""Tests for the hashed fitted-model store (pipeline/model_store.py)."""
+
+from __future__ import annotations
+
+import json
+from functools import partial
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pipeline import export_data
+from pipeline.model_store import ModelStore
+
+
+@pytest.fixture
+def monthly() -> pd.DataFrame:
+    return pd.DataFrame(
+        {"ds": pd.date_range("2020-01-31", periods=12, freq="ME"), "y": range(100, 112)}
+    )
+
+
+def fit_mean(data: pd.DataFrame) -> dict:
+    return {"mean": float(data["y"].mean()), "how": "fit"}
+
+
+def refit_mean(previous: dict, data: pd.DataFrame) -> dict:
+    return {"mean": float(data["y"].mean()), "how": "refit", "previous": previous["mean"]}
+
+
+def fit_scaled(data: pd.DataFrame, scale: float) -> dict:
+    return {"mean": float(data["y"].mean()) * scale, "how": "fit"}
+
+
+class TestModelStore:
+    def test_first_fit_then_cached(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path)
+
+        model, status = store.fit("m", monthly, fit_mean, refit_mean)
+        assert status == "fit"
+
+        cached, status = store.fit("m", monthly.copy(), fit_mean, refit_mean)
+        assert status == "cached"
+        assert cached == model
+
+    def test_last_point_changed_takes_refit_path(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path, warm_start=True)
+        store.fit("m", monthly, fit_mean, refit_mean)
+        moved = monthly.copy()
+        moved.loc[moved.index[-1], "y"] = 500
+
+        model, status = store.fit("m", moved, fit_mean, refit_mean)
+
+        assert status == "refit"
+        assert model["previous"] == pytest.approx(monthly["y"].mean())
+        assert model["mean"] == pytest.approx(moved["y"].mean())
+
+    def test_appended_point_takes_refit_path(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path, warm_start=True)
+        store.fit("m", monthly.iloc[:-1], fit_mean, refit_mean)
+
+        assert store.fit("m", monthly, fit_mean, refit_mean)[1] == "refit"
+
+    def test_without_warm_start_last_point_change_is_full_fit(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path, warm_start=False)
+        store.fit("m", monthly.iloc[:-1], fit_mean, refit_mean)
+
+        assert store.fit("m", monthly, fit_mean, refit_mean)[1] == "fit"
+
+    def test_cold_store_does_not_reuse_warm_started_entry(self, monthly, tmp_path) -> None:
+        ModelStore(tmp_path, warm_start=True).fit("m", monthly.iloc[:-1], fit_mean, refit_mean)
+        ModelStore(tmp_path, warm_start=True).fit("m", monthly, fit_mean, refit_mean)
+
+        model, status = ModelStore(tmp_path, warm_start=False).fit(
+            "m", monthly, fit_mean, refit_mean
+        )
+
+        assert status == "fit"
+        assert model["how"] == "fit"
+        assert ModelStore(tmp_path).load("m")["warm_started"] is False
+
+    def test_warm_start_from_environment(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.delenv("PIPELINE_WARM_START", raising=False)
+        assert ModelStore(tmp_path).warm_start is False
+        monkeypatch.setenv("PIPELINE_WARM_START", "1")
+
+        assert ModelStore(tmp_path).warm_start is True
+
+    def test_changed_hyperparameters_miss_the_cache(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path)
+        store.fit("m", monthly, partial(fit_scaled, scale=1.0))
+
+        model, status = store.fit("m", monthly, partial(fit_scaled, scale=2.0))
+
+        assert status == "fit"
+        assert model["mean"] == pytest.approx(2 * monthly["y"].mean())
+        assert store.fit("m", monthly, partial(fit_scaled, scale=2.0))[1] == "cached"
+
+    def test_changed_fit_function_misses_the_cache(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path)
+        store.fit("m", monthly, fit_mean)
+
+        assert store.fit("m", monthly, partial(fit_scaled, scale=1.0))[1] == "fit"
+
+    def test_earlier_change_refits_from_scratch(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path, warm_start=True)
+        store.fit("m", monthly, fit_mean, refit_mean)
+        revised = monthly.copy()
+        revised.loc[revised.index[0], "y"] = 0
+
+        assert store.fit("m", revised, fit_mean, refit_mean)[1] == "fit"
+
+    def test_without_refit_fn_any_change_is_full_fit(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path)
+        store.fit("m", monthly, fit_mean)
+        moved = monthly.assign(y=monthly["y"].where(monthly.index < 11, 0))
+
+        assert store.fit("m", moved, fit_mean)[1] == "fit"
+
+    def test_corrupt_entry_is_a_miss(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path)
+        store.fit("m", monthly, fit_mean)
+        store.path("m").write_bytes(b"not a joblib file")
+
+        assert store.fit("m", monthly, fit_mean)[1] == "fit"
+
+    def test_encode_decode_round_trip(self, monthly, tmp_path) -> None:
+        store = ModelStore(tmp_path)
+        store.fit("m", monthly, fit_mean, encode=json.dumps, decode=json.loads)
+
+        assert isinstance(store.load("m")["model"], str)
+        model, status = store.fit("m", monthly, fit_mean, encode=json.dumps, decode=json.loads)
+        assert status == "cached"
+        assert model["how"] == "fit"
+
+    def test_cache_dir_from_environment(self, tmp_path, monkeypatch) -> None:
+        monkeypatch.setenv("PIPELINE_MODEL_CACHE", str(tmp_path / "models"))
+
+        assert ModelStore().root == tmp_path / "models"
+
+
+class TestExportForecastingCache:
+    @pytest.fixture
+    def incidents(self, sample_crime_df: pd.DataFrame) -> pd.DataFrame:
+        return sample_crime_df.assign(dispatch_time="12:00:00")
+
+    def test_unchanged_input_reuses_classifier(self, incidents, tmp_path: Path) -> None:
+        pytest.importorskip("sklearn")
+        store = ModelStore(tmp_path / "models")
+        with patch.object(export_data, "HAS_PROPHET", False):
+            export_data._export_forecasting(incidents, tmp_path, store=store)
+            first = json.loads((tmp_path / "classification_features.json").read_text())
+
+            # A cache hit returns before saving anything
+            with patch.object(store, "save", side_effect=AssertionError("refit")):
+                export_data._export_forecasting(incidents, tmp_path, store=store)
+
+        assert json.loads((tmp_path / "classification_features.json").read_text()) == first
+        assert store.path("violence_classifier").exists()
+
+
+class TestSeriesForecasts:
+    @pytest.fixture
+    def incidents(self) -> pd.DataFrame:
+        rng = np.random.default_rng(0)
+        n = 2_000
+        dates = pd.Timestamp("2022-01-01") + pd.to_timedelta(rng.integers(0, 365, n), unit="D")
+        return pd.DataFrame(
+            {
+                "objectid": range(n),
+                "dispatch_date": dates,
+                "dispatch_time": "12:00:00",
+                "ucr_general": rng.choice([100, 600, 800], n),
+                "dc_dist": rng.choice([1, 2], n),
+            }
+        )
+
+    def test_fans_out_every_district_category_series(self, incidents, tmp_path: Path) -> None:
+        with patch.object(export_data, "HAS_PROPHET", False):
+            export_data._export_forecasting(
+                incidents, tmp_path, store=ModelStore(tmp_path / "models"), n_jobs=1
+            )
+
+        payload = json.loads((tmp_path / "forecast_series.json").read_text())
+        keys = {(series["district"], series["category"]) for series in payload["series"]}
+        categories = {"Violent", "Property", "Other"}
+        assert {(d, c) for d in (1, 2) for c in categories} <= keys
+        assert {(1, None), (2, None)} | {(None, c) for c in categories} <= keys
+        assert len(payload["dates"]) == 12
+        assert len(payload["forecast_dates"]) == export_data.FORECAST_PERIODS
+
+        totals = {s["category"]: s["y"] for s in payload["series"] if s["district"] is None}
+        for series in payload["series"]:
+            assert len(series["y"]) == len(payload["dates"])
+            assert len(series["yhat"]) == export_data.FORECAST_PERIODS
+        monthly_total = np.sum([totals[c] for c in categories], axis=0)
+        assert monthly_total.sum() == len(incidents)
+
+    def test_series_failure_falls_back_to_linear(self, incidents, tmp_path: Path) -> None:
+        with (
+            patch.object(export_data, "HAS_PROPHET", True),
+            patch.object(export_data, "model_to_json", create=True),
+            patch.object(export_data, "model_from_json", create=True),
+            patch.object(export_data, "_fit_prophet", side_effect=RuntimeError("stan failed")),
+        ):
+            export_data._export_series_forecasts(
+                export_data.classify_crime_category(incidents),
+                tmp_path,
+                ModelStore(tmp_path / "models"),
+                n_jobs=1,
+            )
+
+        payload = json.loads((tmp_path / "forecast_series.json").read_text())
+        assert payload["series"]
+        assert {series["model"] for series in payload["series"]} == {"LinearFallback"}
+        assert all("stan failed" in series["fallback_reason"] for series in payload["series"])
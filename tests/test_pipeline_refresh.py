@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import importlib
 import json
+import sys
 from pathlib import Path
 from unittest.mock import patch
 
+import pandas as pd
 import pytest
 from typer.testing import CliRunner
 
+from pipeline import export_data, manifest
+from pipeline.manifest import MANIFEST_NAME, code_fingerprint, file_sha256, read_manifest
 from pipeline.refresh_data import (
     _REQUIRED_FILES,
     _assert_reproducible,
     _canonical_json,
     _load_json,
     _validate_artifacts,
+    _verify_reproducibility,
     app,
 )
 
@@ -355,6 +361,180 @@ class TestAssertReproducible:
         assert mock_export.call_count == 2
 
 
+@pytest.fixture
+def toy_stages(monkeypatch: pytest.MonkeyPatch) -> dict[str, object]:
+    """Replace the export stages with two cheap ones over a small frame."""
+    frame = pd.DataFrame({"dispatch_date": pd.date_range("2020-01-01", periods=5), "n": range(5)})
+    state: dict[str, object] = {"frame": frame, "noise": 0}
+
+    def export_counts(df: pd.DataFrame, output_dir: Path) -> None:
+        (output_dir / "counts.json").write_text(json.dumps({"rows": len(df)}))
+
+    def export_noisy(df: pd.DataFrame, output_dir: Path) -> None:
+        (output_dir / "geo" / "noisy.json").write_text(json.dumps({"noise": state["noise"]}))
+
+    monkeypatch.setattr(export_data, "_export_counts", export_counts, raising=False)
+    monkeypatch.setattr(export_data, "_export_noisy", export_noisy, raising=False)
+    monkeypatch.setattr(
+        export_data,
+        "EXPORT_STAGES",
+        {"counts": ("_export_counts", ()), "noisy": ("_export_noisy", ())},
+    )
+    monkeypatch.setattr(export_data, "load_crime_data", lambda clean=True: state["frame"].copy())
+    return state
+
+
+class TestExportManifest:
+    """Tests for the per-stage manifest written by export_all."""
+
+    def test_manifest_records_stage_outputs(self, toy_stages: dict, tmp_path: Path) -> None:
+        export_data.export_all(tmp_path)
+
+        manifest = read_manifest(tmp_path)
+        assert manifest is not None
+        assert manifest["stages"]["counts"]["outputs"] == {
+            "counts.json": file_sha256(tmp_path / "counts.json")
+        }
+        assert list(manifest["stages"]["noisy"]["outputs"]) == ["geo/noisy.json"]
+        assert all(stage["changed"] for stage in manifest["stages"].values())
+
+    def test_unchanged_inputs_are_not_flagged(self, toy_stages: dict, tmp_path: Path) -> None:
+        export_data.export_all(tmp_path)
+        export_data.export_all(tmp_path)
+        first = read_manifest(tmp_path)
+
+        toy_stages["frame"] = toy_stages["frame"].head(3)
+        export_data.export_all(tmp_path)
+        second = read_manifest(tmp_path)
+
+        assert first is not None and second is not None
+        assert not any(stage["changed"] for stage in first["stages"].values())
+        assert all(stage["changed"] for stage in second["stages"].values())
+
+
+class TestCodeFingerprint:
+    """Tests for code_fingerprint, the code part of a stage fingerprint."""
+
+    @pytest.fixture
+    def stage_package(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Package whose stage functions call a helper in a sibling module."""
+        package = tmp_path / "fpdemo"
+        package.mkdir()
+        (package / "__init__.py").write_text("")
+        (package / "stages.py").write_text(
+            "from fpdemo.helpers import scale\n\n\n"
+            "def export(rows):\n    return scale(rows)\n\n\n"
+            "def export_lazy(rows):\n    from fpdemo.helpers import scale\n\n"
+            "    return scale(rows)\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(manifest, "_REPO_PACKAGES", frozenset({"fpdemo"}))
+        # Rewrites within one second keep the size; don't let a stale .pyc win
+        monkeypatch.setattr(sys, "dont_write_bytecode", True)
+
+        def load(helper_source: str):
+            (package / "helpers.py").write_text(helper_source)
+            for name in ("fpdemo.helpers", "fpdemo.stages"):
+                sys.modules.pop(name, None)
+            return importlib.import_module("fpdemo.stages")
+
+        yield load
+        for name in ("fpdemo", "fpdemo.helpers", "fpdemo.stages"):
+            sys.modules.pop(name, None)
+
+    @pytest.mark.parametrize("stage", ["export", "export_lazy"])
+    def test_helper_edits_change_fingerprint(self, stage_package, stage: str) -> None:
+        base = "SCALE = 2\n\n\ndef scale(rows):\n    return rows * SCALE\n"
+        first = code_fingerprint(getattr(stage_package(base), stage))
+        same = code_fingerprint(getattr(stage_package(base), stage))
+        constant = code_fingerprint(getattr(stage_package(base.replace("2", "3")), stage))
+        body = code_fingerprint(getattr(stage_package(base.replace("* SCALE", "+ SCALE")), stage))
+
+        assert first == same
+        assert len({first, constant, body}) == 3
+
+
+class TestVerifyReproducibility:
+    """Tests for the manifest-based _verify_reproducibility check."""
+
+    def test_deterministic_stage_passes(self, toy_stages: dict, tmp_path: Path) -> None:
+        export_data.export_all(tmp_path)
+        assert _verify_reproducibility(tmp_path, "counts") == "counts"
+
+    def test_defaults_to_a_changed_stage(self, toy_stages: dict, tmp_path: Path) -> None:
+        export_data.export_all(tmp_path)
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        manifest["stages"]["noisy"]["changed"] = False
+        (tmp_path / MANIFEST_NAME).write_text(json.dumps(manifest))
+
+        assert _verify_reproducibility(tmp_path) == "counts"
+
+    def test_nondeterministic_stage_fails(self, toy_stages: dict, tmp_path: Path) -> None:
+        export_data.export_all(tmp_path)
+        toy_stages["noise"] = 1
+
+        with pytest.raises(RuntimeError, match="Reproducibility check failed for: geo/noisy.json"):
+            _verify_reproducibility(tmp_path, "noisy")
+
+    def test_modified_published_file_fails(self, toy_stages: dict, tmp_path: Path) -> None:
+        export_data.export_all(tmp_path)
+        (tmp_path / "counts.json").write_text("{}")
+
+        with pytest.raises(RuntimeError, match="counts.json"):
+            _verify_reproducibility(tmp_path, "noisy")
+
+    def test_changed_input_data_fails(self, toy_stages: dict, tmp_path: Path) -> None:
+        export_data.export_all(tmp_path)
+        toy_stages["frame"] = toy_stages["frame"].head(2)
+
+        with pytest.raises(RuntimeError, match="changed since the export"):
+            _verify_reproducibility(tmp_path, "counts")
+
+    def test_warm_start_leaves_out_forecasting(
+        self, toy_stages: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def export_forecasts(df: pd.DataFrame, output_dir: Path, store: object) -> None:
+            (output_dir / "forecast.json").write_text(json.dumps({"rows": len(df)}))
+
+        monkeypatch.setattr(export_data, "_export_forecasts", export_forecasts, raising=False)
+        monkeypatch.setattr(
+            export_data,
+            "EXPORT_STAGES",
+            {"counts": ("_export_counts", ()), "forecasting": ("_export_forecasts", ())},
+        )
+        export_data.export_all(tmp_path)
+        monkeypatch.setenv("PIPELINE_WARM_START", "1")
+
+        assert all(_verify_reproducibility(tmp_path) == "counts" for _ in range(5))
+        with pytest.raises(RuntimeError, match="PIPELINE_WARM_START"):
+            _verify_reproducibility(tmp_path, "forecasting")
+
+    def test_rerun_fits_into_empty_model_store(
+        self, toy_stages: dict, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        from pipeline import refresh_data
+        from pipeline.model_store import resolve_cache_dir
+
+        export_data.export_all(tmp_path)
+        stores = []
+
+        def recording_run_stage(name, df, output_dir, report=None, store=None):
+            stores.append((store, store is not None and any(store.root.glob("*"))))
+            export_data.run_stage(name, df, output_dir, report, store)
+
+        monkeypatch.setattr(refresh_data, "run_stage", recording_run_stage)
+        _verify_reproducibility(tmp_path, "counts")
+
+        store, had_entries = stores[0]
+        assert store is not None
+        assert store.root != resolve_cache_dir()
+        assert not had_entries
+
+    def test_missing_manifest_fails(self, tmp_path: Path) -> None:
+        with pytest.raises(RuntimeError, match="Missing export manifest"):
+            _verify_reproducibility(tmp_path)
+
+
 class TestRefreshCliRun:
     """Tests for refresh CLI run command."""
 
@@ -407,7 +587,7 @@ class TestRefreshCliRun:
         mock_export.assert_called_once()
 
     @patch("pipeline.refresh_data.export_all")
-    @patch("pipeline.refresh_data._assert_reproducible")
+    @patch("pipeline.refresh_data._verify_reproducibility", return_value="trends")
     def test_refresh_run_with_verify_reproducibility(self, mock_repro: patch, mock_export: patch, tmp_path: Path) -> None:
         """Should run reproducibility check when flag provided."""
         def mock_export_func(output_dir: Path) -> Path:
@@ -423,6 +603,22 @@ class TestRefreshCliRun:
         assert "Reproducibility check passed" in result.stdout
         mock_repro.assert_called_once()
 
+    @patch("pipeline.refresh_data.export_all")
+    @patch("pipeline.refresh_data._assert_reproducible")
+    def test_refresh_run_with_full_reproducibility(self, mock_repro: patch, mock_export: patch, tmp_path: Path) -> None:
+        """--full-reproducibility still runs the export twice more."""
+        def mock_export_func(output_dir: Path) -> Path:
+            _create_minimal_valid_files(output_dir)
+            return output_dir
+
+        mock_export.side_effect = mock_export_func
+
+        result = runner.invoke(app, ["--output-dir", str(tmp_path), "--full-reproducibility"])
+
+        assert result.exit_code == 0
+        assert "Full reproducibility check passed" in result.stdout
+        mock_repro.assert_called_once()
+
 
 # =============================================================================
 # Task 4: Corrupt Artifact Detection Tests
@@ -539,7 +735,7 @@ class TestCliErrorHandling:
         assert result.exit_code != 0
 
     @patch("pipeline.refresh_data.export_all")
-    @patch("pipeline.refresh_data._assert_reproducible")
+    @patch("pipeline.refresh_data._verify_reproducibility")
     def test_refresh_run_exits_nonzero_on_reproducibility_failure(
         self, mock_repro: patch, mock_export: patch, tmp_path: Path
     ) -> None:
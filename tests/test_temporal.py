@@ -279,3 +279,67 @@ class TestExtractTemporalFeatures:
         df = pd.DataFrame({"dispatch_datetime": pd.to_datetime(["2023-05-10"])})
         result = extract_temporal_features(df)
         assert "dispatch_datetime" in result.columns
+
+
+class TestTemporalFeatureOptions:
+    """Tests for feature selection, in-place mode, compact dtypes and hour."""
+
+    def test_features_subset(self):
+        """Only the requested features are added."""
+        df = pd.DataFrame({"dispatch_date": ["2023-01-15"]})
+        result = extract_temporal_features(df, features=["year"])
+        assert "year" in result.columns
+        assert not {"month", "day", "day_of_week", "hour"} & set(result.columns)
+
+    def test_unknown_feature_raises(self):
+        """Unknown feature names raise ValueError."""
+        df = pd.DataFrame({"dispatch_date": ["2023-01-15"]})
+        with pytest.raises(ValueError, match="Unknown temporal features"):
+            extract_temporal_features(df, features=["week"])
+
+    def test_inplace_modifies_input(self):
+        """inplace=True adds columns to the input frame and returns it."""
+        df = pd.DataFrame({"dispatch_date": ["2023-01-15"]})
+        result = extract_temporal_features(df, features=["month"], inplace=True)
+        assert result is df
+        assert df["month"].tolist() == [1]
+
+    def test_compact_dtypes(self):
+        """compact=True uses int16 for year and int8 for the rest."""
+        df = pd.DataFrame({"dispatch_datetime": pd.to_datetime(["2023-01-15 10:30:00"])})
+        result = extract_temporal_features(df, compact=True)
+        assert result["year"].dtype == "int16"
+        for col in ["month", "day", "day_of_week", "hour"]:
+            assert result[col].dtype == "int8"
+
+    def test_compact_dtypes_with_missing_values(self):
+        """compact=True falls back to nullable integers when values are missing."""
+        df = pd.DataFrame({"dispatch_date": ["2023-01-15", None]})
+        result = extract_temporal_features(df, features=["year"], compact=True)
+        assert result["year"].dtype == "Int16"
+        assert pd.isna(result["year"].iloc[1])
+
+    def test_hour_from_dispatch_time(self):
+        """hour is parsed from dispatch_time, not the date-only timestamp."""
+        df = pd.DataFrame(
+            {
+                "dispatch_date": ["2023-01-15", "2023-01-15", "2023-01-16"],
+                "dispatch_time": ["14:05:00", None, "00:59:59"],
+            }
+        )
+        result = extract_temporal_features(df, features=["hour"])
+        assert result["hour"].iloc[0] == 14
+        assert pd.isna(result["hour"].iloc[1])
+        assert result["hour"].iloc[2] == 0
+
+    def test_hour_from_dispatch_datetime(self):
+        """Without dispatch_time or hour columns, hour comes from the timestamp."""
+        df = pd.DataFrame({"dispatch_datetime": pd.to_datetime(["2023-01-15 10:30:00"])})
+        result = extract_temporal_features(df)
+        assert result["hour"].tolist() == [10]
+
+    def test_existing_hour_column_kept(self):
+        """An existing hour column is kept when there is no dispatch_time."""
+        df = pd.DataFrame({"dispatch_date": ["2023-01-15"], "hour": [22]})
+        result = extract_temporal_features(df)
+        assert result["hour"].tolist() == [22]
@@ -0,0 +1,118 @@
+"""Unit tests for utils/corridors.py corridor proximity index."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import pytest
+from shapely.geometry import LineString
+
+from analysis.utils.corridors import (
+    build_corridor_index,
+    corridor_crime_stats,
+    load_corridors,
+)
+
+
+@pytest.fixture
+def corridors() -> gpd.GeoDataFrame:
+    """Two north-south corridors roughly 1.7 km apart."""
+    return gpd.GeoDataFrame(
+        {"name": ["West Line", "East Line"], "type": ["rail", "highway"]},
+        geometry=[
+            LineString([(-75.20, 39.90), (-75.20, 40.00)]),
+            LineString([(-75.18, 39.90), (-75.18, 40.00)]),
+        ],
+        crs="EPSG:4326",
+    )
+
+
+@pytest.fixture
+def incidents() -> pd.DataFrame:
+    """Incidents near West Line, near East Line, far from both, and missing."""
+    return pd.DataFrame(
+        {
+            # Two ~0.1 km from West, one ~0.1 km from East, one ~2.5 km from East, one missing
+            "point_x": [-75.2012, -75.2012, -75.1788, -75.15, np.nan],
+            "point_y": [39.95, 39.96, 39.95, 39.95, np.nan],
+        }
+    )
+
+
+class TestBuildCorridorIndex:
+    def test_index_keeps_attributes(self, corridors: gpd.GeoDataFrame) -> None:
+        index = build_corridor_index(corridors, buffer_m=200)
+        assert index.corridors["name"].tolist() == ["West Line", "East Line"]
+        assert "geometry" not in index.corridors.columns
+        assert index.buffer_m == 200
+
+    def test_invalid_buffer_raises(self, corridors: gpd.GeoDataFrame) -> None:
+        with pytest.raises(ValueError, match="buffer_m"):
+            build_corridor_index(corridors, buffer_m=0)
+
+
+class TestCountWithin:
+    def test_chunked_counts_match_single_pass(
+        self, corridors: gpd.GeoDataFrame, incidents: pd.DataFrame
+    ) -> None:
+        index = build_corridor_index(corridors, buffer_m=200)
+        lon = incidents["point_x"].to_numpy()
+        lat = incidents["point_y"].to_numpy()
+
+        per_corridor, near_any = index.count_within(lon, lat)
+        chunked, chunked_near = index.count_within(lon, lat, chunk_size=2)
+
+        assert per_corridor.tolist() == [2, 1]
+        assert near_any.tolist() == [True, True, True, False, False]
+        np.testing.assert_array_equal(per_corridor, chunked)
+        np.testing.assert_array_equal(near_any, chunked_near)
+
+    def test_wide_buffer_counts_point_for_both_corridors(
+        self, corridors: gpd.GeoDataFrame, incidents: pd.DataFrame
+    ) -> None:
+        index = build_corridor_index(corridors, buffer_m=2000)
+        per_corridor, near_any = index.count_within(
+            incidents["point_x"].to_numpy(), incidents["point_y"].to_numpy()
+        )
+        assert per_corridor.tolist() == [3, 3]
+        assert int(near_any.sum()) == 3
+
+
+class TestCorridorCrimeStats:
+    def test_stats_sorted_with_percentages(
+        self, corridors: gpd.GeoDataFrame, incidents: pd.DataFrame
+    ) -> None:
+        stats, summary = corridor_crime_stats(incidents, build_corridor_index(corridors, 200))
+
+        assert stats["name"].tolist() == ["West Line", "East Line"]
+        assert stats["incident_count"].tolist() == [2, 1]
+        assert stats["pct_of_crimes"].tolist() == pytest.approx([40.0, 20.0])
+        assert summary == {
+            "buffer_m": 200,
+            "total_incidents": 5,
+            "within_buffer": 3,
+            "pct_within": pytest.approx(60.0),
+        }
+
+    def test_weighted_counts(self, corridors: gpd.GeoDataFrame, incidents: pd.DataFrame) -> None:
+        weighted = incidents.assign(sample_weight=[10.0, 10.0, 2.5, 1.0, 1.0])
+
+        stats, summary = corridor_crime_stats(
+            weighted, build_corridor_index(corridors, 200), weight_col="sample_weight"
+        )
+
+        assert stats["incident_count"].tolist() == [20, 2]
+        assert summary["total_incidents"] == 24
+        assert summary["within_buffer"] == 22
+
+    def test_missing_columns_raise(self, corridors: gpd.GeoDataFrame) -> None:
+        with pytest.raises(ValueError, match="point_x"):
+            corridor_crime_stats(pd.DataFrame({"a": [1]}), build_corridor_index(corridors))
+
+
+def test_load_corridors_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError, match="download_corridors"):
+        load_corridors(tmp_path / "missing.geojson")
@@ -0,0 +1,111 @@
+"""Unit tests for utils/density.py binned density surfaces."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.utils.density import (
+    build_density_grid,
+    compute_density_layers,
+    density_layers_to_records,
+)
+
+
+@pytest.fixture
+def unit_grid():
+    """A 2x3 grid over a small box with 1-degree cells."""
+    return build_density_grid(cell_size=1.0, bounds=(0.0, 0.0, 3.0, 2.0))
+
+
+class TestBuildDensityGrid:
+    def test_shape_covers_bounds(self, unit_grid) -> None:
+        assert (unit_grid.n_rows, unit_grid.n_cols) == (2, 3)
+        assert unit_grid.n_cells == 6
+        assert unit_grid.bounds == [0.0, 0.0, 3.0, 2.0]
+
+    def test_default_grid_covers_philadelphia(self) -> None:
+        grid = build_density_grid()
+        lon_min, lat_min, lon_max, lat_max = grid.bounds
+        assert lon_min <= -75.16 <= lon_max
+        assert lat_min <= 39.95 <= lat_max
+
+    def test_invalid_cell_size_raises(self) -> None:
+        with pytest.raises(ValueError, match="cell_size"):
+            build_density_grid(cell_size=0)
+
+    def test_invalid_bounds_raises(self) -> None:
+        with pytest.raises(ValueError, match="Invalid bounds"):
+            build_density_grid(cell_size=1.0, bounds=(1.0, 0.0, 0.0, 1.0))
+
+
+class TestCellIndex:
+    def test_row_major_indices(self, unit_grid) -> None:
+        index = unit_grid.cell_index(np.array([0.5, 2.5, 0.5]), np.array([0.5, 0.5, 1.5]))
+        assert index.tolist() == [0, 2, 3]
+
+    def test_off_grid_and_missing_points(self, unit_grid) -> None:
+        index = unit_grid.cell_index(
+            np.array([-0.5, 3.5, np.nan, 1.5]), np.array([0.5, 0.5, 0.5, 2.5])
+        )
+        assert index.tolist() == [-1, -1, -1, -1]
+
+
+class TestComputeDensityLayers:
+    def test_single_layer(self, unit_grid) -> None:
+        df = pd.DataFrame({"point_x": [0.5, 0.5, 2.5], "point_y": [0.5, 0.5, 1.5]})
+        layers, counts = compute_density_layers(df, unit_grid)
+        assert len(layers) == 1
+        assert counts.shape == (1, 2, 3)
+        assert counts.dtype == np.int32
+        assert counts[0, 0, 0] == 2
+        assert counts[0, 1, 2] == 1
+
+    def test_layers_sorted_and_counted(self, unit_grid) -> None:
+        df = pd.DataFrame(
+            {
+                "point_x": [0.5, 1.5, 1.5, 2.5],
+                "point_y": [0.5, 0.5, 0.5, 1.5],
+                "year": [2021, 2020, 2020, 2021],
+            }
+        )
+        layers, counts = compute_density_layers(df, unit_grid, ["year"])
+        assert layers["year"].tolist() == [2020, 2021]
+        assert counts[0].sum() == 2
+        assert counts[0, 0, 1] == 2
+        assert counts[1, 0, 0] == 1
+        assert counts[1, 1, 2] == 1
+
+    def test_drops_off_grid_and_missing_keys(self, unit_grid) -> None:
+        df = pd.DataFrame(
+            {
+                "point_x": [0.5, 10.0, 0.5, np.nan],
+                "point_y": [0.5, 0.5, 0.5, 0.5],
+                "crime_category": ["Violent", "Violent", None, "Property"],
+            }
+        )
+        layers, counts = compute_density_layers(df, unit_grid, ["crime_category"])
+        assert layers["crime_category"].tolist() == ["Property", "Violent"]
+        assert counts.sum() == 1
+        assert counts[1, 0, 0] == 1
+
+    def test_missing_columns_raise(self, unit_grid) -> None:
+        df = pd.DataFrame({"point_x": [0.5], "point_y": [0.5]})
+        with pytest.raises(ValueError, match="year"):
+            compute_density_layers(df, unit_grid, ["year"])
+
+
+class TestDensityLayersToRecords:
+    def test_sparse_records(self, unit_grid) -> None:
+        df = pd.DataFrame(
+            {
+                "point_x": [0.5, 0.5, 2.5],
+                "point_y": [0.5, 0.5, 1.5],
+                "year": [2020, 2020, 2020],
+            }
+        )
+        layers, counts = compute_density_layers(df, unit_grid, ["year"])
+        records = density_layers_to_records(layers, counts)
+        assert records == [{"year": 2020, "total": 3, "max": 2, "cells": [0, 5], "counts": [2, 1]}]
+        assert isinstance(records[0]["year"], int)
@@ -0,0 +1,128 @@
+"""Tests for cached background figure rendering (visualization/render.py)."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import pandas as pd
+import pytest
+
+from analysis.visualization.plots import plot_bar, plot_line
+from analysis.visualization.render import (
+    MANIFEST_NAME,
+    RenderQueue,
+    _update_manifest,
+    figure_batch,
+    figure_key,
+    render_figure,
+)
+
+
+@pytest.fixture
+def annual() -> pd.DataFrame:
+    return pd.DataFrame({"year": [2020, 2021, 2022], "count": [100, 120, 90]})
+
+
+PARAMS = {"x_col": "year", "y_col": "count", "title": "Annual"}
+
+
+class TestFigureKey:
+    def test_stable_for_same_inputs(self, annual) -> None:
+        first = figure_key(plot_line, annual, PARAMS, "png", 300)
+        assert first == figure_key(plot_line, annual.copy(), dict(PARAMS), "png", 300)
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda df, params: (df.assign(count=df["count"] + 1), params, "png", plot_line),
+            lambda df, params: (df, {**params, "title": "Other"}, "png", plot_line),
+            lambda df, params: (df, params, "svg", plot_line),
+            lambda df, params: (df, params, "png", plot_bar),
+        ],
+    )
+    def test_changes_with_data_params_format_and_function(self, annual, change) -> None:
+        data, params, output_format, plot_fn = change(annual, PARAMS)
+        assert figure_key(plot_line, annual, PARAMS, "png", 300) != figure_key(
+            plot_fn, data, params, output_format, 300
+        )
+
+
+class TestRenderFigure:
+    def test_renders_and_records_manifest(self, annual, tmp_path) -> None:
+        path = tmp_path / "trend.png"
+
+        assert render_figure(plot_line, annual, path, **PARAMS)
+
+        assert path.stat().st_size > 0
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert manifest["trend.png"] == figure_key(plot_line, annual, PARAMS, "png", 300)
+
+    def test_skips_unchanged_figure(self, annual, tmp_path) -> None:
+        path = tmp_path / "trend.png"
+        render_figure(plot_line, annual, path, **PARAMS)
+        mtime = path.stat().st_mtime_ns
+
+        assert not render_figure(plot_line, annual, path, **PARAMS)
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_rerenders_when_data_changes(self, annual, tmp_path) -> None:
+        path = tmp_path / "trend.png"
+        render_figure(plot_line, annual, path, **PARAMS)
+
+        assert render_figure(plot_line, annual.assign(count=[1, 2, 3]), path, **PARAMS)
+
+    def test_rerenders_when_file_deleted(self, annual, tmp_path) -> None:
+        path = tmp_path / "trend.png"
+        render_figure(plot_line, annual, path, **PARAMS)
+        path.unlink()
+
+        assert render_figure(plot_line, annual, path, **PARAMS)
+        assert path.exists()
+
+
+class TestFigureBatch:
+    def test_worker_pool_renders_on_exit(self, annual, tmp_path) -> None:
+        paths = [tmp_path / f"trend_{i}.png" for i in range(3)]
+        with figure_batch(max_workers=2) as queue:
+            for i, path in enumerate(paths):
+                render_figure(plot_line, annual, path, **{**PARAMS, "title": f"Trend {i}"})
+
+        assert all(path.exists() for path in paths)
+        assert sorted(queue.rendered) == sorted(paths)
+        assert len(json.loads((tmp_path / MANIFEST_NAME).read_text())) == 3
+
+    def test_nested_batches_share_queue(self, annual, tmp_path) -> None:
+        with figure_batch(max_workers=0) as outer, figure_batch(max_workers=2) as inner:
+            assert inner is outer
+            render_figure(plot_line, annual, tmp_path / "trend.png", **PARAMS)
+        assert outer.rendered == [tmp_path / "trend.png"]
+
+    def test_render_error_raised_on_exit(self, annual, tmp_path) -> None:
+        with pytest.raises(KeyError), figure_batch(max_workers=1):
+            render_figure(plot_line, annual, tmp_path / "bad.png", **{**PARAMS, "x_col": "missing"})
+        assert not (tmp_path / MANIFEST_NAME).exists()
+
+    def test_inline_queue_counts_skips(self, annual, tmp_path) -> None:
+        queue = RenderQueue(max_workers=0)
+        queue.submit(plot_line, annual, tmp_path / "trend.png", **PARAMS)
+        queue.submit(plot_line, annual, tmp_path / "trend.png", **PARAMS)
+        queue.close()
+
+        assert queue.rendered == [tmp_path / "trend.png"]
+        assert queue.skipped == [tmp_path / "trend.png"]
+
+
+class TestManifest:
+    def test_concurrent_updates_keep_every_entry(self, tmp_path) -> None:
+        entries = [{f"fig_{worker}_{i}.png": f"key{i}"} for worker in range(4) for i in range(25)]
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_update_manifest, [tmp_path] * len(entries), entries))
+
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+        assert len(manifest) == 100
+        assert not list(tmp_path.glob("*.tmp"))
@@ -85,6 +85,23 @@ export interface DistrictData {
   other: number;
 }
 
+// Binned density surface: sparse row-major cell indices into a shape[0] x shape[1] grid
+export interface DensityLayer {
+  year: number;
+  crime_category: string;
+  total: number;
+  max: number;
+  cells: number[];
+  counts: number[];
+}
+
+export interface DensityResponse {
+  bounds: [number, number, number, number];
+  cell_size: number;
+  shape: [number, number];
+  layers: DensityLayer[];
+}
+
 export function useAnnualTrends() {
   return useSWR<TrendRow[]>("/api/v1/trends/annual", fetcher);
 }
@@ -105,6 +122,14 @@ export function useDistrictStats() {
   return useSWR<DistrictData[]>("/api/v1/spatial/districts", fetcher);
 }
 
+export function useDensity(year?: number, category?: string) {
+  const params = new URLSearchParams();
+  if (year !== undefined) params.set("year", String(year));
+  if (category) params.set("category", category);
+  const query = params.toString();
+  return useSWR<DensityResponse>(`/api/v1/spatial/density${query ? `?${query}` : ""}`, fetcher);
+}
+
 export function useMetadata() {
   return useSWR<MetadataResponse>("/api/v1/metadata", fetcher);
 }